@@ -428,19 +428,29 @@ end
 
     Falls back to the canonical (base rank) spell's color, so any rank resolves.
 
+    Colors are stored packed as 0xRRGGBB numbers (one per spell, rather than an
+    {r, g, b} table each) and unpacked here; the last result is memoized since
+    aura displays tend to ask for the same spell every refresh.
+
     @param spellID (number) - Spell ID (any rank)
     @return (number, number, number) - r, g, b in 0-1, or nil if unknown
 ]]
+local lastColorID, lastR, lastG, lastB
+
 function lib:GetSpellColor(spellID)
     local colors = self.spellColors
     if not colors or not spellID then return nil end
+    if spellID == lastColorID then return lastR, lastG, lastB end
     local c = colors[spellID]
     if not c then
         local canonical = self:GetCanonicalSpellID(spellID)
         if canonical then c = colors[canonical] end
     end
-    if c then return c[1], c[2], c[3] end
-    return nil
+    if not c then return nil end
+    local r = math.floor(c / 65536)
+    local g = math.floor(c / 256) % 256
+    lastColorID, lastR, lastG, lastB = spellID, r / 255, g / 255, (c % 256) / 255
+    return lastR, lastG, lastB
 end
 
 --[[
@@ -6,706 +6,707 @@
 
     A vibrant representative color extracted from each spell's icon, used
     by consumers (e.g. VeevHUD's Aura Tracker bars) as a sensible default
-    fill color. Keyed by spellID -> {r, g, b} (0-1).
+    fill color. Keyed by spellID -> 0xRRGGBB (8 bits per channel); read it
+    through lib:GetSpellColor(), which returns r, g, b in 0-1.
 ]]
 
 local lib = LIBSPELLDB_REGISTRATION  -- set by Core/LibSpellDB.lua only when this copy won LibStub version selection
 if not lib then return end
 
 lib.spellColors = {
-    [10] = {0.263, 0.489, 1.000},
-    [17] = {1.000, 0.533, 0.340},
-    [53] = {1.000, 0.217, 0.198},
-    [71] = {1.000, 0.698, 0.300},
-    [72] = {1.000, 0.653, 0.340},
-    [78] = {1.000, 0.552, 0.340},
-    [99] = {1.000, 0.756, 0.117},
-    [100] = {1.000, 0.050, 0.051},
-    [116] = {0.300, 0.344, 1.000},
-    [118] = {1.000, 0.582, 0.340},
-    [120] = {0.300, 0.673, 1.000},
-    [122] = {0.138, 0.494, 1.000},
-    [126] = {1.000, 0.602, 0.340},
-    [130] = {1.000, 0.539, 0.340},
-    [131] = {0.300, 0.780, 1.000},
-    [132] = {0.055, 0.354, 1.000},
-    [133] = {1.000, 0.253, 0.050},
-    [136] = {1.000, 0.685, 0.242},
-    [139] = {1.000, 0.720, 0.300},
-    [168] = {0.050, 0.575, 1.000},
-    [172] = {1.000, 0.197, 0.265},
-    [324] = {0.282, 0.203, 1.000},
-    [331] = {0.832, 1.000, 0.291},
-    [339] = {1.000, 0.754, 0.300},
-    [348] = {1.000, 0.088, 0.050},
-    [355] = {1.000, 0.050, 0.205},
-    [370] = {1.000, 0.518, 0.340},
-    [403] = {0.050, 0.145, 1.000},
-    [408] = {1.000, 0.598, 0.340},
-    [421] = {0.094, 0.597, 1.000},
-    [465] = {0.178, 0.618, 1.000},
-    [467] = {1.000, 0.784, 0.300},
-    [469] = {1.000, 0.602, 0.340},
-    [498] = {1.000, 0.698, 0.171},
-    [526] = {0.829, 1.000, 0.247},
-    [527] = {0.466, 0.300, 1.000},
-    [528] = {0.167, 0.526, 1.000},
-    [543] = {1.000, 0.683, 0.300},
-    [546] = {0.300, 0.827, 1.000},
-    [552] = {0.692, 0.300, 1.000},
-    [556] = {0.956, 0.300, 1.000},
-    [585] = {1.000, 0.633, 0.340},
-    [586] = {0.110, 0.671, 1.000},
-    [588] = {1.000, 0.705, 0.191},
-    [589] = {1.000, 0.879, 0.050},
-    [596] = {1.000, 0.879, 0.300},
-    [603] = {0.050, 1.000, 0.121},
-    [604] = {0.300, 1.000, 0.909},
-    [605] = {1.000, 0.629, 0.340},
-    [633] = {1.000, 0.591, 0.340},
-    [635] = {1.000, 0.763, 0.300},
-    [642] = {1.000, 0.613, 0.340},
-    [676] = {1.000, 0.713, 0.198},
-    [686] = {0.807, 0.124, 1.000},
-    [687] = {1.000, 0.079, 0.081},
-    [688] = {0.391, 1.000, 0.300},
-    [689] = {0.379, 1.000, 0.102},
-    [691] = {1.000, 0.225, 0.142},
-    [693] = {0.777, 0.077, 1.000},
-    [694] = {1.000, 0.589, 0.340},
-    [697] = {0.339, 0.050, 1.000},
-    [698] = {0.742, 0.300, 1.000},
-    [702] = {0.575, 1.000, 0.274},
-    [704] = {1.000, 0.686, 0.234},
-    [706] = {1.000, 0.079, 0.081},
-    [710] = {0.488, 1.000, 0.169},
-    [712] = {1.000, 0.355, 0.300},
-    [724] = {1.000, 0.753, 0.203},
-    [740] = {0.300, 0.419, 1.000},
-    [759] = {0.288, 1.000, 0.050},
-    [768] = {0.050, 0.933, 1.000},
-    [770] = {1.000, 0.112, 0.964},
-    [772] = {1.000, 0.067, 0.050},
-    [774] = {0.966, 0.106, 1.000},
-    [779] = {1.000, 0.683, 0.257},
-    [781] = {0.300, 0.658, 1.000},
-    [783] = {0.147, 0.391, 1.000},
-    [845] = {0.833, 1.000, 0.220},
-    [853] = {1.000, 0.608, 0.340},
-    [871] = {1.000, 0.675, 0.340},
-    [879] = {1.000, 0.676, 0.327},
-    [883] = {1.000, 0.685, 0.300},
-    [974] = {1.000, 0.793, 0.300},
-    [976] = {1.000, 0.050, 0.910},
-    [980] = {1.000, 0.383, 0.165},
-    [1008] = {1.000, 0.300, 0.666},
-    [1022] = {1.000, 0.794, 0.300},
-    [1038] = {1.000, 0.740, 0.300},
-    [1044] = {1.000, 0.548, 0.340},
-    [1064] = {0.253, 1.000, 0.847},
-    [1066] = {0.050, 0.239, 1.000},
-    [1079] = {1.000, 0.190, 0.050},
-    [1098] = {0.446, 0.277, 1.000},
-    [1120] = {0.300, 0.826, 1.000},
-    [1122] = {1.000, 0.962, 0.127},
-    [1126] = {1.000, 0.295, 0.984},
-    [1130] = {1.000, 0.051, 0.050},
-    [1152] = {1.000, 0.697, 0.300},
-    [1160] = {1.000, 0.953, 0.300},
-    [1161] = {1.000, 0.613, 0.340},
-    [1243] = {0.300, 0.596, 1.000},
-    [1329] = {0.127, 0.375, 1.000},
-    [1454] = {0.536, 0.050, 1.000},
-    [1459] = {0.050, 0.288, 1.000},
-    [1462] = {1.000, 0.522, 0.340},
-    [1463] = {0.055, 0.354, 1.000},
-    [1464] = {0.300, 0.329, 1.000},
-    [1490] = {0.498, 0.068, 1.000},
-    [1495] = {1.000, 0.741, 0.300},
-    [1499] = {0.449, 0.297, 1.000},
-    [1510] = {1.000, 0.077, 0.074},
-    [1513] = {0.154, 0.925, 1.000},
-    [1535] = {1.000, 0.764, 0.050},
-    [1543] = {1.000, 0.087, 0.272},
-    [1680] = {0.300, 0.778, 1.000},
-    [1706] = {1.000, 0.591, 0.340},
-    [1714] = {1.000, 0.106, 0.050},
-    [1715] = {1.000, 0.603, 0.340},
-    [1719] = {1.000, 0.182, 0.106},
-    [1725] = {0.746, 0.300, 1.000},
-    [1752] = {0.625, 0.050, 1.000},
-    [1766] = {1.000, 0.800, 0.300},
-    [1776] = {1.000, 0.067, 0.050},
-    [1784] = {1.000, 0.679, 0.306},
-    [1833] = {0.300, 0.581, 1.000},
-    [1850] = {0.134, 1.000, 0.162},
-    [1856] = {0.300, 0.595, 1.000},
-    [1943] = {1.000, 0.050, 0.051},
-    [1949] = {1.000, 0.285, 0.050},
-    [1953] = {0.454, 0.300, 1.000},
-    [1966] = {0.300, 0.658, 1.000},
-    [1978] = {1.000, 0.755, 0.300},
-    [2006] = {0.300, 0.697, 1.000},
-    [2050] = {1.000, 0.300, 0.365},
-    [2054] = {1.000, 0.689, 0.216},
-    [2060] = {1.000, 0.581, 0.340},
-    [2061] = {1.000, 0.300, 0.666},
-    [2062] = {1.000, 0.617, 0.340},
-    [2094] = {1.000, 0.679, 0.305},
-    [2098] = {1.000, 0.065, 0.051},
-    [2120] = {1.000, 0.147, 0.050},
-    [2136] = {1.000, 0.624, 0.340},
-    [2139] = {0.390, 0.300, 1.000},
-    [2457] = {1.000, 0.164, 0.112},
-    [2458] = {0.300, 0.920, 1.000},
-    [2484] = {1.000, 0.688, 0.300},
-    [2565] = {1.000, 0.736, 0.300},
-    [2637] = {1.000, 0.600, 0.340},
-    [2641] = {0.790, 0.188, 1.000},
-    [2643] = {1.000, 0.069, 0.967},
-    [2645] = {0.790, 0.188, 1.000},
-    [2651] = {0.300, 0.441, 1.000},
-    [2652] = {0.270, 1.000, 0.621},
-    [2687] = {1.000, 0.144, 0.050},
-    [2812] = {1.000, 0.704, 0.164},
-    [2823] = {0.364, 1.000, 0.182},
-    [2825] = {1.000, 0.123, 0.050},
-    [2870] = {0.688, 0.286, 1.000},
-    [2878] = {0.402, 1.000, 0.211},
-    [2894] = {1.000, 0.599, 0.340},
-    [2912] = {0.720, 0.300, 1.000},
-    [2944] = {0.728, 0.300, 1.000},
-    [2948] = {1.000, 0.918, 0.188},
-    [2973] = {0.050, 0.358, 1.000},
-    [2974] = {1.000, 0.871, 0.300},
-    [2983] = {1.000, 0.050, 0.134},
-    [3044] = {0.991, 1.000, 0.220},
-    [3045] = {1.000, 0.050, 0.051},
-    [3355] = {0.449, 0.297, 1.000},
-    [3408] = {1.000, 0.300, 0.831},
-    [3409] = {1.000, 0.300, 0.831},
-    [3411] = {1.000, 0.868, 0.109},
-    [3552] = {0.178, 1.000, 0.117},
-    [3599] = {1.000, 0.682, 0.277},
-    [3738] = {1.000, 0.937, 0.300},
-    [4987] = {1.000, 0.720, 0.300},
-    [5116] = {0.154, 0.771, 1.000},
-    [5118] = {1.000, 0.764, 0.250},
-    [5138] = {0.116, 0.753, 1.000},
-    [5143] = {0.603, 0.300, 1.000},
-    [5171] = {1.000, 0.694, 0.158},
-    [5176] = {0.300, 1.000, 0.909},
-    [5185] = {0.232, 1.000, 0.295},
-    [5209] = {1.000, 0.059, 0.069},
-    [5211] = {1.000, 0.703, 0.300},
-    [5215] = {0.685, 0.300, 1.000},
-    [5246] = {0.570, 0.086, 1.000},
-    [5277] = {1.000, 0.685, 0.243},
-    [5308] = {1.000, 0.240, 0.187},
-    [5384] = {0.187, 1.000, 0.947},
-    [5394] = {0.243, 0.752, 1.000},
-    [5484] = {1.000, 0.117, 0.050},
-    [5487] = {0.300, 0.976, 1.000},
-    [5530] = {0.154, 0.771, 1.000},
-    [5570] = {0.830, 1.000, 0.300},
-    [5675] = {0.651, 0.263, 1.000},
-    [5676] = {1.000, 0.918, 0.188},
-    [5697] = {0.300, 0.780, 1.000},
-    [5730] = {1.000, 0.683, 0.263},
-    [5740] = {1.000, 0.144, 0.050},
-    [5761] = {0.692, 0.300, 1.000},
-    [5782] = {0.819, 0.060, 1.000},
-    [5938] = {0.338, 1.000, 0.292},
-    [6117] = {0.300, 0.444, 1.000},
-    [6143] = {0.300, 0.861, 1.000},
-    [6150] = {1.000, 0.120, 0.050},
-    [6201] = {0.960, 1.000, 0.300},
-    [6229] = {1.000, 0.050, 0.910},
-    [6343] = {0.195, 0.664, 1.000},
-    [6346] = {1.000, 0.704, 0.164},
-    [6353] = {1.000, 0.613, 0.340},
-    [6358] = {1.000, 0.679, 0.305},
-    [6495] = {0.050, 1.000, 0.051},
-    [6552] = {1.000, 0.662, 0.340},
-    [6572] = {1.000, 0.676, 0.333},
-    [6673] = {1.000, 0.608, 0.340},
-    [6770] = {1.000, 0.100, 0.050},
-    [6789] = {0.976, 1.000, 0.300},
-    [6795] = {1.000, 0.522, 0.340},
-    [6807] = {0.356, 0.300, 1.000},
-    [6940] = {1.000, 0.129, 0.135},
-    [7294] = {0.728, 0.300, 1.000},
-    [7302] = {0.050, 0.575, 1.000},
-    [7384] = {0.050, 0.358, 1.000},
-    [7386] = {1.000, 0.347, 0.300},
-    [7744] = {1.000, 0.872, 0.300},
-    [7812] = {1.000, 0.185, 0.050},
-    [8004] = {0.295, 1.000, 0.436},
-    [8017] = {0.729, 1.000, 0.300},
-    [8024] = {0.413, 0.300, 1.000},
-    [8033] = {0.443, 0.300, 1.000},
-    [8042] = {1.000, 0.780, 0.079},
-    [8050] = {1.000, 0.874, 0.050},
-    [8056] = {0.228, 0.733, 1.000},
-    [8071] = {0.300, 1.000, 0.923},
-    [8075] = {1.000, 0.733, 0.094},
-    [8092] = {1.000, 0.610, 0.340},
-    [8122] = {0.188, 0.408, 1.000},
-    [8129] = {0.117, 0.517, 1.000},
-    [8143] = {1.000, 0.906, 0.205},
-    [8166] = {0.300, 1.000, 0.329},
-    [8170] = {0.300, 0.671, 1.000},
-    [8177] = {0.571, 0.222, 1.000},
-    [8181] = {1.000, 0.306, 0.104},
-    [8184] = {0.300, 0.587, 1.000},
-    [8190] = {1.000, 0.147, 0.050},
-    [8227] = {1.000, 0.268, 0.050},
-    [8232] = {0.473, 1.000, 0.300},
-    [8512] = {0.708, 0.300, 1.000},
-    [8647] = {0.300, 0.343, 1.000},
-    [8679] = {0.646, 1.000, 0.071},
-    [8835] = {0.300, 0.883, 1.000},
-    [8921] = {0.603, 0.300, 1.000},
-    [8936] = {0.588, 1.000, 0.300},
-    [9005] = {0.300, 1.000, 0.678},
-    [9035] = {0.314, 1.000, 0.092},
-    [9484] = {1.000, 0.617, 0.340},
-    [9634] = {0.300, 0.976, 1.000},
-    [10053] = {1.000, 0.636, 0.340},
-    [10054] = {1.000, 0.133, 0.205},
-    [10060] = {1.000, 0.647, 0.340},
-    [10595] = {0.251, 1.000, 0.766},
-    [10797] = {0.720, 0.300, 1.000},
-    [11113] = {1.000, 0.676, 0.327},
-    [11129] = {1.000, 0.764, 0.050},
-    [11426] = {0.218, 0.953, 1.000},
-    [11958] = {0.051, 0.419, 1.000},
-    [12042] = {0.050, 0.145, 1.000},
-    [12043] = {0.050, 0.430, 1.000},
-    [12051] = {1.000, 0.518, 0.340},
-    [12292] = {1.000, 0.075, 0.050},
-    [12294] = {0.300, 0.461, 1.000},
-    [12323] = {1.000, 0.117, 0.050},
-    [12328] = {1.000, 0.694, 0.158},
-    [12472] = {0.113, 0.331, 1.000},
-    [12536] = {0.117, 0.517, 1.000},
-    [12579] = {0.300, 0.699, 1.000},
-    [12654] = {1.000, 0.285, 0.050},
-    [12721] = {1.000, 0.217, 0.198},
-    [12809] = {0.300, 1.000, 0.939},
-    [12970] = {1.000, 0.190, 0.050},
-    [12975] = {1.000, 0.605, 0.340},
-    [13159] = {0.913, 1.000, 0.300},
-    [13161] = {1.000, 0.300, 0.542},
-    [13163] = {1.000, 0.768, 0.088},
-    [13165] = {0.300, 1.000, 0.956},
-    [13219] = {1.000, 0.162, 0.050},
-    [13750] = {1.000, 0.629, 0.340},
-    [13795] = {1.000, 0.874, 0.050},
-    [13809] = {0.145, 0.495, 1.000},
-    [13813] = {1.000, 0.147, 0.050},
-    [13877] = {1.000, 0.589, 0.340},
-    [13896] = {0.625, 0.050, 1.000},
-    [13908] = {1.000, 0.698, 0.171},
-    [14149] = {0.856, 1.000, 0.300},
-    [14177] = {0.218, 0.953, 1.000},
-    [14183] = {0.819, 0.060, 1.000},
-    [14185] = {1.000, 0.050, 0.910},
-    [14204] = {1.000, 0.610, 0.340},
-    [14251] = {1.000, 0.680, 0.289},
-    [14278] = {1.000, 0.535, 0.340},
-    [14743] = {0.454, 0.300, 1.000},
-    [14751] = {0.300, 0.827, 1.000},
-    [14752] = {0.071, 0.763, 1.000},
-    [14914] = {1.000, 0.832, 0.300},
-    [15107] = {0.300, 0.340, 1.000},
-    [15237] = {1.000, 0.685, 0.240},
-    [15258] = {0.728, 0.300, 1.000},
-    [15269] = {0.904, 0.300, 1.000},
-    [15271] = {0.366, 1.000, 0.300},
-    [15286] = {0.197, 0.385, 1.000},
-    [15363] = {1.000, 0.591, 0.340},
-    [15407] = {0.116, 0.753, 1.000},
-    [15473] = {0.256, 1.000, 0.050},
-    [15487] = {1.000, 0.721, 0.300},
-    [16166] = {0.223, 0.262, 1.000},
-    [16188] = {0.300, 1.000, 0.956},
-    [16190] = {0.120, 0.722, 1.000},
-    [16237] = {0.455, 1.000, 0.300},
-    [16246] = {0.117, 0.517, 1.000},
-    [16280] = {1.000, 0.190, 0.050},
-    [16491] = {0.391, 1.000, 0.300},
-    [16511] = {1.000, 0.186, 0.098},
-    [16689] = {1.000, 0.621, 0.340},
-    [16864] = {0.300, 1.000, 0.810},
-    [16870] = {0.117, 0.517, 1.000},
-    [16886] = {1.000, 0.694, 0.300},
-    [16914] = {0.473, 1.000, 0.300},
-    [16922] = {0.720, 0.300, 1.000},
-    [16979] = {1.000, 0.554, 0.340},
-    [17116] = {0.300, 1.000, 0.956},
-    [17364] = {0.300, 0.603, 1.000},
-    [17800] = {0.807, 0.124, 1.000},
-    [17862] = {0.300, 0.351, 1.000},
-    [17877] = {0.300, 0.511, 1.000},
-    [17941] = {0.742, 0.300, 1.000},
-    [17962] = {1.000, 0.624, 0.340},
-    [18137] = {0.282, 0.203, 1.000},
-    [18220] = {0.130, 0.604, 1.000},
-    [18223] = {1.000, 0.050, 0.062},
-    [18265] = {0.366, 1.000, 0.300},
-    [18288] = {1.000, 0.973, 0.300},
-    [18499] = {1.000, 0.096, 0.056},
-    [18540] = {0.954, 1.000, 0.050},
-    [18562] = {0.181, 0.666, 1.000},
-    [18708] = {0.050, 1.000, 0.051},
-    [18788] = {0.188, 0.408, 1.000},
-    [18789] = {0.188, 0.408, 1.000},
-    [18790] = {0.188, 0.408, 1.000},
-    [18791] = {0.188, 0.408, 1.000},
-    [18792] = {0.188, 0.408, 1.000},
-    [19028] = {0.904, 0.300, 1.000},
-    [19229] = {1.000, 0.871, 0.300},
-    [19244] = {1.000, 0.255, 0.227},
-    [19263] = {0.300, 0.778, 1.000},
-    [19306] = {1.000, 0.680, 0.289},
-    [19386] = {0.482, 1.000, 0.111},
-    [19410] = {0.154, 0.771, 1.000},
-    [19434] = {0.222, 0.713, 1.000},
-    [19503] = {0.091, 0.201, 1.000},
-    [19505] = {1.000, 0.518, 0.340},
-    [19506] = {1.000, 0.927, 0.300},
-    [19574] = {1.000, 0.094, 0.135},
-    [19577] = {1.000, 0.300, 0.328},
-    [19740] = {1.000, 0.646, 0.340},
-    [19742] = {1.000, 0.788, 0.300},
-    [19746] = {0.439, 0.300, 1.000},
-    [19750] = {1.000, 0.300, 0.666},
-    [19752] = {1.000, 0.690, 0.197},
-    [19801] = {0.806, 0.300, 1.000},
-    [19876] = {0.265, 0.050, 1.000},
-    [19888] = {0.051, 0.419, 1.000},
-    [19891] = {1.000, 0.764, 0.050},
-    [19977] = {1.000, 0.879, 0.300},
-    [20043] = {0.171, 1.000, 0.050},
-    [20055] = {0.300, 0.920, 1.000},
-    [20066] = {0.132, 0.865, 1.000},
-    [20128] = {1.000, 0.736, 0.300},
-    [20154] = {0.300, 1.000, 0.939},
-    [20164] = {1.000, 0.768, 0.241},
-    [20165] = {1.000, 0.677, 0.318},
-    [20166] = {0.149, 0.702, 1.000},
-    [20178] = {0.119, 0.085, 1.000},
-    [20216] = {1.000, 0.689, 0.216},
-    [20217] = {0.445, 0.236, 1.000},
-    [20218] = {1.000, 0.599, 0.340},
-    [20230] = {1.000, 0.680, 0.289},
-    [20243] = {0.106, 0.764, 1.000},
-    [20252] = {1.000, 0.050, 0.134},
-    [20271] = {1.000, 0.687, 0.226},
-    [20375] = {1.000, 0.120, 0.050},
-    [20473] = {1.000, 0.832, 0.300},
-    [20484] = {1.000, 0.050, 0.205},
-    [20549] = {1.000, 0.647, 0.340},
-    [20572] = {1.000, 0.619, 0.340},
-    [20577] = {1.000, 0.120, 0.057},
-    [20580] = {0.685, 0.300, 1.000},
-    [20589] = {1.000, 0.871, 0.300},
-    [20594] = {1.000, 0.686, 0.234},
-    [20600] = {1.000, 0.600, 0.340},
-    [20608] = {1.000, 0.050, 0.205},
-    [20911] = {0.282, 0.203, 1.000},
-    [20925] = {1.000, 0.516, 0.340},
-    [21082] = {1.000, 0.633, 0.340},
-    [21562] = {0.225, 1.000, 0.420},
-    [21849] = {1.000, 0.300, 0.975},
-    [22568] = {1.000, 0.094, 0.135},
-    [22812] = {1.000, 0.683, 0.263},
-    [22842] = {1.000, 0.613, 0.340},
-    [22959] = {1.000, 0.918, 0.188},
-    [23028] = {0.086, 0.980, 1.000},
-    [23273] = {0.466, 0.300, 1.000},
-    [23276] = {0.466, 0.300, 1.000},
-    [23694] = {1.000, 0.603, 0.340},
-    [23881] = {1.000, 0.123, 0.050},
-    [23920] = {1.000, 0.818, 0.300},
-    [23922] = {1.000, 0.692, 0.300},
-    [23978] = {0.300, 1.000, 0.435},
-    [23989] = {0.300, 0.840, 1.000},
-    [24275] = {1.000, 0.749, 0.300},
-    [24378] = {1.000, 0.123, 0.050},
-    [24379] = {0.800, 0.792, 0.786},
-    [24398] = {0.300, 0.572, 1.000},
-    [24858] = {0.230, 0.898, 1.000},
-    [25046] = {0.300, 0.592, 1.000},
-    [25780] = {1.000, 0.711, 0.300},
-    [25782] = {1.000, 0.779, 0.265},
-    [25890] = {1.000, 0.816, 0.259},
-    [25894] = {1.000, 0.300, 0.315},
-    [25895] = {1.000, 0.695, 0.145},
-    [25898] = {1.000, 0.696, 0.136},
-    [25899] = {0.300, 0.924, 1.000},
-    [25908] = {0.300, 0.628, 1.000},
-    [26297] = {1.000, 0.208, 0.254},
-    [26573] = {1.000, 0.705, 0.191},
-    [27000] = {1.000, 0.155, 0.185},
-    [27002] = {1.000, 0.278, 0.050},
-    [27003] = {1.000, 0.110, 0.050},
-    [27011] = {1.000, 0.112, 0.964},
-    [27101] = {0.200, 1.000, 0.252},
-    [27243] = {0.726, 0.213, 1.000},
-    [27681] = {0.050, 0.743, 1.000},
-    [27683] = {0.582, 0.050, 1.000},
-    [27813] = {1.000, 0.389, 0.300},
-    [27827] = {1.000, 0.581, 0.340},
-    [28176] = {0.054, 1.000, 0.269},
-    [28730] = {0.300, 0.592, 1.000},
-    [28734] = {0.238, 0.344, 1.000},
-    [28880] = {1.000, 0.948, 0.050},
-    [29063] = {0.050, 0.662, 1.000},
-    [29166] = {0.050, 0.145, 1.000},
-    [29178] = {1.000, 0.300, 0.568},
-    [29203] = {1.000, 0.924, 0.300},
-    [29722] = {1.000, 0.682, 0.274},
-    [29801] = {1.000, 0.584, 0.340},
-    [29841] = {1.000, 0.300, 0.570},
-    [29858] = {0.312, 0.218, 1.000},
-    [30070] = {1.000, 0.169, 0.145},
-    [30108] = {1.000, 0.518, 0.340},
-    [30146] = {1.000, 0.214, 0.147},
-    [30283] = {0.196, 0.073, 1.000},
-    [30300] = {1.000, 0.149, 0.050},
-    [30451] = {0.450, 0.219, 1.000},
-    [30482] = {1.000, 0.267, 0.050},
-    [30706] = {1.000, 0.517, 0.340},
-    [30807] = {1.000, 0.703, 0.282},
-    [30823] = {1.000, 0.171, 0.128},
-    [31125] = {0.154, 0.771, 1.000},
-    [31224] = {0.573, 0.202, 1.000},
-    [31238] = {0.149, 1.000, 0.548},
-    [31589] = {1.000, 0.617, 0.340},
-    [31643] = {1.000, 0.684, 0.248},
-    [31661] = {1.000, 0.125, 0.050},
-    [31687] = {0.300, 1.000, 0.567},
-    [31789] = {1.000, 0.685, 0.244},
-    [31801] = {1.000, 0.896, 0.300},
-    [31834] = {1.000, 0.953, 0.089},
-    [31842] = {1.000, 0.589, 0.340},
-    [31884] = {1.000, 0.698, 0.300},
-    [31892] = {1.000, 0.763, 0.144},
-    [31935] = {1.000, 0.736, 0.220},
-    [32182] = {1.000, 0.269, 0.078},
-    [32391] = {0.300, 0.476, 1.000},
-    [32546] = {1.000, 0.797, 0.153},
-    [32548] = {0.794, 1.000, 0.300},
-    [32676] = {0.300, 0.962, 1.000},
-    [32996] = {1.000, 0.927, 0.090},
-    [33076] = {1.000, 0.830, 0.300},
-    [33154] = {1.000, 0.946, 0.300},
-    [33206] = {0.457, 0.300, 1.000},
-    [33697] = {1.000, 0.619, 0.340},
-    [33702] = {1.000, 0.619, 0.340},
-    [33745] = {1.000, 0.271, 0.303},
-    [33763] = {0.226, 1.000, 0.438},
-    [33831] = {1.000, 0.300, 0.707},
-    [33891] = {0.050, 0.507, 1.000},
-    [33983] = {1.000, 0.098, 0.066},
-    [33987] = {1.000, 0.098, 0.066},
-    [34026] = {1.000, 0.523, 0.340},
-    [34074] = {0.348, 0.292, 1.000},
-    [34120] = {1.000, 0.838, 0.300},
-    [34428] = {1.000, 0.522, 0.340},
-    [34433] = {0.469, 0.268, 1.000},
-    [34456] = {0.428, 0.050, 1.000},
-    [34471] = {0.073, 0.945, 1.000},
-    [34477] = {0.300, 0.942, 1.000},
-    [34490] = {0.834, 0.300, 1.000},
-    [34501] = {0.149, 1.000, 0.548},
-    [34510] = {1.000, 0.693, 0.179},
-    [34709] = {1.000, 0.602, 0.340},
-    [34754] = {1.000, 0.844, 0.274},
-    [34837] = {1.000, 0.161, 0.768},
-    [34861] = {1.000, 0.787, 0.197},
-    [34914] = {0.058, 0.645, 1.000},
-    [34939] = {1.000, 0.305, 0.082},
-    [35099] = {1.000, 0.300, 0.374},
-    [35395] = {1.000, 0.839, 0.300},
-    [35475] = {1.000, 0.600, 0.340},
-    [35476] = {1.000, 0.662, 0.340},
-    [35477] = {1.000, 0.805, 0.300},
-    [35701] = {0.188, 0.408, 1.000},
-    [36554] = {0.300, 0.340, 1.000},
-    [36936] = {0.696, 1.000, 0.050},
-    [42292] = {0.466, 0.300, 1.000},
-    [43339] = {1.000, 0.346, 0.109},
-    [44046] = {1.000, 0.579, 0.340},
-    [45182] = {0.568, 1.000, 0.300},
-    [45242] = {1.000, 0.428, 0.300},
-    [45283] = {0.848, 1.000, 0.300},
-    [45438] = {0.188, 0.670, 1.000},
-    [48108] = {1.000, 0.643, 0.340},
-    [351355] = {1.000, 0.662, 0.340},
-    [351359] = {1.000, 0.805, 0.300},
-    [351360] = {1.000, 0.600, 0.340},
-    [398196] = {1.000, 0.682, 0.271},
-    [399956] = {0.127, 0.375, 1.000},
-    [399963] = {0.508, 1.000, 0.070},
-    [399985] = {0.834, 0.300, 1.000},
-    [399986] = {1.000, 0.069, 0.967},
-    [400009] = {1.000, 0.678, 0.315},
-    [400012] = {0.294, 0.372, 1.000},
-    [400029] = {0.300, 0.340, 1.000},
-    [400573] = {0.450, 0.219, 1.000},
-    [400574] = {0.450, 0.219, 1.000},
-    [400589] = {0.967, 0.123, 1.000},
-    [400610] = {0.275, 0.155, 1.000},
-    [400613] = {1.000, 0.786, 0.157},
-    [400640] = {0.300, 0.707, 1.000},
-    [400647] = {0.300, 0.562, 1.000},
-    [400730] = {0.300, 0.344, 1.000},
-    [401417] = {1.000, 0.300, 0.965},
-    [401462] = {1.000, 0.730, 0.124},
-    [401502] = {0.113, 0.656, 1.000},
-    [401556] = {1.000, 0.623, 0.340},
-    [401859] = {1.000, 0.830, 0.300},
-    [401937] = {1.000, 0.797, 0.153},
-    [401946] = {1.000, 0.787, 0.197},
-    [401955] = {1.000, 0.927, 0.090},
-    [401977] = {0.469, 0.268, 1.000},
-    [402004] = {0.457, 0.300, 1.000},
-    [402174] = {1.000, 0.949, 0.300},
-    [402668] = {0.058, 0.645, 1.000},
-    [402789] = {0.300, 0.369, 1.000},
-    [402799] = {0.269, 0.196, 1.000},
-    [402911] = {1.000, 0.741, 0.300},
-    [402913] = {1.000, 0.300, 0.570},
-    [402927] = {1.000, 0.522, 0.340},
-    [403195] = {0.106, 0.764, 1.000},
-    [403215] = {1.000, 0.602, 0.340},
-    [403228] = {0.796, 0.794, 0.800},
-    [403338] = {1.000, 0.868, 0.109},
-    [403501] = {0.758, 0.081, 1.000},
-    [403619] = {0.054, 1.000, 0.269},
-    [403628] = {0.726, 0.300, 1.000},
-    [403629] = {0.668, 1.000, 0.202},
-    [403666] = {1.000, 0.147, 0.050},
-    [403668] = {1.000, 0.186, 0.098},
-    [403789] = {0.636, 0.300, 1.000},
-    [407613] = {1.000, 0.685, 0.246},
-    [407624] = {1.000, 0.698, 0.118},
-    [407631] = {1.000, 0.885, 0.300},
-    [407632] = {1.000, 0.740, 0.300},
-    [407669] = {1.000, 0.736, 0.220},
-    [407676] = {1.000, 0.839, 0.300},
-    [407778] = {1.000, 0.696, 0.232},
-    [407788] = {1.000, 0.698, 0.300},
-    [407798] = {1.000, 0.763, 0.144},
-    [407988] = {1.000, 0.616, 0.340},
-    [407995] = {1.000, 0.098, 0.066},
-    [408024] = {1.000, 0.529, 0.340},
-    [408120] = {0.392, 1.000, 0.288},
-    [408247] = {1.000, 0.300, 0.855},
-    [408250] = {1.000, 0.666, 0.340},
-    [408255] = {0.050, 0.851, 1.000},
-    [408339] = {1.000, 0.764, 0.050},
-    [408490] = {1.000, 0.227, 0.088},
-    [408505] = {0.501, 0.300, 1.000},
-    [408507] = {1.000, 0.167, 0.053},
-    [408510] = {0.300, 0.572, 1.000},
-    [408514] = {1.000, 0.793, 0.300},
-    [408521] = {0.123, 0.867, 1.000},
-    [409240] = {1.000, 0.050, 0.707},
-    [409433] = {0.802, 0.050, 1.000},
-    [409507] = {0.149, 1.000, 0.548},
-    [409552] = {1.000, 0.688, 0.217},
-    [409593] = {1.000, 0.050, 0.065},
-    [409824] = {0.226, 1.000, 0.438},
-    [410176] = {1.000, 0.969, 0.300},
-    [412019] = {1.000, 0.821, 0.189},
-    [412096] = {1.000, 0.108, 0.298},
-    [412510] = {1.000, 0.300, 0.947},
-    [412513] = {1.000, 0.702, 0.300},
-    [412532] = {0.184, 0.663, 1.000},
-    [412758] = {1.000, 0.682, 0.274},
-    [412789] = {1.000, 0.613, 0.340},
-    [412798] = {0.636, 0.300, 1.000},
-    [412800] = {0.636, 0.300, 1.000},
-    [413247] = {0.050, 0.618, 1.000},
-    [413259] = {0.498, 0.300, 1.000},
-    [413399] = {0.941, 1.000, 0.168},
-    [414644] = {1.000, 0.271, 0.303},
-    [414689] = {1.000, 0.278, 0.050},
-    [414800] = {1.000, 0.684, 0.249},
-    [415105] = {1.000, 0.161, 0.050},
-    [415236] = {0.300, 0.419, 1.000},
-    [415320] = {1.000, 0.300, 0.570},
-    [415358] = {1.000, 0.843, 0.300},
-    [415413] = {1.000, 0.052, 0.050},
-    [415423] = {0.348, 0.292, 1.000},
-    [417141] = {1.000, 0.702, 0.300},
-    [417149] = {1.000, 0.240, 0.421},
-    [417157] = {0.674, 0.161, 1.000},
-    [424785] = {1.000, 0.756, 0.300},
-    [424919] = {1.000, 0.295, 0.937},
-    [425012] = {0.777, 1.000, 0.050},
-    [425096] = {0.752, 0.300, 1.000},
-    [425121] = {0.113, 0.331, 1.000},
-    [425124] = {0.990, 0.300, 1.000},
-    [425204] = {0.821, 0.130, 1.000},
-    [425207] = {1.000, 0.834, 0.300},
-    [425266] = {1.000, 0.470, 0.300},
-    [425284] = {0.300, 0.831, 1.000},
-    [425294] = {0.773, 0.081, 1.000},
-    [425336] = {1.000, 0.171, 0.128},
-    [425339] = {1.000, 0.630, 0.340},
-    [425463] = {0.423, 1.000, 0.091},
-    [425464] = {1.000, 0.594, 0.340},
-    [425600] = {1.000, 0.789, 0.300},
-    [425609] = {1.000, 0.684, 0.256},
-    [425711] = {0.554, 0.248, 1.000},
-    [426195] = {1.000, 0.341, 0.145},
-    [426303] = {1.000, 0.351, 0.249},
-    [426311] = {1.000, 0.322, 0.253},
-    [426320] = {0.954, 0.300, 1.000},
-    [426490] = {1.000, 0.300, 0.712},
-    [426940] = {1.000, 0.584, 0.340},
-    [426969] = {1.000, 0.912, 0.201},
-    [427714] = {1.000, 0.587, 0.340},
-    [427717] = {1.000, 0.518, 0.340},
-    [427726] = {0.796, 1.000, 0.075},
-    [427733] = {1.000, 0.214, 0.147},
-    [428726] = {1.000, 0.687, 0.218},
-    [428739] = {0.300, 0.794, 1.000},
-    [428741] = {1.000, 0.267, 0.050},
-    [428861] = {0.334, 0.300, 1.000},
-    [428878] = {1.000, 0.617, 0.340},
-    [428885] = {0.050, 0.421, 1.000},
-    [428912] = {1.000, 0.953, 0.089},
-    [429765] = {0.052, 0.655, 1.000},
-    [431622] = {1.000, 0.763, 0.157},
-    [431655] = {0.611, 0.050, 1.000},
-    [431666] = {1.000, 0.946, 0.300},
-    [431681] = {0.496, 0.300, 1.000},
-    [432042] = {0.085, 0.669, 1.000},
-    [436516] = {0.300, 0.450, 1.000},
-    [436564] = {1.000, 0.779, 0.300},
-    [437009] = {1.000, 0.577, 0.340},
-    [437123] = {1.000, 0.838, 0.300},
-    [438040] = {1.000, 0.567, 0.340},
-    [439733] = {0.050, 0.507, 1.000},
-    [439748] = {0.300, 0.317, 1.000},
-    [440114] = {1.000, 0.209, 0.091},
-    [440488] = {1.000, 0.703, 0.300},
-    [440580] = {0.300, 0.846, 1.000},
-    [440658] = {1.000, 0.833, 0.120},
-    [440802] = {0.300, 0.848, 1.000},
-    [440873] = {1.000, 0.613, 0.340},
-    [440882] = {1.000, 0.203, 0.113},
-    [458479] = {0.482, 1.000, 0.111},
-    [458856] = {1.000, 0.946, 0.300},
-    [461475] = {1.000, 0.120, 0.050},
-    [461607] = {1.000, 0.681, 0.280},
-    [462707] = {1.000, 0.524, 0.340},
-    [462853] = {1.000, 0.129, 0.135},
-    [469145] = {0.300, 0.954, 1.000},
+    [10] = 0x437DFF,
+    [17] = 0xFF8857,
+    [53] = 0xFF3732,
+    [71] = 0xFFB24C,
+    [72] = 0xFFA757,
+    [78] = 0xFF8D57,
+    [99] = 0xFFC11E,
+    [100] = 0xFF0D0D,
+    [116] = 0x4C58FF,
+    [118] = 0xFF9457,
+    [120] = 0x4CACFF,
+    [122] = 0x237EFF,
+    [126] = 0xFF9A57,
+    [130] = 0xFF8957,
+    [131] = 0x4CC7FF,
+    [132] = 0x0E5AFF,
+    [133] = 0xFF410D,
+    [136] = 0xFFAF3E,
+    [139] = 0xFFB84C,
+    [168] = 0x0D93FF,
+    [172] = 0xFF3244,
+    [324] = 0x4834FF,
+    [331] = 0xD4FF4A,
+    [339] = 0xFFC04C,
+    [348] = 0xFF160D,
+    [355] = 0xFF0D34,
+    [370] = 0xFF8457,
+    [403] = 0x0D25FF,
+    [408] = 0xFF9857,
+    [421] = 0x1898FF,
+    [465] = 0x2D9EFF,
+    [467] = 0xFFC84C,
+    [469] = 0xFF9A57,
+    [498] = 0xFFB22C,
+    [526] = 0xD3FF3F,
+    [527] = 0x774CFF,
+    [528] = 0x2B86FF,
+    [543] = 0xFFAE4C,
+    [546] = 0x4CD3FF,
+    [552] = 0xB04CFF,
+    [556] = 0xF44CFF,
+    [585] = 0xFFA157,
+    [586] = 0x1CABFF,
+    [588] = 0xFFB431,
+    [589] = 0xFFE00D,
+    [596] = 0xFFE04C,
+    [603] = 0x0DFF1F,
+    [604] = 0x4CFFE8,
+    [605] = 0xFFA057,
+    [633] = 0xFF9757,
+    [635] = 0xFFC34C,
+    [642] = 0xFF9C57,
+    [676] = 0xFFB632,
+    [686] = 0xCE20FF,
+    [687] = 0xFF1415,
+    [688] = 0x64FF4C,
+    [689] = 0x61FF1A,
+    [691] = 0xFF3924,
+    [693] = 0xC614FF,
+    [694] = 0xFF9657,
+    [697] = 0x560DFF,
+    [698] = 0xBD4CFF,
+    [702] = 0x93FF46,
+    [704] = 0xFFAF3C,
+    [706] = 0xFF1415,
+    [710] = 0x7CFF2B,
+    [712] = 0xFF5B4C,
+    [724] = 0xFFC034,
+    [740] = 0x4C6BFF,
+    [759] = 0x49FF0D,
+    [768] = 0x0DEEFF,
+    [770] = 0xFF1DF6,
+    [772] = 0xFF110D,
+    [774] = 0xF61BFF,
+    [779] = 0xFFAE42,
+    [781] = 0x4CA8FF,
+    [783] = 0x2564FF,
+    [845] = 0xD4FF38,
+    [853] = 0xFF9B57,
+    [871] = 0xFFAC57,
+    [879] = 0xFFAC53,
+    [883] = 0xFFAF4C,
+    [974] = 0xFFCA4C,
+    [976] = 0xFF0DE8,
+    [980] = 0xFF622A,
+    [1008] = 0xFF4CAA,
+    [1022] = 0xFFCA4C,
+    [1038] = 0xFFBD4C,
+    [1044] = 0xFF8C57,
+    [1064] = 0x41FFD8,
+    [1066] = 0x0D3DFF,
+    [1079] = 0xFF300D,
+    [1098] = 0x7247FF,
+    [1120] = 0x4CD3FF,
+    [1122] = 0xFFF520,
+    [1126] = 0xFF4BFB,
+    [1130] = 0xFF0D0D,
+    [1152] = 0xFFB24C,
+    [1160] = 0xFFF34C,
+    [1161] = 0xFF9C57,
+    [1243] = 0x4C98FF,
+    [1329] = 0x2060FF,
+    [1454] = 0x890DFF,
+    [1459] = 0x0D49FF,
+    [1462] = 0xFF8557,
+    [1463] = 0x0E5AFF,
+    [1464] = 0x4C54FF,
+    [1490] = 0x7F11FF,
+    [1495] = 0xFFBD4C,
+    [1499] = 0x724CFF,
+    [1510] = 0xFF1413,
+    [1513] = 0x27ECFF,
+    [1535] = 0xFFC30D,
+    [1543] = 0xFF1645,
+    [1680] = 0x4CC6FF,
+    [1706] = 0xFF9757,
+    [1714] = 0xFF1B0D,
+    [1715] = 0xFF9A57,
+    [1719] = 0xFF2E1B,
+    [1725] = 0xBE4CFF,
+    [1752] = 0x9F0DFF,
+    [1766] = 0xFFCC4C,
+    [1776] = 0xFF110D,
+    [1784] = 0xFFAD4E,
+    [1833] = 0x4C94FF,
+    [1850] = 0x22FF29,
+    [1856] = 0x4C98FF,
+    [1943] = 0xFF0D0D,
+    [1949] = 0xFF490D,
+    [1953] = 0x744CFF,
+    [1966] = 0x4CA8FF,
+    [1978] = 0xFFC14C,
+    [2006] = 0x4CB2FF,
+    [2050] = 0xFF4C5D,
+    [2054] = 0xFFB037,
+    [2060] = 0xFF9457,
+    [2061] = 0xFF4CAA,
+    [2062] = 0xFF9D57,
+    [2094] = 0xFFAD4E,
+    [2098] = 0xFF110D,
+    [2120] = 0xFF250D,
+    [2136] = 0xFF9F57,
+    [2139] = 0x634CFF,
+    [2457] = 0xFF2A1D,
+    [2458] = 0x4CEBFF,
+    [2484] = 0xFFAF4C,
+    [2565] = 0xFFBC4C,
+    [2637] = 0xFF9957,
+    [2641] = 0xC930FF,
+    [2643] = 0xFF12F7,
+    [2645] = 0xC930FF,
+    [2651] = 0x4C70FF,
+    [2652] = 0x45FF9E,
+    [2687] = 0xFF250D,
+    [2812] = 0xFFB42A,
+    [2823] = 0x5DFF2E,
+    [2825] = 0xFF1F0D,
+    [2870] = 0xAF49FF,
+    [2878] = 0x67FF36,
+    [2894] = 0xFF9957,
+    [2912] = 0xB84CFF,
+    [2944] = 0xBA4CFF,
+    [2948] = 0xFFEA30,
+    [2973] = 0x0D5BFF,
+    [2974] = 0xFFDE4C,
+    [2983] = 0xFF0D22,
+    [3044] = 0xFDFF38,
+    [3045] = 0xFF0D0D,
+    [3355] = 0x724CFF,
+    [3408] = 0xFF4CD4,
+    [3409] = 0xFF4CD4,
+    [3411] = 0xFFDD1C,
+    [3552] = 0x2DFF1E,
+    [3599] = 0xFFAE47,
+    [3738] = 0xFFEF4C,
+    [4987] = 0xFFB84C,
+    [5116] = 0x27C5FF,
+    [5118] = 0xFFC340,
+    [5138] = 0x1EC0FF,
+    [5143] = 0x9A4CFF,
+    [5171] = 0xFFB128,
+    [5176] = 0x4CFFE8,
+    [5185] = 0x3BFF4B,
+    [5209] = 0xFF0F12,
+    [5211] = 0xFFB34C,
+    [5215] = 0xAF4CFF,
+    [5246] = 0x9116FF,
+    [5277] = 0xFFAF3E,
+    [5308] = 0xFF3D30,
+    [5384] = 0x30FFF1,
+    [5394] = 0x3EC0FF,
+    [5484] = 0xFF1E0D,
+    [5487] = 0x4CF9FF,
+    [5530] = 0x27C5FF,
+    [5570] = 0xD4FF4C,
+    [5675] = 0xA643FF,
+    [5676] = 0xFFEA30,
+    [5697] = 0x4CC7FF,
+    [5730] = 0xFFAE43,
+    [5740] = 0xFF250D,
+    [5761] = 0xB04CFF,
+    [5782] = 0xD10FFF,
+    [5938] = 0x56FF4A,
+    [6117] = 0x4C71FF,
+    [6143] = 0x4CDCFF,
+    [6150] = 0xFF1F0D,
+    [6201] = 0xF5FF4C,
+    [6229] = 0xFF0DE8,
+    [6343] = 0x32A9FF,
+    [6346] = 0xFFB42A,
+    [6353] = 0xFF9C57,
+    [6358] = 0xFFAD4E,
+    [6495] = 0x0DFF0D,
+    [6552] = 0xFFA957,
+    [6572] = 0xFFAC55,
+    [6673] = 0xFF9B57,
+    [6770] = 0xFF1A0D,
+    [6789] = 0xF9FF4C,
+    [6795] = 0xFF8557,
+    [6807] = 0x5B4CFF,
+    [6940] = 0xFF2122,
+    [7294] = 0xBA4CFF,
+    [7302] = 0x0D93FF,
+    [7384] = 0x0D5BFF,
+    [7386] = 0xFF584C,
+    [7744] = 0xFFDE4C,
+    [7812] = 0xFF2F0D,
+    [8004] = 0x4BFF6F,
+    [8017] = 0xBAFF4C,
+    [8024] = 0x694CFF,
+    [8033] = 0x714CFF,
+    [8042] = 0xFFC714,
+    [8050] = 0xFFDF0D,
+    [8056] = 0x3ABBFF,
+    [8071] = 0x4CFFEB,
+    [8075] = 0xFFBB18,
+    [8092] = 0xFF9C57,
+    [8122] = 0x3068FF,
+    [8129] = 0x1E84FF,
+    [8143] = 0xFFE734,
+    [8166] = 0x4CFF54,
+    [8170] = 0x4CABFF,
+    [8177] = 0x9239FF,
+    [8181] = 0xFF4E1B,
+    [8184] = 0x4C96FF,
+    [8190] = 0xFF250D,
+    [8227] = 0xFF440D,
+    [8232] = 0x79FF4C,
+    [8512] = 0xB54CFF,
+    [8647] = 0x4C57FF,
+    [8679] = 0xA5FF12,
+    [8835] = 0x4CE1FF,
+    [8921] = 0x9A4CFF,
+    [8936] = 0x96FF4C,
+    [9005] = 0x4CFFAD,
+    [9035] = 0x50FF17,
+    [9484] = 0xFF9D57,
+    [9634] = 0x4CF9FF,
+    [10053] = 0xFFA257,
+    [10054] = 0xFF2234,
+    [10060] = 0xFFA557,
+    [10595] = 0x40FFC3,
+    [10797] = 0xB84CFF,
+    [11113] = 0xFFAC53,
+    [11129] = 0xFFC30D,
+    [11426] = 0x38F3FF,
+    [11958] = 0x0D6BFF,
+    [12042] = 0x0D25FF,
+    [12043] = 0x0D6EFF,
+    [12051] = 0xFF8457,
+    [12292] = 0xFF130D,
+    [12294] = 0x4C76FF,
+    [12323] = 0xFF1E0D,
+    [12328] = 0xFFB128,
+    [12472] = 0x1D54FF,
+    [12536] = 0x1E84FF,
+    [12579] = 0x4CB2FF,
+    [12654] = 0xFF490D,
+    [12721] = 0xFF3732,
+    [12809] = 0x4CFFEF,
+    [12970] = 0xFF300D,
+    [12975] = 0xFF9A57,
+    [13159] = 0xE9FF4C,
+    [13161] = 0xFF4C8A,
+    [13163] = 0xFFC416,
+    [13165] = 0x4CFFF4,
+    [13219] = 0xFF290D,
+    [13750] = 0xFFA057,
+    [13795] = 0xFFDF0D,
+    [13809] = 0x257EFF,
+    [13813] = 0xFF250D,
+    [13877] = 0xFF9657,
+    [13896] = 0x9F0DFF,
+    [13908] = 0xFFB22C,
+    [14149] = 0xDAFF4C,
+    [14177] = 0x38F3FF,
+    [14183] = 0xD10FFF,
+    [14185] = 0xFF0DE8,
+    [14204] = 0xFF9C57,
+    [14251] = 0xFFAD4A,
+    [14278] = 0xFF8857,
+    [14743] = 0x744CFF,
+    [14751] = 0x4CD3FF,
+    [14752] = 0x12C3FF,
+    [14914] = 0xFFD44C,
+    [15107] = 0x4C57FF,
+    [15237] = 0xFFAF3D,
+    [15258] = 0xBA4CFF,
+    [15269] = 0xE74CFF,
+    [15271] = 0x5DFF4C,
+    [15286] = 0x3262FF,
+    [15363] = 0xFF9757,
+    [15407] = 0x1EC0FF,
+    [15473] = 0x41FF0D,
+    [15487] = 0xFFB84C,
+    [16166] = 0x3943FF,
+    [16188] = 0x4CFFF4,
+    [16190] = 0x1FB8FF,
+    [16237] = 0x74FF4C,
+    [16246] = 0x1E84FF,
+    [16280] = 0xFF300D,
+    [16491] = 0x64FF4C,
+    [16511] = 0xFF2F19,
+    [16689] = 0xFF9E57,
+    [16864] = 0x4CFFCF,
+    [16870] = 0x1E84FF,
+    [16886] = 0xFFB14C,
+    [16914] = 0x79FF4C,
+    [16922] = 0xB84CFF,
+    [16979] = 0xFF8D57,
+    [17116] = 0x4CFFF4,
+    [17364] = 0x4C9AFF,
+    [17800] = 0xCE20FF,
+    [17862] = 0x4C5AFF,
+    [17877] = 0x4C82FF,
+    [17941] = 0xBD4CFF,
+    [17962] = 0xFF9F57,
+    [18137] = 0x4834FF,
+    [18220] = 0x219AFF,
+    [18223] = 0xFF0D10,
+    [18265] = 0x5DFF4C,
+    [18288] = 0xFFF84C,
+    [18499] = 0xFF180E,
+    [18540] = 0xF3FF0D,
+    [18562] = 0x2EAAFF,
+    [18708] = 0x0DFF0D,
+    [18788] = 0x3068FF,
+    [18789] = 0x3068FF,
+    [18790] = 0x3068FF,
+    [18791] = 0x3068FF,
+    [18792] = 0x3068FF,
+    [19028] = 0xE74CFF,
+    [19229] = 0xFFDE4C,
+    [19244] = 0xFF413A,
+    [19263] = 0x4CC6FF,
+    [19306] = 0xFFAD4A,
+    [19386] = 0x7BFF1C,
+    [19410] = 0x27C5FF,
+    [19434] = 0x39B6FF,
+    [19503] = 0x1733FF,
+    [19505] = 0xFF8457,
+    [19506] = 0xFFEC4C,
+    [19574] = 0xFF1822,
+    [19577] = 0xFF4C54,
+    [19740] = 0xFFA557,
+    [19742] = 0xFFC94C,
+    [19746] = 0x704CFF,
+    [19750] = 0xFF4CAA,
+    [19752] = 0xFFB032,
+    [19801] = 0xCE4CFF,
+    [19876] = 0x440DFF,
+    [19888] = 0x0D6BFF,
+    [19891] = 0xFFC30D,
+    [19977] = 0xFFE04C,
+    [20043] = 0x2CFF0D,
+    [20055] = 0x4CEBFF,
+    [20066] = 0x22DDFF,
+    [20128] = 0xFFBC4C,
+    [20154] = 0x4CFFEF,
+    [20164] = 0xFFC43D,
+    [20165] = 0xFFAD51,
+    [20166] = 0x26B3FF,
+    [20178] = 0x1E16FF,
+    [20216] = 0xFFB037,
+    [20217] = 0x713CFF,
+    [20218] = 0xFF9957,
+    [20230] = 0xFFAD4A,
+    [20243] = 0x1BC3FF,
+    [20252] = 0xFF0D22,
+    [20271] = 0xFFAF3A,
+    [20375] = 0xFF1F0D,
+    [20473] = 0xFFD44C,
+    [20484] = 0xFF0D34,
+    [20549] = 0xFFA557,
+    [20572] = 0xFF9E57,
+    [20577] = 0xFF1F0F,
+    [20580] = 0xAF4CFF,
+    [20589] = 0xFFDE4C,
+    [20594] = 0xFFAF3C,
+    [20600] = 0xFF9957,
+    [20608] = 0xFF0D34,
+    [20911] = 0x4834FF,
+    [20925] = 0xFF8457,
+    [21082] = 0xFFA157,
+    [21562] = 0x39FF6B,
+    [21849] = 0xFF4CF9,
+    [22568] = 0xFF1822,
+    [22812] = 0xFFAE43,
+    [22842] = 0xFF9C57,
+    [22959] = 0xFFEA30,
+    [23028] = 0x16FAFF,
+    [23273] = 0x774CFF,
+    [23276] = 0x774CFF,
+    [23694] = 0xFF9A57,
+    [23881] = 0xFF1F0D,
+    [23920] = 0xFFD14C,
+    [23922] = 0xFFB04C,
+    [23978] = 0x4CFF6F,
+    [23989] = 0x4CD6FF,
+    [24275] = 0xFFBF4C,
+    [24378] = 0xFF1F0D,
+    [24379] = 0xCCCAC8,
+    [24398] = 0x4C92FF,
+    [24858] = 0x3BE5FF,
+    [25046] = 0x4C97FF,
+    [25780] = 0xFFB54C,
+    [25782] = 0xFFC744,
+    [25890] = 0xFFD042,
+    [25894] = 0xFF4C50,
+    [25895] = 0xFFB125,
+    [25898] = 0xFFB123,
+    [25899] = 0x4CECFF,
+    [25908] = 0x4CA0FF,
+    [26297] = 0xFF3541,
+    [26573] = 0xFFB431,
+    [27000] = 0xFF282F,
+    [27002] = 0xFF470D,
+    [27003] = 0xFF1C0D,
+    [27011] = 0xFF1DF6,
+    [27101] = 0x33FF40,
+    [27243] = 0xB936FF,
+    [27681] = 0x0DBDFF,
+    [27683] = 0x940DFF,
+    [27813] = 0xFF634C,
+    [27827] = 0xFF9457,
+    [28176] = 0x0EFF45,
+    [28730] = 0x4C97FF,
+    [28734] = 0x3D58FF,
+    [28880] = 0xFFF20D,
+    [29063] = 0x0DA9FF,
+    [29166] = 0x0D25FF,
+    [29178] = 0xFF4C91,
+    [29203] = 0xFFEC4C,
+    [29722] = 0xFFAE46,
+    [29801] = 0xFF9557,
+    [29841] = 0xFF4C91,
+    [29858] = 0x5038FF,
+    [30070] = 0xFF2B25,
+    [30108] = 0xFF8457,
+    [30146] = 0xFF3725,
+    [30283] = 0x3213FF,
+    [30300] = 0xFF260D,
+    [30451] = 0x7338FF,
+    [30482] = 0xFF440D,
+    [30706] = 0xFF8457,
+    [30807] = 0xFFB348,
+    [30823] = 0xFF2C21,
+    [31125] = 0x27C5FF,
+    [31224] = 0x9234FF,
+    [31238] = 0x26FF8C,
+    [31589] = 0xFF9D57,
+    [31643] = 0xFFAE3F,
+    [31661] = 0xFF200D,
+    [31687] = 0x4CFF91,
+    [31789] = 0xFFAF3E,
+    [31801] = 0xFFE44C,
+    [31834] = 0xFFF317,
+    [31842] = 0xFF9657,
+    [31884] = 0xFFB24C,
+    [31892] = 0xFFC325,
+    [31935] = 0xFFBC38,
+    [32182] = 0xFF4514,
+    [32391] = 0x4C79FF,
+    [32546] = 0xFFCB27,
+    [32548] = 0xCAFF4C,
+    [32676] = 0x4CF5FF,
+    [32996] = 0xFFEC17,
+    [33076] = 0xFFD44C,
+    [33154] = 0xFFF14C,
+    [33206] = 0x754CFF,
+    [33697] = 0xFF9E57,
+    [33702] = 0xFF9E57,
+    [33745] = 0xFF454D,
+    [33763] = 0x3AFF70,
+    [33831] = 0xFF4CB4,
+    [33891] = 0x0D81FF,
+    [33983] = 0xFF1911,
+    [33987] = 0xFF1911,
+    [34026] = 0xFF8557,
+    [34074] = 0x594AFF,
+    [34120] = 0xFFD64C,
+    [34428] = 0xFF8557,
+    [34433] = 0x7844FF,
+    [34456] = 0x6D0DFF,
+    [34471] = 0x13F1FF,
+    [34477] = 0x4CF0FF,
+    [34490] = 0xD54CFF,
+    [34501] = 0x26FF8C,
+    [34510] = 0xFFB12E,
+    [34709] = 0xFF9A57,
+    [34754] = 0xFFD746,
+    [34837] = 0xFF29C4,
+    [34861] = 0xFFC932,
+    [34914] = 0x0FA4FF,
+    [34939] = 0xFF4E15,
+    [35099] = 0xFF4C5F,
+    [35395] = 0xFFD64C,
+    [35475] = 0xFF9957,
+    [35476] = 0xFFA957,
+    [35477] = 0xFFCD4C,
+    [35701] = 0x3068FF,
+    [36554] = 0x4C57FF,
+    [36936] = 0xB1FF0D,
+    [42292] = 0x774CFF,
+    [43339] = 0xFF581C,
+    [44046] = 0xFF9457,
+    [45182] = 0x91FF4C,
+    [45242] = 0xFF6D4C,
+    [45283] = 0xD8FF4C,
+    [45438] = 0x30ABFF,
+    [48108] = 0xFFA457,
+    [351355] = 0xFFA957,
+    [351359] = 0xFFCD4C,
+    [351360] = 0xFF9957,
+    [398196] = 0xFFAE45,
+    [399956] = 0x2060FF,
+    [399963] = 0x82FF12,
+    [399985] = 0xD54CFF,
+    [399986] = 0xFF12F7,
+    [400009] = 0xFFAD50,
+    [400012] = 0x4B5FFF,
+    [400029] = 0x4C57FF,
+    [400573] = 0x7338FF,
+    [400574] = 0x7338FF,
+    [400589] = 0xF71FFF,
+    [400610] = 0x4628FF,
+    [400613] = 0xFFC828,
+    [400640] = 0x4CB4FF,
+    [400647] = 0x4C8FFF,
+    [400730] = 0x4C58FF,
+    [401417] = 0xFF4CF6,
+    [401462] = 0xFFBA20,
+    [401502] = 0x1DA7FF,
+    [401556] = 0xFF9F57,
+    [401859] = 0xFFD44C,
+    [401937] = 0xFFCB27,
+    [401946] = 0xFFC932,
+    [401955] = 0xFFEC17,
+    [401977] = 0x7844FF,
+    [402004] = 0x754CFF,
+    [402174] = 0xFFF24C,
+    [402668] = 0x0FA4FF,
+    [402789] = 0x4C5EFF,
+    [402799] = 0x4532FF,
+    [402911] = 0xFFBD4C,
+    [402913] = 0xFF4C91,
+    [402927] = 0xFF8557,
+    [403195] = 0x1BC3FF,
+    [403215] = 0xFF9A57,
+    [403228] = 0xCBCACC,
+    [403338] = 0xFFDD1C,
+    [403501] = 0xC115FF,
+    [403619] = 0x0EFF45,
+    [403628] = 0xB94CFF,
+    [403629] = 0xAAFF34,
+    [403666] = 0xFF250D,
+    [403668] = 0xFF2F19,
+    [403789] = 0xA24CFF,
+    [407613] = 0xFFAF3F,
+    [407624] = 0xFFB21E,
+    [407631] = 0xFFE24C,
+    [407632] = 0xFFBD4C,
+    [407669] = 0xFFBC38,
+    [407676] = 0xFFD64C,
+    [407778] = 0xFFB13B,
+    [407788] = 0xFFB24C,
+    [407798] = 0xFFC325,
+    [407988] = 0xFF9D57,
+    [407995] = 0xFF1911,
+    [408024] = 0xFF8757,
+    [408120] = 0x64FF49,
+    [408247] = 0xFF4CDA,
+    [408250] = 0xFFAA57,
+    [408255] = 0x0DD9FF,
+    [408339] = 0xFFC30D,
+    [408490] = 0xFF3A16,
+    [408505] = 0x804CFF,
+    [408507] = 0xFF2B0E,
+    [408510] = 0x4C92FF,
+    [408514] = 0xFFCA4C,
+    [408521] = 0x1FDDFF,
+    [409240] = 0xFF0DB4,
+    [409433] = 0xCD0DFF,
+    [409507] = 0x26FF8C,
+    [409552] = 0xFFAF37,
+    [409593] = 0xFF0D11,
+    [409824] = 0x3AFF70,
+    [410176] = 0xFFF74C,
+    [412019] = 0xFFD130,
+    [412096] = 0xFF1C4C,
+    [412510] = 0xFF4CF1,
+    [412513] = 0xFFB34C,
+    [412532] = 0x2FA9FF,
+    [412758] = 0xFFAE46,
+    [412789] = 0xFF9C57,
+    [412798] = 0xA24CFF,
+    [412800] = 0xA24CFF,
+    [413247] = 0x0D9EFF,
+    [413259] = 0x7F4CFF,
+    [413399] = 0xF0FF2B,
+    [414644] = 0xFF454D,
+    [414689] = 0xFF470D,
+    [414800] = 0xFFAE3F,
+    [415105] = 0xFF290D,
+    [415236] = 0x4C6BFF,
+    [415320] = 0xFF4C91,
+    [415358] = 0xFFD74C,
+    [415413] = 0xFF0D0D,
+    [415423] = 0x594AFF,
+    [417141] = 0xFFB34C,
+    [417149] = 0xFF3D6B,
+    [417157] = 0xAC29FF,
+    [424785] = 0xFFC14C,
+    [424919] = 0xFF4BEF,
+    [425012] = 0xC6FF0D,
+    [425096] = 0xC04CFF,
+    [425121] = 0x1D54FF,
+    [425124] = 0xFC4CFF,
+    [425204] = 0xD121FF,
+    [425207] = 0xFFD54C,
+    [425266] = 0xFF784C,
+    [425284] = 0x4CD4FF,
+    [425294] = 0xC515FF,
+    [425336] = 0xFF2C21,
+    [425339] = 0xFFA157,
+    [425463] = 0x6CFF17,
+    [425464] = 0xFF9757,
+    [425600] = 0xFFC94C,
+    [425609] = 0xFFAE41,
+    [425711] = 0x8D3FFF,
+    [426195] = 0xFF5725,
+    [426303] = 0xFF5A3F,
+    [426311] = 0xFF5241,
+    [426320] = 0xF34CFF,
+    [426490] = 0xFF4CB6,
+    [426940] = 0xFF9557,
+    [426969] = 0xFFE933,
+    [427714] = 0xFF9657,
+    [427717] = 0xFF8457,
+    [427726] = 0xCBFF13,
+    [427733] = 0xFF3725,
+    [428726] = 0xFFAF38,
+    [428739] = 0x4CCAFF,
+    [428741] = 0xFF440D,
+    [428861] = 0x554CFF,
+    [428878] = 0xFF9D57,
+    [428885] = 0x0D6BFF,
+    [428912] = 0xFFF317,
+    [429765] = 0x0DA7FF,
+    [431622] = 0xFFC328,
+    [431655] = 0x9C0DFF,
+    [431666] = 0xFFF14C,
+    [431681] = 0x7E4CFF,
+    [432042] = 0x16ABFF,
+    [436516] = 0x4C73FF,
+    [436564] = 0xFFC74C,
+    [437009] = 0xFF9357,
+    [437123] = 0xFFD64C,
+    [438040] = 0xFF9157,
+    [439733] = 0x0D81FF,
+    [439748] = 0x4C51FF,
+    [440114] = 0xFF3517,
+    [440488] = 0xFFB34C,
+    [440580] = 0x4CD8FF,
+    [440658] = 0xFFD41F,
+    [440802] = 0x4CD8FF,
+    [440873] = 0xFF9C57,
+    [440882] = 0xFF341D,
+    [458479] = 0x7BFF1C,
+    [458856] = 0xFFF14C,
+    [461475] = 0xFF1F0D,
+    [461607] = 0xFFAE47,
+    [462707] = 0xFF8657,
+    [462853] = 0xFF2122,
+    [469145] = 0x4CF3FF,
 }
@@ -8,17 +8,23 @@ Compares existing LibSpellDB entries against wago.tools CSV data to find:
 3. Abilities that might need triggersAuras added
 
 Usage:
-    python audit_existing.py <SpellName.csv> <Spell.csv> <SpellEffect.csv>
+    python audit_existing.py <SpellName.csv> <Spell.csv> <SpellEffect.csv> [SpellLevels.csv]
+    python audit_existing.py --build <version>   (tables from the local DB2 store)
+
+With SpellLevels, a rank is a spell of the same name with a "Rank N" subtext
+and a learn level; without it the older ID-range heuristics are used.
 """
 
-import csv
 import re
-import os
 from collections import defaultdict
 from pathlib import Path
 
+import db2_store
+import spell_db
+
 # TBC player spell IDs are generally under this threshold
 # NPC/mob versions often have much higher IDs
+# (only used for ranks when SpellLevels is not available, and for triggers)
 MAX_PLAYER_SPELL_ID = 50000
 
 # Spell IDs that are known to be player abilities (for edge cases)
@@ -35,32 +41,20 @@ KNOWN_NPC_SPELL_IDS = {
 
 def load_spell_names(filepath):
     """Load SpellName.csv: ID -> Name"""
-    names = {}
-    with open(filepath, 'r', encoding='utf-8-sig') as f:
-        reader = csv.reader(f)
-        next(reader)  # Skip header
-        for row in reader:
-            if len(row) >= 2:
-                spell_id = int(row[0])
-                name = row[1]
-                names[spell_id] = name
-    return names
+    return dict(db2_store.iter_csv_columns(filepath, (0, 1), (int, str)))
 
 
 def load_spell_data(filepath):
     """Load Spell.csv: ID -> {rank, description, auraDescription}"""
     spells = {}
-    with open(filepath, 'r', encoding='utf-8-sig') as f:
-        reader = csv.reader(f)
-        next(reader)  # Skip header
-        for row in reader:
-            if len(row) >= 4:
-                spell_id = int(row[0])
-                spells[spell_id] = {
-                    'rank': row[1],  # NameSubtext_lang (e.g., "Rank 1")
-                    'description': row[2],
-                    'auraDescription': row[3],
-                }
+    # NameSubtext_lang (e.g., "Rank 1"), Description_lang, AuraDescription_lang
+    for spell_id, rank, description, aura_description in db2_store.iter_csv_columns(
+            filepath, (0, 1, 2, 3), (int, str, str, str)):
+        spells[spell_id] = {
+            'rank': rank,
+            'description': description,
+            'auraDescription': aura_description,
+        }
     return spells
 
 
@@ -68,29 +62,68 @@ def load_spell_effects(filepath):
     """Load SpellEffect.csv and extract trigger mappings"""
     triggers = defaultdict(list)  # source_spell_id -> [triggered_spell_ids]
     
-    with open(filepath, 'r', encoding='utf-8-sig') as f:
-        reader = csv.reader(f)
-        header = next(reader)
-        
-        # Find column indices
-        trigger_idx = header.index('EffectTriggerSpell') if 'EffectTriggerSpell' in header else 18
-        spell_id_idx = header.index('SpellID') if 'SpellID' in header else -1
-        
-        for row in reader:
-            if len(row) > max(trigger_idx, spell_id_idx):
-                try:
-                    source_spell_id = int(row[spell_id_idx])
-                    triggered_spell_id = int(row[trigger_idx])
-                    
-                    if triggered_spell_id > 0 and triggered_spell_id != source_spell_id:
-                        if triggered_spell_id not in triggers[source_spell_id]:
-                            triggers[source_spell_id].append(triggered_spell_id)
-                except (ValueError, IndexError):
-                    continue
+    header = db2_store.csv_header(filepath)
+    columns = ('SpellID' if 'SpellID' in header else -1,
+               'EffectTriggerSpell' if 'EffectTriggerSpell' in header else 18)
+    
+    for source_spell_id, triggered_spell_id in db2_store.iter_csv_columns(filepath, columns, (int, int)):
+        if triggered_spell_id > 0 and triggered_spell_id != source_spell_id:
+            if triggered_spell_id not in triggers[source_spell_id]:
+                triggers[source_spell_id].append(triggered_spell_id)
     
     return triggers
 
 
+def load_spell_levels(filepath):
+    """Load SpellLevels.csv: SpellID -> (BaseLevel, SpellLevel, MaxLevel)"""
+    levels = {}
+    for spell_id, base_level, spell_level, max_level in db2_store.iter_csv_columns(
+            filepath, ('SpellID', 'BaseLevel', 'SpellLevel', 'MaxLevel'), (int, int, int, int)):
+        levels.setdefault(spell_id, (base_level, spell_level, max_level))
+    return levels
+
+
+def load_from_store(build):
+    """Load the same three tables from the build-pinned DB2 store, downloading
+    any that have not been ingested for this build yet."""
+    store = db2_store.Db2Store(build)
+    try:
+        store.ensure('SpellName')
+        names = {int(spell_id): str(name)
+                 for spell_id, name in store.rows('SpellName', store.columns('SpellName')[:2])}
+
+        store.ensure('Spell')
+        spells = {}
+        for spell_id, rank, description, aura_description in store.rows('Spell', store.columns('Spell')[:4]):
+            spells[int(spell_id)] = {
+                'rank': str(rank),
+                'description': str(description),
+                'auraDescription': str(aura_description),
+            }
+
+        triggers = defaultdict(list)
+        for source_spell_id, triggered_spell_id in store.rows('SpellEffect', ('SpellID', 'EffectTriggerSpell')):
+            try:
+                source_spell_id = int(source_spell_id)
+                triggered_spell_id = int(triggered_spell_id)
+            except ValueError:
+                continue
+            if triggered_spell_id > 0 and triggered_spell_id != source_spell_id:
+                if triggered_spell_id not in triggers[source_spell_id]:
+                    triggers[source_spell_id].append(triggered_spell_id)
+
+        levels = {}
+        for row in store.rows('SpellLevels', ('SpellID', 'BaseLevel', 'SpellLevel', 'MaxLevel')):
+            try:
+                spell_id, base_level, spell_level, max_level = map(int, row)
+            except ValueError:
+                continue
+            levels.setdefault(spell_id, (base_level, spell_level, max_level))
+    finally:
+        store.close()
+    return names, spells, triggers, levels
+
+
 def parse_rank_number(rank_str):
     """Extract rank number from 'Rank X' string"""
     if not rank_str:
@@ -139,29 +172,60 @@ def is_likely_player_spell(spell_id, spell_data, base_spell_id=None):
     return False
 
 
-def find_player_ranks(spell_names, spell_data, base_name, base_id):
+def normalize_spell_name(name):
+    return name.lower().strip()
+
+
+def build_name_index(spell_names):
+    """Normalized spell name -> all spell IDs with that name.
+
+    Built once per run so every rank family is a single lookup instead of a
+    scan over the whole SpellName table.
+    """
+    index = defaultdict(list)
+    for spell_id, name in spell_names.items():
+        index[normalize_spell_name(name)].append(spell_id)
+    return index
+
+
+def is_player_rank(spell_id, spell_data, spell_levels):
+    """A rank of a player ability: has a "Rank N" subtext and a learn level"""
+    if spell_id in KNOWN_NPC_SPELL_IDS:
+        return False
+    if spell_id in KNOWN_PLAYER_SPELL_IDS:
+        return True
+    if parse_rank_number(spell_data.get(spell_id, {}).get('rank', '')) is None:
+        return False
+    levels = spell_levels.get(spell_id)
+    return levels is not None and max(levels[0], levels[1]) > 0
+
+
+def find_player_ranks(spell_names, spell_data, base_name, base_id, name_index=None, spell_levels=None):
     """Find all player spell IDs that are ranks of the same ability"""
+    if name_index is None:
+        name_index = build_name_index(spell_names)
     matches = []
-    base_name_lower = base_name.lower().strip()
     
-    for spell_id, name in spell_names.items():
-        # Must match name exactly
-        if name.lower().strip() != base_name_lower:
-            continue
-        
+    # Must match name exactly
+    for spell_id in name_index.get(normalize_spell_name(base_name), ()):
         # Must be a likely player spell
-        if not is_likely_player_spell(spell_id, spell_data, base_id):
+        if spell_levels:
+            if not is_player_rank(spell_id, spell_data, spell_levels):
+                continue
+        elif not is_likely_player_spell(spell_id, spell_data, base_id):
             continue
         
         data = spell_data.get(spell_id, {})
         rank_str = data.get('rank', '')
         rank_num = parse_rank_number(rank_str)
+        levels = (spell_levels or {}).get(spell_id)
         
         matches.append({
             'id': spell_id,
-            'name': name,
+            'name': spell_names[spell_id],
             'rank': rank_str,
             'rank_num': rank_num,
+            'level': max(levels[0], levels[1]) if levels else None,
         })
     
     # Sort by rank number (if available) then by ID
@@ -173,6 +237,7 @@ def find_player_ranks(spell_names, spell_data, base_name, base_id):
 def parse_existing_libspelldb(data_dir):
     """Parse existing LibSpellDB Lua files to extract spell definitions"""
     spells_by_class = {}
+    db = spell_db.connect(data_dir=Path(data_dir))
     
     class_files = {
         'Warrior.lua': 'WARRIOR',
@@ -187,59 +252,35 @@ def parse_existing_libspelldb(data_dir):
     }
     
     for filename, class_name in class_files.items():
-        filepath = os.path.join(data_dir, filename)
-        if not os.path.exists(filepath):
+        filepath = Path(data_dir) / filename
+        if not filepath.exists():
             continue
             
         spells_by_class[class_name] = []
-        
-        with open(filepath, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        # Find spell blocks with spellID
-        # Match the whole spell entry more carefully
-        spell_entries = re.findall(
-            r'\{\s*\n\s*spellID\s*=\s*(\d+),.*?(?=\n\s*\{|\n\s*\},\s*"|\Z)',
-            content,
-            re.DOTALL
-        )
-        
-        for entry in spell_entries:
-            if isinstance(entry, tuple):
-                spell_id = int(entry[0])
-                block = entry[1] if len(entry) > 1 else ""
-            else:
-                spell_id = int(entry)
-                # Re-find the full block for this spell
-                block_match = re.search(
-                    rf'\{{\s*\n\s*spellID\s*=\s*{spell_id},(.+?)(?=\n\s*\{{|\n\s*\}},\s*"|\Z)',
-                    content,
-                    re.DOTALL
-                )
-                block = block_match.group(1) if block_match else ""
-            
+
+        # Ranks and triggered auras come from the compiled snapshot (spell_db.py)
+        rows = db.execute(
+            "SELECT id, spell_id, json_type(data, '$.triggersAuras') IS NOT NULL"
+            " FROM spells WHERE file = ? AND spell_id IS NOT NULL ORDER BY line",
+            (filename,),
+        ).fetchall()
+        for row_id, spell_id, has_triggers in rows:
             # Extract ranks
             ranks = [spell_id]
-            ranks_match = re.search(r'ranks\s*=\s*\{([^}]+)\}', block)
-            if ranks_match:
-                for rank_id in re.findall(r'(\d+)', ranks_match.group(1)):
-                    rid = int(rank_id)
-                    if rid not in ranks:
-                        ranks.append(rid)
-            
-            # Check for triggersAuras
-            has_triggers = 'triggersAuras' in block
-            trigger_ids = []
-            if has_triggers:
-                triggers_match = re.search(r'triggersAuras\s*=\s*\{(.+?)\}\s*,?\s*\n\s*\}', block, re.DOTALL)
-                if triggers_match:
-                    for tid in re.findall(r'spellID\s*=\s*(\d+)', triggers_match.group(1)):
-                        trigger_ids.append(int(tid))
-            
+            for (rid,) in db.execute("SELECT spell_id FROM ranks WHERE entry = ? ORDER BY position", (row_id,)):
+                if rid not in ranks:
+                    ranks.append(rid)
+
+            trigger_ids = [
+                aura_id for (aura_id,) in db.execute(
+                    "SELECT spell_id FROM triggered_auras WHERE entry = ? AND spell_id IS NOT NULL"
+                    " ORDER BY position", (row_id,))
+            ]
+
             spells_by_class[class_name].append({
                 'base_id': spell_id,
                 'ranks': sorted(ranks),
-                'has_triggers': has_triggers,
+                'has_triggers': bool(has_triggers),
                 'trigger_ids': trigger_ids,
             })
     
@@ -249,22 +290,28 @@ def parse_existing_libspelldb(data_dir):
 def main():
     import sys
     
-    if len(sys.argv) < 4:
-        print("Usage: python audit_existing.py <SpellName.csv> <Spell.csv> <SpellEffect.csv>")
+    if len(sys.argv) == 3 and sys.argv[1] == '--build':
+        print(f"Loading spell data for build {sys.argv[2]} from the DB2 store...")
+        spell_names, spell_data, spell_triggers, spell_levels = load_from_store(sys.argv[2])
+    elif len(sys.argv) >= 4:
+        print("Loading spell data...")
+        spell_names = load_spell_names(sys.argv[1])
+        spell_data = load_spell_data(sys.argv[2])
+        spell_triggers = load_spell_effects(sys.argv[3])
+        spell_levels = load_spell_levels(sys.argv[4]) if len(sys.argv) >= 5 else {}
+    else:
+        print("Usage: python audit_existing.py <SpellName.csv> <Spell.csv> <SpellEffect.csv> [SpellLevels.csv]")
+        print("       python audit_existing.py --build <version>")
         sys.exit(1)
     
-    spell_name_file = sys.argv[1]
-    spell_file = sys.argv[2]
-    spell_effect_file = sys.argv[3]
-    
-    print("Loading spell data...")
-    spell_names = load_spell_names(spell_name_file)
-    spell_data = load_spell_data(spell_file)
-    spell_triggers = load_spell_effects(spell_effect_file)
-    
     print(f"Loaded {len(spell_names)} spell names")
     print(f"Loaded {len(spell_data)} spell data entries")
     print(f"Found {len(spell_triggers)} spells with triggers")
+    if spell_levels:
+        print(f"Loaded learn levels for {len(spell_levels)} spells")
+    else:
+        print("No SpellLevels data; falling back to ID-range rank heuristics")
+    name_index = build_name_index(spell_names)
     
     # Find LibSpellDB Data directory
     script_dir = Path(__file__).parent
@@ -303,7 +350,7 @@ def main():
             issues = []
             
             # 1. Check for missing ranks (filtered for player spells only)
-            all_ranks = find_player_ranks(spell_names, spell_data, base_name, base_id)
+            all_ranks = find_player_ranks(spell_names, spell_data, base_name, base_id, name_index, spell_levels)
             all_rank_ids = set(r['id'] for r in all_ranks)
             missing_ranks = all_rank_ids - current_ranks
             
@@ -312,7 +359,10 @@ def main():
                 missing_info = []
                 for r in all_ranks:
                     if r['id'] in missing_ranks:
-                        rank_str = f" ({r['rank']})" if r['rank'] else ""
+                        details = [r['rank']] if r['rank'] else []
+                        if r['level']:
+                            details.append(f"level {r['level']}")
+                        rank_str = f" ({', '.join(details)})" if details else ""
                         missing_info.append(f"{r['id']}{rank_str}")
                 
                 if missing_info:
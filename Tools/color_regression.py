@@ -0,0 +1,332 @@
+#!/usr/bin/env python3
+"""Golden-color regression and throughput benchmark for icon color extraction.
+
+Two corpora:
+
+* A fixed synthetic corpus (``CORPUS``): one icon per case the extractor has
+  to get right, such as warm hues lifted by ``_warm_brighten``, a hue on a bin
+  edge, two competing hues, an edge-fx frame, an achromatic icon, and black or
+  transparent icons. It is drawn with integer arithmetic only, so it is
+  the same on every platform and NumPy version. Its expected colors are
+  committed in ``icon_colors_golden.json``.
+* With ``--icons``, the spells' real icons from an icon source (see
+  icon_source.py). Those are compared with the committed ``Data/SpellColors.lua``,
+  so the report names the spells whose colors moved.
+
+Every extraction path (``EXTRACTORS``: the per-icon reference and the batched
+path) is checked against the goldens. A color that moved more than
+``--tolerance`` (CIEDE2000 delta-E) is listed. Each path is then timed
+(icons/sec) and measured with tracemalloc (peak memory). The exit status is 1
+when a path moves a color beyond the tolerance, when a candidate path's
+output is not bit-identical to the reference's, or when a candidate path is
+not at least ``--min-speedup`` times as fast as the reference: a faster path
+is only acceptable if it is also color-stable.
+
+Examples:
+    python Tools/color_regression.py                     # synthetic goldens + timings
+    python Tools/color_regression.py --icons Tools/icons.pack --repeat 1
+    python Tools/color_regression.py --update            # after an intended change
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable
+
+import numpy as np
+
+import generate_icon_colors as colors
+import icon_source
+import spell_data
+import wowhead_store
+
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+GOLDEN_FILE = SCRIPT_DIR / "icon_colors_golden.json"
+DEFAULT_TOLERANCE = 0.5  # CIEDE2000; ~1.0 is the just-noticeable difference
+SHOW_MOVED = 40
+
+
+# -- synthetic corpus ----------------------------------------------------------
+
+
+@dataclass(frozen=True)
+class IconSpec:
+    subject: tuple[int, int, int]               # disc in the middle of the icon
+    background: tuple[int, int, int] = (24, 20, 28)
+    size: int = 64
+    radius: int = 40                            # percent of half the size
+    offset: tuple[int, int] = (0, 0)            # subject center offset (x, y)
+    noise: int = 24                             # +/- per-pixel hash noise
+    second: tuple[int, int, int] | None = None  # a smaller competing disc
+    ring: tuple[int, int, int] | None = None    # frame reaching past the crop
+    alpha: str = "opaque"                       # "opaque", "corner" or "clear"
+    seed: int = 1
+
+
+CORPUS = {
+    "warm_orange": IconSpec((255, 136, 24)),
+    "gold": IconSpec((236, 184, 44)),
+    "deep_orange": IconSpec((220, 96, 10)),
+    "red": IconSpec((214, 30, 36)),
+    "green": IconSpec((52, 196, 64)),
+    "blue": IconSpec((40, 96, 232)),
+    "purple": IconSpec((150, 60, 210)),
+    "cyan": IconSpec((36, 200, 214)),
+    "bin_edge": IconSpec((255, 128, 0), noise=0),
+    "two_hues": IconSpec((200, 40, 40), second=(40, 60, 220)),
+    "edge_fx": IconSpec((60, 180, 70), ring=(240, 40, 200)),
+    "off_center": IconSpec((230, 210, 40), radius=30, offset=(14, -12)),
+    "steel": IconSpec((150, 150, 158), background=(70, 70, 74)),
+    "pale": IconSpec((200, 186, 180), background=(180, 176, 172), noise=4),
+    "black": IconSpec((0, 0, 0), background=(0, 0, 0), noise=0),
+    "transparent": IconSpec((200, 40, 40), alpha="clear"),
+    "corner_cut": IconSpec((40, 180, 220), alpha="corner", seed=2),
+    "small_32": IconSpec((220, 60, 140), size=32, seed=3),
+    "odd_56": IconSpec((90, 210, 120), size=56, seed=4),
+}
+
+
+def render(spec: IconSpec):
+    """RGBA uint8 pixels of one synthetic icon (integer arithmetic only)."""
+    n, half = spec.size, spec.size // 2
+    y, x = np.mgrid[0:n, 0:n].astype(np.int64)
+    rgb = np.empty((n, n, 3), np.int64)
+    rgb[:] = spec.background
+    radius = spec.radius * half // 100
+    cx, cy = half + spec.offset[0], half + spec.offset[1]
+    rgb[(x - cx) ** 2 + (y - cy) ** 2 <= radius * radius] = spec.subject
+    if spec.second:
+        small = radius // 2
+        rgb[(x - cx + radius) ** 2 + (y - cy + radius) ** 2 <= small * small] = spec.second
+    if spec.ring:
+        border = np.minimum(np.minimum(x, y), np.minimum(n - 1 - x, n - 1 - y))
+        rgb[border < n // 6] = spec.ring
+    if spec.noise:
+        hashed = ((x * 73856093) ^ (y * 19349663) ^ (spec.seed * 83492791)) & 0xFFFF
+        rgb += (hashed % (2 * spec.noise + 1) - spec.noise)[..., None]
+    alpha = np.full((n, n, 1), 255, np.int64)
+    if spec.alpha == "clear":
+        alpha[:] = 0
+    elif spec.alpha == "corner":
+        alpha[:half, :half] = 0
+    return np.concatenate([np.clip(rgb, 0, 255), alpha], axis=2).astype(np.uint8)
+
+
+# -- delta-E -------------------------------------------------------------------
+
+
+def _lab(rgb: tuple[float, float, float]) -> tuple[float, float, float]:
+    """CIELAB (D65) of an sRGB color in 0-1."""
+    r, g, b = (c / 12.92 if c <= 0.04045 else ((c + 0.055) / 1.055) ** 2.4 for c in rgb)
+    xyz = (
+        (0.4124 * r + 0.3576 * g + 0.1805 * b) / 0.95047,
+        (0.2126 * r + 0.7152 * g + 0.0722 * b) / 1.0,
+        (0.0193 * r + 0.1192 * g + 0.9505 * b) / 1.08883,
+    )
+    fx, fy, fz = (t ** (1 / 3) if t > (6 / 29) ** 3 else t / (3 * (6 / 29) ** 2) + 4 / 29 for t in xyz)
+    return 116 * fy - 16, 500 * (fx - fy), 200 * (fy - fz)
+
+
+def delta_e2000(lab1: tuple[float, float, float], lab2: tuple[float, float, float]) -> float:
+    """CIEDE2000 color difference (Sharma, Wu and Dalal's formulation)."""
+    l1, a1, b1 = lab1
+    l2, a2, b2 = lab2
+    c_bar = (math.hypot(a1, b1) + math.hypot(a2, b2)) / 2
+    g = 0.5 * (1 - math.sqrt(c_bar ** 7 / (c_bar ** 7 + 25 ** 7)))
+    a1p, a2p = a1 * (1 + g), a2 * (1 + g)
+    c1p, c2p = math.hypot(a1p, b1), math.hypot(a2p, b2)
+    h1p = math.degrees(math.atan2(b1, a1p)) % 360 if c1p else 0.0
+    h2p = math.degrees(math.atan2(b2, a2p)) % 360 if c2p else 0.0
+    dl, dc = l2 - l1, c2p - c1p
+    if not c1p * c2p:
+        dh = 0.0
+    elif abs(h2p - h1p) <= 180:
+        dh = h2p - h1p
+    else:
+        dh = h2p - h1p - 360 if h2p > h1p else h2p - h1p + 360
+    dh_big = 2 * math.sqrt(c1p * c2p) * math.sin(math.radians(dh / 2))
+    l_bar, cp_bar = (l1 + l2) / 2, (c1p + c2p) / 2
+    if not c1p * c2p:
+        h_bar = h1p + h2p
+    elif abs(h1p - h2p) <= 180:
+        h_bar = (h1p + h2p) / 2
+    else:
+        h_bar = (h1p + h2p + 360) / 2 if h1p + h2p < 360 else (h1p + h2p - 360) / 2
+    t = (1 - 0.17 * math.cos(math.radians(h_bar - 30)) + 0.24 * math.cos(math.radians(2 * h_bar))
+         + 0.32 * math.cos(math.radians(3 * h_bar + 6)) - 0.20 * math.cos(math.radians(4 * h_bar - 63)))
+    s_l = 1 + 0.015 * (l_bar - 50) ** 2 / math.sqrt(20 + (l_bar - 50) ** 2)
+    s_c = 1 + 0.045 * cp_bar
+    s_h = 1 + 0.015 * cp_bar * t
+    r_t = (-2 * math.sqrt(cp_bar ** 7 / (cp_bar ** 7 + 25 ** 7))
+           * math.sin(math.radians(60 * math.exp(-(((h_bar - 275) / 25) ** 2)))))
+    return math.sqrt((dl / s_l) ** 2 + (dc / s_c) ** 2 + (dh_big / s_h) ** 2
+                     + r_t * (dc / s_c) * (dh_big / s_h))
+
+
+def color_delta(golden, actual) -> float:
+    """delta-E between two colors; a color appearing or vanishing is infinite."""
+    if golden is None or actual is None:
+        return 0.0 if golden is actual else math.inf
+    return delta_e2000(_lab(golden), _lab(actual))
+
+
+# -- corpora -------------------------------------------------------------------
+
+
+@dataclass
+class Corpus:
+    label: str
+    names: list[str]                                   # one per icon, reported
+    load: Callable[[], list]                           # RGBA arrays, decoded
+    golden: dict[str, tuple[float, float, float] | None]
+    spells: dict[str, list[int]]                       # icon -> spells using it
+    exact: bool = True                                 # goldens are unrounded
+
+
+def synthetic_corpus() -> Corpus:
+    golden = {}
+    if GOLDEN_FILE.is_file():
+        document = json.loads(GOLDEN_FILE.read_text(encoding="utf-8"))
+        golden = {name: tuple(color) if color else None for name, color in document["colors"].items()}
+    names = list(CORPUS)
+    return Corpus(f"{len(names)} synthetic icons", names, lambda: [render(CORPUS[name]) for name in names],
+                  golden, {})
+
+
+def spell_corpus(path: Path) -> Corpus:
+    """The DB spells' icons in ``path``, against the committed SpellColors.lua."""
+    spell_ids = sorted({entry.spell_id for name in colors.SPELL_FILES
+                        for entry in spell_data.parse_data_file(colors.DATA_DIR / name).spells()})
+    store = wowhead_store.WowheadStore()
+    store.sync_legacy(colors.CACHE_FILE)
+    icons = store.icons(wowhead_store.LEGACY_BRANCH, spell_ids)
+    store.close()
+    committed = colors.read_spell_colors()
+    source = icon_source.open_source(path)
+    index = source.names()
+    spells: dict[str, list[int]] = {}
+    golden = {}
+    for spell_id, icon in sorted(icons.items()):
+        member = colors.resolve_tga(index, icon)
+        if member is None or spell_id not in committed:
+            continue
+        spells.setdefault(member, []).append(spell_id)
+        # Spells sharing an icon share its color; the first one stands for them.
+        golden.setdefault(member, committed[spell_id])
+    names = sorted(spells)
+    return Corpus(f"{len(names)} icons of {sum(map(len, spells.values()))} spells in {path}", names,
+                  lambda: [source.pixels(member) for member in names], golden, spells, exact=False)
+
+
+EXTRACTORS: dict[str, Callable[[list], list]] = {
+    "per-icon": lambda icons: [colors.extract_color(icon) for icon in icons],
+    "batched": colors.extract_colors,
+}
+REFERENCE = "per-icon"
+
+
+def _rgb255(color) -> str:
+    return "none" if color is None else "({:3d},{:3d},{:3d})".format(*(round(c * 255) for c in color))
+
+
+def deltas(corpus: Corpus, result: list) -> dict[str, float]:
+    """Name -> delta-E from the golden color, for every icon that has one."""
+    return {name: color_delta(corpus.golden[name], color)
+            for name, color in zip(corpus.names, result) if name in corpus.golden}
+
+
+def run(corpus: Corpus, repeat: int, tolerance: float, min_speedup: float) -> int:
+    icons = corpus.load()
+    failures = 0
+    print(f"Golden colors: {corpus.label}, tolerance delta-E00 {tolerance}")
+    if not corpus.golden:
+        print(f"  no goldens recorded; run with --update to write {GOLDEN_FILE.name}")
+        return 1
+    reference = EXTRACTORS[REFERENCE](icons)
+    for path, extract in EXTRACTORS.items():
+        extracted = reference if path == REFERENCE else extract(icons)
+        result = dict(zip(corpus.names, extracted))
+        delta = deltas(corpus, extracted)
+        moved = sorted(((value, name) for name, value in delta.items() if value > tolerance), reverse=True)
+        changed = sum(1 for name in delta if result[name] != corpus.golden[name])
+        print(f"  {path:10s} {len(delta) - len(moved)}/{len(delta)} within tolerance"
+              + (f", {changed} not bit-identical" if corpus.exact else " (goldens quantized to 8 bits per channel)")
+              + f", max delta-E {max(delta.values(), default=0):.3f}")
+        for value, name in moved[:SHOW_MOVED]:
+            who = f" spells {', '.join(map(str, corpus.spells[name][:6]))}" if corpus.spells.get(name) else ""
+            print(f"    {name:32s} {_rgb255(corpus.golden[name])} -> {_rgb255(result[name])}"
+                  f"  delta-E {value:.2f}{who}")
+        if len(moved) > SHOW_MOVED:
+            print(f"    ... and {len(moved) - SHOW_MOVED} more")
+        failures += bool(moved)
+        # Every other path must reproduce the reference bit for bit, on any corpus.
+        differ = [name for name, a, b in zip(corpus.names, extracted, reference) if a != b]
+        if differ:
+            print(f"    REJECTED: {len(differ)} color(s) differ from {REFERENCE}, e.g. {', '.join(differ[:SHOW_MOVED])}")
+            failures += 1
+
+    workload = icons * repeat
+    print(f"Performance: {len(icons)} icons x {repeat}")
+    speeds = {}
+    for path, extract in EXTRACTORS.items():
+        extract(icons[:8])  # warm caches (center weights, imports)
+        start = time.perf_counter()
+        extract(workload)
+        speeds[path] = len(workload) / (time.perf_counter() - start)
+        tracemalloc.start()
+        extract(icons)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        verdict = ""
+        if path != REFERENCE:
+            speedup = speeds[path] / speeds[REFERENCE]
+            slow = speedup < min_speedup
+            failures += slow
+            verdict = f"  {speedup:4.2f}x {'REJECTED: not faster' if slow else 'ok'}"
+        print(f"  {path:10s} {speeds[path]:8.0f} icons/s  peak {peak / 1024:8.1f} KiB for {len(icons)} icons{verdict}")
+    return 1 if failures else 0
+
+
+def update_goldens() -> None:
+    names = list(CORPUS)
+    result = EXTRACTORS[REFERENCE]([render(CORPUS[name]) for name in names])
+    document = {
+        "note": "Expected extract_color output for color_regression.CORPUS; rewrite with --update.",
+        "params": colors.color_params_key(),
+        "colors": {name: None if color is None else list(color) for name, color in zip(names, result)},
+    }
+    GOLDEN_FILE.write_text(json.dumps(document, indent=2) + "\n", encoding="utf-8")
+    print(f"Wrote {len(names)} golden colors to {GOLDEN_FILE}")
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--icons", type=Path, help="check the spells' real icons against Data/SpellColors.lua")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE, help="largest accepted delta-E00")
+    parser.add_argument("--repeat", type=int, default=40, help="passes over the corpus when timing")
+    parser.add_argument("--min-speedup", type=float, default=1.0,
+                        help="required icons/sec ratio of each candidate path over the reference")
+    parser.add_argument("--update", action="store_true", help="rewrite the synthetic goldens")
+    args = parser.parse_args(argv)
+
+    if args.update:
+        update_goldens()
+        return 0
+    try:
+        corpus = spell_corpus(args.icons) if args.icons else synthetic_corpus()
+    except icon_source.IconSourceError as error:
+        print(error, file=sys.stderr)
+        return 2
+    return run(corpus, max(1, args.repeat), args.tolerance, args.min_speedup)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,469 @@
+#!/usr/bin/env python3
+"""Build-pinned local store for Wago DB2 exports.
+
+Wago builds are immutable, so a DB2 table only has to be downloaded (or
+hand-exported) once per build. Each build gets one SQLite file under
+Tools/.cache/db2/<build>.sqlite holding every ingested table with its CSV
+columns, indexed on ``ID`` and ``SpellID``. ``WagoClient`` (wowhead_audit.py),
+``audit_existing.py`` and ``parse_spell_triggers.py`` all read from it, so
+repeat runs against the same build need no download and no CSV parse, and
+work offline once the build's tables are ingested.
+
+Examples:
+    python Tools/db2_store.py --list
+    python Tools/db2_store.py --build 2.5.5.65000 --fetch SpellName,Spell,SpellEffect
+    python Tools/db2_store.py --build 2.5.5.65000 --ingest SpellEffect.csv Spell.csv
+    python Tools/db2_store.py --bench-csv 2000000
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import io
+import json
+import re
+import shutil
+import sqlite3
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from itertools import chain, repeat
+from operator import itemgetter
+from pathlib import Path
+from typing import Callable, Iterable, Iterator, Mapping, Sequence
+
+import http_session
+
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+STORE_DIR = SCRIPT_DIR / ".cache" / "db2"
+WAGO_BUILDS_URL = "https://wago.tools/api/builds"
+WAGO_CSV_URL = "https://wago.tools/db2/{table}/csv?build={build}"
+
+# Columns that hold numbers get NUMERIC affinity, so SQLite stores "123" as an
+# integer; localized strings must stay text even when they look numeric.
+_TEXT_COLUMN = re.compile(r"_lang(?:_\d+)?$|^Name", re.IGNORECASE)
+_INDEXED_COLUMNS = ("ID", "SpellID")
+_BATCH_ROWS = 5000
+_CSV_BLOCK = 1 << 18
+
+
+class StoreError(RuntimeError):
+    pass
+
+
+# Tables may be loaded from several threads at once (WagoClient does), possibly
+# into the same build file: one lock per (file, table) stops duplicate
+# downloads, one per file serializes the SQLite writes.
+_LOCKS: dict[tuple, threading.Lock] = {}
+_LOCKS_GUARD = threading.Lock()
+
+
+def _lock(*key) -> threading.Lock:
+    with _LOCKS_GUARD:
+        return _LOCKS.setdefault(key, threading.Lock())
+
+
+def _quote(identifier: str) -> str:
+    return '"' + identifier.replace('"', '""') + '"'
+
+
+def csv_header(path: Path) -> list[str]:
+    """Column names of a CSV export (BOM stripped)."""
+    with open(path, encoding="utf-8-sig", newline="") as handle:
+        return next(csv.reader(handle), [])
+
+
+def iter_csv_columns(
+    path: Path,
+    columns: Sequence[str | int],
+    types: Sequence[Callable[[str], object]] | None = None,
+    defaults: Mapping[str, object] | None = None,
+) -> Iterator[tuple]:
+    """Stream only ``columns`` (header names or positions) of a CSV export as
+    tuples, converted by ``types`` (default: left as strings). A named column
+    the export lacks is an error unless ``defaults`` gives its value.
+
+    The file is read in blocks of about ``_CSV_BLOCK`` bytes and nothing but
+    the projected values of one block is held at a time, so memory stays flat
+    however large the export is. DB2 exports quote only a few string columns:
+    blocks without quotes are split, projected and converted entirely by
+    C-level ``map`` calls, while blocks with quotes (including multi-line
+    fields) go through ``csv.reader``. Rows that are too short or fail
+    conversion are skipped, as the hand-written loaders always did.
+    """
+    types = list(types) if types is not None else [str] * len(columns)
+    if len(types) != len(columns):
+        raise ValueError("types must match columns")
+    if defaults:
+        header = csv_header(path)
+        absent = {column for column in columns if column in defaults and column not in header}
+        if absent:
+            present = [(column, kind) for column, kind in zip(columns, types) if column not in absent]
+            if not present:
+                raise StoreError(f"{path}: no column(s) {', '.join(map(str, columns))}")
+            rows = iter_csv_columns(path, [column for column, _ in present], [kind for _, kind in present])
+            for row in rows:
+                values = iter(row)
+                yield tuple(defaults[column] if column in absent else next(values) for column in columns)
+            return
+    with open(path, encoding="utf-8-sig", newline="") as handle:
+        header = next(csv.reader([handle.readline()]), [])
+        missing = [column for column in columns if isinstance(column, str) and column not in header]
+        if missing:
+            raise StoreError(f"{path}: no column(s) {', '.join(missing)}")
+        indices = [header.index(column) if isinstance(column, str) else column for column in columns]
+        if len(indices) == 1:
+            single = itemgetter(indices[0])
+            project = lambda fields: (single(fields),)  # noqa: E731
+        else:
+            project = itemgetter(*indices)
+        # A split line keeps its line ending on the last field; int() and
+        # float() ignore it, anything else gets stripped lines.
+        strip_ending = any(kind not in (int, float) for kind in types)
+
+        if all(kind is str for kind in types):
+            def convert(rows):
+                return rows
+        elif all(kind is types[0] for kind in types):
+            def convert(rows, kind=types[0]):
+                return map(tuple, map(map, repeat(kind), rows))
+        else:
+            def convert(rows):
+                return (tuple(kind(value) for kind, value in zip(types, row)) for row in rows)
+
+        def split(lines):
+            if strip_ending:
+                lines = map(str.rstrip, lines, repeat("\r\n"))
+            return map(str.split, lines, repeat(","))
+
+        def careful(block):
+            lines = iter(block)
+            # A quoted field may span lines, taken from the rest of the block
+            # first and then from the file.
+            continuations = chain(lines, iter(handle.readline, ""))
+            for line in lines:
+                if '"' in line:
+                    fields = next(csv.reader(chain((line,), continuations)), None)
+                elif line.isspace() or not line:
+                    continue
+                else:
+                    fields = next(split((line,)))
+                if not fields:
+                    continue
+                try:
+                    yield from convert((project(fields),))
+                except (IndexError, ValueError):
+                    continue
+
+        while True:
+            block = handle.readlines(_CSV_BLOCK)
+            if not block:
+                return
+            if '"' not in "".join(block):
+                try:
+                    rows = list(convert(map(project, split(block))))
+                except (IndexError, ValueError):
+                    pass
+                else:
+                    yield from rows
+                    continue
+            yield from careful(block)
+
+
+def latest_builds(products: Iterable[str], *, offline: bool = False, root: Path | None = None) -> dict[str, str]:
+    """Newest Wago build per product.
+
+    The last successful answer is remembered in ``builds.json`` and used when
+    offline (or when the builds API is unreachable), so a previously ingested
+    build keeps working without network access.
+    """
+    root = root or STORE_DIR
+    remembered_path = root / "builds.json"
+    remembered: dict[str, str] = {}
+    if remembered_path.is_file():
+        try:
+            remembered = json.loads(remembered_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            remembered = {}
+    products = list(products)
+    if not offline:
+        try:
+            builds = http_session.shared_session().get(WAGO_BUILDS_URL).json()
+        except (OSError, http_session.HTTPStatusError) as error:
+            if not all(product in remembered for product in products):
+                raise
+            print(f"Wago builds API unavailable ({error}); using last known builds.", file=sys.stderr)
+        else:
+            for product in products:
+                candidates = builds.get(product) or []
+                if not candidates:
+                    raise StoreError(f"Wago returned no builds for {product}")
+                remembered[product] = candidates[0]["version"]
+            try:
+                root.mkdir(parents=True, exist_ok=True)
+                remembered_path.write_text(json.dumps(remembered, indent=2, sort_keys=True), encoding="utf-8")
+            except OSError:
+                pass
+    missing = [product for product in products if product not in remembered]
+    if missing:
+        raise StoreError(f"no known build for {', '.join(missing)} (run once online or pass a build)")
+    return {product: remembered[product] for product in products}
+
+
+class Db2Store:
+    """The ingested DB2 tables of one build."""
+
+    def __init__(self, build: str, root: Path | None = None, *, offline: bool = False):
+        if not re.fullmatch(r"[\w.\-]+", build):
+            raise StoreError(f"invalid build version {build!r}")
+        self.build = build
+        self.offline = offline
+        # "<table> download" / "<table> ingest" -> (start, end) perf_counter times.
+        self.timings: dict[str, tuple[float, float]] = {}
+        self.path = (root or STORE_DIR) / f"{build}.sqlite"
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.connection = sqlite3.connect(self.path, timeout=60)
+        # WAL lets other connections keep reading while a table is ingested.
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute(
+            "CREATE TABLE IF NOT EXISTS db2_tables ("
+            " name TEXT PRIMARY KEY, columns TEXT NOT NULL, rows INTEGER NOT NULL,"
+            " source TEXT NOT NULL, ingested_at TEXT NOT NULL)"
+        )
+
+    def close(self) -> None:
+        self.connection.close()
+
+    def tables(self) -> dict[str, tuple[int, str, str]]:
+        """Ingested table name -> (rows, source, ingested_at)."""
+        return {
+            name: (rows, source, ingested_at)
+            for name, rows, source, ingested_at in self.connection.execute(
+                "SELECT name, rows, source, ingested_at FROM db2_tables ORDER BY name")
+        }
+
+    def has(self, table: str) -> bool:
+        return self.connection.execute("SELECT 1 FROM db2_tables WHERE name = ?", (table,)).fetchone() is not None
+
+    def columns(self, table: str) -> list[str]:
+        row = self.connection.execute("SELECT columns FROM db2_tables WHERE name = ?", (table,)).fetchone()
+        if row is None:
+            raise StoreError(f"{table} is not ingested for build {self.build}")
+        return json.loads(row[0])
+
+    def ingest(self, table: str, lines: Iterable[str], source: str) -> int:
+        """Load a CSV export (any iterable of lines) as ``table``, replacing any
+        previous copy. Rows are streamed in batches inside one transaction, so
+        a failed ingest leaves the previous state untouched."""
+        reader = csv.reader(lines)
+        try:
+            header = next(reader)
+        except StopIteration:
+            raise StoreError(f"{source}: empty CSV") from None
+        if header and header[0].startswith("\ufeff"):
+            header[0] = header[0][1:]
+        quoted = _quote(f"db2_{table}")
+        definitions = ", ".join(
+            f"{_quote(column)} {'TEXT' if _TEXT_COLUMN.search(column) else 'NUMERIC'}" for column in header
+        )
+        insert = f"INSERT INTO {quoted} VALUES ({', '.join('?' * len(header))})"
+        width = len(header)
+        count = 0
+        with self.connection:
+            self.connection.execute(f"DROP TABLE IF EXISTS {quoted}")
+            self.connection.execute(f"CREATE TABLE {quoted} ({definitions})")
+            batch = []
+            for row in reader:
+                if len(row) != width:
+                    row = (row + [""] * width)[:width]
+                batch.append(row)
+                if len(batch) >= _BATCH_ROWS:
+                    self.connection.executemany(insert, batch)
+                    count += len(batch)
+                    batch = []
+            self.connection.executemany(insert, batch)
+            count += len(batch)
+            for column in _INDEXED_COLUMNS:
+                if column in header:
+                    self.connection.execute(
+                        f"CREATE INDEX {_quote(f'db2_{table}_{column}')} ON {quoted} ({_quote(column)})")
+            self.connection.execute(
+                "INSERT OR REPLACE INTO db2_tables VALUES (?, ?, ?, ?, ?)",
+                (table, json.dumps(header), count, source, datetime.now(timezone.utc).isoformat()),
+            )
+        return count
+
+    def ingest_file(self, path: Path, table: str | None = None) -> int:
+        with path.open(encoding="utf-8-sig", newline="") as handle:
+            return self.ingest(table or path.stem, handle, str(path))
+
+    def ensure(self, table: str) -> None:
+        """Download ``table`` from Wago for this build unless already ingested.
+
+        The export is spooled to a temporary file first, so the SQLite write
+        lock is held for the ingest only, not for the whole download.
+        """
+        with _lock(self.path, table):
+            if self.has(table):
+                return
+            if self.offline:
+                raise StoreError(f"{table} for build {self.build} is not ingested and --offline was given")
+            url = WAGO_CSV_URL.format(table=table, build=self.build)
+            with tempfile.TemporaryFile() as spool:
+                started = time.perf_counter()
+                with http_session.shared_session().stream(url) as body:
+                    shutil.copyfileobj(body, spool, _CSV_BLOCK)
+                spool.seek(0)
+                self.timings[f"{table} download"] = (started, time.perf_counter())
+                with _lock(self.path):
+                    ingesting = time.perf_counter()
+                    self.ingest(table, io.TextIOWrapper(spool, encoding="utf-8-sig", newline=""), url)
+                self.timings[f"{table} ingest"] = (ingesting, time.perf_counter())
+
+    def rows(self, table: str, columns: Iterable[str]) -> Iterator[tuple]:
+        """Stream ``columns`` of ``table`` (fetched on first use) as tuples."""
+        self.ensure(table)
+        columns = list(columns)
+        missing = [column for column in columns if column not in self.columns(table)]
+        if missing:
+            raise StoreError(f"{table} for build {self.build} has no column(s) {', '.join(missing)}")
+        selected = ", ".join(_quote(column) for column in columns)
+        return iter(self.connection.execute(f"SELECT {selected} FROM {_quote(f'db2_{table}')}"))
+
+    def spell_names(self) -> dict[int, str]:
+        return {int(spell_id): str(name) for spell_id, name in self.rows("SpellName", ("ID", "Name_lang"))}
+
+    def spell_cooldowns(self) -> dict[int, float]:
+        """SpellID -> cooldown in seconds (the longer of recovery and category recovery)."""
+        result: dict[int, float] = {}
+        for spell_id, recovery, category in self.rows(
+                "SpellCooldowns", ("SpellID", "RecoveryTime", "CategoryRecoveryTime")):
+            milliseconds = max(int(recovery or 0), int(category or 0))
+            if milliseconds:
+                result[int(spell_id)] = milliseconds / 1000
+        return result
+
+
+# Column layout of a Classic SpellEffect export, for the synthetic benchmark.
+_SPELL_EFFECT_HEADER = (
+    "ID,EffectAura,DifficultyID,EffectIndex,Effect,EffectAmplitude,EffectAttributes,EffectAuraPeriod,"
+    "EffectBonusCoefficient,EffectChainAmplitude,EffectChainTargets,EffectItemType,EffectMechanic,"
+    "EffectPointsPerResource,EffectPos_facing,EffectRealPointsPerLevel,EffectTriggerSpell,"
+    "BonusCoefficientFromAP,PvpMultiplier,Coefficient,Variance,ResourceCoefficient,"
+    "GroupSizeBasePointsCoefficient,EffectBasePoints,ScalingClass,EffectMiscValue_0,EffectMiscValue_1,"
+    "EffectRadiusIndex_0,EffectRadiusIndex_1,EffectSpellClassMask_0,EffectSpellClassMask_1,"
+    "EffectSpellClassMask_2,EffectSpellClassMask_3,ImplicitTarget_0,ImplicitTarget_1,SpellID"
+)
+
+
+def _write_synthetic_spell_effect(path: Path, rows: int) -> None:
+    with open(path, "w", encoding="utf-8", newline="") as handle:
+        handle.write(_SPELL_EFFECT_HEADER + "\r\n")
+        for row in range(1, rows + 1):
+            effect = 64 if row % 7 == 0 else 6
+            trigger = row * 3 % 60000 if effect == 64 else 0
+            handle.write(
+                f"{row},{row % 300},0,{row % 3},{effect},0,0,{row % 5 * 1000},0.5,1,0,0,{row % 30},0,0,0,"
+                f"{trigger},0,1,0,0,0,0,{row % 900 - 1},0,{row % 127},0,{row % 40},0,{row},0,0,0,"
+                f"{row % 6},0,{row // 3}\r\n"
+            )
+
+
+def bench_csv(rows: int) -> None:
+    """Time and trace the SpellEffect column read on a synthetic export,
+    against the full-row csv.reader/DictReader loops the loaders used."""
+    columns = ("Effect", "SpellID", "EffectTriggerSpell", "EffectIndex")
+
+    def dict_reader(path: Path) -> Iterator[tuple]:
+        with open(path, encoding="utf-8", newline="") as handle:
+            for row in csv.DictReader(handle):
+                try:
+                    yield tuple(int(row[column]) for column in columns)
+                except (ValueError, KeyError):
+                    continue
+
+    def full_rows(path: Path) -> Iterator[tuple]:
+        with open(path, encoding="utf-8-sig", newline="") as handle:
+            reader = csv.reader(handle)
+            header = next(reader)
+            indices = [header.index(column) for column in columns]
+            for row in reader:
+                try:
+                    yield tuple(int(row[index]) for index in indices)
+                except (ValueError, IndexError):
+                    continue
+
+    def projected(path: Path) -> Iterator[tuple]:
+        return iter_csv_columns(path, columns, (int, int, int, int))
+
+    with tempfile.TemporaryDirectory() as temp:
+        path = Path(temp) / "SpellEffect.csv"
+        _write_synthetic_spell_effect(path, rows)
+        size = path.stat().st_size / 1e6
+        print(f"Synthetic SpellEffect.csv: {rows} rows, {size:.0f} MB")
+        checksums = set()
+        for label, reader in (("csv.DictReader", dict_reader), ("csv.reader full rows", full_rows),
+                              ("iter_csv_columns", projected)):
+            start = time.perf_counter()
+            checksum = count = 0
+            for effect, spell_id, trigger, _index in reader(path):
+                count += 1
+                if effect == 64:
+                    checksum += spell_id ^ trigger
+            elapsed = time.perf_counter() - start
+            checksums.add((count, checksum))
+            tracemalloc.start()
+            for _row in reader(path):
+                pass
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            print(f"  {label:22s} {elapsed:7.2f}s  {count / elapsed:10,.0f} rows/s  peak {peak / 1024:8.1f} KiB")
+        if len(checksums) != 1:
+            raise SystemExit("readers disagree on the synthetic file")
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--build", help="Wago build version, e.g. 2.5.5.65000")
+    parser.add_argument("--fetch", metavar="TABLES", help="comma-separated DB2 tables to download if missing")
+    parser.add_argument("--ingest", nargs="+", type=Path, metavar="CSV",
+                        help="hand-exported CSVs to ingest; the table name is the file stem")
+    parser.add_argument("--list", action="store_true", help="list ingested builds and tables")
+    parser.add_argument("--bench-csv", type=int, metavar="ROWS",
+                        help="benchmark column-projected CSV reads on a synthetic SpellEffect export")
+    args = parser.parse_args(argv)
+
+    if args.bench_csv:
+        bench_csv(args.bench_csv)
+        return 0
+
+    if args.list or not args.build:
+        for path in sorted(STORE_DIR.glob("*.sqlite")):
+            store = Db2Store(path.stem)
+            for name, (rows, source, ingested_at) in store.tables().items():
+                print(f"{store.build:20s} {name:20s} {rows:9d} rows  {ingested_at}  {source}")
+            store.close()
+        return 0
+
+    store = Db2Store(args.build)
+    try:
+        for path in args.ingest or ():
+            print(f"{args.build}: ingested {path.stem} ({store.ingest_file(path)} rows)")
+        for table in filter(None, (args.fetch or "").split(",")):
+            store.ensure(table.strip())
+            print(f"{args.build}: {table.strip()} ({store.tables()[table.strip()][0]} rows)")
+    except (OSError, StoreError, http_session.HTTPStatusError) as error:
+        print(f"ERROR: {error}", file=sys.stderr)
+        return 1
+    finally:
+        store.close()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,43 +1,47 @@
 #!/usr/bin/env python3
 """Fetch Wowhead icon names for any LibSpellDB spell missing from the cache."""
-import json, time, urllib.request, urllib.error, sys
+import sys
+import http_session, wowhead_store
 from generate_icon_colors import parse_spell_ids, SPELL_FILES, DATA_DIR, CACHE_FILE
 
 WOWHEAD_URL = "https://nether.wowhead.com/tbc/tooltip/spell/{}"
+LIMITER = http_session.TokenBucket(1 / 0.15)
 
-def fetch(sid, delay=0.15):
-    url = WOWHEAD_URL.format(sid)
-    for attempt in range(3):
-        try:
-            req = urllib.request.Request(url, headers={"User-Agent": "LibSpellDB-Audit/1.0"})
-            with urllib.request.urlopen(req, timeout=15) as r:
-                d = json.loads(r.read().decode("utf-8"))
-            time.sleep(delay); return d
-        except urllib.error.HTTPError as e:
-            if e.code == 404:
-                time.sleep(delay); return {"error": "not_found", "spell_id": sid}
-            time.sleep(2**(attempt+1))
-        except Exception as e:
-            time.sleep(2**(attempt+1))
+def fetch(sid):
+    # Pooled keep-alive connection; 429/5xx and dropped connections are retried by the session.
+    try:
+        return http_session.shared_session().get(WOWHEAD_URL.format(sid), limiter=LIMITER, retries=2).json()
+    except http_session.HTTPStatusError as e:
+        if e.code == 404:
+            return {"error": "not_found", "spell_id": sid}
+    except Exception:
+        pass
     return {"error": "failed", "spell_id": sid}
 
 def main():
-    cache = json.load(open(CACHE_FILE, encoding="utf-8"))
+    # Responses go into the indexed store one at a time (crash-safe, no
+    # whole-file rewrites); the legacy JSON is written once at the end.
+    store = wowhead_store.WowheadStore()
+    store.sync_legacy(CACHE_FILE)
     ids = set()
     for fn in SPELL_FILES:
         fp = DATA_DIR / fn
         if fp.exists():
             ids.update(parse_spell_ids(fp))
-    missing = [s for s in sorted(ids)
-               if str(s) not in cache or not cache[str(s)].get("icon")]
+    # Missing from the committed JSON (mirrored in the legacy branch), not from
+    # whatever the live audit happens to have stored.
+    icons = store.icons(wowhead_store.LEGACY_BRANCH, ids)
+    missing = [s for s in sorted(ids) if s not in icons]
     print(f"{len(missing)} spells to fetch...")
     for i, sid in enumerate(missing, 1):
         d = fetch(sid)
-        cache[str(sid)] = d
+        store.put("tbc", sid, WOWHEAD_URL.format(sid), d)
         if i % 25 == 0 or i == len(missing):
-            json.dump(cache, open(CACHE_FILE,"w",encoding="utf-8"), indent=2, ensure_ascii=False)
             print(f"  {i}/{len(missing)} (last: {sid} -> {d.get('icon') or d.get('error')})")
-    json.dump(cache, open(CACHE_FILE,"w",encoding="utf-8"), indent=2, ensure_ascii=False)
+    if missing:
+        store.export_legacy(missing, CACHE_FILE)
+    store.close()
+    print(http_session.shared_session().summary())
     print("done")
 
 if __name__ == "__main__":
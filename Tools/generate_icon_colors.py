@@ -3,15 +3,23 @@
 LibSpellDB Icon Color Generator
 
 Extracts a vibrant representative color from each spell's icon and emits a
-Lua table (Data/SpellColors.lua) mapping spellID -> {r, g, b}. VeevHUD's
-Aura Tracker uses this as the default bar fill color (user override wins).
+Lua table (Data/SpellColors.lua) mapping spellID -> packed 0xRRGGBB number,
+each channel quantized to 8 bits; lib:GetSpellColor unpacks it to r, g, b in
+0-1. VeevHUD's Aura Tracker uses this as the default bar fill color (user
+override wins).
 
 Pipeline:
   1. Parse every spellID from the Data/*.lua files.
-  2. Resolve each spellID -> icon name via the Wowhead cache (wowhead_cache.json).
-  3. Decode ICONS/<iconname>.tga (Pillow) and extract a vibrant, center-weighted
+  2. Resolve each spellID -> icon name via the Wowhead response store
+     (Tools/wowhead_store.py, seeded from wowhead_cache.json).
+  3. Decode <iconname>.tga/.blp from the icon source (--icons: the game's
+     ICONS folder, a zip/tar bundle, or the packed Tools/icons.pack; see
+     Tools/icon_source.py) and extract a vibrant, center-weighted
      dominant-hue color (so the subject wins over edge fx / dark borders).
-  4. Write Data/SpellColors.lua.
+     Results are cached in Tools/.cache/icon_colors.json by TGA content hash
+     and extraction parameters; only new or changed icons are decoded, in
+     same-size batches (extract_colors) in parallel across CPU cores.
+  4. Write Data/SpellColors.lua (only if its contents changed).
 
 Color algorithm (tuned against sniff tests — Slice and Dice=orange,
 Enrage=orange, Flurry=red, Blood Craze=green):
@@ -23,18 +31,33 @@ Enrage=orange, Flurry=red, Blood Craze=green):
 Usage:
   python generate_icon_colors.py --report      # coverage + sniff test, no write
   python generate_icon_colors.py --write        # generate Data/SpellColors.lua
+  python generate_icon_colors.py --write --no-color-cache --jobs 1   # from scratch, serially
+  python generate_icon_colors.py --bench-batch 2000   # per-icon vs batched icons/sec
+  python generate_icon_colors.py --icons "<game>/Interface/ICONS" --pack icons.pack   # CI bundle
 """
 
-import argparse, json, os, re, sys
+import argparse, hashlib, inspect, json, os, re, sys, tempfile, time
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 import numpy as np
 from PIL import Image
 
+import icon_source
+import spell_data
+import wowhead_store
+
 SCRIPT_DIR = Path(__file__).parent
 DATA_DIR = SCRIPT_DIR.parent / "Data"
 CACHE_FILE = SCRIPT_DIR / "wowhead_cache.json"
 ICONS_DIR = Path(r"C:\Games\World of Warcraft\_anniversary_\Interface\ICONS")
+ICON_BUNDLE = SCRIPT_DIR / "icons.pack"   # checked-in icons, preferred when present (CI)
 OUT_FILE = DATA_DIR / "SpellColors.lua"
+COLOR_CACHE = SCRIPT_DIR / ".cache" / "icon_colors.json"
+
+# Bump when extract_color changes in a way its default parameters don't show;
+# either invalidates every cached color.
+COLOR_ALGO_VERSION = 1
 
 # Spell-bearing data files: all Data/*.lua except the item/color tables. Globbed
 # (not hard-coded) so new spell files are picked up automatically and stay in
@@ -47,30 +70,59 @@ SPELL_FILES = sorted(f.name for f in DATA_DIR.glob("*.lua") if f.name not in _NO
 # entry so coverage is always complete and the CI coverage check stays fixable.
 FALLBACK_COLOR = (0.6, 0.6, 0.6)
 
-# ─── Lua spellID parsing (depth-tracking, matches wowhead_audit.py) ───────────
+# ─── Lua spellID parsing (shared Tools/spell_data.py parser) ─────────────────
 
 def parse_spell_ids(filepath):
-    ids = []
-    depth = 0
-    for line in open(filepath, encoding="utf-8"):
-        code = line.split("--")[0]
-        m = re.match(r"^(\s+)spellID\s*=\s*(\d+)", line)
-        if m and depth == 2 and len(m.group(1)) == 8:
-            ids.append(int(m.group(2)))
-        depth += code.count("{") - code.count("}")
-    return ids
+    return [entry.spell_id for entry in spell_data.parse_data_file(Path(filepath)).spells()]
+
+# SpellColors.lua stores each color as one 0xRRGGBB integer rather than an
+# {r, g, b} table: in game that is a plain number in the spellID hash instead of
+# a separate table per spell (~112 bytes saved per entry under Lua 5.1).
+# lib:GetSpellColor unpacks it on demand.
+
+def pack_color(rgb):
+    r,g,b = (min(255, max(0, round(c*255))) for c in rgb)
+    return (r << 16) | (g << 8) | b
+
+def unpack_color(value):
+    return ((value >> 16) / 255, ((value >> 8) & 0xFF) / 255, (value & 0xFF) / 255)
+
+def read_spell_colors(path=OUT_FILE):
+    """spellID -> (r, g, b) as committed in Data/SpellColors.lua."""
+    text = path.read_text(encoding="utf-8") if path.exists() else ""
+    return {int(sid): unpack_color(int(value, 16)) for sid, value in
+            re.findall(r"\[(\d+)\]\s*=\s*0x([0-9A-Fa-f]{6})\b", text)}
+
+def render_spell_colors(spell_color):
+    """Data/SpellColors.lua text for spellID -> (r, g, b)."""
+    lines = ["--[[",
+             "    LibSpellDB - Spell Colors",
+             "",
+             "    AUTO-GENERATED by Tools/generate_icon_colors.py — DO NOT EDIT BY HAND.",
+             "    Regenerate with: python Tools/generate_icon_colors.py --write",
+             "",
+             "    A vibrant representative color extracted from each spell's icon, used",
+             "    by consumers (e.g. VeevHUD's Aura Tracker bars) as a sensible default",
+             "    fill color. Keyed by spellID -> 0xRRGGBB (8 bits per channel); read it",
+             "    through lib:GetSpellColor(), which returns r, g, b in 0-1.",
+             "]]",
+             "",
+             'local lib = LIBSPELLDB_REGISTRATION  -- set by Core/LibSpellDB.lua only when this copy won LibStub version selection',
+             "if not lib then return end",
+             "",
+             "lib.spellColors = {"]
+    for sid in sorted(spell_color):
+        lines.append(f"    [{sid}] = 0x{pack_color(spell_color[sid]):06X},")
+    lines.append("}")
+    return "\n".join(lines) + "\n"
 
 # ─── Icon index (case-insensitive) ───────────────────────────────────────────
 
-def build_icon_index():
-    idx = {}
-    for f in os.listdir(ICONS_DIR):
-        if f.lower().endswith(".tga"):
-            idx[f[:-4].lower()] = f
-    return idx
+def default_icon_source():
+    return ICON_BUNDLE if ICON_BUNDLE.exists() else ICONS_DIR
 
 def resolve_tga(icon_index, icon):
-    """Map a Wowhead icon name to a .tga filename, with known fallbacks:
+    """Map a Wowhead icon name to a .tga/.blp file name, with known fallbacks:
     Wowhead prefixes some Classic variants with 'classic_' and renders '&' as '-'."""
     icon = icon.lower()
     if icon in icon_index: return icon_index[icon]
@@ -85,8 +137,12 @@ def resolve_tga(icon_index, icon):
 # ─── Color extraction ────────────────────────────────────────────────────────
 
 def rgb_to_hsv_np(rgb):
-    r,g,b = rgb[:,0],rgb[:,1],rgb[:,2]
-    mx = np.max(rgb,axis=1); mn = np.min(rgb,axis=1); df = mx-mn
+    return hsv_planes(rgb[:,0],rgb[:,1],rgb[:,2])
+
+def hsv_planes(r,g,b):
+    # Elementwise on same-shape channel arrays; pairwise max/min are exact, and
+    # far faster than reducing over a length-3 axis.
+    mx = np.maximum(np.maximum(r,g),b); mn = np.minimum(np.minimum(r,g),b); df = mx-mn
     h = np.zeros_like(mx); nz = df > 1e-6
     idx = nz & (mx==r); h[idx] = ((g[idx]-b[idx])/df[idx]) % 6
     idx = nz & (mx==g) & (mx!=r); h[idx] = ((b[idx]-r[idx])/df[idx]) + 2
@@ -123,17 +179,57 @@ def _warm_brighten(ch, cs, cv, target=0.72, lo_hue=16, hi_hue=68, min_sat=0.66):
             hi = mid
     return hsv_to_rgb(ch, min(max(lo, min_sat), cs), cv)
 
-def extract_color(path, svexp=(1.5,1.0), csigma=0.40, minS=0.12, minV=0.12,
-                  floorS=0.70, capS=0.95, floorV=1.0):
-    img = Image.open(path).convert("RGBA")
-    w,hh = img.size
-    m = int(round(min(w,hh)*0.10))
-    if m: img = img.crop((m,m,w-m,hh-m))
-    arr = np.asarray(img).astype(np.float32)/255.0
-    H,W = arr.shape[0], arr.shape[1]
+HUE_BINS = 36
+BATCH_SIZE = 64   # icons per stacked array (~1 MB of pixels per channel set)
+
+@lru_cache(maxsize=None)
+def _center_weights(H, W, csigma):
+    # Gaussian center weight per pixel; built once per icon size, shared read-only.
     yy,xx = np.mgrid[0:H,0:W].astype(np.float32)
     cy,cx,half = (H-1)/2.0,(W-1)/2.0,(min(H,W)/2.0)
     cw = np.exp(-(((yy-cy)**2+(xx-cx)**2)/(half*half))/(2*csigma*csigma)).reshape(-1)
+    cw.flags.writeable = False
+    return cw
+
+def _cropped(icon):
+    # Icon (a path, or RGBA uint8 pixels from an icon source) as RGBA uint8
+    # with the 10% border cropped off (a view for arrays).
+    arr = icon if isinstance(icon, np.ndarray) else np.asarray(Image.open(icon).convert("RGBA"))
+    hh,w = arr.shape[:2]
+    m = int(round(min(w,hh)*0.10))
+    return arr[m:hh-m, m:w-m] if m else arr
+
+def _load_rgba(icon):
+    # Float32 RGBA in 0-1.
+    return _cropped(icon).astype(np.float32)/255.0
+
+def _neutral_color(rgb, w):
+    # Achromatic icon (steel/grey): keep it neutral and just brighten —
+    # don't fabricate a hue by forcing saturation up.
+    if float(w.sum()) <= 1e-9:
+        return FALLBACK_COLOR  # all-black / zero-weight icon → neutral grey
+    col = np.average(rgb, axis=0, weights=w)
+    ch,cs,cv = rgb_to_hsv_np(col.reshape(1,3))
+    return hsv_to_rgb(float(ch[0]), min(float(cs[0]), 0.18), max(float(cv[0]), 0.80))
+
+def _smoothed_peak(bw, axis=-1):
+    bw = bw + 0.5*np.roll(bw,1,axis=axis) + 0.5*np.roll(bw,-1,axis=axis)
+    return np.argmax(bw, axis=axis)
+
+def _peak_color(rgb, w, floorS, capS, floorV):
+    col = np.average(rgb, axis=0, weights=w)
+    ch,cs,cv = rgb_to_hsv_np(col.reshape(1,3))
+    ch,cs,cv = float(ch[0]), float(cs[0]), float(cv[0])
+    # Vivid + bright finalize: cap over-saturation (reads dark/muddy on warm
+    # hues) and lift value so colors pop on a bar.
+    cs = min(max(cs, floorS), capS); cv = max(cv, floorV)
+    # Warm-hue perceptual brightness correction (orange/gold only).
+    return _warm_brighten(ch, cs, cv)
+
+def extract_color(icon, svexp=(1.5,1.0), csigma=0.40, minS=0.12, minV=0.12,
+                  floorS=0.70, capS=0.95, floorV=1.0):
+    arr = _load_rgba(icon)
+    cw = _center_weights(arr.shape[0], arr.shape[1], csigma)
     rgb = arr[...,:3].reshape(-1,3); a = arr[...,3].reshape(-1)
     keep = a>0.6; rgb = rgb[keep]; cw = cw[keep]
     if len(rgb)==0: return None
@@ -142,29 +238,194 @@ def extract_color(path, svexp=(1.5,1.0), csigma=0.40, minS=0.12, minV=0.12,
     weight = (s**se)*(v**ve)*cw
     mask = (s>minS)&(v>minV)
     if mask.sum() < max(8, 0.02*len(rgb)):
-        # Achromatic icon (steel/grey): keep it neutral and just brighten —
-        # don't fabricate a hue by forcing saturation up.
-        w = (v**2)*cw
-        if float(w.sum()) <= 1e-9:
-            return FALLBACK_COLOR  # all-black / zero-weight icon → neutral grey
-        col = np.average(rgb, axis=0, weights=w)
-        ch,cs,cv = rgb_to_hsv_np(col.reshape(1,3))
-        return hsv_to_rgb(float(ch[0]), min(float(cs[0]), 0.18), max(float(cv[0]), 0.80))
+        return _neutral_color(rgb, (v**2)*cw)
     hm,wm,rgbm = h[mask], weight[mask], rgb[mask]
-    bins=36
+    bins = HUE_BINS
     bi = np.minimum((hm*bins).astype(int), bins-1)
-    bw = np.bincount(bi, weights=wm, minlength=bins)
-    bw = bw + 0.5*np.roll(bw,1) + 0.5*np.roll(bw,-1)
-    peak = int(np.argmax(bw))
+    peak = int(_smoothed_peak(np.bincount(bi, weights=wm, minlength=bins)))
     sel = np.isin(bi, [(peak-1)%bins, peak, (peak+1)%bins])
-    col = np.average(rgbm[sel], axis=0, weights=wm[sel])
-    ch,cs,cv = rgb_to_hsv_np(col.reshape(1,3))
-    ch,cs,cv = float(ch[0]), float(cs[0]), float(cv[0])
-    # Vivid + bright finalize: cap over-saturation (reads dark/muddy on warm
-    # hues) and lift value so colors pop on a bar.
-    cs = min(max(cs, floorS), capS); cv = max(cv, floorV)
-    # Warm-hue perceptual brightness correction (orange/gold only).
-    return _warm_brighten(ch, cs, cv)
+    return _peak_color(rgbm[sel], wm[sel], floorS, capS, floorV)
+
+def extract_colors(icons, svexp=(1.5,1.0), csigma=0.40, minS=0.12, minV=0.12,
+                   floorS=0.70, capS=0.95, floorV=1.0):
+    """extract_color for many icons at once, with bit-identical results.
+
+    Same-size icons are stacked BATCH_SIZE at a time, so HSV conversion,
+    weighting, masking, the per-icon hue histograms (one bincount over
+    icon*bins+bin) and peak selection run as whole-batch array operations.
+    Only the final weighted mean of each icon's peak pixels is taken per icon,
+    through the same np.average call as extract_color: its pairwise float32
+    summation depends on the length of each slice, so a segmented sum would
+    not round identically."""
+    out = [None]*len(icons)
+    by_size = {}
+    for i, icon in enumerate(icons):
+        arr = _cropped(icon)   # uint8 until its chunk, a quarter of the float size
+        by_size.setdefault(arr.shape, []).append((i, arr))
+    bins = HUE_BINS
+    se,ve = svexp
+    for shape, group in by_size.items():
+        cw = _center_weights(shape[0], shape[1], csigma)
+        for start in range(0, len(group), BATCH_SIZE):
+            chunk = group[start:start+BATCH_SIZE]
+            n = len(chunk)
+            stack = (np.stack([arr for _, arr in chunk]).astype(np.float32)/255.0).reshape(n, -1, 4)
+            rgb = stack[...,:3]; keep = stack[...,3]>0.6
+            # Contiguous channel planes: the HSV math runs on n*H*W-long rows.
+            h,s,v = hsv_planes(*np.ascontiguousarray(np.moveaxis(rgb, -1, 0)))
+            weight = (s**se)*(v**ve)*cw
+            mask = keep & (s>minS) & (v>minV)
+            kept = keep.sum(axis=1)
+            neutral = mask.sum(axis=1) < np.maximum(8, 0.02*kept)
+            bi = np.minimum((h*bins).astype(int), bins-1)
+            slot = bi + bins*np.arange(n)[:,None]
+            hist = np.bincount(slot[mask], weights=weight[mask], minlength=n*bins).reshape(n,bins)
+            peak = _smoothed_peak(hist, axis=1)
+            off = (bi - peak[:,None]) % bins
+            sel = mask & ((off <= 1) | (off == bins-1))
+            nw = (v**2)*cw
+            for j, (i, _) in enumerate(chunk):
+                if not kept[j]:
+                    continue
+                if neutral[j]:
+                    out[i] = _neutral_color(rgb[j][keep[j]], nw[j][keep[j]])
+                else:
+                    out[i] = _peak_color(rgb[j][sel[j]], weight[j][sel[j]], floorS, capS, floorV)
+    return out
+
+# ─── Color cache + parallel extraction ───────────────────────────────────────
+
+def color_params_key():
+    defaults = [(fn.__name__, [(n, p.default) for n, p in inspect.signature(fn).parameters.items()
+                               if p.default is not inspect.Parameter.empty])
+                for fn in (extract_color, _warm_brighten)]
+    text = repr((COLOR_ALGO_VERSION, defaults, FALLBACK_COLOR))
+    return hashlib.sha256(text.encode()).hexdigest()[:16]
+
+def load_color_cache(params):
+    try:
+        cached = json.loads(COLOR_CACHE.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if cached.get("params") != params: return {}
+    return {k: (tuple(v) if v else None) for k, v in cached.get("colors", {}).items()}
+
+def save_color_cache(params, colors):
+    # Only the colors used this run are kept, so the file tracks the icon set.
+    COLOR_CACHE.parent.mkdir(parents=True, exist_ok=True)
+    tmp = COLOR_CACHE.with_name(COLOR_CACHE.name + ".tmp")
+    tmp.write_text(json.dumps({"params": params, "colors": colors}, sort_keys=True), encoding="utf-8")
+    os.replace(tmp, COLOR_CACHE)
+
+_worker_sources = {}
+
+def _extract_job(source_path, members):
+    # Runs in a worker process on one batch of icons; errors come back as text
+    # so one bad icon doesn't abort the pool (a failed batch is redone per icon).
+    # Each process opens the source once, from its persisted index.
+    source = _worker_sources.get(source_path)
+    if source is None:
+        source = _worker_sources[source_path] = icon_source.open_source(source_path)
+    try:
+        return [(color, None) for color in extract_colors([source.pixels(m) for m in members])]
+    except Exception:
+        pass
+    results = []
+    for member in members:
+        try:
+            results.append((extract_color(source.pixels(member)), None))
+        except Exception as e:
+            results.append((None, str(e)))
+    return results
+
+def icon_colors(source, tga_by_icon, jobs=None, use_cache=True):
+    """icon -> color for every resolved icon file in `source`. Colors are
+    looked up by file content hash + extraction parameters; misses are
+    extracted in batches (extract_colors) across `jobs` processes.
+    Returns (colors, errors, number of cache hits)."""
+    params = color_params_key()
+    cached = load_color_cache(params) if use_cache else {}
+    digest = {icon: source.digest(tga) for icon, tga in tga_by_icon.items()}
+    source.save()   # newly hashed files; workers and later runs reuse them
+    member_of = {d: tga_by_icon[icon] for icon, d in digest.items()}
+    todo = sorted(d for d in member_of if d not in cached)
+    members = [member_of[d] for d in todo]
+    batches = [members[i:i+BATCH_SIZE] for i in range(0, len(members), BATCH_SIZE)]
+    if len(batches) < 2 or jobs == 1:   # a process pool costs more than it saves here
+        _worker_sources[str(source.path)] = source
+        results = [r for batch in batches for r in _extract_job(str(source.path), batch)]
+    else:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            results = [r for batch in pool.map(_extract_job, [str(source.path)]*len(batches), batches)
+                       for r in batch]
+    by_digest = {d: cached[d] for d in member_of if d in cached}
+    failed = {}
+    for d, (color, err) in zip(todo, results):
+        if err: failed[d] = err
+        else: by_digest[d] = color
+    if use_cache and by_digest != cached:
+        save_color_cache(params, by_digest)
+    colors = {icon: by_digest[d] for icon, d in digest.items() if d in by_digest}
+    errors = {icon: failed[d] for icon, d in digest.items() if d in failed}
+    return colors, errors, len(member_of) - len(todo)
+
+# ─── Batch benchmark ─────────────────────────────────────────────────────────
+
+def synthetic_icons(directory, count, size=64, seed=1):
+    # Deterministic stand-in corpus: a bright blob of a random hue on a dark,
+    # noisy field; every 7th icon grey, every 11th with a transparent corner.
+    rng = np.random.default_rng(seed)
+    yy,xx = np.mgrid[0:size,0:size]
+    paths = []
+    for n in range(count):
+        r = rng.uniform(size*0.2, size*0.45)
+        blob = ((yy-rng.uniform(20,44))**2 + (xx-rng.uniform(20,44))**2) < r*r
+        color = np.array(hsv_to_rgb(rng.random(), 0.3 if n % 7 == 0 else rng.uniform(0.5,1), 1.0))
+        px = rng.uniform(0, 0.35, (size,size,3)) + blob[...,None]*color*rng.uniform(0.6,1.0,(size,size,1))
+        if n % 7 == 0: px = px.mean(axis=2, keepdims=True).repeat(3, axis=2)
+        alpha = np.full((size,size,1), 255.0)
+        if n % 11 == 0: alpha[:size//2,:size//2] = 0
+        rgba = np.concatenate([np.clip(px,0,1)*255, alpha], axis=2).astype(np.uint8)
+        path = directory / f"bench_{n:05d}.tga"
+        Image.fromarray(rgba, "RGBA").save(path)
+        paths.append(path)
+    return paths
+
+def bench_batch(count, source_path=None):
+    """Per-icon vs batched extraction: icons/sec, and a bit-for-bit comparison.
+    Uses the given icon source, else a synthetic corpus in a temporary folder;
+    folder sources also time Pillow decoding for comparison."""
+    with tempfile.TemporaryDirectory() as tmp:
+        if source_path is None:
+            synthetic_icons(Path(tmp), count)
+            source_path, label = Path(tmp), "synthetic 64x64 icons"
+        else:
+            label = str(source_path)
+        source = icon_source.open_source(source_path, index_dir=Path(tmp) / "index")
+        members = sorted(source.entries)[:count]
+        runs = [("decode (mmap)", lambda: [source.pixels(m) for m in members]),
+                ("per-icon", lambda: [extract_color(source.pixels(m)) for m in members]),
+                ("batched", lambda: extract_colors([source.pixels(m) for m in members]))]
+        if isinstance(source, icon_source.FolderSource):
+            paths = [source.path / m for m in members]
+            runs.insert(0, ("decode (PIL)", lambda: [np.asarray(Image.open(p).convert("RGBA")) for p in paths]))
+        timings = {}
+        for name, run in runs:
+            start = time.perf_counter()
+            timings[name] = (run(), time.perf_counter() - start)
+        source.close()
+    single, batch = timings["per-icon"][0], timings["batched"][0]
+    differ = [m for m, a, b in zip(members, single, batch) if a != b]
+    print(f"{len(members)} {label}")
+    for name, (_, seconds) in timings.items():
+        print(f"  {name:14s} {seconds:7.3f}s  {len(members)/seconds:8.0f} icons/s")
+    if "decode (PIL)" in timings and not all(
+            np.array_equal(a, b) for a, b in zip(timings["decode (PIL)"][0], timings["decode (mmap)"][0])):
+        print("  mmap decoding differs from Pillow")
+        return 1
+    print("  batched colors are bit-identical" if not differ
+          else f"  {len(differ)} colors differ, e.g. {differ[:5]}")
+    return 1 if differ else 0
 
 # ─── Main ────────────────────────────────────────────────────────────────────
 
@@ -172,10 +433,27 @@ def main():
     ap = argparse.ArgumentParser()
     ap.add_argument("--write", action="store_true")
     ap.add_argument("--report", action="store_true")
+    ap.add_argument("--jobs", type=int, default=None, help="extraction processes (default: CPU count)")
+    ap.add_argument("--no-color-cache", action="store_true", help="ignore and don't update the color cache")
+    ap.add_argument("--icons", type=Path, default=None,
+                    help=f"icon folder, zip/tar bundle or packed archive (default: {ICON_BUNDLE.name} if present, "
+                         f"else the game's ICONS folder)")
+    ap.add_argument("--pack", type=Path, metavar="OUT", help="pack the icons used by the DB into one archive")
+    ap.add_argument("--bench-batch", type=int, metavar="N", help="time per-icon vs batched extraction on N icons")
     args = ap.parse_args()
+    if args.bench_batch:
+        sys.exit(bench_batch(args.bench_batch, args.icons))
+
+    try:
+        source = icon_source.open_source(args.icons or default_icon_source())
+    except icon_source.IconSourceError as e:
+        sys.exit(f"{e} (pass --icons)")
+    icon_index = source.names()
 
-    cache = {int(k): v for k,v in json.load(open(CACHE_FILE)).items()}
-    icon_index = build_icon_index()
+    # Icon names only: the store answers from an indexed column, so no
+    # tooltip HTML is decompressed or parsed.
+    store = wowhead_store.WowheadStore()
+    store.sync_legacy(CACHE_FILE)
 
     # gather spellIDs per file
     spell_ids = {}
@@ -185,27 +463,37 @@ def main():
             for sid in parse_spell_ids(fp):
                 spell_ids[sid] = fn
     all_ids = sorted(spell_ids)
+    icons = store.icons(wowhead_store.LEGACY_BRANCH, all_ids)
+    store.close()
 
     missing_icon_name = []   # in DB, not in cache
-    missing_tga = set()      # icon name with no tga
-    color_by_icon = {}       # iconname -> (r,g,b)
+    missing_tga = set()      # icon name with no tga/blp
+    tga_by_icon = {}         # iconname -> icon file name in the source
     spell_color = {}         # spellID -> (r,g,b)
 
     for sid in all_ids:
-        entry = cache.get(sid)
-        if not entry or not entry.get("icon"):
+        if sid not in icons:
             missing_icon_name.append(sid); continue
-        icon = entry["icon"].lower()
-        if icon not in color_by_icon:
+        icon = icons[sid].lower()
+        if icon not in tga_by_icon and icon not in missing_tga:
             tga = resolve_tga(icon_index, icon)
-            if not tga:
-                missing_tga.add(icon); continue
-            try:
-                color_by_icon[icon] = extract_color(ICONS_DIR / tga)
-            except Exception as e:
-                print(f"  ! {icon}: {e}", file=sys.stderr); continue
-        if color_by_icon.get(icon):
-            spell_color[sid] = color_by_icon[icon]
+            if tga: tga_by_icon[icon] = tga
+            else: missing_tga.add(icon)
+
+    if args.pack:
+        count = icon_source.pack(source, args.pack, tga_by_icon.values())
+        source.close()
+        print(f"Packed {count} icon(s) into {args.pack} ({args.pack.stat().st_size:,} bytes)")
+        return
+
+    color_by_icon, errors, hits = icon_colors(source, tga_by_icon, args.jobs, not args.no_color_cache)
+    source.close()
+    for icon, e in sorted(errors.items()):
+        print(f"  ! {icon}: {e}", file=sys.stderr)
+    for sid in all_ids:
+        color = color_by_icon.get(icons.get(sid, "").lower())
+        if color:
+            spell_color[sid] = color
 
     # Guarantee every DB spell has a color: anything we couldn't sample (no icon
     # name, no .tga, or unreadable/black/transparent) gets the neutral fallback.
@@ -218,9 +506,9 @@ def main():
     print(f"Spells in DB:        {len(all_ids)}")
     print(f"Colored (sampled):   {len(spell_color) - len(fallback_ids)}")
     print(f"Fallback (no icon):  {len(fallback_ids)}" + (f"  e.g. {fallback_ids[:8]}" if fallback_ids else ""))
-    print(f"Unique icons:        {len(color_by_icon)}")
+    print(f"Unique icons:        {len(color_by_icon)} ({hits} unique files from the color cache)")
     print(f"Missing icon name:   {len(missing_icon_name)} (not in wowhead cache)")
-    print(f"Missing .tga file:   {len(missing_tga)}")
+    print(f"Missing icon file:   {len(missing_tga)} (not in {source.path})")
     if missing_tga:
         print("  e.g.:", ", ".join(sorted(missing_tga)[:10]))
 
@@ -237,27 +525,12 @@ def main():
             print(f"  {nm:14s} -> (no color)")
 
     if args.write:
-        lines = ["--[[",
-                 "    LibSpellDB - Spell Colors",
-                 "",
-                 "    AUTO-GENERATED by Tools/generate_icon_colors.py — DO NOT EDIT BY HAND.",
-                 "    Regenerate with: python Tools/generate_icon_colors.py --write",
-                 "",
-                 "    A vibrant representative color extracted from each spell's icon, used",
-                 "    by consumers (e.g. VeevHUD's Aura Tracker bars) as a sensible default",
-                 "    fill color. Keyed by spellID -> {r, g, b} (0-1).",
-                 "]]",
-                 "",
-                 'local lib = LIBSPELLDB_REGISTRATION  -- set by Core/LibSpellDB.lua only when this copy won LibStub version selection',
-                 "if not lib then return end",
-                 "",
-                 "lib.spellColors = {"]
-        for sid in sorted(spell_color):
-            r,g,b = spell_color[sid]
-            lines.append(f"    [{sid}] = {{{r:.3f}, {g:.3f}, {b:.3f}}},")
-        lines.append("}")
-        OUT_FILE.write_text("\n".join(lines) + "\n", encoding="utf-8")
-        print(f"\nWrote {OUT_FILE} ({len(spell_color)} entries)")
+        text = render_spell_colors(spell_color)
+        if OUT_FILE.exists() and OUT_FILE.read_text(encoding="utf-8") == text:
+            print(f"\n{OUT_FILE} is up to date ({len(spell_color)} entries)")
+        else:
+            OUT_FILE.write_text(text, encoding="utf-8")
+            print(f"\nWrote {OUT_FILE} ({len(spell_color)} entries)")
 
 if __name__ == "__main__":
     main()
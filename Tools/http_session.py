@@ -0,0 +1,456 @@
+#!/usr/bin/env python3
+"""Shared keep-alive HTTP layer for the tools that talk to Wowhead and Wago.
+
+One ``Session`` keeps a pool of persistent ``http.client`` connections per
+host, so repeated requests skip TCP and TLS setup, asks for gzip-compressed
+responses and decodes them, follows redirects, and retries throttled (429),
+failing (5xx) or dropped requests with a uniform backoff that honours
+``Retry-After``. Every request is accounted per host (requests, retries,
+errors, connections opened, bytes on the wire, time spent).
+
+Standard library only, like the rest of Tools/.
+
+Examples:
+    python Tools/http_session.py --bench https://nether.wowhead.com/tbc/tooltip/spell/133 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import gzip
+import http.client
+import io
+import json
+import ssl
+import threading
+import time
+import urllib.parse
+import urllib.request
+import zlib
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import BinaryIO, Iterator
+
+
+USER_AGENT = "LibSpellDB-Live-Audit/2.0"
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+REDIRECT_STATUSES = frozenset({301, 302, 303, 307, 308})
+MAX_REDIRECTS = 5
+# A pooled connection the server already closed fails on first use; those
+# errors mean "reconnect", not "the request failed".
+_STALE_ERRORS = (http.client.RemoteDisconnected, http.client.BadStatusLine, ConnectionResetError, BrokenPipeError)
+
+
+class HTTPStatusError(Exception):
+    """A final non-2xx response (after retries and redirects)."""
+
+    def __init__(self, url: str, code: int, headers: dict[str, str]):
+        super().__init__(f"HTTP {code} for {url}")
+        self.url = url
+        self.code = code
+        self.headers = headers
+
+
+@dataclass
+class Response:
+    url: str
+    status: int
+    headers: dict[str, str]
+    body: bytes
+
+    def text(self) -> str:
+        return self.body.decode("utf-8")
+
+    def json(self) -> object:
+        return json.loads(self.body)
+
+
+@dataclass
+class HostStats:
+    requests: int = 0
+    retries: int = 0
+    errors: int = 0
+    connections: int = 0
+    bytes: int = 0
+    seconds: float = 0.0
+    throttled: float = 0.0  # waiting for the rate limiter, summed over threads
+    backoff: float = 0.0  # sleeping before retries
+    latencies: list[float] = field(default_factory=list, repr=False)  # per attempt, to response headers
+
+    def percentile(self, fraction: float) -> float | None:
+        if not self.latencies:
+            return None
+        ordered = sorted(self.latencies)
+        return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+    def as_dict(self) -> dict[str, float | int | None]:
+        return {
+            "requests": self.requests, "retries": self.retries, "errors": self.errors,
+            "connections": self.connections, "bytes": self.bytes, "seconds": round(self.seconds, 3),
+            "throttled_seconds": round(self.throttled, 3), "backoff_seconds": round(self.backoff, 3),
+            "p50_ms": _milliseconds(self.percentile(0.5)), "p95_ms": _milliseconds(self.percentile(0.95)),
+        }
+
+
+def _milliseconds(seconds: float | None) -> float | None:
+    return None if seconds is None else round(seconds * 1000, 1)
+
+
+class TokenBucket:
+    """Thread-safe token bucket shared by every request that passes it.
+
+    ``rate`` tokens per second refill up to ``capacity``. ``slow_down`` halves
+    the rate after a 429/5xx and ``speed_up`` adds a little back after each
+    success (never above the configured rate), so a throttled run settles just
+    under whatever the server tolerates.
+    """
+
+    def __init__(self, rate: float, capacity: float = 1.0, min_rate: float = 0.2):
+        self.max_rate = rate
+        self.rate = rate
+        self.min_rate = min(min_rate, rate)
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self) -> None:
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+    def slow_down(self) -> None:
+        with self.lock:
+            self.rate = max(self.min_rate, self.rate / 2)
+            self.tokens = min(self.tokens, 0.0)
+
+    def speed_up(self) -> None:
+        with self.lock:
+            self.rate = min(self.max_rate, self.rate + self.max_rate / 20)
+
+
+class Session:
+    def __init__(self, user_agent: str = USER_AGENT, timeout: float = 30, retries: int = 4,
+                 backoff: float = 0.5, max_backoff: float = 30, pool_size: int = 8):
+        self.user_agent = user_agent
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.pool_size = pool_size
+        self.stats: dict[str, HostStats] = {}
+        self._idle: dict[tuple[str, str, int], list[http.client.HTTPConnection]] = {}
+        self._lock = threading.Lock()
+        self._ssl = ssl.create_default_context()
+
+    # -- connection pool -------------------------------------------------
+
+    def _host_stats(self, host: str) -> HostStats:
+        with self._lock:
+            return self.stats.setdefault(host, HostStats())
+
+    def _checkout(self, key: tuple[str, str, int]) -> tuple[http.client.HTTPConnection, bool]:
+        with self._lock:
+            idle = self._idle.get(key)
+            if idle:
+                return idle.pop(), True
+        scheme, host, port = key
+        if scheme == "https":
+            connection = http.client.HTTPSConnection(host, port, timeout=self.timeout, context=self._ssl)
+        else:
+            connection = http.client.HTTPConnection(host, port, timeout=self.timeout)
+        stats = self._host_stats(host)
+        with self._lock:
+            stats.connections += 1
+        return connection, False
+
+    def _checkin(self, key: tuple[str, str, int], connection: http.client.HTTPConnection,
+                 response: http.client.HTTPResponse) -> None:
+        if response.will_close or not response.isclosed():
+            connection.close()
+            return
+        with self._lock:
+            idle = self._idle.setdefault(key, [])
+            if len(idle) < self.pool_size:
+                idle.append(connection)
+                return
+        connection.close()
+
+    def close(self) -> None:
+        with self._lock:
+            idle, self._idle = self._idle, {}
+        for connections in idle.values():
+            for connection in connections:
+                connection.close()
+
+    # -- requests --------------------------------------------------------
+
+    def _wait(self, stats: HostStats, attempt: int, headers: dict[str, str]) -> None:
+        retry_after = headers.get("retry-after", "")
+        delay = min(float(retry_after) if retry_after.isdigit() else self.backoff * 2 ** attempt, self.max_backoff)
+        with self._lock:
+            stats.backoff += delay
+        time.sleep(delay)
+
+    def _open(self, url: str, headers: dict[str, str] | None, limiter: TokenBucket | None,
+              retries: int | None):
+        """Send a GET and return (key, connection, response) with the body
+        unread, after redirects and retries. Raises HTTPStatusError for a
+        final 4xx/5xx and OSError when the host stays unreachable."""
+        retries = self.retries if retries is None else retries
+        attempt = redirects = 0
+        while True:
+            parts = urllib.parse.urlsplit(url)
+            scheme = parts.scheme.lower()
+            if scheme not in ("http", "https") or not parts.hostname:
+                raise ValueError(f"unsupported URL {url!r}")
+            host = parts.hostname
+            key = (scheme, host, parts.port or (443 if scheme == "https" else 80))
+            path = urllib.parse.urlunsplit(("", "", parts.path or "/", parts.query, ""))
+            request_headers = {"User-Agent": self.user_agent, "Accept-Encoding": "gzip, deflate"}
+            request_headers.update(headers or {})
+            stats = self._host_stats(host)
+
+            if limiter:
+                waiting = time.perf_counter()
+                limiter.acquire()
+                with self._lock:
+                    stats.throttled += time.perf_counter() - waiting
+            started = time.perf_counter()
+            connection, reused = self._checkout(key)
+            try:
+                try:
+                    connection.request("GET", path, headers=request_headers)
+                    response = connection.getresponse()
+                except _STALE_ERRORS:
+                    if not reused:
+                        raise
+                    connection.close()
+                    connection, _ = self._checkout(key)
+                    connection.request("GET", path, headers=request_headers)
+                    response = connection.getresponse()
+            except (OSError, http.client.HTTPException):
+                connection.close()
+                elapsed = time.perf_counter() - started
+                with self._lock:
+                    stats.requests += 1
+                    stats.errors += 1
+                    stats.seconds += elapsed
+                    stats.latencies.append(elapsed)
+                if attempt >= retries:
+                    raise
+                with self._lock:
+                    stats.retries += 1
+                self._wait(stats, attempt, {})
+                attempt += 1
+                continue
+
+            response_headers = {name.lower(): value for name, value in response.getheaders()}
+            elapsed = time.perf_counter() - started
+            with self._lock:
+                stats.requests += 1
+                stats.seconds += elapsed
+                stats.latencies.append(elapsed)
+            if response.status in REDIRECT_STATUSES and "location" in response_headers:
+                response.read()
+                self._checkin(key, connection, response)
+                redirects += 1
+                if redirects > MAX_REDIRECTS:
+                    raise HTTPStatusError(url, response.status, response_headers)
+                url = urllib.parse.urljoin(url, response_headers["location"])
+                continue
+            if response.status in RETRY_STATUSES and attempt < retries:
+                response.read()
+                self._checkin(key, connection, response)
+                with self._lock:
+                    stats.retries += 1
+                if limiter:
+                    limiter.slow_down()
+                self._wait(stats, attempt, response_headers)
+                attempt += 1
+                continue
+            if response.status >= 400:
+                response.read()
+                self._checkin(key, connection, response)
+                with self._lock:
+                    stats.errors += 1
+                raise HTTPStatusError(url, response.status, response_headers)
+            if limiter:
+                limiter.speed_up()
+            return key, connection, response
+
+    def get(self, url: str, headers: dict[str, str] | None = None, *,
+            limiter: TokenBucket | None = None, retries: int | None = None) -> Response:
+        key, connection, response = self._open(url, headers, limiter, retries)
+        started = time.perf_counter()
+        try:
+            raw = response.read()
+        except OSError:
+            connection.close()
+            raise
+        stats = self._host_stats(key[1])
+        with self._lock:
+            stats.bytes += len(raw)
+            stats.seconds += time.perf_counter() - started
+        self._checkin(key, connection, response)
+        headers = {name.lower(): value for name, value in response.getheaders()}
+        return Response(url, response.status, headers, _decode(raw, headers.get("content-encoding", "")))
+
+    @contextmanager
+    def stream(self, url: str, headers: dict[str, str] | None = None, *,
+               limiter: TokenBucket | None = None, retries: int | None = None) -> Iterator[BinaryIO]:
+        """Binary file object over a (decompressed) response body, for
+        downloads too large to hold in memory."""
+        key, connection, response = self._open(url, headers, limiter, retries)
+        counted = _CountingReader(response)
+        encoding = (response.getheader("Content-Encoding") or "").lower()
+        if encoding == "gzip":
+            body: BinaryIO = gzip.GzipFile(fileobj=io.BufferedReader(counted))
+        elif encoding == "deflate":
+            body = io.BufferedReader(_InflatingReader(counted))
+        else:
+            body = io.BufferedReader(counted)
+        try:
+            yield body
+        finally:
+            stats = self._host_stats(key[1])
+            with self._lock:
+                stats.bytes += counted.count
+            self._checkin(key, connection, response)
+
+    def summary(self) -> str:
+        lines = []
+        for host, stats in sorted(self.stats.items()):
+            line = (f"{host}: {stats.requests} request(s), {stats.retries} retried, {stats.errors} failed, "
+                    f"{stats.connections} connection(s), {stats.bytes / 1024:.0f} KiB, {stats.seconds:.2f}s")
+            if stats.latencies:
+                line += f", p50 {stats.percentile(0.5) * 1000:.0f} ms, p95 {stats.percentile(0.95) * 1000:.0f} ms"
+            if stats.throttled or stats.backoff:
+                line += f", {stats.throttled:.1f}s rate-limited, {stats.backoff:.1f}s backing off"
+            lines.append(line)
+        return "\n".join(lines)
+
+
+class _CountingReader(io.RawIOBase):
+    """Raw stream over a response that counts the bytes on the wire."""
+
+    def __init__(self, response: http.client.HTTPResponse):
+        self.response = response
+        self.count = 0
+
+    def readinto(self, buffer) -> int:
+        size = self.response.readinto(buffer)
+        self.count += size
+        return size
+
+    def readable(self) -> bool:
+        return True
+
+
+class _InflatingReader(io.RawIOBase):
+    """Raw stream that inflates a ``deflate`` body. Like _decode, it accepts
+    zlib-wrapped data and, as some servers send, a bare deflate stream."""
+
+    def __init__(self, raw: io.RawIOBase, chunk_size: int = 64 * 1024):
+        self.raw = raw
+        self.chunk_size = chunk_size
+        self.inflater = None
+        self.pending = b""
+        self.finished = False
+
+    def _inflate(self, data: bytes) -> bytes:
+        if self.inflater is None:
+            self.inflater = zlib.decompressobj()
+            try:
+                return self.inflater.decompress(data)
+            except zlib.error:
+                self.inflater = zlib.decompressobj(-zlib.MAX_WBITS)
+        return self.inflater.decompress(data)
+
+    def readinto(self, buffer) -> int:
+        while not self.pending and not self.finished:
+            data = self.raw.read(self.chunk_size)
+            if data:
+                self.pending = self._inflate(data)
+            else:
+                self.finished = True
+                self.pending = self.inflater.flush() if self.inflater else b""
+        size = min(len(buffer), len(self.pending))
+        buffer[:size] = self.pending[:size]
+        self.pending = self.pending[size:]
+        return size
+
+    def readable(self) -> bool:
+        return True
+
+
+def _decode(raw: bytes, encoding: str) -> bytes:
+    encoding = encoding.lower()
+    if encoding == "gzip":
+        return gzip.decompress(raw)
+    if encoding == "deflate":
+        try:
+            return zlib.decompress(raw)
+        except zlib.error:
+            return zlib.decompress(raw, -zlib.MAX_WBITS)
+    return raw
+
+
+_shared: Session | None = None
+_shared_lock = threading.Lock()
+
+
+def shared_session() -> Session:
+    """The process-wide session every tool uses, so all of them share one
+    connection pool and one set of per-host counters."""
+    global _shared
+    with _shared_lock:
+        if _shared is None:
+            _shared = Session()
+        return _shared
+
+
+def bench(url: str, count: int) -> None:
+    """Per-request latency of a fresh urllib connection versus the pool."""
+    timings = {}
+    for label in ("urllib (new connection)", "Session (keep-alive)"):
+        session = Session(retries=0)
+        elapsed = []
+        for _ in range(count):
+            started = time.perf_counter()
+            if label.startswith("urllib"):
+                request = urllib.request.Request(url, headers={"User-Agent": USER_AGENT})
+                with urllib.request.urlopen(request, timeout=30) as response:
+                    response.read()
+            else:
+                session.get(url)
+            elapsed.append(time.perf_counter() - started)
+        session.close()
+        elapsed.sort()
+        timings[label] = elapsed
+        print(f"{label:24s} median {elapsed[len(elapsed) // 2] * 1000:7.1f} ms"
+              f"  mean {sum(elapsed) / len(elapsed) * 1000:7.1f} ms")
+    old, new = (sum(values) / len(values) for values in timings.values())
+    print(f"Keep-alive saves {(old - new) * 1000:.1f} ms per request ({(1 - new / old) * 100:.0f}%)")
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--bench", nargs=2, metavar=("URL", "COUNT"), help="compare per-request latency")
+    args = parser.parse_args(argv)
+    if not args.bench:
+        parser.print_help()
+        return 2
+    bench(args.bench[0], int(args.bench[1]))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
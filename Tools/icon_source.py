@@ -0,0 +1,444 @@
+#!/usr/bin/env python3
+"""Icon sources for generate_icon_colors.py: a folder, a zip or tar bundle, or
+one packed icon archive.
+
+A source maps file names (``Spell_Nature_Lightning.tga``) to image files and
+decodes them to RGBA pixels. Its index of names, offsets and content hashes is
+kept under ``Tools/.cache/icons/``, so opening a source lists no folder and
+walks no archive member table: a folder index is reused until the folder's
+mtime changes (files added, removed or renamed), an archive index until the
+archive's size or mtime changes. A folder file's hash is reused while its size
+and mtime are unchanged.
+
+Files are memory-mapped. Uncompressed true-color TGA and BLP2 (raw BGRA or
+palettized) are decoded as NumPy views of the mapped bytes, without reading
+them into Python buffers or going through Pillow; the RGBA array is the only
+copy. Other encodings (RLE TGA, DXT or JPEG BLP), deflated zip members and
+compressed tars are read into memory and decoded by Pillow.
+
+The packed archive is a single file holding a header, a JSON index (with
+content hashes) and the original image files back to back. It opens with one
+read of the index and decodes every icon in place from one mapping, which makes
+it the format for a checked-in icon bundle on CI.
+
+Examples:
+    python Tools/icon_source.py "C:\\Games\\World of Warcraft\\_anniversary_\\Interface\\ICONS"
+    python Tools/icon_source.py icons.zip --pack Tools/icons.pack
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import io
+import json
+import mmap
+import os
+import struct
+import sys
+import tarfile
+import zipfile
+from pathlib import Path, PurePosixPath
+from typing import Iterable
+
+try:
+    import numpy as np
+except ImportError:  # indexing, hashing and packing work without NumPy
+    np = None
+
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+INDEX_DIR = SCRIPT_DIR / ".cache" / "icons"
+INDEX_VERSION = 1
+IMAGE_SUFFIXES = (".tga", ".blp")  # preference order when both exist
+
+PACK_MAGIC = b"LSDBICON"
+PACK_VERSION = 1
+_PACK_HEADER = struct.Struct("<8sII")  # magic, version, index length
+
+_TGA_HEADER = struct.Struct("<BBBHHBHHHHBB")
+_BLP2_HEADER = struct.Struct("<4sIBBBBII16I16I")
+_BLP2_PALETTE = _BLP2_HEADER.size
+_TGA_FOOTER = b"TRUEVISION-XFILE.\x00"
+
+
+class IconSourceError(RuntimeError):
+    pass
+
+
+def _sha256(data) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def _stat_stamp(path: Path) -> str:
+    stat = path.stat()
+    return f"{stat.st_size}:{stat.st_mtime_ns}"
+
+
+def _map(path: Path):
+    """Read-only mapping of a whole file (bytes for an empty one). Mappings are
+    never closed explicitly: NumPy views keep them alive until released."""
+    with open(path, "rb") as handle:
+        if os.fstat(handle.fileno()).st_size == 0:
+            return b""
+        return mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+# -- decoding ------------------------------------------------------------------
+
+
+def _bgra_to_rgba(pixels, alpha=None):
+    rgba = np.empty(pixels.shape[:2] + (4,), np.uint8)
+    rgba[..., 0] = pixels[..., 2]
+    rgba[..., 1] = pixels[..., 1]
+    rgba[..., 2] = pixels[..., 0]
+    rgba[..., 3] = (pixels[..., 3] if pixels.shape[2] == 4 else 255) if alpha is None else alpha
+    return rgba
+
+
+def _tga_pixels(data):
+    """RGBA of an uncompressed 24/32-bit TGA, or None for anything else.
+    Matches Pillow, including TGA 2.0 files whose extension area says the
+    alpha channel is unused."""
+    if len(data) < _TGA_HEADER.size:
+        return None
+    (id_length, colormap_type, image_type, _, colormap_length, colormap_depth,
+     _, _, width, height, depth, descriptor) = _TGA_HEADER.unpack_from(data)
+    if image_type != 2 or depth not in (24, 32) or not width or not height:
+        return None
+    start = _TGA_HEADER.size + id_length + (colormap_length * ((colormap_depth + 7) // 8) if colormap_type else 0)
+    channels = depth // 8
+    if len(data) < start + width * height * channels:
+        return None
+    pixels = np.frombuffer(data, np.uint8, width * height * channels, start).reshape(height, width, channels)
+    if not descriptor & 0x20:
+        pixels = pixels[::-1]  # rows are stored bottom-up
+    if descriptor & 0x10:
+        pixels = pixels[:, ::-1]
+    alpha = None
+    if channels == 4 and len(data) >= 26 and bytes(data[-18:]) == _TGA_FOOTER:
+        extension = struct.unpack_from("<I", data, len(data) - 26)[0]
+        if extension and len(data) > extension + 494 and data[extension + 494] == 0:
+            alpha = 255
+    return _bgra_to_rgba(pixels, alpha)
+
+
+def _blp_pixels(data):
+    """RGBA of a BLP2 with raw BGRA or palettized pixels (mip level 0), or None
+    for DXT, BLP1 and anything else. Palettized alpha comes from the alpha
+    bits that follow the indices, as the game reads it."""
+    if len(data) < _BLP2_PALETTE + 1024 or bytes(data[:4]) != b"BLP2":
+        return None
+    header = _BLP2_HEADER.unpack_from(data)
+    _, kind, encoding, alpha_depth, _, _, width, height = header[:8]
+    offset, length = header[8], header[24]
+    count = width * height
+    if kind != 1 or not count or offset + length > len(data):
+        return None
+    if encoding == 3 and length >= count * 4:
+        pixels = np.frombuffer(data, np.uint8, count * 4, offset).reshape(height, width, 4)
+        return _bgra_to_rgba(pixels, None if alpha_depth else 255)
+    if encoding != 1 or alpha_depth not in (0, 1, 4, 8) or length < count + (count * alpha_depth + 7) // 8:
+        return None
+    palette = np.frombuffer(data, np.uint8, 1024, _BLP2_PALETTE).reshape(256, 4)
+    indices = np.frombuffer(data, np.uint8, count, offset)
+    if alpha_depth == 0:
+        alpha = 255
+    else:
+        packed = np.frombuffer(data, np.uint8, (count * alpha_depth + 7) // 8, offset + count)
+        if alpha_depth == 8:
+            alpha = packed
+        elif alpha_depth == 4:
+            alpha = (np.stack([packed & 0x0F, packed >> 4], axis=1).reshape(-1)[:count] * 17).astype(np.uint8)
+        else:
+            alpha = np.unpackbits(packed, bitorder="little")[:count] * np.uint8(255)
+        alpha = alpha.reshape(height, width)
+    return _bgra_to_rgba(palette[indices].reshape(height, width, 4), alpha)
+
+
+def decode(data, suffix: str):
+    """RGBA uint8 array (height, width, 4) of one image file's bytes."""
+    if np is None:
+        raise IconSourceError("decoding icons needs NumPy (pip install numpy pillow)")
+    pixels = _tga_pixels(data) if suffix == ".tga" else _blp_pixels(data)
+    if pixels is not None:
+        return pixels
+    from PIL import Image
+    with Image.open(io.BytesIO(bytes(data))) as image:
+        return np.asarray(image.convert("RGBA"))
+
+
+# -- sources -------------------------------------------------------------------
+
+
+class IconSource:
+    """Base class: ``entries`` maps each image file name to ``[offset, size,
+    stored, sha256, stamp]``. ``stored`` means the file's bytes sit
+    uncompressed at ``offset`` in the mapped archive; ``stamp`` is the file's
+    size and mtime that the hash belongs to (folders only)."""
+
+    kind = ""
+
+    def __init__(self, path: Path, index_dir: Path = INDEX_DIR):
+        self.path = Path(path)
+        self.index_dir = index_dir
+        self.entries: dict[str, list] = {}
+        self._dirty = False
+        self._mapping = None
+        self._load_index()
+
+    # Subclasses provide the stamp that invalidates the index, a full scan,
+    # and access to one file's bytes.
+    def _stamp(self) -> str:
+        return _stat_stamp(self.path)
+
+    def _scan(self) -> dict[str, list]:
+        raise NotImplementedError
+
+    def _read_unstored(self, member: str) -> bytes:
+        raise IconSourceError(f"{member} is not stored in {self.path}")
+
+    @property
+    def _index_file(self) -> Path:
+        key = hashlib.sha256(str(self.path.resolve()).encode("utf-8")).hexdigest()[:16]
+        return self.index_dir / f"{self.kind}-{key}.json"
+
+    def _load_index(self) -> None:
+        if not self.path.exists():
+            raise IconSourceError(f"icon source {self.path} does not exist")
+        self.stamp = self._stamp()
+        try:
+            document = json.loads(self._index_file.read_text(encoding="utf-8"))
+            if document["version"] == INDEX_VERSION and document["stamp"] == self.stamp:
+                self.entries = document["entries"]
+                return
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+        self.entries = self._scan()
+        self._dirty = True
+        self.save()
+
+    def save(self) -> None:
+        """Write the index (and any hashes computed since) if it changed."""
+        if not self._dirty:
+            return
+        self.index_dir.mkdir(parents=True, exist_ok=True)
+        temp = self._index_file.with_name(f"{self._index_file.name}.{os.getpid()}.tmp")
+        temp.write_text(json.dumps({"version": INDEX_VERSION, "source": str(self.path), "stamp": self.stamp,
+                                    "entries": self.entries}, separators=(",", ":")), encoding="utf-8")
+        os.replace(temp, self._index_file)
+        self._dirty = False
+
+    def close(self) -> None:
+        self.save()
+        self._mapping = None
+
+    def __enter__(self) -> "IconSource":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def names(self) -> dict[str, str]:
+        """Lower-case icon name -> file name, preferring .tga over .blp."""
+        found: dict[str, str] = {}
+        for member in sorted(self.entries, key=lambda m: IMAGE_SUFFIXES.index(PurePosixPath(m).suffix.lower()),
+                             reverse=True):
+            found[PurePosixPath(member).stem.lower()] = member
+        return found
+
+    def read(self, member: str):
+        """The file's bytes: a zero-copy memoryview of the mapping when stored."""
+        offset, size, stored = self.entries[member][:3]
+        if not stored:
+            return self._read_unstored(member)
+        if self._mapping is None:
+            self._mapping = _map(self.path)
+        return memoryview(self._mapping)[offset:offset + size]
+
+    def digest(self, member: str) -> str:
+        entry = self.entries[member]
+        if entry[3] is None:
+            entry[3] = _sha256(self.read(member))
+            self._dirty = True
+        return entry[3]
+
+    def pixels(self, member: str):
+        return decode(self.read(member), PurePosixPath(member).suffix.lower())
+
+
+class FolderSource(IconSource):
+    kind = "folder"
+
+    def _stamp(self) -> str:
+        return str(self.path.stat().st_mtime_ns)
+
+    def _scan(self) -> dict[str, list]:
+        with os.scandir(self.path) as found:
+            return {item.name: [0, 0, True, None, None] for item in found
+                    if item.name.lower().endswith(IMAGE_SUFFIXES) and item.is_file()}
+
+    def read(self, member: str):
+        return memoryview(_map(self.path / member))
+
+    def digest(self, member: str) -> str:
+        entry = self.entries[member]
+        stamp = _stat_stamp(self.path / member)
+        if entry[3] is None or entry[4] != stamp:
+            entry[3], entry[4] = _sha256(self.read(member)), stamp
+            self._dirty = True
+        return entry[3]
+
+
+class ZipSource(IconSource):
+    kind = "zip"
+
+    def _scan(self) -> dict[str, list]:
+        entries = {}
+        with zipfile.ZipFile(self.path) as archive, open(self.path, "rb") as raw:
+            for info in archive.infolist():
+                if info.is_dir() or not info.filename.lower().endswith(IMAGE_SUFFIXES):
+                    continue
+                stored = info.compress_type == zipfile.ZIP_STORED and not info.flag_bits & 0x1
+                offset = 0
+                if stored:
+                    # Data follows the local header, whose name/extra lengths
+                    # may differ from the central directory's.
+                    raw.seek(info.header_offset + 26)
+                    name_length, extra_length = struct.unpack("<HH", raw.read(4))
+                    offset = info.header_offset + 30 + name_length + extra_length
+                entries[info.filename] = [offset, info.file_size, stored, None, None]
+        return entries
+
+    _archive = None
+
+    def _read_unstored(self, member: str) -> bytes:
+        if self._archive is None:
+            self._archive = zipfile.ZipFile(self.path)
+        return self._archive.read(member)
+
+    def close(self) -> None:
+        super().close()
+        if self._archive is not None:
+            self._archive.close()
+            self._archive = None
+
+
+class TarSource(IconSource):
+    kind = "tar"
+    _members = None
+
+    def _scan(self) -> dict[str, list]:
+        try:
+            archive = tarfile.open(self.path, "r:")
+            stored = True
+        except tarfile.ReadError:
+            archive = tarfile.open(self.path, "r:*")
+            stored = False
+        with archive:
+            return {info.name: [info.offset_data if stored else 0, info.size, stored, None, None]
+                    for info in archive if info.isfile() and info.name.lower().endswith(IMAGE_SUFFIXES)}
+
+    def _read_unstored(self, member: str) -> bytes:
+        # A compressed tar has no random access (every backward seek restarts
+        # decompression), so its icons are read in one pass on first use.
+        if self._members is None:
+            with tarfile.open(self.path, "r:*") as archive:
+                self._members = {info.name: archive.extractfile(info).read()
+                                 for info in archive if info.name in self.entries}
+        return self._members[member]
+
+    def close(self) -> None:
+        super().close()
+        self._members = None
+
+
+class PackSource(IconSource):
+    """The packed archive carries its own index, so nothing is cached for it."""
+
+    kind = "pack"
+
+    def _load_index(self) -> None:
+        self.stamp = self._stamp()
+        with open(self.path, "rb") as handle:
+            magic, version, length = _PACK_HEADER.unpack(handle.read(_PACK_HEADER.size))
+            if magic != PACK_MAGIC or version != PACK_VERSION:
+                raise IconSourceError(f"{self.path} is not a version {PACK_VERSION} icon pack")
+            index = json.loads(handle.read(length).decode("utf-8"))
+        start = _PACK_HEADER.size + length  # offsets count from the first file
+        self.entries = {member: [start + offset, size, True, digest, None]
+                        for member, (offset, size, digest) in index.items()}
+
+    def save(self) -> None:
+        pass
+
+
+def open_source(path: Path | str, index_dir: Path = INDEX_DIR) -> IconSource:
+    """Open a folder, zip, tar (plain or compressed) or packed archive."""
+    path = Path(path)
+    if path.is_dir():
+        return FolderSource(path, index_dir)
+    if not path.is_file():
+        raise IconSourceError(f"icon source {path} does not exist")
+    with open(path, "rb") as handle:
+        magic = handle.read(len(PACK_MAGIC))
+    if magic == PACK_MAGIC:
+        return PackSource(path, index_dir)
+    if zipfile.is_zipfile(path):
+        return ZipSource(path, index_dir)
+    if tarfile.is_tarfile(path):
+        return TarSource(path, index_dir)
+    raise IconSourceError(f"{path} is not a folder, zip, tar or icon pack")
+
+
+def pack(source: IconSource, out: Path, members: Iterable[str] | None = None) -> int:
+    """Write the given files of ``source`` (all by default) into one packed
+    archive at ``out``, atomically. Returns the number of files packed."""
+    members = sorted(source.entries if members is None else set(members))
+    blobs = [bytes(source.read(member)) for member in members]
+    index, offset = {}, 0
+    for member, blob in zip(members, blobs):
+        index[PurePosixPath(member).name] = [offset, len(blob), _sha256(blob)]
+        offset += len(blob)
+    if len(index) != len(members):
+        raise IconSourceError("packed icons must have distinct file names")
+    body = json.dumps(index, separators=(",", ":")).encode("utf-8")
+    out.parent.mkdir(parents=True, exist_ok=True)
+    temp = out.with_name(out.name + ".tmp")
+    with open(temp, "wb") as handle:
+        handle.write(_PACK_HEADER.pack(PACK_MAGIC, PACK_VERSION, len(body)))
+        handle.write(body)
+        for blob in blobs:
+            handle.write(blob)
+    os.replace(temp, out)
+    return len(members)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("source", type=Path, help="icon folder, zip, tar or packed archive")
+    parser.add_argument("--pack", type=Path, metavar="OUT", help="write every icon into one packed archive")
+    args = parser.parse_args(argv)
+
+    try:
+        with open_source(args.source) as source:
+            if args.pack:
+                count = pack(source, args.pack)
+                print(f"Packed {count} icon(s) into {args.pack} ({args.pack.stat().st_size:,} bytes)")
+                return 0
+            suffixes: dict[str, int] = {}
+            for member in source.entries:
+                suffix = PurePosixPath(member).suffix.lower()
+                suffixes[suffix] = suffixes.get(suffix, 0) + 1
+            stored = sum(1 for entry in source.entries.values() if entry[2])
+            print(f"{source.kind} {args.source}: {len(source.entries)} icon file(s) "
+                  f"({', '.join(f'{count} {suffix}' for suffix, count in sorted(suffixes.items())) or 'none'}), "
+                  f"{stored} memory-mapped")
+    except IconSourceError as error:
+        print(error, file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
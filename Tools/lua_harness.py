@@ -0,0 +1,357 @@
+#!/usr/bin/env python3
+"""Headless load-time and memory harness for the addon.
+
+Runs lib.xml's Lua files (LibStub, Core/*.lua, then Data/*.lua) in load order
+under a stock ``lua5.1`` with a stubbed WoW API, the way the client loads them
+at login. ``C_Spell.GetSpellName``, ``GetSpellInfo`` and
+``C_Spell.GetSpellTexture`` answer from a Wago SpellName snapshot (read through
+db2_store.py), so spells absent from the build are skipped exactly as in game.
+
+Each run is a fresh interpreter. The report is the median over the runs of:
+compile and run time per file (``os.clock``), ``collectgarbage("count")``
+growth per file after a full collection, and the memory each lib index holds on
+its own, measured by dropping it and collecting. With ``--against REV`` the
+same measurement runs on a git revision too, interleaved with this tree's runs,
+and the harness fails if load time or memory grew past the tolerances.
+
+Examples:
+    python Tools/lua_harness.py
+    python Tools/lua_harness.py --flavor vanilla --repeat 9 --json load.json
+    python Tools/lua_harness.py --against origin/master
+    python Tools/lua_harness.py --baseline load.json --memory-tolerance 0.05
+"""
+
+from __future__ import annotations
+
+import argparse
+import io
+import json
+import re
+import shutil
+import statistics
+import subprocess
+import sys
+import tarfile
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+
+import db2_store
+import http_session
+import spell_data
+import wowhead_audit
+
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+ADDON_DIR = spell_data.ADDON_DIR
+LIBSTUB_FILE = "Libs/LibStub/LibStub.lua"
+# Tables on lib whose own memory is reported (spell records are pinned while
+# they are dropped, so each figure excludes the records every index shares).
+INDEXES = ("spells", "spellsByClass", "spellsByTag", "spellIDToTags", "rankToCanonical", "auraToSource",
+           "spellColors")
+
+
+class HarnessError(RuntimeError):
+    pass
+
+
+@dataclass(frozen=True)
+class Flavor:
+    product: str
+    project_id: int   # WOW_PROJECT_ID
+    toc: int          # 4th return of GetBuildInfo()
+
+
+FLAVORS = {
+    "tbc": Flavor(wowhead_audit.TBC_PRODUCT, 5, 20505),
+    "vanilla": Flavor(wowhead_audit.CLASSIC_PRODUCT, 2, 11508),
+}
+
+
+# Stand-ins for the client API the addon touches while loading, then the timed
+# load itself. The Python side prepends SPELL_NAMES, FILES, ROOT and the flavor
+# constants.
+DRIVER = r"""
+local clock, gc, write, concat, select, tostring = os.clock, collectgarbage, io.write, table.concat, select, tostring
+
+local function emit(...)
+    local fields = {...}
+    for i = 1, select("#", ...) do fields[i] = (tostring(fields[i]):gsub("[\t\r\n]", " ")) end
+    write(concat(fields, "\t"), "\n")
+end
+
+local QUESTION_MARK_ICON = 134400
+WOW_PROJECT_MAINLINE, WOW_PROJECT_CLASSIC, WOW_PROJECT_BURNING_CRUSADE_CLASSIC = 1, 2, 5
+WOW_PROJECT_ID = PROJECT_ID
+function GetBuildInfo() return BUILD_VERSION, BUILD_NUMBER, "", TOC end
+function wipe(t) for k in pairs(t) do t[k] = nil end return t end
+function print(...)
+    local parts = {}
+    for i = 1, select("#", ...) do parts[i] = tostring((select(i, ...))) end
+    emit("print", concat(parts, " "))
+end
+C_Spell = {
+    GetSpellName = function(spellID) return SPELL_NAMES[spellID] end,
+    GetSpellTexture = function(spellID)
+        if SPELL_NAMES[spellID] then return QUESTION_MARK_ICON, QUESTION_MARK_ICON end
+    end,
+}
+function GetSpellInfo(spellID)
+    local name = SPELL_NAMES[spellID]
+    if name then return name, nil, QUESTION_MARK_ICON, 0, 0, 0, spellID end
+end
+local function noop() end
+local frameMethods = {__index = function() return noop end}
+function CreateFrame() return setmetatable({}, frameMethods) end
+SlashCmdList = {}
+
+if not LibStub then
+    -- Same contract as Libs/LibStub when fetch-libs.sh has not been run.
+    local libs, minors = {}, {}
+    LibStub = setmetatable({libs = libs, minors = minors}, {__call = function(self, major, silent)
+        if not libs[major] and not silent then error("Cannot find a library instance of " .. tostring(major), 2) end
+        return libs[major], minors[major]
+    end})
+    function LibStub:NewLibrary(major, minor)
+        minor = tonumber(minor)
+        local oldMinor = minors[major]
+        if oldMinor and oldMinor >= minor then return nil end
+        minors[major], libs[major] = minor, libs[major] or {}
+        return libs[major], oldMinor
+    end
+end
+
+local function collected()
+    gc("collect")
+    return gc("count")
+end
+
+local start = collected()
+for _, path in ipairs(FILES) do
+    local before = collected()
+    local t0 = clock()
+    local chunk, err = loadfile(ROOT .. path)
+    local t1 = clock()
+    if not chunk then emit("error", path, err) os.exit(1) end
+    local ok, runErr = pcall(chunk, "LibSpellDB", {})
+    local t2 = clock()
+    if not ok then emit("error", path, runErr) os.exit(1) end
+    chunk = nil
+    emit("file", path, t1 - t0, t2 - t1, collected() - before)
+end
+emit("total", collected() - start)
+
+local lib = LibStub("LibSpellDB-1.0")
+local function count(t)
+    local n = 0
+    for _ in pairs(t or {}) do n = n + 1 end
+    return n
+end
+emit("count", "spells", count(lib.spells))
+emit("count", "invalid", count(lib.invalidSpellsLogged))
+"""
+
+# Runs after the load with the index tables intact; ``extra`` Lua passed to
+# driver_source() goes between the two parts and may emit("result", ...).
+DRIVER_INDEXES = r"""
+local records = {}
+for _, spellData in pairs(lib.spells) do records[#records + 1] = spellData end
+for _, name in ipairs(INDEXES) do
+    local before = collected()
+    lib[name] = nil
+    emit("index", name, before - collected())
+end
+"""
+
+
+def referenced_ids(root: Path) -> set[int]:
+    """Every integer literal in the data files: a superset of the spell IDs the
+    addon can look up, so the name snapshot stays small."""
+    return {int(number) for path in sorted((root / "Data").glob("*.lua"))
+            for number in re.findall(r"\b\d{1,7}\b", path.read_text(encoding="utf-8"))}
+
+
+def spell_names(build: str, ids: set[int], offline: bool = False) -> dict[int, str]:
+    store = db2_store.Db2Store(build, offline=offline)
+    try:
+        return {spell_id: name for spell_id, name in store.spell_names().items() if spell_id in ids}
+    finally:
+        store.close()
+
+
+def _lua_string(text: str) -> str:
+    return '"' + "".join(chr(byte) if 32 <= byte < 127 and byte not in (34, 92) else f"\\{byte}"
+                         for byte in text.encode("utf-8")) + '"'
+
+
+def driver_source(root: Path, names: dict[int, str], flavor: Flavor, build: str, extra: str = "") -> str:
+    files = [name for name in spell_data.load_order(root) if name != LIBSTUB_FILE or (root / name).is_file()]
+    version, _, number = build.rpartition(".")
+    lines = ["local SPELL_NAMES = {"]
+    lines += [f"[{spell_id}]={_lua_string(name)}," for spell_id, name in sorted(names.items())]
+    lines += ["}",
+              f"local FILES = {{{', '.join(_lua_string(name) for name in files)}}}",
+              f"local INDEXES = {{{', '.join(_lua_string(name) for name in INDEXES)}}}",
+              f"local ROOT = {_lua_string(root.as_posix() + '/')}",
+              f"local PROJECT_ID, TOC = {flavor.project_id}, {flavor.toc}",
+              f"local BUILD_VERSION, BUILD_NUMBER = {_lua_string(version)}, {_lua_string(number)}",
+              DRIVER, extra, DRIVER_INDEXES]
+    return "\n".join(lines)
+
+
+def run_once(lua: str, script: Path) -> dict:
+    """One fresh interpreter: the parsed report of a single load."""
+    completed = subprocess.run((lua, str(script)), capture_output=True, text=True, encoding="utf-8",
+                               errors="replace")
+    report: dict = {"files": {}, "indexes": {}, "counts": {}, "prints": [], "results": {}}
+    for line in completed.stdout.splitlines():
+        kind, *fields = line.split("\t")
+        if kind == "file":
+            path, compile_s, run_s, growth = fields
+            report["files"][path] = {"compile_ms": float(compile_s) * 1000, "run_ms": float(run_s) * 1000,
+                                     "memory_kb": float(growth)}
+        elif kind == "total":
+            report["memory_kb"] = float(fields[0])
+        elif kind == "index":
+            report["indexes"][fields[0]] = float(fields[1])
+        elif kind == "count":
+            report["counts"][fields[0]] = int(fields[1])
+        elif kind == "result":
+            report["results"][fields[0]] = fields[1] if len(fields) > 1 else ""
+        elif kind == "print":
+            report["prints"].append(fields[0])
+        elif kind == "error":
+            raise HarnessError(f"{fields[0]}: {fields[1]}")
+    if completed.returncode or "memory_kb" not in report:
+        raise HarnessError(f"{lua} exited with {completed.returncode}: {completed.stderr.strip()}")
+    return report
+
+
+def _median(runs: list[dict]) -> dict:
+    report = dict(runs[0])
+    report["files"] = {path: {key: statistics.median(run["files"][path][key] for run in runs) for key in timing}
+                       for path, timing in runs[0]["files"].items()}
+    report["indexes"] = {name: statistics.median(run["indexes"][name] for run in runs) for name in runs[0]["indexes"]}
+    report["memory_kb"] = statistics.median(run["memory_kb"] for run in runs)
+    report["load_ms"] = statistics.median(sum(f["compile_ms"] + f["run_ms"] for f in run["files"].values())
+                                          for run in runs)
+    report["runs"] = len(runs)
+    return report
+
+
+def measure(roots: list[Path], names: dict[int, str], flavor: Flavor, build: str,
+            lua: str, repeat: int, extra: str = "") -> list[dict]:
+    """Median report per tree. Trees are run in turn, so machine noise affects
+    a baseline and its candidate alike."""
+    runs: list[list[dict]] = [[] for _ in roots]
+    with tempfile.TemporaryDirectory() as temp:
+        scripts = []
+        for index, root in enumerate(roots):
+            script = Path(temp) / f"load{index}.lua"
+            script.write_text(driver_source(root, names, flavor, build, extra), encoding="utf-8")
+            scripts.append(script)
+        for _ in range(repeat):
+            for script, collected in zip(scripts, runs):
+                collected.append(run_once(lua, script))
+    version = subprocess.run((lua, "-v"), capture_output=True, text=True)
+    for collected in runs:
+        for run in collected:
+            run["lua"] = (version.stdout or version.stderr).split("  ")[0].strip()
+            run["build"] = build
+    return [_median(collected) for collected in runs]
+
+
+def checkout(rev: str, destination: Path) -> Path:
+    """The addon files of ``rev`` (lib.xml, Libs, Core, Data) under ``destination``."""
+    archive = subprocess.run(("git", "archive", "--format=tar", rev, "--", "lib.xml", "Core", "Data"),
+                             cwd=ADDON_DIR, check=True, capture_output=True).stdout
+    with tarfile.open(fileobj=io.BytesIO(archive)) as tar:
+        tar.extractall(destination, **({"filter": "data"} if hasattr(tarfile, "data_filter") else {}))
+    if (ADDON_DIR / "Libs").is_dir():
+        shutil.copytree(ADDON_DIR / "Libs", destination / "Libs")
+    return destination
+
+
+def print_report(report: dict) -> None:
+    counts = report["counts"]
+    print(f"{report['lua']}, build {report['build']}, median of {report['runs']} run(s)")
+    print(f"  {'file':28s} {'compile ms':>10s} {'run ms':>9s} {'memory KB':>10s}")
+    for path, timing in report["files"].items():
+        print(f"  {path:28s} {timing['compile_ms']:10.2f} {timing['run_ms']:9.2f} {timing['memory_kb']:10.1f}")
+    print(f"  {'total':28s} {report['load_ms']:20.2f} {report['memory_kb']:10.1f}")
+    print(f"  {counts.get('spells', 0)} spells registered, {counts.get('invalid', 0)} not in the build, "
+          f"{len(report['prints'])} load-time print(s)")
+    for line in report["prints"][:5]:
+        print(f"    {line}")
+    print(f"  {'index':28s} {'KB':>10s}")
+    for name, size in report["indexes"].items():
+        print(f"  {name:28s} {size:10.1f}")
+
+
+def compare(base: dict, head: dict, time_tolerance: float, memory_tolerance: float) -> list[str]:
+    """Print head against base; return the metrics that regressed."""
+    metrics = [("load ms", base["load_ms"], head["load_ms"], time_tolerance),
+               ("memory KB", base["memory_kb"], head["memory_kb"], memory_tolerance)]
+    metrics += [(f"{name} KB", base["indexes"][name], head["indexes"].get(name, 0.0), memory_tolerance)
+                for name in base["indexes"]]
+    regressions = []
+    print(f"\n  {'metric':28s} {'base':>10s} {'head':>10s} {'change':>8s}")
+    for label, before, after, tolerance in metrics:
+        change = (after - before) / before if before else 0.0
+        flag = change > tolerance
+        print(f"  {label:28s} {before:10.2f} {after:10.2f} {change:+8.1%}{'  REGRESSED' if flag else ''}")
+        if flag:
+            regressions.append(f"{label} {before:.2f} -> {after:.2f} ({change:+.1%}, tolerance {tolerance:.0%})")
+    return regressions
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--lua", default="lua5.1", help="Lua 5.1 interpreter (default: lua5.1 on PATH)")
+    parser.add_argument("--flavor", choices=sorted(FLAVORS), default="tbc", help="client the stubs imitate")
+    parser.add_argument("--build", help="Wago build for the SpellName snapshot (default: the flavor's latest)")
+    parser.add_argument("--offline", action="store_true", help="use only already ingested DB2 tables")
+    parser.add_argument("--repeat", type=int, default=5, help="fresh interpreter runs per tree")
+    parser.add_argument("--json", type=Path, metavar="OUT", help="write this tree's report as JSON")
+    parser.add_argument("--baseline", type=Path, metavar="JSON", help="compare against a saved report")
+    parser.add_argument("--against", metavar="REV", help="compare against a git revision, measured now")
+    parser.add_argument("--time-tolerance", type=float, default=0.25, help="accepted relative load-time growth")
+    parser.add_argument("--memory-tolerance", type=float, default=0.02, help="accepted relative memory growth")
+    args = parser.parse_args(argv)
+
+    lua = shutil.which(args.lua)
+    if lua is None:
+        print(f"{args.lua} not found: install Lua 5.1 or pass --lua", file=sys.stderr)
+        return 2
+    flavor = FLAVORS[args.flavor]
+    try:
+        build = args.build or db2_store.latest_builds((flavor.product,), offline=args.offline)[flavor.product]
+        with tempfile.TemporaryDirectory() as temp:
+            roots = [ADDON_DIR]
+            if args.against:
+                roots.insert(0, checkout(args.against, Path(temp)))
+            names = spell_names(build, set().union(*map(referenced_ids, roots)), args.offline)
+            reports = measure(roots, names, flavor, build, lua, max(1, args.repeat))
+    except (OSError, HarnessError, db2_store.StoreError, http_session.HTTPStatusError,
+            subprocess.CalledProcessError) as error:
+        detail = getattr(error, "stderr", None) or error
+        print(f"ERROR: {str(detail).strip()}", file=sys.stderr)
+        return 2
+
+    head = reports[-1]
+    print_report(head)
+    if args.json:
+        args.json.write_text(json.dumps(head, indent=2), encoding="utf-8")
+    base = reports[0] if args.against else None
+    if args.baseline:
+        base = json.loads(args.baseline.read_text(encoding="utf-8"))
+    if base is None:
+        return 0
+    regressions = compare(base, head, args.time_tolerance, args.memory_tolerance)
+    for regression in regressions:
+        print(f"REGRESSION: {regression}", file=sys.stderr)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -11,6 +11,10 @@ Usage:
 3. Export as CSV
 4. Run: python parse_spell_triggers.py SpellEffect.csv
 
+Or, without exporting anything by hand, read the tables of a Wago build from
+the local DB2 store (downloaded once, then offline):
+    python parse_spell_triggers.py --build 2.5.5.65000
+
 The script will identify:
 - Spells with TRIGGER_SPELL effects (Effect = 64)
 - Spells that apply different auras
@@ -22,6 +26,8 @@ import json
 from collections import defaultdict
 from pathlib import Path
 
+import db2_store
+
 # Spell class families (from SpellClassSet in Spell.dbc)
 SPELL_FAMILIES = {
     0: "GENERIC",
@@ -94,67 +100,94 @@ PLAYER_ABILITIES = {
 }
 
 
+EFFECT_COLUMNS = ('Effect', 'SpellID', 'EffectTriggerSpell', 'EffectIndex')
+# Optional in an export; the other three are needed to find any trigger.
+EFFECT_DEFAULTS = {'EffectIndex': 0}
+
+
 def parse_spell_effect_csv(filepath):
     """Parse SpellEffect.csv from wago.tools"""
+    # Only the four needed columns are read, already as ints; rows with
+    # unparsable values are skipped by the reader.
+    return _parse_effect_rows(db2_store.iter_csv_columns(filepath, EFFECT_COLUMNS, (int, int, int, int),
+                                                         EFFECT_DEFAULTS))
+
+
+def _parse_effect_rows(rows):
     triggers = []
-    
-    with open(filepath, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        
-        for row in reader:
-            try:
-                effect_type = int(row.get('Effect', 0))
-                spell_id = int(row.get('SpellID', 0))
-                trigger_spell = int(row.get('EffectTriggerSpell', 0))
-                
-                # Look for TRIGGER_SPELL effects with a different target spell
-                if effect_type == EFFECT_TRIGGER_SPELL and trigger_spell > 0:
-                    if trigger_spell != spell_id:
-                        triggers.append({
-                            'source_spell': spell_id,
-                            'triggered_spell': trigger_spell,
-                            'effect_index': int(row.get('EffectIndex', 0)),
-                            'effect_type': 'TRIGGER_SPELL',
-                        })
-                        
-            except (ValueError, KeyError) as e:
-                continue
+    for effect_type, spell_id, trigger_spell, effect_index in rows:
+        # Look for TRIGGER_SPELL effects with a different target spell
+        if effect_type == EFFECT_TRIGGER_SPELL and trigger_spell > 0:
+            if trigger_spell != spell_id:
+                triggers.append({
+                    'source_spell': spell_id,
+                    'triggered_spell': trigger_spell,
+                    'effect_index': effect_index,
+                    'effect_type': 'TRIGGER_SPELL',
+                })
     
     return triggers
 
 
 def parse_spell_csv(filepath):
     """Parse Spell.csv to get spell names and class families"""
-    spells = {}
-    
     if not Path(filepath).exists():
-        return spells
+        return {}
         
     with open(filepath, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        
-        for row in reader:
-            try:
-                spell_id = int(row.get('ID', 0))
-                
-                # Try different possible column names for the spell name
-                name = (row.get('Name_lang', '') or 
-                       row.get('Name', '') or 
-                       row.get('Name_0', ''))
-                
-                spell_class = int(row.get('SpellClassSet', 0))
-                
-                spells[spell_id] = {
-                    'name': name,
-                    'class': SPELL_FAMILIES.get(spell_class, 'UNKNOWN'),
-                    'spell_class_id': spell_class,
-                }
-            except (ValueError, KeyError):
-                continue
+        return _parse_spell_rows(csv.DictReader(f))
+
+
+def _parse_spell_rows(rows):
+    spells = {}
+    for row in rows:
+        try:
+            spell_id = int(row.get('ID', 0))
+            
+            # Try different possible column names for the spell name
+            name = (row.get('Name_lang', '') or 
+                   row.get('Name', '') or 
+                   row.get('Name_0', ''))
+            
+            spell_class = int(row.get('SpellClassSet', 0))
+            
+            spells[spell_id] = {
+                'name': name,
+                'class': SPELL_FAMILIES.get(spell_class, 'UNKNOWN'),
+                'spell_class_id': spell_class,
+            }
+        except (ValueError, KeyError):
+            continue
     
     return spells
 
 
+def _store_rows(store, table, wanted):
+    """Rows of a DB2 store table as dicts holding only the ``wanted`` columns
+    that the build actually has, like a DictReader over the export."""
+    store.ensure(table)
+    columns = [column for column in wanted if column in store.columns(table)]
+    for values in store.rows(table, columns):
+        yield {column: str(value) for column, value in zip(columns, values)}
+
+
+def parse_spell_effect_store(store):
+    """parse_spell_effect_csv over the SpellEffect table of a DB2 store"""
+    def typed_rows():
+        for row in _store_rows(store, 'SpellEffect', EFFECT_COLUMNS):
+            try:
+                yield tuple(int(row[column] if column in row else EFFECT_DEFAULTS[column])
+                            for column in EFFECT_COLUMNS)
+            except (KeyError, ValueError):
+                continue
+    return _parse_effect_rows(typed_rows())
+
+
+def parse_spell_store(store):
+    """parse_spell_csv over the Spell table of a DB2 store"""
+    return _parse_spell_rows(_store_rows(store, 'Spell', ('ID', 'Name_lang', 'Name', 'Name_0', 'SpellClassSet')))
+
+
 def find_class_relevant_triggers(triggers, spells, class_filter=None):
     """Filter triggers to only class-relevant spells"""
     
@@ -220,9 +253,24 @@ def generate_lua_code(triggers):
 
 
 def main():
+    if len(sys.argv) == 3 and sys.argv[1] == '--build':
+        build = sys.argv[2]
+        store = db2_store.Db2Store(build)
+        try:
+            print(f"Reading SpellEffect and Spell for build {build} from the DB2 store...")
+            triggers = parse_spell_effect_store(store)
+            print(f"Found {len(triggers)} spells with TRIGGER_SPELL effects")
+            spells = parse_spell_store(store)
+            print(f"Loaded {len(spells)} spell definitions")
+        finally:
+            store.close()
+        write_report(triggers, spells, f"SpellEffect_{build}")
+        return
+
     if len(sys.argv) < 2:
         print(__doc__)
         print("\nUsage: python parse_spell_triggers.py <SpellEffect.csv> [Spell.csv]")
+        print("       python parse_spell_triggers.py --build <version>")
         print("\nTo get the CSV files:")
         print("1. Go to https://wago.tools/db2/SpellEffect")
         print("2. Select build: wow_classic (for TBC 3.4.3)")
@@ -243,6 +291,11 @@ def main():
         spells = parse_spell_csv(spell_csv)
         print(f"Loaded {len(spells)} spell definitions")
     
+    write_report(triggers, spells, Path(effect_csv).stem)
+
+
+def write_report(triggers, spells, stem):
+    """Print the class-relevant triggers and write <stem>_triggers.lua/.json"""
     # Filter to relevant class spells
     relevant = find_class_relevant_triggers(triggers, spells)
     print(f"\nFiltered to {len(relevant)} class-relevant triggers")
@@ -265,7 +318,7 @@ def main():
     # Generate Lua code
     lua_output = generate_lua_code(relevant)
     
-    output_file = Path(effect_csv).stem + "_triggers.lua"
+    output_file = stem + "_triggers.lua"
     with open(output_file, 'w', encoding='utf-8') as f:
         f.write("-- Auto-generated spell trigger mappings\n")
         f.write("-- Review and add to appropriate class files in LibSpellDB/Data/\n\n")
@@ -274,7 +327,7 @@ def main():
     print(f"\nLua code written to: {output_file}")
     
     # Also save JSON for programmatic use
-    json_output = Path(effect_csv).stem + "_triggers.json"
+    json_output = stem + "_triggers.json"
     with open(json_output, 'w', encoding='utf-8') as f:
         json.dump(relevant, f, indent=2)
     
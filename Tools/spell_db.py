@@ -0,0 +1,310 @@
+#!/usr/bin/env python3
+"""Compiled SQLite snapshot of the authored LibSpellDB data.
+
+Every ``lib:RegisterSpells``, ``RegisterTrinkets``, ``RegisterPotions`` and
+``RegisterConsumables`` entry in Data/*.lua is compiled into an indexed SQLite
+file so tooling questions become queries instead of another pass over the Lua
+source. The snapshot is rebuilt incrementally: each data file's SHA-256 and the
+parser version are recorded, and only files whose content changed are re-read
+(through the spell_data parse cache) and re-inserted.
+
+Tables (``entry`` columns reference ``spells.id``):
+    files              name, sha256, parser_version
+    spells             one row per RegisterSpells entry; common fields as
+                       columns, the whole entry as JSON in ``data``
+    ranks              entry, position, spell_id
+    variants           entry, position, spell_id
+    tags               entry, tag
+    triggered_auras    entry, position, spell_id, type, on_target, data
+    applied_buffs      entry, position, spell_id
+    rank_durations     entry, rank_spell_id, duration
+    version_overrides  entry, version, disabled, spell_id, data
+    items              one row per trinket/potion/consumable entry
+
+Examples:
+    python Tools/spell_db.py                      # build/refresh Tools/.cache/spells.sqlite
+    python Tools/spell_db.py --query "
+        SELECT s.spell_id, s.name FROM spells s
+        JOIN tags t ON t.entry = s.id AND t.tag = 'CC_HARD'
+        JOIN triggered_auras a ON a.entry = s.id AND a.on_target = 0"
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import sqlite3
+import sys
+from pathlib import Path
+
+import spell_data
+
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+DEFAULT_DB = SCRIPT_DIR / ".cache" / "spells.sqlite"
+
+# Bump whenever the tables below change; older snapshots are rebuilt from scratch.
+SCHEMA_VERSION = 1
+
+ITEM_KINDS = {"RegisterTrinkets": "trinket", "RegisterPotions": "potion", "RegisterConsumables": "consumable"}
+
+SCHEMA = """
+CREATE TABLE files (
+    name TEXT PRIMARY KEY,
+    sha256 TEXT NOT NULL,
+    parser_version INTEGER NOT NULL
+);
+CREATE TABLE spells (
+    id INTEGER PRIMARY KEY,
+    file TEXT NOT NULL REFERENCES files(name) ON DELETE CASCADE,
+    line INTEGER NOT NULL,
+    end_line INTEGER NOT NULL,
+    spell_id INTEGER,
+    name TEXT,
+    class TEXT,
+    default_class TEXT,
+    duration REAL,
+    cooldown REAL,
+    aura_target TEXT,
+    priority INTEGER,
+    buff_group TEXT,
+    shared_cooldown_group TEXT,
+    talent INTEGER,
+    data TEXT NOT NULL
+);
+CREATE INDEX spells_spell_id ON spells(spell_id);
+CREATE INDEX spells_class ON spells(class);
+CREATE INDEX spells_file ON spells(file, line);
+CREATE TABLE ranks (
+    entry INTEGER NOT NULL REFERENCES spells(id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    spell_id INTEGER NOT NULL
+);
+CREATE INDEX ranks_spell_id ON ranks(spell_id);
+CREATE INDEX ranks_entry ON ranks(entry);
+CREATE TABLE variants (
+    entry INTEGER NOT NULL REFERENCES spells(id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    spell_id INTEGER NOT NULL
+);
+CREATE INDEX variants_spell_id ON variants(spell_id);
+CREATE INDEX variants_entry ON variants(entry);
+CREATE TABLE tags (
+    entry INTEGER NOT NULL REFERENCES spells(id) ON DELETE CASCADE,
+    tag TEXT NOT NULL
+);
+CREATE INDEX tags_tag ON tags(tag);
+CREATE INDEX tags_entry ON tags(entry);
+CREATE TABLE triggered_auras (
+    entry INTEGER NOT NULL REFERENCES spells(id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    spell_id INTEGER,
+    type TEXT,
+    on_target INTEGER,
+    data TEXT NOT NULL
+);
+CREATE INDEX triggered_auras_spell_id ON triggered_auras(spell_id);
+CREATE INDEX triggered_auras_entry ON triggered_auras(entry);
+CREATE TABLE applied_buffs (
+    entry INTEGER NOT NULL REFERENCES spells(id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    spell_id INTEGER NOT NULL
+);
+CREATE INDEX applied_buffs_spell_id ON applied_buffs(spell_id);
+CREATE INDEX applied_buffs_entry ON applied_buffs(entry);
+CREATE TABLE rank_durations (
+    entry INTEGER NOT NULL REFERENCES spells(id) ON DELETE CASCADE,
+    rank_spell_id INTEGER NOT NULL,
+    duration REAL
+);
+CREATE INDEX rank_durations_entry ON rank_durations(entry);
+CREATE TABLE version_overrides (
+    entry INTEGER NOT NULL REFERENCES spells(id) ON DELETE CASCADE,
+    version TEXT NOT NULL,
+    disabled INTEGER NOT NULL,
+    spell_id INTEGER,
+    data TEXT
+);
+CREATE INDEX version_overrides_spell_id ON version_overrides(spell_id);
+CREATE INDEX version_overrides_entry ON version_overrides(entry);
+CREATE TABLE items (
+    id INTEGER PRIMARY KEY,
+    file TEXT NOT NULL REFERENCES files(name) ON DELETE CASCADE,
+    line INTEGER NOT NULL,
+    kind TEXT NOT NULL,
+    item_id INTEGER,
+    proc_buff_id INTEGER,
+    buff_spell_id INTEGER,
+    icd REAL,
+    on_target INTEGER,
+    data TEXT NOT NULL
+);
+CREATE INDEX items_item_id ON items(item_id);
+CREATE INDEX items_proc_buff_id ON items(proc_buff_id);
+CREATE INDEX items_buff_spell_id ON items(buff_spell_id);
+"""
+
+
+def _int(value: object) -> int | None:
+    return value if isinstance(value, int) and not isinstance(value, bool) else None
+
+
+def _real(value: object) -> float | None:
+    return float(value) if isinstance(value, (int, float)) and not isinstance(value, bool) else None
+
+
+def _text(value: object) -> str | None:
+    if isinstance(value, spell_data.Ref):
+        return value.name
+    return value if isinstance(value, str) else None
+
+
+def _flag(value: object) -> int | None:
+    return int(value) if isinstance(value, bool) else None
+
+
+def _json(table: spell_data.LuaTable) -> str:
+    return json.dumps(table.to_python())
+
+
+def _open(db_path: Path) -> sqlite3.Connection:
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    connection = sqlite3.connect(db_path)
+    connection.execute("PRAGMA foreign_keys = ON")
+    if connection.execute("PRAGMA user_version").fetchone()[0] != SCHEMA_VERSION:
+        tables = [row[0] for row in connection.execute("SELECT name FROM sqlite_master WHERE type = 'table'")]
+        with connection:
+            for table in tables:
+                connection.execute(f"DROP TABLE IF EXISTS {table}")
+            connection.executescript(SCHEMA)
+            connection.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+    return connection
+
+
+def _insert_spell(connection: sqlite3.Connection, entry: spell_data.Entry) -> None:
+    table = entry.table
+    cursor = connection.execute(
+        "INSERT INTO spells (file, line, end_line, spell_id, name, class, default_class, duration, cooldown,"
+        " aura_target, priority, buff_group, shared_cooldown_group, talent, data)"
+        " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+        (
+            entry.file.name, entry.line, entry.end_line, entry.spell_id, entry.name, entry.resolved_class,
+            entry.default_class, _real(table.get("duration")), _real(table.get("cooldown")),
+            _text(table.get("auraTarget")), _int(table.get("priority")), _text(table.get("buffGroup")),
+            _text(table.get("sharedCooldownGroup")), _flag(table.get("talent")), _json(table),
+        ),
+    )
+    row = cursor.lastrowid
+    connection.executemany("INSERT INTO ranks VALUES (?, ?, ?)",
+                           [(row, index, spell_id) for index, spell_id in enumerate(table.ints("ranks"), 1)])
+    connection.executemany("INSERT INTO variants VALUES (?, ?, ?)",
+                           [(row, index, spell_id) for index, spell_id in enumerate(table.ints("variants"), 1)])
+    connection.executemany("INSERT INTO tags VALUES (?, ?)", [(row, tag) for tag in entry.tags])
+    connection.executemany("INSERT INTO applied_buffs VALUES (?, ?, ?)",
+                           [(row, index, spell_id) for index, spell_id in enumerate(table.ints("appliesBuff"), 1)])
+
+    auras = table.table("triggersAuras")
+    if auras is not None:
+        connection.executemany("INSERT INTO triggered_auras VALUES (?, ?, ?, ?, ?, ?)", [
+            (row, index, _int(aura.get("spellID")), _text(aura.get("type")), _flag(aura.get("onTarget")), _json(aura))
+            for index, aura in enumerate(auras.array, 1) if isinstance(aura, spell_data.LuaTable)
+        ])
+    durations = table.table("rankDurations")
+    if durations is not None:
+        connection.executemany("INSERT INTO rank_durations VALUES (?, ?, ?)", [
+            (row, key, _real(value)) for key, value in durations.fields.items() if _int(key) is not None
+        ])
+    overrides = table.table("versionOverrides")
+    if overrides is not None:
+        # ``{ vanilla = false }`` removes the spell from that version entirely
+        connection.executemany("INSERT INTO version_overrides VALUES (?, ?, ?, ?, ?)", [
+            (row, version, int(override is False),
+             _int(override.get("spellID")) if isinstance(override, spell_data.LuaTable) else None,
+             _json(override) if isinstance(override, spell_data.LuaTable) else None)
+            for version, override in overrides.fields.items()
+        ])
+
+
+def _insert_item(connection: sqlite3.Connection, entry: spell_data.Entry) -> None:
+    table = entry.table
+    connection.execute(
+        "INSERT INTO items (file, line, kind, item_id, proc_buff_id, buff_spell_id, icd, on_target, data)"
+        " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+        (
+            entry.file.name, entry.line, ITEM_KINDS[entry.method], _int(table.get("itemID")),
+            _int(table.get("procBuffID")), _int(table.get("buffSpellID")), _real(table.get("icd")),
+            _flag(table.get("onTarget")), _json(table),
+        ),
+    )
+
+
+def build(*, db_path: Path = DEFAULT_DB, data_dir: Path = spell_data.DATA_DIR) -> tuple[sqlite3.Connection, list[str]]:
+    """Bring the snapshot at ``db_path`` up to date with ``data_dir``.
+
+    Returns the open connection and the names of the files that were
+    (re)compiled; unchanged files are left untouched.
+    """
+    connection = _open(db_path)
+    known = {name: (sha, version) for name, sha, version in connection.execute("SELECT * FROM files")}
+    paths = {path.name: path for path in spell_data.data_files(data_dir)}
+    rebuilt = []
+    with connection:
+        for name in sorted(set(known) - set(paths)):
+            connection.execute("DELETE FROM files WHERE name = ?", (name,))
+        for name, path in sorted(paths.items()):
+            sha = hashlib.sha256(path.read_bytes()).hexdigest()
+            if known.get(name) == (sha, spell_data.PARSER_VERSION):
+                continue
+            data_file = spell_data.parse_data_file(path)
+            connection.execute("DELETE FROM files WHERE name = ?", (name,))
+            connection.execute("INSERT INTO files VALUES (?, ?, ?)", (name, sha, spell_data.PARSER_VERSION))
+            for entry in data_file.entries():
+                if entry.method == "RegisterSpells":
+                    _insert_spell(connection, entry)
+                else:
+                    _insert_item(connection, entry)
+            rebuilt.append(name)
+    return connection, rebuilt
+
+
+def connect(*, db_path: Path = DEFAULT_DB, data_dir: Path = spell_data.DATA_DIR) -> sqlite3.Connection:
+    """Up-to-date snapshot connection for tools that query the authored data."""
+    connection, _rebuilt = build(db_path=db_path, data_dir=data_dir)
+    return connection
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--db", type=Path, default=DEFAULT_DB, help="snapshot path (default: %(default)s)")
+    parser.add_argument("--rebuild", action="store_true", help="discard the snapshot and compile every file")
+    parser.add_argument("--query", metavar="SQL", help="run a read-only query and print tab-separated rows")
+    args = parser.parse_args(argv)
+
+    if args.rebuild:
+        args.db.unlink(missing_ok=True)
+    connection, rebuilt = build(db_path=args.db)
+    if args.query:
+        connection.execute("PRAGMA query_only = ON")
+        try:
+            cursor = connection.execute(args.query)
+        except sqlite3.Error as error:
+            print(f"ERROR: {error}", file=sys.stderr)
+            return 1
+        print("\t".join(column[0] for column in cursor.description or ()))
+        for row in cursor:
+            print("\t".join("" if value is None else str(value) for value in row))
+        return 0
+
+    counts = {
+        table: connection.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+        for table in ("spells", "ranks", "variants", "tags", "triggered_auras", "applied_buffs",
+                      "rank_durations", "version_overrides", "items")
+    }
+    print(f"{args.db}: recompiled {len(rebuilt)} file(s){': ' + ', '.join(rebuilt) if rebuilt else ''}")
+    print("  " + ", ".join(f"{table} {count}" for table, count in counts.items()))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
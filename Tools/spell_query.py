@@ -0,0 +1,302 @@
+#!/usr/bin/env python3
+"""The addon's spell query API, in Python.
+
+Registers Data/*.lua the way Core/LibSpellDB.lua does at load: files in
+Data.xml order, ``versionOverrides`` applied for the chosen game version,
+spells unknown to the client skipped (when a name snapshot is given), later
+registrations of a spellID replacing earlier ones, and ``C.*``, ``AT.*`` and
+``S.*`` constants resolved from Core. The answers then come from indexes built
+once, so each query is a dictionary lookup or a set intersection.
+
+    Lua                                      Python
+    lib:GetSpellInfo(id)                     db.spell_info(id)
+    lib:GetSpellsByClassAndTag(class, tag)   db.spells_by_class_and_tag(class, tag)
+    lib:GetSpellsByAllTags(tags)             db.spells_by_all_tags(tags)
+    lib:GetCanonicalSpellID(id)              db.canonical_spell_id(id)
+    lib:GetAuraSourceSpellID(id)             db.aura_source_spell_id(id)
+    lib:GetAllRankIDs(id)                    db.all_rank_ids(id)
+    lib:GetProcInfo(id)                      db.proc_info(id)
+
+Results hold the same spell data tables the addon would (authored fields,
+constants resolved); treat them as read-only.
+
+Examples:
+    python Tools/spell_query.py canonical 6178
+    python Tools/spell_query.py class-and-tag WARRIOR INTERRUPT
+    python Tools/spell_query.py all-tags CC_HARD PVE_PVP --version vanilla
+    python Tools/spell_query.py --bench 20000
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import time
+from pathlib import Path
+from typing import Any, Iterable, Iterator, Mapping
+
+import spell_data
+
+
+# Core files whose ``lib.X = {...}`` tables the data files alias as locals.
+CONSTANT_FILES = ("Core/Categories.lua", "Core/SpecDetection.lua")
+GAME_VERSIONS = ("vanilla", "tbc", "wrath", "cata", "mists", "retail")
+
+
+def _truthy(value: Any) -> bool:
+    """Lua truth: only nil and false are false."""
+    return value is not None and value is not False
+
+
+def _ipairs(value: Any) -> Iterator[Any]:
+    """Lua ipairs over a converted array: stops at the first nil."""
+    if isinstance(value, list):
+        for item in value:
+            if item is None:
+                return
+            yield item
+
+
+class _Evaluator:
+    """Turns parsed tables into the values Lua builds from them."""
+
+    def __init__(self, root: Path):
+        self.constants: dict[str, spell_data.LuaTable] = {}
+        for name in CONSTANT_FILES:
+            for target, value in spell_data.parse_data_file(root / name).assignments.items():
+                if isinstance(value, spell_data.LuaTable):
+                    self.constants[target] = value
+
+    def value(self, value: Any, data_file: spell_data.DataFile) -> Any:
+        if isinstance(value, spell_data.LuaTable):
+            if not value.fields:
+                return [self.value(item, data_file) for item in value.array]
+            return {key: self.value(item, data_file) for key, item in value.items}
+        if isinstance(value, spell_data.Ref):
+            return self.value(self._resolve(value.name, data_file), data_file)
+        return value
+
+    def _resolve(self, name: str, data_file: spell_data.DataFile) -> Any:
+        # ``C.CC_HARD`` -> local C = lib.Categories -> lib.Categories.CC_HARD;
+        # a name that resolves to nothing is nil, as an unset global is in Lua.
+        head, _, member = name.partition(".")
+        value = data_file.locals.get(head)
+        if isinstance(value, spell_data.Ref):
+            value = self.constants.get(value.name)
+        if not member:
+            return value
+        return value.get(member) if isinstance(value, spell_data.LuaTable) else None
+
+
+class SpellQuery:
+    """Indexes of one game version's registered spells.
+
+    ``names`` is the client's spellID -> name table (e.g. a Wago SpellName
+    snapshot). With it, spells the client lacks are skipped and missing names
+    filled in, as in game; without it every authored spell registers.
+    """
+
+    def __init__(self, game_version: str = "tbc", names: Mapping[int, str] | None = None,
+                 root: Path = spell_data.ADDON_DIR, use_cache: bool = True):
+        self.game_version = game_version
+        self.names = names
+        self.spells: dict[int, dict] = {}
+        self.spells_by_class: dict[str, dict[int, dict]] = {}
+        self.spells_by_tag: dict[str, dict[int, dict]] = {}
+        self.spell_id_to_tags: dict[int, set[str]] = {}
+        self.rank_to_canonical: dict[int, int] = {}
+        self.aura_to_source: dict[int, dict] = {}
+        self.invalid: set[int] = set()
+
+        evaluator = _Evaluator(root)
+        for name in spell_data.load_order(root):
+            if not name.startswith("Data/"):
+                continue
+            data_file = spell_data.parse_data_file(root / name, use_cache)
+            for entry in data_file.entries("RegisterSpells"):
+                spell = evaluator.value(entry.table, data_file)
+                if isinstance(spell, dict):
+                    if entry.default_class and not _truthy(spell.get("class")):
+                        spell["class"] = entry.default_class
+                    self._register(spell)
+
+        # Derived indexes: the per-class tag buckets, tag ID sets for
+        # intersections, and each spell's full rank set.
+        self._class_tag: dict[tuple[str, str], dict[int, dict]] = {}
+        for class_name, spells in self.spells_by_class.items():
+            for spell_id, spell in spells.items():
+                for tag in self.spell_id_to_tags.get(spell_id, ()):
+                    self._class_tag.setdefault((class_name, tag), {})[spell_id] = spell
+        self._tag_ids = {tag: frozenset(spells) for tag, spells in self.spells_by_tag.items()}
+        self._rank_ids = {spell_id: frozenset([spell_id, *_ipairs(spell.get("ranks"))])
+                          for spell_id, spell in self.spells.items()}
+
+    def _known(self, spell_id: Any) -> bool:
+        return self.names is None or spell_id in self.names
+
+    def _register(self, spell: dict) -> bool:
+        """lib:RegisterSpell, minus the client-only side effects."""
+        overrides = spell.get("versionOverrides")
+        override = overrides.get(self.game_version) if isinstance(overrides, dict) else None
+        if override is False:
+            return False
+        if isinstance(override, dict):
+            spell.update(override)
+
+        spell_id = spell["spellID"]
+        resolve_id = spell_id
+        if not self._known(spell_id):
+            resolve_id = next((rank for rank in _ipairs(spell.get("ranks")) if self._known(rank)), None)
+            if resolve_id is None:
+                self.invalid.add(spell_id)
+                return False
+        if self.names is not None and not _truthy(spell.get("name")):
+            spell["name"] = self.names[resolve_id]
+
+        previous = self.spells.get(spell_id)
+        if previous is not None and previous is not spell:
+            previous_class = previous.get("class")
+            if _truthy(previous_class) and previous_class != spell["class"] and previous_class in self.spells_by_class:
+                self.spells_by_class[previous_class][spell_id] = spell
+            for tag in self.spell_id_to_tags.get(spell_id, ()):
+                self.spells_by_tag.get(tag, {}).pop(spell_id, None)
+            for rank_id in (*_ipairs(previous.get("ranks")), *_ipairs(previous.get("variants"))):
+                if self.rank_to_canonical.get(rank_id) == spell_id:
+                    del self.rank_to_canonical[rank_id]
+            for aura in _ipairs(previous.get("triggersAuras")):
+                entry = self.aura_to_source.get(aura.get("spellID")) if isinstance(aura, dict) else None
+                if entry is not None and entry["sourceSpellID"] == spell_id:
+                    del self.aura_to_source[aura["spellID"]]
+
+        self.spells[spell_id] = spell
+        self.spells_by_class.setdefault(spell["class"], {})[spell_id] = spell
+        self.spell_id_to_tags[spell_id] = set()
+        for tag in _ipairs(spell.get("tags")):
+            self.spells_by_tag.setdefault(tag, {})[spell_id] = spell
+            self.spell_id_to_tags[spell_id].add(tag)
+        for rank_id in _ipairs(spell.get("ranks")):
+            self.rank_to_canonical[rank_id] = spell_id
+        self.rank_to_canonical[spell_id] = spell_id
+        for variant_id in _ipairs(spell.get("variants")):
+            self.rank_to_canonical[variant_id] = spell_id
+        for aura in _ipairs(spell.get("triggersAuras")):
+            if isinstance(aura, dict) and _truthy(aura.get("spellID")):
+                self.aura_to_source[aura["spellID"]] = {
+                    "sourceSpellID": spell_id,
+                    "tags": aura["tags"] if _truthy(aura.get("tags")) else [],
+                    "type": aura["type"] if _truthy(aura.get("type")) else "DEBUFF",
+                    "onTarget": aura.get("onTarget"),
+                    "duration": aura.get("duration"),
+                }
+        return True
+
+    # ─── Query API ───────────────────────────────────────────────────────────
+
+    def spell_info(self, spell_id: int) -> dict | None:
+        """lib:GetSpellInfo: the spell's data, looked up by any rank."""
+        spell = self.spells.get(spell_id)
+        if spell is not None:
+            return spell
+        canonical_id = self.rank_to_canonical.get(spell_id)
+        return self.spells.get(canonical_id) if canonical_id is not None else None
+
+    def spells_by_class_and_tag(self, class_name: str, tag: str) -> dict[int, dict]:
+        """lib:GetSpellsByClassAndTag: spellID -> data."""
+        return dict(self._class_tag.get((class_name, tag), {}))
+
+    def spells_by_all_tags(self, tags: Iterable[str]) -> dict[int, dict]:
+        """lib:GetSpellsByAllTags: spells carrying every tag (none for no tags)."""
+        sets = [self._tag_ids.get(tag, frozenset()) for tag in tags]
+        if not sets:
+            return {}
+        return {spell_id: self.spells[spell_id] for spell_id in frozenset.intersection(*sorted(sets, key=len))}
+
+    def canonical_spell_id(self, spell_id: int) -> int | None:
+        """lib:GetCanonicalSpellID."""
+        return self.rank_to_canonical.get(spell_id)
+
+    def aura_info(self, aura_spell_id: int) -> dict | None:
+        """lib:GetAuraInfo: {sourceSpellID, tags, type, onTarget, duration}."""
+        return self.aura_to_source.get(aura_spell_id)
+
+    def aura_source_spell_id(self, aura_spell_id: int) -> int | None:
+        """lib:GetAuraSourceSpellID."""
+        aura = self.aura_to_source.get(aura_spell_id)
+        return aura["sourceSpellID"] if aura is not None else None
+
+    def all_rank_ids(self, spell_id: int) -> frozenset[int]:
+        """lib:GetAllRankIDs: the canonical ID and every rank (the ID itself if unknown)."""
+        canonical_id = self.rank_to_canonical.get(spell_id, spell_id)
+        return self._rank_ids.get(canonical_id) or frozenset([canonical_id])
+
+    def proc_info(self, spell_id: int) -> dict | None:
+        """lib:GetProcInfo."""
+        spell = self.spell_info(spell_id)
+        info = spell.get("procInfo") if spell is not None else None
+        return info if _truthy(info) else None
+
+
+def bench(db: SpellQuery, calls: int) -> None:
+    classes = sorted(db.spells_by_class)
+    tags = sorted(db.spells_by_tag)
+    ids = sorted(set(db.rank_to_canonical) | set(db.aura_to_source)) + [0, 999999999]
+    tag_lists = [sorted(db.spell_id_to_tags[spell_id]) for spell_id in sorted(db.spells)]
+    queries = {
+        "spells_by_class_and_tag": lambda i: db.spells_by_class_and_tag(classes[i % len(classes)], tags[i % len(tags)]),
+        "spells_by_all_tags": lambda i: db.spells_by_all_tags(tag_lists[i % len(tag_lists)][:2]),
+        "canonical_spell_id": lambda i: db.canonical_spell_id(ids[i % len(ids)]),
+        "aura_source_spell_id": lambda i: db.aura_source_spell_id(ids[i % len(ids)]),
+        "all_rank_ids": lambda i: db.all_rank_ids(ids[i % len(ids)]),
+        "proc_info": lambda i: db.proc_info(ids[i % len(ids)]),
+    }
+    for name, query in queries.items():
+        started = time.perf_counter()
+        for i in range(calls):
+            query(i)
+        elapsed = time.perf_counter() - started
+        print(f"  {name:24s} {elapsed / calls * 1e6:8.2f} us/query")
+
+
+def _printable(result: Any) -> Any:
+    if isinstance(result, dict) and all(isinstance(value, dict) for value in result.values()) and result:
+        return {spell_id: spell.get("name") for spell_id, spell in sorted(result.items())}
+    if isinstance(result, frozenset):
+        return sorted(result)
+    return result
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("query", nargs="?", choices=("info", "class-and-tag", "all-tags", "canonical",
+                                                     "aura-source", "ranks", "proc"))
+    parser.add_argument("args", nargs="*")
+    parser.add_argument("--version", choices=GAME_VERSIONS, default="tbc", help="game version for versionOverrides")
+    parser.add_argument("--bench", type=int, metavar="N", help="time N calls of each query")
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    db = SpellQuery(args.version)
+    if args.bench:
+        print(f"Indexed {len(db.spells)} spells ({args.version}) in {(time.perf_counter() - started) * 1000:.1f} ms")
+        bench(db, args.bench)
+        return 0
+    if not args.query:
+        parser.error("a query or --bench is required")
+    try:
+        if args.query == "class-and-tag":
+            class_name, tag = args.args
+            result = db.spells_by_class_and_tag(class_name, tag)
+        elif args.query == "all-tags":
+            result = db.spells_by_all_tags(args.args)
+        else:
+            spell_id, = map(int, args.args)
+            result = {"info": db.spell_info, "canonical": db.canonical_spell_id, "aura-source": db.aura_source_spell_id,
+                      "ranks": db.all_rank_ids, "proc": db.proc_info}[args.query](spell_id)
+    except ValueError:
+        parser.error(f"wrong arguments for {args.query}")
+    print(json.dumps(_printable(result), indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""Golden-color regression for icon color extraction (needs NumPy and Pillow)."""
+
+from __future__ import annotations
+
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+
+TOOLS_DIR = Path(__file__).resolve().parent
+if str(TOOLS_DIR) not in sys.path:
+    sys.path.insert(0, str(TOOLS_DIR))
+
+try:
+    import color_regression  # noqa: E402
+except ImportError:  # NumPy or Pillow missing
+    color_regression = None
+
+
+@unittest.skipIf(color_regression is None, "NumPy and Pillow are not installed")
+class GoldenColorTests(unittest.TestCase):
+    def test_delta_e2000_matches_published_pairs(self):
+        # Sharma, Wu and Dalal (2005), pairs 1, 7, 17 and 25.
+        for lab1, lab2, expected in (((50, 2.6772, -79.7751), (50, 0, -82.7485), 2.0425),
+                                     ((50, 0, 0), (50, -1, 2), 2.3669),
+                                     ((50, 2.5, 0), (73, 25, -18), 27.1492),
+                                     ((60.2574, -34.0099, 36.2677), (60.4626, -34.1751, 39.4387), 1.2644)):
+            self.assertAlmostEqual(color_regression.delta_e2000(lab1, lab2), expected, places=4)
+
+    def test_every_extraction_path_matches_the_goldens(self):
+        corpus = color_regression.synthetic_corpus()
+        self.assertEqual(set(corpus.golden), set(color_regression.CORPUS), "run color_regression.py --update")
+        icons = corpus.load()
+        for path, extract in color_regression.EXTRACTORS.items():
+            with self.subTest(path):
+                moved = {name: delta for name, delta in color_regression.deltas(corpus, extract(icons)).items()
+                         if delta > color_regression.DEFAULT_TOLERANCE}
+                self.assertEqual(moved, {})
+
+    def test_batched_extraction_is_bit_identical_to_per_icon(self):
+        colors = color_regression.colors
+        icons = color_regression.synthetic_corpus().load()
+        self.assertEqual(colors.extract_colors(icons), [colors.extract_color(icon) for icon in icons])
+
+    def test_a_tuning_change_names_the_colors_it_moves(self):
+        corpus = color_regression.synthetic_corpus()
+        colors = color_regression.colors
+        with mock.patch.object(colors, "_warm_brighten", lambda ch, cs, cv, **_: colors.hsv_to_rgb(ch, cs, cv)):
+            result = color_regression.EXTRACTORS["batched"](corpus.load())
+        moved = {name for name, delta in color_regression.deltas(corpus, result).items()
+                 if delta > color_regression.DEFAULT_TOLERANCE}
+        # Gold and yellow already read bright enough; only the oranges were lifted.
+        self.assertEqual(moved, {"warm_orange", "deep_orange", "bin_edge"})
+
+    def test_packed_colors_round_trip_within_a_quantization_step(self):
+        colors = color_regression.colors
+        corpus = color_regression.synthetic_corpus()
+        spell_color = {index: tuple(rgb) for index, rgb in enumerate(filter(None, corpus.golden.values()), start=1)}
+        spell_color[len(spell_color) + 1] = (1.0, 0.0, 0.6)
+        with tempfile.TemporaryDirectory() as temp:
+            path = Path(temp) / "SpellColors.lua"
+            path.write_text(colors.render_spell_colors(spell_color), encoding="utf-8")
+            packed = colors.read_spell_colors(path)
+        self.assertEqual(packed.keys(), spell_color.keys())
+        for spell_id, rgb in spell_color.items():
+            for channel, value in zip(packed[spell_id], rgb):
+                self.assertLessEqual(abs(channel - value), 0.5 / 255 + 1e-9)
+        self.assertEqual(packed[len(spell_color)], (1.0, 0.0, 0.6))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""Offline tests for the build-pinned DB2 store."""
+
+from __future__ import annotations
+
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+
+TOOLS_DIR = Path(__file__).resolve().parent
+if str(TOOLS_DIR) not in sys.path:
+    sys.path.insert(0, str(TOOLS_DIR))
+
+import db2_store  # noqa: E402
+import http_session  # noqa: E402
+import wowhead_audit  # noqa: E402
+
+
+SPELL_NAME_CSV = "﻿ID,Name_lang\n100,Charge\n7922,Charge Stun\n1337,007\n"
+SPELL_COOLDOWNS_CSV = (
+    "ID,DifficultyID,CategoryRecoveryTime,RecoveryTime,StartRecoveryTime,SpellID\n"
+    "1,0,0,15000,0,100\n"
+    "2,0,0,0,1500,7922\n"
+)
+
+
+class StoreTests(unittest.TestCase):
+    def setUp(self):
+        temp = tempfile.TemporaryDirectory()
+        self.addCleanup(temp.cleanup)
+        self.root = Path(temp.name)
+        patcher = mock.patch.object(db2_store, "STORE_DIR", self.root)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        store = db2_store.Db2Store("2.5.5.1")
+        store.ingest("SpellName", SPELL_NAME_CSV.splitlines(keepends=True), "test")
+        store.ingest("SpellCooldowns", SPELL_COOLDOWNS_CSV.splitlines(keepends=True), "test")
+        store.close()
+
+    def test_ingested_tables_are_typed_and_indexed(self):
+        store = db2_store.Db2Store("2.5.5.1")
+        self.addCleanup(store.close)
+        self.assertEqual(store.tables()["SpellName"][0], 3)
+        self.assertEqual(store.spell_names(), {100: "Charge", 7922: "Charge Stun", 1337: "007"})
+        self.assertEqual(store.spell_cooldowns(), {100: 15.0})
+        plan = " ".join(str(row) for row in store.connection.execute(
+            'EXPLAIN QUERY PLAN SELECT * FROM db2_SpellCooldowns WHERE SpellID = 100'))
+        self.assertIn("db2_SpellCooldowns_SpellID", plan)
+
+    def test_ingested_builds_need_no_network(self):
+        with mock.patch.object(http_session.Session, "_open", side_effect=AssertionError("network")):
+            wago = wowhead_audit.WagoClient("2.5.5.1", "2.5.5.1", offline=True)
+            self.assertEqual(wago.names["tbc"][100], "Charge")
+            self.assertEqual(wago.cooldowns["classic"], {100: 15.0})
+            background = wowhead_audit.WagoClient("2.5.5.1", "2.5.5.1", offline=True, background=True)
+            self.assertEqual(background.cooldowns["tbc"], {100: 15.0})
+            self.assertEqual(background.builds, {"tbc": "2.5.5.1", "classic": "2.5.5.1"})
+            with self.assertRaises(db2_store.StoreError):
+                db2_store.Db2Store("2.5.5.1", offline=True).ensure("SpellEffect")
+
+    def test_offline_builds_use_last_known_versions(self):
+        with self.assertRaises(db2_store.StoreError):
+            db2_store.latest_builds(["wow_anniversary"], offline=True)
+        (self.root / "builds.json").write_text('{"wow_anniversary": "2.5.5.1"}', encoding="utf-8")
+        self.assertEqual(db2_store.latest_builds(["wow_anniversary"], offline=True),
+                         {"wow_anniversary": "2.5.5.1"})
+
+
+class CsvColumnTests(unittest.TestCase):
+    def test_projects_typed_columns_and_skips_bad_rows(self):
+        with tempfile.TemporaryDirectory() as temp:
+            path = Path(temp) / "Spell.csv"
+            path.write_text(
+                "﻿ID,NameSubtext_lang,Description_lang,SpellID\r\n"
+                "1,Rank 1,plain,100\r\n"
+                '2,,"quoted, with comma\r\nand a second line",200\r\n'
+                "\r\n"
+                "3,short\r\n"
+                "x,Rank 2,not an id,300\r\n"
+                "4,Rank 3,last,400",
+                encoding="utf-8",
+            )
+            self.assertEqual(
+                list(db2_store.iter_csv_columns(path, ("SpellID", 0, "Description_lang"), (int, int, str))),
+                [(100, 1, "plain"), (200, 2, "quoted, with comma\r\nand a second line"),
+                 (400, 4, "last")],
+            )
+            self.assertEqual(list(db2_store.iter_csv_columns(path, ("NameSubtext_lang",)))[:2], [("Rank 1",), ("",)])
+            with self.assertRaises(db2_store.StoreError):
+                list(db2_store.iter_csv_columns(path, ("EffectTriggerSpell",)))
+
+    def test_missing_columns_take_their_defaults(self):
+        with tempfile.TemporaryDirectory() as temp:
+            path = Path(temp) / "SpellEffect.csv"
+            path.write_text("ID,Effect,SpellID,EffectTriggerSpell\n1,64,100,7922\n2,6,x,0\n", encoding="utf-8")
+            columns = ("Effect", "SpellID", "EffectTriggerSpell", "EffectIndex")
+            self.assertEqual(list(db2_store.iter_csv_columns(path, columns, (int,) * 4, {"EffectIndex": 0})),
+                             [(64, 100, 7922, 0)])
+            with self.assertRaises(db2_store.StoreError):
+                list(db2_store.iter_csv_columns(path, columns, (int,) * 4, {"EffectAura": 0}))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""Tests for the icon color cache and parallel extraction of
+generate_icon_colors.py (needs NumPy and Pillow)."""
+
+from __future__ import annotations
+
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+
+TOOLS_DIR = Path(__file__).resolve().parent
+if str(TOOLS_DIR) not in sys.path:
+    sys.path.insert(0, str(TOOLS_DIR))
+
+import icon_source  # noqa: E402
+
+try:
+    import generate_icon_colors as colors  # noqa: E402
+except ImportError:  # NumPy or Pillow missing
+    colors = None
+
+
+@unittest.skipIf(colors is None, "NumPy and Pillow are not installed")
+class ColorCacheTests(unittest.TestCase):
+    def setUp(self):
+        temp = tempfile.TemporaryDirectory()
+        self.addCleanup(temp.cleanup)
+        self.root = Path(temp.name)
+        self.icons = self.root / "icons"
+        self.icons.mkdir()
+        colors.synthetic_icons(self.icons, 12, size=32)
+        # Three batches, so jobs > 1 really goes through the process pool.
+        for patcher in (mock.patch.object(colors, "COLOR_CACHE", self.root / "icon_colors.json"),
+                        mock.patch.object(colors, "BATCH_SIZE", 4)):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def icon_colors(self, **kwargs):
+        with icon_source.open_source(self.icons, self.root / "index") as source:
+            result, errors, hits = colors.icon_colors(source, source.names(), **kwargs)
+        self.assertEqual(errors, {})
+        return result, hits
+
+    def test_warm_runs_reextract_only_changed_icons(self):
+        cold, hits = self.icon_colors(jobs=1)
+        self.assertEqual((len(cold), hits), (12, 0))
+        self.assertEqual(self.icon_colors(jobs=1), (cold, 12))
+
+        edited = self.root / "edited"
+        edited.mkdir()
+        colors.synthetic_icons(edited, 1, size=32, seed=2)[0].replace(self.icons / "bench_00003.tga")
+        recolored, hits = self.icon_colors(jobs=1)
+        self.assertEqual(hits, 11)
+        self.assertEqual({icon for icon in cold if recolored[icon] != cold[icon]}, {"bench_00003"})
+
+        with mock.patch.object(colors, "COLOR_ALGO_VERSION", colors.COLOR_ALGO_VERSION + 1):
+            self.assertEqual(self.icon_colors(jobs=1), (recolored, 0))
+
+    def test_process_pool_matches_serial_extraction(self):
+        serial, _ = self.icon_colors(jobs=1, use_cache=False)
+        self.assertEqual(self.icon_colors(jobs=2, use_cache=False), (serial, 0))
+        self.assertFalse(colors.COLOR_CACHE.exists())
+
+
+if __name__ == "__main__":
+    unittest.main()
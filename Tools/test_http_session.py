@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""Offline tests for the shared keep-alive HTTP session."""
+
+from __future__ import annotations
+
+import gzip
+import sys
+import threading
+import unittest
+import zlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+
+TOOLS_DIR = Path(__file__).resolve().parent
+if str(TOOLS_DIR) not in sys.path:
+    sys.path.insert(0, str(TOOLS_DIR))
+
+import http_session  # noqa: E402
+
+
+class KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    hits: dict[str, int] = {}
+
+    def do_GET(self):
+        self.hits[self.path] = self.hits.get(self.path, 0) + 1
+        if self.path == "/flaky" and self.hits[self.path] == 1:
+            return self.reply(503, b"busy", {"Retry-After": "0"})
+        if self.path == "/moved":
+            return self.reply(302, b"", {"Location": "/csv"})
+        if self.path == "/missing":
+            return self.reply(404, b"no")
+        body = b"ID,Name_lang\n" + b"".join(b"%d,Spell %d\n" % (n, n) for n in range(2000))
+        if self.path == "/deflate":
+            return self.reply(200, zlib.compress(body), {"Content-Encoding": "deflate"})
+        if self.path == "/raw-deflate":
+            deflater = zlib.compressobj(wbits=-zlib.MAX_WBITS)
+            return self.reply(200, deflater.compress(body) + deflater.flush(), {"Content-Encoding": "deflate"})
+        if "gzip" in self.headers.get("Accept-Encoding", ""):
+            return self.reply(200, gzip.compress(body), {"Content-Encoding": "gzip"})
+        return self.reply(200, body)
+
+    def reply(self, status, body, headers=None):
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class SessionTests(unittest.TestCase):
+    def setUp(self):
+        KeepAliveHandler.hits = {}
+        server = ThreadingHTTPServer(("127.0.0.1", 0), KeepAliveHandler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        self.base = f"http://127.0.0.1:{server.server_address[1]}"
+        self.session = http_session.Session(backoff=0)
+        self.addCleanup(self.session.close)
+
+    def test_connections_are_reused_and_gzip_is_decoded(self):
+        for _ in range(5):
+            response = self.session.get(self.base + "/csv")
+        self.assertTrue(response.text().startswith("ID,Name_lang\n0,Spell 0\n"))
+        stats = self.session.stats["127.0.0.1"]
+        self.assertEqual((stats.requests, stats.connections), (5, 1))
+        self.assertLess(stats.bytes / 5, len(response.body) / 2)
+
+    def test_retries_redirects_and_errors_are_accounted(self):
+        self.assertEqual(self.session.get(self.base + "/flaky").status, 200)
+        with self.session.stream(self.base + "/moved") as body:
+            self.assertEqual(body.read().count(b"\n"), 2001)
+        with self.assertRaises(http_session.HTTPStatusError) as raised:
+            self.session.get(self.base + "/missing")
+        self.assertEqual(raised.exception.code, 404)
+        stats = self.session.stats["127.0.0.1"]
+        self.assertEqual((stats.requests, stats.retries, stats.errors, stats.connections), (5, 1, 1, 1))
+        report = stats.as_dict()
+        self.assertEqual(len(stats.latencies), 5)
+        self.assertLessEqual(report["p50_ms"], report["p95_ms"])
+
+    def test_streamed_deflate_is_decoded_with_or_without_zlib_header(self):
+        for path in ("/deflate", "/raw-deflate"):
+            with self.subTest(path), self.session.stream(self.base + path) as body:
+                self.assertEqual(body.readline(), b"ID,Name_lang\n")
+                self.assertEqual(body.read().count(b"\n"), 2000)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""Offline tests for the icon sources used by generate_icon_colors.py."""
+
+from __future__ import annotations
+
+import io
+import os
+import struct
+import sys
+import tarfile
+import tempfile
+import unittest
+import zipfile
+from pathlib import Path
+from unittest import mock
+
+
+TOOLS_DIR = Path(__file__).resolve().parent
+if str(TOOLS_DIR) not in sys.path:
+    sys.path.insert(0, str(TOOLS_DIR))
+
+import icon_source  # noqa: E402
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+WIDTH, HEIGHT = 4, 3
+# Row-major RGBA, top row first.
+PIXELS = [((17 * i) % 256, (40 + 29 * i) % 256, (200 - 13 * i) % 256, 255 if i % 3 else 90)
+          for i in range(WIDTH * HEIGHT)]
+
+
+def tga(depth: int, top_down: bool) -> bytes:
+    descriptor = (8 if depth == 32 else 0) | (0x20 if top_down else 0)
+    rows = [PIXELS[y * WIDTH:(y + 1) * WIDTH] for y in range(HEIGHT)]
+    if not top_down:
+        rows.reverse()
+    body = bytes(value for row in rows for r, g, b, a in row for value in (b, g, r, a)[:depth // 8])
+    return struct.pack("<BBBHHBHHHHBB", 0, 0, 2, 0, 0, 0, 0, 0, WIDTH, HEIGHT, depth, descriptor) + body
+
+
+def blp(encoding: int, alpha_depth: int) -> bytes:
+    palette = bytearray(1024)
+    if encoding == 3:
+        data = bytes(value for r, g, b, a in PIXELS for value in (b, g, r, a))
+    else:
+        # One palette entry per pixel; palette alpha is left at 0 on purpose.
+        for index, (r, g, b, _) in enumerate(PIXELS):
+            palette[index * 4:index * 4 + 4] = bytes((b, g, r, 0))
+        alpha = [a for *_, a in PIXELS]
+        if alpha_depth == 1:
+            bits = sum((value > 127) << n for n, value in enumerate(alpha))
+            packed = bits.to_bytes((len(alpha) + 7) // 8, "little")
+        else:
+            packed = bytes(alpha)
+        data = bytes(range(len(PIXELS))) + packed
+    offsets = [148 + 1024] + [0] * 15
+    lengths = [len(data)] + [0] * 15
+    header = struct.pack("<4sIBBBBII16I16I", b"BLP2", 1, encoding, alpha_depth, 0, 0, WIDTH, HEIGHT, *offsets, *lengths)
+    return header + bytes(palette) + data
+
+
+FILES = {
+    "Spell_Bottom_Up.tga": tga(32, top_down=False),
+    "Spell_Top_Down.tga": tga(24, top_down=True),
+    "Spell_Raw.blp": blp(3, 8),
+    "Spell_Palette.blp": blp(1, 8),
+    "Spell_Palette_1bit.blp": blp(1, 1),
+    "Spell_Top_Down.blp": blp(3, 0),  # shadowed by the .tga of the same name
+    "readme.txt": b"not an icon",
+}
+
+
+class SourceTests(unittest.TestCase):
+    def setUp(self):
+        temp = tempfile.TemporaryDirectory()
+        self.addCleanup(temp.cleanup)
+        self.root = Path(temp.name)
+        self.index = self.root / "index"
+        self.folder = self.root / "ICONS"
+        self.folder.mkdir()
+        for name, data in FILES.items():
+            (self.folder / name).write_bytes(data)
+
+    def open(self, path):
+        source = icon_source.open_source(path, self.index)
+        self.addCleanup(source.close)
+        return source
+
+    def test_folder_index_is_persisted_until_the_folder_changes(self):
+        source = self.open(self.folder)
+        self.assertEqual(source.names()["spell_top_down"], "Spell_Top_Down.tga")
+        self.assertEqual(len(source.entries), 6)
+        digest = source.digest("Spell_Raw.blp")
+        source.close()
+        with mock.patch.object(os, "scandir", side_effect=AssertionError("scanned")), \
+                mock.patch.object(icon_source, "_sha256", side_effect=AssertionError("hashed")):
+            reopened = self.open(self.folder)
+            self.assertEqual(reopened.digest("Spell_Raw.blp"), digest)
+        (self.folder / "Spell_Raw.blp").write_bytes(FILES["Spell_Palette.blp"])
+        self.assertNotEqual(reopened.digest("Spell_Raw.blp"), digest)
+        (self.folder / "Spell_New.tga").write_bytes(FILES["Spell_Top_Down.tga"])
+        os.utime(self.folder, ns=(0, self.folder.stat().st_mtime_ns + 1))
+        self.assertIn("spell_new", self.open(self.folder).names())
+
+    def test_archives_and_pack_match_the_folder(self):
+        folder = self.open(self.folder)
+        stored, deflated = self.root / "stored.zip", self.root / "deflated.zip"
+        for path, method in ((stored, zipfile.ZIP_STORED), (deflated, zipfile.ZIP_DEFLATED)):
+            with zipfile.ZipFile(path, "w", method) as archive:
+                for name, data in FILES.items():
+                    archive.writestr(f"Interface/ICONS/{name}", data)
+        for path, mode in ((self.root / "icons.tar", "w"), (self.root / "icons.tgz", "w:gz")):
+            with tarfile.open(path, mode) as archive:
+                for name, data in FILES.items():
+                    info = tarfile.TarInfo(name)
+                    info.size = len(data)
+                    archive.addfile(info, io.BytesIO(data))
+        self.assertEqual(icon_source.pack(folder, self.root / "icons.pack"), 6)
+
+        expected = {name: folder.digest(member) for name, member in folder.names().items()}
+        for path, kind, mapped in ((stored, "zip", True), (deflated, "zip", False), (self.root / "icons.tar", "tar", True),
+                                   (self.root / "icons.tgz", "tar", False), (self.root / "icons.pack", "pack", True)):
+            with self.subTest(path.name):
+                source = self.open(path)
+                self.assertEqual(source.kind, kind)
+                names = source.names()
+                self.assertEqual({name: source.digest(member) for name, member in names.items()}, expected)
+                self.assertEqual(isinstance(source.read(names["spell_raw"]), memoryview), mapped)
+                if np is not None:
+                    np.testing.assert_array_equal(source.pixels(names["spell_raw"]), folder.pixels("Spell_Raw.blp"))
+        with self.assertRaises(icon_source.IconSourceError):
+            icon_source.open_source(self.folder / "readme.txt", self.index)
+
+    @unittest.skipIf(np is None, "NumPy is not installed")
+    def test_uncompressed_formats_decode_from_the_mapping(self):
+        source = self.open(self.folder)
+        expected = np.array(PIXELS, np.uint8).reshape(HEIGHT, WIDTH, 4)
+        opaque = expected.copy()
+        opaque[..., 3] = 255
+        one_bit = expected.copy()
+        one_bit[..., 3] = np.where(expected[..., 3] > 127, 255, 0)
+        for member, pixels in (("Spell_Bottom_Up.tga", expected), ("Spell_Top_Down.tga", opaque),
+                               ("Spell_Raw.blp", expected), ("Spell_Palette.blp", expected),
+                               ("Spell_Palette_1bit.blp", one_bit), ("Spell_Top_Down.blp", opaque)):
+            with self.subTest(member):
+                self.assertIsNotNone(icon_source._tga_pixels(source.read(member)) if member.endswith(".tga")
+                                     else icon_source._blp_pixels(source.read(member)))
+                np.testing.assert_array_equal(source.pixels(member), pixels)
+        try:
+            from PIL import Image
+        except ImportError:
+            return
+        for member in ("Spell_Bottom_Up.tga", "Spell_Top_Down.tga"):
+            with Image.open(self.folder / member) as image:
+                np.testing.assert_array_equal(source.pixels(member), np.asarray(image.convert("RGBA")))
+        # RLE TGA is not mapped but still decodes, through Pillow.
+        rle = self.root / "rle.tga"
+        Image.fromarray(expected, "RGBA").save(rle, compression="tga_rle")
+        np.testing.assert_array_equal(icon_source.decode(rle.read_bytes(), ".tga"), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""Tests for the headless Lua load harness (the load runs need lua5.1)."""
+
+from __future__ import annotations
+
+import shutil
+import sys
+import unittest
+from pathlib import Path
+
+
+TOOLS_DIR = Path(__file__).resolve().parent
+if str(TOOLS_DIR) not in sys.path:
+    sys.path.insert(0, str(TOOLS_DIR))
+
+import lua_harness  # noqa: E402
+import spell_data  # noqa: E402
+
+
+LUA = shutil.which("lua5.1")
+
+
+class LoadOrderTests(unittest.TestCase):
+    def test_files_load_in_xml_order(self):
+        files = spell_data.load_order(lua_harness.ADDON_DIR)
+        self.assertEqual(files[:5], [lua_harness.LIBSTUB_FILE, "Core/LibSpellDB.lua", "Core/Categories.lua",
+                                     "Core/SpecDetection.lua", "Core/Commands.lua"])
+        self.assertEqual(files[-1], "Data/SpellColors.lua")
+        self.assertEqual(len(files), len(set(files)))
+
+
+@unittest.skipIf(LUA is None, "lua5.1 is not installed")
+class LoadTests(unittest.TestCase):
+    def test_load_reports_files_indexes_and_unknown_spells(self):
+        names = {spell_id: f"Spell {spell_id} \"ö\"" for spell_id in lua_harness.referenced_ids(lua_harness.ADDON_DIR)}
+        del names[18499]  # Berserker Rage has no other ranks to fall back to
+        report, = lua_harness.measure([lua_harness.ADDON_DIR], names, lua_harness.FLAVORS["tbc"],
+                                      "2.5.5.1", LUA, 1)
+        libstub = (lua_harness.ADDON_DIR / lua_harness.LIBSTUB_FILE).is_file()
+        self.assertEqual(list(report["files"]), [name for name in spell_data.load_order(lua_harness.ADDON_DIR)
+                                                 if libstub or name != lua_harness.LIBSTUB_FILE])
+        self.assertGreater(report["files"]["Data/Warrior.lua"]["memory_kb"], 0)
+        self.assertEqual(report["counts"]["invalid"], 1)
+        self.assertEqual(set(report["indexes"]), set(lua_harness.INDEXES))
+        self.assertTrue(all(size > 0 for size in report["indexes"].values()))
+
+
+if __name__ == "__main__":
+    unittest.main()
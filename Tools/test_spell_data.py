@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""Offline regression tests for the shared Data/*.lua parser."""
+
+from __future__ import annotations
+
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+
+TOOLS_DIR = Path(__file__).resolve().parent
+if str(TOOLS_DIR) not in sys.path:
+    sys.path.insert(0, str(TOOLS_DIR))
+
+import spell_data  # noqa: E402
+
+
+SAMPLE = '''local lib = LIBSPELLDB_REGISTRATION
+if not lib then return end
+local C = lib.Categories
+local AT = lib.AuraTarget
+local HUMAN = "Human"
+
+lib:RegisterSpells({
+    {
+        spellID = 100,  -- Charge { not a brace }
+        name = "Charge \\"Stun\\"",
+        tags = {C.CC_HARD, C.MOVEMENT},
+        duration = 1.5,
+        auraTarget = AT.ENEMY,
+        race = HUMAN,
+        --[[ spellID = 999, a commented-out field ]]
+        triggersAuras = {
+            { spellID = 7922, type = "DEBUFF", onTarget = true },
+        },
+        rankDurations = {[3599] = 30, [6363] = 35},
+        versionOverrides = { vanilla = { spellID = 11958 } },
+    },
+}, "WARRIOR")
+'''
+
+
+class ParserTests(unittest.TestCase):
+    def setUp(self):
+        self.data_file = spell_data.parse_source(SAMPLE, "Sample.lua")
+        self.entry = self.data_file.spells()[0]
+
+    def test_top_level_fields_are_typed(self):
+        self.assertEqual(self.entry.spell_id, 100)
+        self.assertEqual(self.entry.name, 'Charge "Stun"')
+        self.assertEqual(self.entry.tags, ["CC_HARD", "MOVEMENT"])
+        self.assertEqual(self.entry.get("duration"), 1.5)
+        self.assertEqual(self.entry.get("auraTarget"), spell_data.Ref("AT.ENEMY"))
+        self.assertEqual(self.entry.resolved_class, "WARRIOR")
+
+    def test_nested_tables_stay_nested(self):
+        auras = self.entry.table.table("triggersAuras")
+        self.assertEqual([aura.get("spellID") for aura in auras.array], [7922])
+        self.assertEqual(sorted(self.entry.table.table("rankDurations").fields), [3599, 6363])
+        overrides = self.entry.table.table("versionOverrides")
+        self.assertEqual(overrides.table("vanilla").get("spellID"), 11958)
+
+    def test_comments_and_strings_do_not_leak_fields(self):
+        nested_ids = [table.get("spellID") for table in self.entry.table.walk() if "spellID" in table]
+        self.assertNotIn(999, nested_ids)
+
+    def test_entry_lines_and_text(self):
+        self.assertEqual((self.entry.line, self.entry.end_line), (8, 21))
+        self.assertTrue(self.entry.text.startswith("{") and self.entry.text.endswith("}"))
+        self.assertEqual(self.data_file.registrations[0].line, 7)
+
+    def test_file_locals_resolve(self):
+        self.assertEqual(self.data_file.locals["AT"], spell_data.Ref("lib.AuraTarget"))
+        self.assertEqual(self.data_file.resolve(self.entry.get("race")), "Human")
+
+    def test_syntax_errors_name_the_line(self):
+        with self.assertRaises(spell_data.LuaSyntaxError) as context:
+            spell_data.parse_source('lib:RegisterSpells({\n    { spellID = 1 name = "x" },\n})', "Bad.lua")
+        self.assertEqual(context.exception.line, 2)
+        with self.assertRaises(spell_data.LuaSyntaxError):
+            spell_data.parse_table('{ name = "unterminated }')
+
+
+class ParseCacheTests(unittest.TestCase):
+    def setUp(self):
+        temp = tempfile.TemporaryDirectory()
+        self.addCleanup(temp.cleanup)
+        self.root = Path(temp.name)
+        patcher = mock.patch.object(spell_data, "PARSE_CACHE_DIR", self.root / "parsed")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.path = self.root / "Sample.lua"
+        self.path.write_text(SAMPLE, encoding="utf-8")
+
+    def test_unchanged_file_loads_from_cache(self):
+        first = spell_data.parse_data_file(self.path)
+        with mock.patch.object(spell_data, "parse_source", side_effect=AssertionError("re-parsed")):
+            cached = spell_data.parse_data_file(self.path)
+        self.assertEqual(cached.spells()[0].table.to_python(), first.spells()[0].table.to_python())
+        self.assertEqual(cached.spells()[0].text, first.spells()[0].text)
+        self.assertEqual(cached.locals, first.locals)
+
+    def test_edited_or_corrupt_entries_are_reparsed(self):
+        spell_data.parse_data_file(self.path)
+        self.path.write_text(SAMPLE.replace("spellID = 100", "spellID = 101"), encoding="utf-8")
+        self.assertEqual(spell_data.parse_data_file(self.path).spells()[0].spell_id, 101)
+        (self.root / "parsed" / "Sample.lua.pickle").write_bytes(b"not a pickle")
+        self.assertEqual(spell_data.parse_data_file(self.path).spells()[0].spell_id, 101)
+
+
+class RepositoryDataTests(unittest.TestCase):
+    def test_every_data_file_parses(self):
+        parsed = spell_data.load_data_files()
+        self.assertTrue(parsed["Warrior.lua"].spells())
+        self.assertTrue(parsed["Trinkets.lua"].entries("RegisterTrinkets"))
+        self.assertIn("lib.spellColors", parsed["SpellColors.lua"].assignments)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""Offline regression tests for the compiled SQLite spell snapshot."""
+
+from __future__ import annotations
+
+import shutil
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+
+TOOLS_DIR = Path(__file__).resolve().parent
+if str(TOOLS_DIR) not in sys.path:
+    sys.path.insert(0, str(TOOLS_DIR))
+
+import spell_data  # noqa: E402
+import spell_db  # noqa: E402
+
+
+class SnapshotTests(unittest.TestCase):
+    def setUp(self):
+        temp = tempfile.TemporaryDirectory()
+        self.addCleanup(temp.cleanup)
+        root = Path(temp.name)
+        self.data_dir = root / "Data"
+        shutil.copytree(spell_data.DATA_DIR, self.data_dir)
+        patcher = mock.patch.object(spell_data, "PARSE_CACHE_DIR", root / "parsed")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.db_path = root / "spells.sqlite"
+        self.connection, self.rebuilt = spell_db.build(db_path=self.db_path, data_dir=self.data_dir)
+        self.addCleanup(self.connection.close)
+
+    def scalar(self, query, *params):
+        return self.connection.execute(query, params).fetchone()[0]
+
+    def test_every_entry_is_compiled(self):
+        entries = [entry for data_file in spell_data.load_data_files(data_dir=self.data_dir).values()
+                   for entry in data_file.entries()]
+        spells = sum(entry.method == "RegisterSpells" for entry in entries)
+        self.assertEqual(self.scalar("SELECT COUNT(*) FROM spells"), spells)
+        self.assertEqual(self.scalar("SELECT COUNT(*) FROM items"), len(entries) - spells)
+
+    def test_nested_tables_are_queryable(self):
+        charge = self.scalar("SELECT id FROM spells WHERE spell_id = 100 AND file = 'Warrior.lua'")
+        self.assertEqual(self.scalar("SELECT spell_id FROM triggered_auras WHERE entry = ?", charge), 7922)
+        self.assertTrue(self.scalar("SELECT COUNT(*) FROM tags WHERE entry = ?", charge))
+        self.assertTrue(self.scalar("SELECT COUNT(*) FROM version_overrides WHERE disabled = 1"))
+        self.assertEqual(self.scalar(
+            "SELECT COUNT(*) FROM ranks r JOIN spells s ON s.id = r.entry"
+            " WHERE s.spell_id = 2136 AND s.file = 'Mage.lua'"), 9)
+
+    def test_only_changed_files_are_recompiled(self):
+        self.assertIn("Warrior.lua", self.rebuilt)
+        self.assertEqual(spell_db.build(db_path=self.db_path, data_dir=self.data_dir)[1], [])
+
+        warrior = self.data_dir / "Warrior.lua"
+        warrior.write_text(warrior.read_text(encoding="utf-8").replace("spellID = 100,", "spellID = 99100,", 1),
+                           encoding="utf-8")
+        connection, rebuilt = spell_db.build(db_path=self.db_path, data_dir=self.data_dir)
+        self.addCleanup(connection.close)
+        self.assertEqual(rebuilt, ["Warrior.lua"])
+        self.assertEqual(connection.execute("SELECT COUNT(*) FROM spells WHERE spell_id = 99100").fetchone()[0], 1)
+        self.assertEqual(connection.execute("SELECT COUNT(*) FROM spells WHERE spell_id = 100").fetchone()[0], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""Tests for the Python spell query API, including conformance with the Lua
+library run through lua_harness.py (needs lua5.1)."""
+
+from __future__ import annotations
+
+import re
+import shutil
+import sys
+import time
+import unittest
+from pathlib import Path
+
+
+TOOLS_DIR = Path(__file__).resolve().parent
+if str(TOOLS_DIR) not in sys.path:
+    sys.path.insert(0, str(TOOLS_DIR))
+
+import lua_harness  # noqa: E402
+import spell_query  # noqa: E402
+
+
+LUA = shutil.which("lua5.1")
+# Dropped from the conformance name snapshot: Berserker Rage has no other rank
+# (skipped), Charge registers through its rank 2.
+MISSING_FROM_CLIENT = (18499, 100)
+
+# Queries the Lua side answers for every input below, one "result" line each.
+CONFORMANCE_LUA = r"""
+local function idList(set)
+    local list = {}
+    for id in pairs(set) do list[#list + 1] = id end
+    table.sort(list)
+    return table.concat(list, ",")
+end
+local function show(value)
+    if type(value) == "string" then return '"' .. value .. '"' end
+    if type(value) == "number" then return string.format("%.14g", value) end
+    if type(value) ~= "table" then return tostring(value) end
+    local keys, parts = {}, {}
+    for key in pairs(value) do keys[#keys + 1] = tostring(key) end
+    table.sort(keys)
+    for _, key in ipairs(keys) do
+        parts[#parts + 1] = key .. "=" .. show(value[tonumber(key) or key])
+    end
+    return "{" .. table.concat(parts, ",") .. "}"
+end
+for _, query in ipairs(CLASS_TAG) do
+    emit("result", "class_and_tag " .. query[1] .. " " .. query[2], idList(lib:GetSpellsByClassAndTag(query[1], query[2])))
+end
+for _, tags in ipairs(ALL_TAGS) do
+    emit("result", "all_tags " .. table.concat(tags, "+"), idList(lib:GetSpellsByAllTags(tags)))
+end
+for _, id in ipairs(IDS) do
+    emit("result", "canonical " .. id, show(lib:GetCanonicalSpellID(id)))
+    emit("result", "aura_source " .. id, show(lib:GetAuraSourceSpellID(id)))
+    emit("result", "ranks " .. id, idList(lib:GetAllRankIDs(id)))
+    emit("result", "proc " .. id, show(lib:GetProcInfo(id)))
+end
+"""
+
+
+def _show(value) -> str:
+    """Python twin of the Lua ``show`` above."""
+    if isinstance(value, bool) or value is None:
+        return {True: "true", False: "false", None: "nil"}[value]
+    if isinstance(value, str):
+        return f'"{value}"'
+    if isinstance(value, (int, float)):
+        return format(value, ".14g")
+    items = dict(enumerate(value, 1)) if isinstance(value, list) else value
+    return "{" + ",".join(f"{key}={_show(items[key])}" for key in sorted(items, key=str)) + "}"
+
+
+def conformance_inputs(db: spell_query.SpellQuery) -> tuple[list, list, list]:
+    classes = sorted(db.spells_by_class) + ["SHARED", "NOBODY"]
+    tags = sorted(db.spells_by_tag) + ["NOT_A_TAG"]
+    class_tag = [(class_name, tag) for class_name in classes for tag in tags]
+    all_tags = [[tag] for tag in tags] + [[], ["DPS", "NOT_A_TAG"]]
+    all_tags += [list(spell["tags"]) for spell in db.spells.values()]
+    ids = sorted(lua_harness.referenced_ids(lua_harness.ADDON_DIR) | {0, 999999999})
+    return class_tag, all_tags, ids
+
+
+def python_results(db: spell_query.SpellQuery, inputs: tuple[list, list, list]) -> dict[str, str]:
+    class_tag, all_tags, ids = inputs
+    results = {}
+    for class_name, tag in class_tag:
+        results[f"class_and_tag {class_name} {tag}"] = ",".join(
+            map(str, sorted(db.spells_by_class_and_tag(class_name, tag))))
+    for tags in all_tags:
+        results[f"all_tags {'+'.join(tags)}"] = ",".join(map(str, sorted(db.spells_by_all_tags(tags))))
+    for spell_id in ids:
+        results[f"canonical {spell_id}"] = _show(db.canonical_spell_id(spell_id))
+        results[f"aura_source {spell_id}"] = _show(db.aura_source_spell_id(spell_id))
+        results[f"ranks {spell_id}"] = ",".join(map(str, sorted(db.all_rank_ids(spell_id))))
+        results[f"proc {spell_id}"] = re.sub(r"[\t\r\n]", " ", _show(db.proc_info(spell_id)))
+    return results
+
+
+def lua_inputs(inputs: tuple[list, list, list]) -> str:
+    class_tag, all_tags, ids = inputs
+    string = lua_harness._lua_string
+    return "\n".join([
+        "local CLASS_TAG = {" + ",".join(f"{{{string(c)},{string(t)}}}" for c, t in class_tag) + "}",
+        "local ALL_TAGS = {" + ",".join("{" + ",".join(map(string, tags)) + "}" for tags in all_tags) + "}",
+        "local IDS = {" + ",".join(map(str, ids)) + "}",
+        CONFORMANCE_LUA,
+    ])
+
+
+class QueryTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.db = spell_query.SpellQuery("tbc")
+
+    def test_queries_follow_the_registered_data(self):
+        db = self.db
+        self.assertEqual(db.canonical_spell_id(6178), 100)
+        self.assertEqual(db.all_rank_ids(11578), frozenset({100, 6178, 11578}))
+        self.assertEqual(db.all_rank_ids(999999999), frozenset({999999999}))
+        self.assertEqual(db.aura_source_spell_id(7922), 100)
+        self.assertEqual(db.aura_info(7922)["tags"], ["CC_HARD"])
+        self.assertIsNone(db.aura_source_spell_id(100))
+        self.assertLessEqual({72, 6552}, set(db.spells_by_class_and_tag("WARRIOR", "INTERRUPT")))
+        self.assertEqual(db.spells_by_all_tags([]), {})
+        self.assertIn(100, db.spells_by_all_tags(["CC_HARD", "MOVEMENT_GAP_CLOSE"]))
+        self.assertEqual(db.proc_info(12880), db.proc_info(14204))
+        self.assertIs(db.proc_info(14204)["stacks"], False)
+        self.assertEqual(db.spell_info(100)["auraTarget"], "enemy")
+
+    def test_version_overrides_and_client_names(self):
+        self.assertIn(33745, self.db.spells)
+        self.assertNotIn(33745, spell_query.SpellQuery("vanilla").spells)  # Lacerate: vanilla = false
+        names = {spell_id: "Spell" for spell_id in self.db.rank_to_canonical if spell_id not in MISSING_FROM_CLIENT}
+        db = spell_query.SpellQuery("tbc", names)
+        self.assertEqual(db.invalid, {18499})
+        self.assertEqual(db.canonical_spell_id(6178), 100)
+
+    def test_queries_are_sub_millisecond(self):
+        db, calls = self.db, 2000
+        for query in (lambda: db.spells_by_class_and_tag("MAGE", "DPS"),
+                      lambda: db.spells_by_all_tags(["DPS", "ROTATIONAL", "PVE"]),
+                      lambda: db.canonical_spell_id(6178), lambda: db.aura_source_spell_id(7922),
+                      lambda: db.all_rank_ids(6178), lambda: db.proc_info(12880)):
+            started = time.perf_counter()
+            for _ in range(calls):
+                query()
+            self.assertLess((time.perf_counter() - started) / calls, 1e-3)
+
+
+@unittest.skipIf(LUA is None, "lua5.1 is not installed")
+class LuaConformanceTests(unittest.TestCase):
+    def test_python_answers_match_the_lua_library(self):
+        ids = lua_harness.referenced_ids(lua_harness.ADDON_DIR)
+        names = {spell_id: f"Spell {spell_id}" for spell_id in ids if spell_id not in MISSING_FROM_CLIENT}
+        for version in ("tbc", "vanilla"):
+            with self.subTest(version):
+                db = spell_query.SpellQuery(version, names)
+                inputs = conformance_inputs(db)
+                report, = lua_harness.measure([lua_harness.ADDON_DIR], names, lua_harness.FLAVORS[version],
+                                              "2.5.5.1", LUA, 1, lua_inputs(inputs))
+                expected = python_results(db, inputs)
+                self.assertEqual(report["counts"]["spells"], len(db.spells))
+                self.assertEqual(len(report["results"]), len(expected))
+                mismatched = {key: (value, expected.get(key)) for key, value in report["results"].items()
+                              if expected.get(key) != value}
+                self.assertEqual(mismatched, {})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""Offline regression tests for the Data/*.lua validator."""
+
+from __future__ import annotations
+
+import contextlib
+import io
+import shutil
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+
+TOOLS_DIR = Path(__file__).resolve().parent
+if str(TOOLS_DIR) not in sys.path:
+    sys.path.insert(0, str(TOOLS_DIR))
+
+import spell_data  # noqa: E402
+import validate_spells  # noqa: E402
+
+
+def run_validator(*argv: str) -> tuple[int, str]:
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        status = validate_spells.main(list(argv))
+    return status, output.getvalue()
+
+
+class FieldExtractionTests(unittest.TestCase):
+    def test_nested_keys_do_not_shadow_top_level_fields(self):
+        fields = validate_spells.parse_spell_fields("""{
+            versionOverrides = { vanilla = { spellID = 11958, name = "Old Name", duration = 3 } },
+            triggersAuras = {
+                { spellID = 7922, type = "DEBUFF", onTarget = true },
+                { spellID = 7923, onTarget = true },
+            },
+            spellID = 100,
+            name = "Charge",
+            tags = {C.CC_HARD, C.MOVEMENT},
+            appliesBuff = 29131,
+        }""")
+        self.assertEqual((fields["spellID"], fields["name"]), (100, "Charge"))
+        self.assertNotIn("duration", fields)
+        self.assertEqual(fields["tags"], ["CC_HARD", "MOVEMENT"])
+        # The second triggered aura has no type, which rule 13 must see
+        self.assertTrue(fields["triggersAuras.has_spellID"])
+        self.assertFalse(fields["triggersAuras.has_type"])
+        self.assertFalse(fields["appliesBuff_is_array"])
+
+
+class RepositoryValidationTests(unittest.TestCase):
+    def test_repository_data_passes(self):
+        status, output = run_validator()
+        self.assertEqual(status, 0, output)
+
+    def test_parallel_run_matches_serial_output(self):
+        self.assertEqual(run_validator("--jobs", "2"), run_validator("--jobs", "1"))
+
+
+class RuleSelectionTests(unittest.TestCase):
+    def test_selection_by_number_and_name(self):
+        rules = validate_spells.select_rules({"6", "known-buff-group"}, None)
+        self.assertEqual([rule.number for rule in rules], [6, 14])
+        skipped = validate_spells.select_rules(None, {"spell-colors"})
+        self.assertNotIn(33, [rule.number for rule in skipped])
+
+    def test_rules_skip_spells_missing_their_fields(self):
+        rules = validate_spells.select_rules({"14"}, None)
+        stats = {}
+        errors = validate_spells.validate_spell(
+            {"spellID": 1, "name": "Test"}, 1, Path("Test.lua"), set(), set(), set(),
+            resolved_class="MAGE", rules=rules, stats=stats,
+        )
+        self.assertEqual((errors, stats[14][1:]), ([], [0, 1]))
+        errors = validate_spells.validate_spell(
+            {"spellID": 1, "name": "Test", "buffGroup": "NOPE"}, 1, Path("Test.lua"), set(), set(), set(),
+            resolved_class="MAGE", rules=rules, stats=stats,
+        )
+        self.assertEqual(len(errors), 1)
+        self.assertEqual(stats[14][1:], [1, 1])
+
+    def test_timings_report_lists_selected_rules(self):
+        status, output = run_validator("--rules", "1,2", "--timings")
+        self.assertEqual(status, 0, output)
+        self.assertIn("duration-needs-aura-target", output)
+        self.assertNotIn("known-tags", output)
+
+
+class WatchTests(unittest.TestCase):
+    def setUp(self):
+        temp = tempfile.TemporaryDirectory()
+        self.addCleanup(temp.cleanup)
+        root = Path(temp.name)
+        shutil.copytree(validate_spells.DATA_DIR, root / "Data")
+        shutil.copytree(validate_spells.CORE_DIR, root / "Core")
+        for name, value in (("DATA_DIR", root / "Data"), ("CORE_DIR", root / "Core")):
+            patcher = mock.patch.object(validate_spells, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        patcher = mock.patch.object(spell_data, "PARSE_CACHE_DIR", root / "parsed")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.warlock = root / "Data" / "Warlock.lua"
+
+    def test_only_the_edited_file_is_revalidated(self):
+        watcher = validate_spells.Watcher(validate_spells.RULES)
+        self.assertEqual(watcher.poll()[1], [])
+        self.assertIsNone(watcher.poll())
+
+        source = self.warlock.read_text(encoding="utf-8")
+        self.warlock.write_text(source.replace("C.CC_HARD", "C.NOT_A_TAG", 1), encoding="utf-8")
+        with mock.patch.object(validate_spells, "validate_file", wraps=validate_spells.validate_file) as spy:
+            names, added, resolved = watcher.poll()
+        self.assertEqual([call.args[0].name for call in spy.call_args_list], ["Warlock.lua"])
+        self.assertEqual(names, ["Warlock.lua"])
+        self.assertEqual(len(added), 1)
+        self.assertIn("NOT_A_TAG", added[0])
+
+        self.warlock.write_text(source, encoding="utf-8")
+        names, added, resolved = watcher.poll()
+        self.assertEqual((added, len(resolved)), ([], 1))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -3,9 +3,15 @@
 
 from __future__ import annotations
 
+import json
+import subprocess
 import sys
+import tempfile
+import threading
 import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
+from unittest import mock
 
 
 TOOLS_DIR = Path(__file__).resolve().parent
@@ -22,6 +28,12 @@ class FakeWowhead:
     def fetch(self, branch, spell_id):
         return self.payloads[(branch, spell_id)]
 
+    def tooltip(self, branch, spell_id):
+        return audit.parse_tooltip(self.fetch(branch, spell_id))
+
+    def prefetch(self, keys):
+        pass
+
     def save(self):
         pass
 
@@ -88,6 +100,216 @@ class ConsensusTests(unittest.TestCase):
         self.assertEqual([item.code for item in findings], ["confirmed_cooldown_mismatch"])
 
 
+class CheckpointTests(unittest.TestCase):
+    def test_resumed_run_reports_the_same_findings(self):
+        references = [audit.SpellReference(spell_id, "tbc", "primary", "Test.lua", spell_id,
+                                           expected_name="Other" if spell_id % 3 == 0 else f"Spell {spell_id}")
+                      for spell_id in range(1, 10)]
+        payloads = {("tbc", spell_id): {"name": f"Spell {spell_id}"} for spell_id in range(1, 10)}
+        wago = FakeWago({"tbc": {spell_id: f"Spell {spell_id}" for spell_id in range(1, 10)}, "classic": {}})
+        expected = audit.audit(references, FakeWowhead(payloads), wago)
+
+        class Interrupted(FakeWowhead):
+            def tooltip(self, branch, spell_id):
+                if spell_id == 6:
+                    raise KeyboardInterrupt
+                return super().tooltip(branch, spell_id)
+
+        with tempfile.TemporaryDirectory() as temp:
+            checkpoint = audit.AuditCheckpoint(Path(temp), references, {"tbc": "1"})
+            with self.assertRaises(KeyboardInterrupt):
+                audit.audit(references, Interrupted(payloads), wago, checkpoint=checkpoint)
+            checkpoint.close()
+            with checkpoint.path.open("a", encoding="utf-8") as handle:
+                handle.write('{"branch": "tbc", "spell_id": 6, "find')  # torn by the kill
+            resumed = audit.AuditCheckpoint(Path(temp), references, {"tbc": "1"}, resume=True)
+            self.assertEqual(sorted(resumed.done), [("tbc", spell_id) for spell_id in range(1, 6)])
+            remaining = {key: payload for key, payload in payloads.items() if key[1] >= 6}
+            self.assertEqual(audit.audit(references, FakeWowhead(remaining), wago, checkpoint=resumed), expected)
+            resumed.close(completed=True)
+            self.assertFalse(resumed.path.exists())
+            other = audit.AuditCheckpoint(Path(temp), references, {"tbc": "2"}, resume=True)
+            self.assertEqual(other.done, {})
+            other.close()
+
+
+class StubWowhead(BaseHTTPRequestHandler):
+    """Tooltip server: spell 7 is throttled once, spell 13 does not exist."""
+
+    requests: list[str] = []
+    lock = threading.Lock()
+
+    def do_GET(self):
+        spell_id = int(self.path.rsplit("/", 1)[1])
+        with self.lock:
+            self.requests.append(self.path)
+            throttled = spell_id == 7 and self.requests.count(self.path) == 1
+        if throttled or spell_id == 13:
+            self.send_response(429 if throttled else 404)
+            self.send_header("Retry-After", "0")
+            self.end_headers()
+            return
+        body = json.dumps({"name": f"Spell {spell_id}", "tooltip": ""}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class ConcurrentFetchTests(unittest.TestCase):
+    def setUp(self):
+        StubWowhead.requests = []
+        server = ThreadingHTTPServer(("127.0.0.1", 0), StubWowhead)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        url = f"http://127.0.0.1:{server.server_address[1]}/{{branch}}/tooltip/spell/{{spell_id}}"
+        patcher = mock.patch.object(audit, "WOWHEAD_URL", url)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def run_audit(self, workers):
+        references = [audit.SpellReference(spell_id, "tbc", "primary", "Test.lua", spell_id,
+                                           expected_name=f"Spell {spell_id}" if spell_id != 5 else "Other")
+                      for spell_id in range(1, 30)]
+        wago = FakeWago({"tbc": {spell_id: f"Spell {spell_id}" for spell_id in range(1, 30)}, "classic": {}})
+        client = audit.WowheadClient(None, 24, 0.001, workers=workers)
+        return client, audit.audit(references, client, wago)
+
+    def test_concurrent_fetch_matches_sequential_audit(self):
+        _, sequential = self.run_audit(workers=1)
+        StubWowhead.requests = []
+        client, concurrent = self.run_audit(workers=4)
+        self.assertEqual(concurrent, sequential)
+        self.assertEqual([(finding.code, finding.spell_id) for finding in concurrent],
+                         [("confirmed_name_mismatch", 5), ("source_incomplete", 13)])
+        # The throttled spell was retried once; everything else fetched exactly once.
+        self.assertEqual(len(StubWowhead.requests), 30)
+        self.assertEqual(client.fetch("tbc", 7)["name"], "Spell 7")
+        self.assertEqual({key: client.metrics()[key] for key in ("store_hits", "downloads", "hit_ratio")},
+                         {"store_hits": 0, "downloads": 29, "hit_ratio": 0.0})
+
+    def test_interrupted_audit_drops_queued_prefetches(self):
+        references = [audit.SpellReference(spell_id, "tbc", "primary", "Test.lua", spell_id)
+                      for spell_id in range(1, 61)]
+        wago = FakeWago({"tbc": {}, "classic": {}})
+        client = audit.WowheadClient(None, 24, 0.05, workers=2)
+        with mock.patch.object(audit, "check_spell", side_effect=KeyboardInterrupt):
+            with self.assertRaises(KeyboardInterrupt):
+                audit.audit(references, client, wago)
+        self.assertIsNone(client.pool)
+        self.assertLess(len(StubWowhead.requests), 10)
+
+
+TRANQUILITY = {
+    "name": "Tranquility",
+    "icon": "spell_nature_tranquility",
+    "tooltip": (
+        '<table><tr><td><b class="whtt-name">Tranquility</b></td><th><b class="q0">Rank 2</b></th></tr></table>'
+        '525 Mana<table width="100%"><tr><td>Channeled (8 sec cast)</td><th>40 yd range</th><th>'
+        "<!--cooldownText-->10 min cooldown<!--cooldownText--><!--baseCooldown:10 min cooldown--></th></tr>"
+        '</table><table><tr><td><div class="q">Heals all nearby group members for <!--ppl740:30-->365'
+        " every 2 seconds for 8 sec. &nbsp;Druid must channel.</div></td></tr></table>"
+    ),
+    "buff": '<table><tr><td>Heals.<br><span class="q">8 seconds remaining</span></td></tr></table>',
+}
+
+
+class TooltipTests(unittest.TestCase):
+    def test_one_pass_record_matches_the_field_extractors(self):
+        record = audit.parse_tooltip(TRANQUILITY)
+        self.assertEqual((record.cooldown, record.duration, record.description),
+                         (audit.extract_cooldown(TRANQUILITY["tooltip"]), audit.extract_duration(TRANQUILITY["buff"]),
+                          audit.extract_description(TRANQUILITY["tooltip"])))
+        self.assertEqual((record.cooldown, record.duration, record.cast_time, record.channeled,
+                          record.range, record.rank), (600.0, 8.0, 8.0, True, "40 yd", "Rank 2"))
+        self.assertEqual(audit.parse_tooltip({"error": "http_404"}).error, "http_404")
+
+    def test_records_are_stored_with_payloads_and_not_parsed_again(self):
+        with tempfile.TemporaryDirectory() as temp:
+            path = Path(temp) / "wowhead.sqlite"
+            client = audit.WowheadClient(path, 24, 0)
+            with mock.patch.object(client, "_download", return_value=TRANQUILITY):
+                first = client.tooltip("tbc", 740)
+            client.save()
+            client = audit.WowheadClient(path, 24, 0)
+            with mock.patch.object(audit, "parse_tooltip", side_effect=AssertionError("parsed again")):
+                self.assertEqual(client.tooltip("tbc", 740), first)
+            self.assertEqual(client.tooltip("tbc", 740).description, first.description)
+            client.save()
+
+
+CHANGED_SOURCE = """local lib = LIBSPELLDB_REGISTRATION
+lib:RegisterSpells({
+    {
+        spellID = 100,
+        name = "Charge",
+    },
+    {
+        spellID = 45438,
+        name = "Ice Block",
+        versionOverrides = { vanilla = { spellID = 11958 } },
+    },
+    {
+        spellID = 2136,
+        name = "Fire Blast",
+        cooldown = 8,
+        ranks = {2136, 2137},
+    },
+}, "MAGE")
+"""
+
+
+class ChangedSinceTests(unittest.TestCase):
+    def git(self, *args):
+        subprocess.run(("git", "-c", "user.name=test", "-c", "user.email=test@example.com", *args),
+                       cwd=self.root, check=True, capture_output=True)
+
+    def setUp(self):
+        temp = tempfile.TemporaryDirectory()
+        self.addCleanup(temp.cleanup)
+        self.root = Path(temp.name)
+        self.data = self.root / "Data"
+        self.data.mkdir()
+        (self.data / "Mage.lua").write_text(CHANGED_SOURCE, encoding="utf-8")
+        self.git("init", "-q")
+        self.git("add", ".")
+        self.git("commit", "-q", "-m", "base")
+        patcher = mock.patch.object(audit.spell_data, "PARSE_CACHE_DIR", self.root / "parsed")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_only_changed_blocks_and_their_overrides_are_selected(self):
+        edited = CHANGED_SOURCE.replace("spellID = 11958", "spellID = 11959").replace("        cooldown = 8,\n", "")
+        (self.data / "Mage.lua").write_text(edited, encoding="utf-8")
+        (self.data / "Rogue.lua").write_text(CHANGED_SOURCE.replace("MAGE", "ROGUE"), encoding="utf-8")
+        changed = audit.changed_entries("HEAD", self.data)
+        self.assertEqual(changed, {"Mage.lua": {7, 12}, "Rogue.lua": {3, 7, 12}})
+        references = [reference for reference in audit.parse_lua_file(self.data / "Mage.lua")
+                      if reference.line in changed["Mage.lua"]]
+        self.assertEqual({(reference.spell_id, reference.branch) for reference in references},
+                         {(45438, "tbc"), (11959, "classic"), (2136, "tbc"), (2137, "tbc")})
+        self.git("add", ".")
+        self.git("commit", "-q", "-m", "edit")
+        self.assertEqual(audit.changed_entries("HEAD", self.data), {})
+        (self.data / "Mage.lua").write_text("-- Mage spells\n" + edited, encoding="utf-8")
+        self.assertEqual(audit.changed_entries("HEAD", self.data), {})
+
+    def test_no_changed_entry_exits_without_contacting_wago(self):
+        (self.data / "Mage.lua").write_text(CHANGED_SOURCE.replace("local lib", "-- Mage\nlocal lib"),
+                                            encoding="utf-8")
+        changed_entries = audit.changed_entries
+        with mock.patch.object(audit, "DATA_DIR", self.data), \
+                mock.patch.object(audit, "changed_entries", lambda ref: changed_entries(ref, self.data)), \
+                mock.patch.object(audit, "WagoClient", side_effect=AssertionError("contacted Wago")), \
+                mock.patch("sys.stdout"):
+            self.assertEqual(audit.main(["--audit", "--changed-since", "HEAD"]), 0)
+
+
 class RepositoryRegressionTests(unittest.TestCase):
     @classmethod
     def setUpClass(cls):
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""Offline tests for the indexed Wowhead response store."""
+
+from __future__ import annotations
+
+import json
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+
+TOOLS_DIR = Path(__file__).resolve().parent
+if str(TOOLS_DIR) not in sys.path:
+    sys.path.insert(0, str(TOOLS_DIR))
+
+import wowhead_store  # noqa: E402
+
+
+class StoreTests(unittest.TestCase):
+    def setUp(self):
+        temp = tempfile.TemporaryDirectory()
+        self.addCleanup(temp.cleanup)
+        self.root = Path(temp.name)
+        self.store = wowhead_store.WowheadStore(self.root / "wowhead.sqlite")
+        self.addCleanup(self.store.close)
+
+    def test_writes_are_durable_without_close_and_respect_max_age(self):
+        self.store.put("tbc", 133, "https://example/133", {"name": "Fireball", "icon": "spell_fire_flamebolt"})
+        self.store.put("classic", 133, "https://example/133", {"error": "http_404"}, fetched_at_epoch=1.0)
+        reopened = wowhead_store.WowheadStore(self.root / "wowhead.sqlite")
+        self.addCleanup(reopened.close)
+        self.assertEqual(reopened.get("tbc", 133, max_age=60)["name"], "Fireball")
+        self.assertIsNone(reopened.get("classic", 133, max_age=60))
+        self.assertEqual(reopened.get("classic", 133), {"error": "http_404"})
+        self.assertEqual(reopened.fresh(60), {("tbc", 133)})
+        self.assertEqual(reopened.icons("tbc", [133, 134]), {133: "spell_fire_flamebolt"})
+
+    def test_legacy_cache_round_trip_keeps_order_and_ignores_live_fetches(self):
+        legacy = self.root / "wowhead_cache.json"
+        legacy.write_text(json.dumps({"20": {"icon": "b"}, "10": {"name": "Old", "icon": "a"}}, indent=2),
+                          encoding="utf-8")
+        self.assertEqual(self.store.sync_legacy(legacy), 2)
+        self.assertEqual(self.store.sync_legacy(legacy), 0)
+        self.assertEqual(self.store.fresh(60), set())
+        self.assertEqual(self.store.icons("tbc", [10, 20]), {})
+
+        # The audit's live responses never reach the committed icon data.
+        self.store.put("tbc", 10, "https://example/10", {"name": "New", "icon": "c"})
+        self.store.put("tbc", 30, "https://example/30", {"icon": "d"})
+        self.assertEqual(self.store.icons(wowhead_store.LEGACY_BRANCH, [10, 20, 30]), {10: "a", 20: "b"})
+
+        self.store.export_legacy([30], legacy)
+        self.assertEqual(list(json.loads(legacy.read_text(encoding="utf-8"))), ["20", "10", "30"])
+        self.assertEqual(self.store.sync_legacy(legacy), 0)
+        self.assertEqual(self.store.icons(wowhead_store.LEGACY_BRANCH, [10, 20, 30]), {10: "a", 20: "b", 30: "d"})
+
+        # Checking out another version of the file replaces the branch wholesale.
+        legacy.write_text(json.dumps({"10": {"icon": "a"}}), encoding="utf-8")
+        self.assertEqual(self.store.sync_legacy(legacy), 1)
+        self.assertEqual(self.store.icons(wowhead_store.LEGACY_BRANCH, [10, 20, 30]), {10: "a"})
+        self.assertEqual(self.store.icons("tbc", [10, 30]), {10: "c", 30: "d"})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -56,17 +56,36 @@ Checks:
    31. Every spell must resolve to a class (per-spell or RegisterSpells default)
    32. auraTarget consistency with tags (ENEMY↔BUFF/HAS_BUFF, SELF/ALLY/PET↔DEBUFF/HAS_DEBUFF/HAS_DOT)
 
+  Generated data:
+   33. Every spell must have a generated bar color (Data/SpellColors.lua)
+
+Each check is a registered Rule (see the rule registry below) that declares the
+spell fields it needs; spells lacking them skip the rule without evaluating it.
+
 Usage:
     python validate_spells.py           # from Tools/ directory
     python Tools/validate_spells.py     # from repo root
+    python Tools/validate_spells.py --jobs 0   # one worker process per CPU
+    python Tools/validate_spells.py --bench 20 # field-extraction blocks/sec
+    python Tools/validate_spells.py --list-rules
+    python Tools/validate_spells.py --rules 6,known-buff-group --timings
+    python Tools/validate_spells.py --skip-rules spell-colors
+    python Tools/validate_spells.py --watch    # re-validate edited files as they change
 
 Exit code 0 = all checks pass, 1 = validation errors found.
 """
 
+import argparse
+import os
 import re
 import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
 
+import spell_data
+
 # Resolve directories relative to this script
 SCRIPT_DIR = Path(__file__).parent
 ROOT_DIR = SCRIPT_DIR.parent
@@ -171,497 +190,481 @@ def extract_shared_cd_groups(categories_path):
     return groups
 
 
-def parse_spell_blocks(lua_content, filepath):
-    """
-    Extract spell definition blocks from a Lua file.
-    Yields (spell_dict, line_number) for each spell block found.
-    """
-    lines = lua_content.split("\n")
-    in_register_block = False
-    brace_depth = 0
-    current_spell_lines = []
-    current_spell_start = 0
+def _lua_bool(value):
+    """Lua boolean as the "true"/"false" string the rules compare against, else None."""
+    return ("true" if value else "false") if isinstance(value, bool) else None
 
-    for i, line in enumerate(lines, 1):
-        stripped = line.strip()
 
-        if "lib:RegisterSpells(" in stripped:
-            in_register_block = True
-            brace_depth += stripped.count("{") - stripped.count("}")
-            continue
+def _is_number(value):
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
 
-        if not in_register_block:
-            continue
 
-        open_count = stripped.count("{")
-        close_count = stripped.count("}")
+def parse_spell_fields(table):
+    """Extract the validated fields of one spell entry in a single walk over its
+    top-level keys.
 
-        if brace_depth == 1 and open_count > 0 and stripped.startswith("{"):
-            current_spell_lines = [stripped]
-            current_spell_start = i
-            brace_depth += open_count - close_count
-            continue
-
-        brace_depth += open_count - close_count
-
-        if current_spell_lines:
-            current_spell_lines.append(stripped)
-
-            if brace_depth <= 1:
-                spell_text = "\n".join(current_spell_lines)
-                spell_data = parse_spell_fields(spell_text)
-                if spell_data.get("spellID"):
-                    yield spell_data, current_spell_start
-                current_spell_lines = []
-
-        if brace_depth <= 0:
-            in_register_block = False
-            brace_depth = 0
-
-
-def strip_version_overrides(block_text):
-    """Remove a versionOverrides = {...} table (balanced braces) before field extraction, so
-    its per-version delta values (spellID/ranks/name/...) aren't mis-parsed as the spell's
-    primary fields. The validator checks the default-version data; per-version overrides are
-    validated at runtime in-game (RegisterSpell + the /vh invalid name-mismatch audit)."""
-    idx = block_text.find("versionOverrides")
-    if idx == -1:
-        return block_text
-    brace_start = block_text.find("{", idx)
-    if brace_start == -1:
-        return block_text
-    depth = 0
-    for i in range(brace_start, len(block_text)):
-        if block_text[i] == "{":
-            depth += 1
-        elif block_text[i] == "}":
-            depth -= 1
-            if depth == 0:
-                return block_text[:idx] + block_text[i + 1:]
-    return block_text
-
-
-def parse_spell_fields(block_text):
-    """Parse key-value pairs from a spell definition block."""
-    block_text = strip_version_overrides(block_text)
+    ``table`` is the entry's parsed ``LuaTable`` (source text is parsed first).
+    Nested tables are only inspected under the keys that own them, so a
+    ``spellID`` inside ``triggersAuras`` or a ``name`` inside ``versionOverrides``
+    can never be mistaken for the spell's own field. The validator checks the
+    default-version data; per-version overrides are validated at runtime in-game
+    (RegisterSpell + the /vh invalid name-mismatch audit)."""
+    if isinstance(table, str):
+        table = spell_data.parse_table(table)
     fields = {}
 
-    # spellID
-    m = re.search(r"spellID\s*=\s*(\d+)", block_text)
-    if m:
-        fields["spellID"] = int(m.group(1))
-
-    # name
-    m = re.search(r'name\s*=\s*"([^"]*)"', block_text)
-    if m:
-        fields["name"] = m.group(1)
-
-    # class (per-spell override)
-    m = re.search(r'class\s*=\s*"(\w+)"', block_text)
-    if m:
-        fields["class"] = m.group(1)
-
-    # duration (top-level only, not inside nested tables)
-    m = re.search(r"^\s*duration\s*=\s*(\d+\.?\d*)", block_text, re.MULTILINE)
-    if m:
-        fields["duration"] = float(m.group(1))
-
-    # cooldown
-    m = re.search(r"^\s*cooldown\s*=\s*(\d+\.?\d*)", block_text, re.MULTILINE)
-    if m:
-        fields["cooldown"] = float(m.group(1))
-
-    # auraTarget
-    m = re.search(r"auraTarget\s*=\s*(AT\.\w+)", block_text)
-    if m:
-        fields["auraTarget"] = m.group(1)
-
-    # selfOnly (legacy field)
-    m = re.search(r"selfOnly\s*=\s*(true|false)", block_text)
-    if m:
-        fields["selfOnly"] = m.group(1)
-
-    # singleTarget
-    m = re.search(r"singleTarget\s*=\s*(true|false)", block_text)
-    if m:
-        fields["singleTarget"] = m.group(1)
-
-    # sharedAura
-    m = re.search(r"sharedAura\s*=\s*(true|false)", block_text)
-    if m:
-        fields["sharedAura"] = m.group(1)
-
-    # reactiveWindow
-    m = re.search(r"reactiveWindow\s*=\s*(\d+\.?\d*)", block_text)
-    if m:
-        fields["reactiveWindow"] = float(m.group(1))
-
-    # dodgeReactive
-    m = re.search(r"dodgeReactive\s*=\s*(\d+\.?\d*)", block_text)
-    if m:
-        fields["dodgeReactive"] = float(m.group(1))
-
-    # tags - extract the tag references (C.TAG_NAME)
-    tags_match = re.search(r"tags\s*=\s*\{([^}]*)\}", block_text)
-    if tags_match:
-        tag_text = tags_match.group(1)
-        # Extract C.TAG_NAME references
-        fields["tags"] = re.findall(r"C\.(\w+)", tag_text)
-        fields["tags_raw"] = tag_text.strip()
-
-    # ranks array - extract numeric IDs
-    ranks_match = re.search(r"ranks\s*=\s*\{([^}]+)\}", block_text)
-    if ranks_match:
-        rank_text = ranks_match.group(1)
-        rank_ids = [int(x) for x in re.findall(r"\d+", rank_text)]
-        fields["ranks"] = rank_ids
-
-    # rankDurations - extract keys
-    rd_match = re.search(r"rankDurations\s*=\s*\{([^}]+)\}", block_text)
-    if rd_match:
-        rd_text = rd_match.group(1)
-        # Keys are in [spellID] = value format
-        rd_keys = [int(x) for x in re.findall(r"\[(\d+)\]", rd_text)]
-        fields["rankDurations_keys"] = rd_keys
-
-    # buffGroup
-    m = re.search(r'buffGroup\s*=\s*"(\w+)"', block_text)
-    if m:
-        fields["buffGroup"] = m.group(1)
-
-    # sharedCooldownGroup
-    m = re.search(r'sharedCooldownGroup\s*=\s*"(\w+)"', block_text)
-    if m:
-        fields["sharedCooldownGroup"] = m.group(1)
-
-    # procInfo block
-    proc_match = re.search(r"procInfo\s*=\s*\{(.*?)\}", block_text, re.DOTALL)
-    if proc_match:
-        proc_text = proc_match.group(1)
-        fields["has_procInfo"] = True
-
-        m = re.search(r"onTarget\s*=\s*(true|false)", proc_text)
-        if m:
-            fields["procInfo.onTarget"] = m.group(1)
-        m = re.search(r"onAlly\s*=\s*(true|false)", proc_text)
-        if m:
-            fields["procInfo.onAlly"] = m.group(1)
-
-        # Check for required procInfo sub-fields
-        fields["procInfo.has_description"] = bool(re.search(r'description\s*=\s*"', proc_text))
-        fields["procInfo.has_stacks"] = bool(re.search(r'stacks\s*=\s*(false|\d+)', proc_text))
-
-    # triggersAuras - check for required fields in each entry
-    ta_match = re.search(r"triggersAuras\s*=\s*\{(.+)\}", block_text, re.DOTALL)
-    if ta_match:
-        ta_text = ta_match.group(1)
-        fields["has_triggersAuras"] = True
-        fields["triggersAuras.onTarget"] = None
-
-        m = re.search(r"onTarget\s*=\s*(true|false)", ta_text)
-        if m:
-            fields["triggersAuras.onTarget"] = m.group(1)
-
-        # Check each sub-entry has spellID
-        fields["triggersAuras.has_spellID"] = bool(re.search(r"spellID\s*=\s*\d+", ta_text))
-        fields["triggersAuras.has_type"] = bool(re.search(r'type\s*=\s*"(BUFF|DEBUFF)"', ta_text))
-        fields["triggersAuras.has_onTarget"] = bool(re.search(r"onTarget\s*=\s*(true|false)", ta_text))
-
-    # appliesBuff - check it's an array and extract IDs
-    ab_match = re.search(r"appliesBuff\s*=\s*(\{[^}]+\}|\d+)", block_text)
-    if ab_match:
-        value = ab_match.group(1)
-        fields["has_appliesBuff"] = True
-        fields["appliesBuff_is_array"] = value.startswith("{")
-        if value.startswith("{"):
-            buff_ids = [int(x) for x in re.findall(r"\d+", value)]
-            fields["appliesBuff_count"] = len(buff_ids)
-        else:
-            fields["appliesBuff_count"] = 1
+    for key, value in table.items:
+        is_table = isinstance(value, spell_data.LuaTable)
+
+        if key == "spellID":
+            if isinstance(value, int) and not isinstance(value, bool):
+                fields["spellID"] = value
+        elif key in ("name", "class", "buffGroup", "sharedCooldownGroup"):
+            if isinstance(value, str):
+                fields[key] = value
+        elif key in ("duration", "cooldown", "reactiveWindow", "dodgeReactive"):
+            if _is_number(value):
+                fields[key] = float(value)
+        elif key == "auraTarget":
+            if isinstance(value, spell_data.Ref):
+                fields["auraTarget"] = value.name
+        elif key in ("selfOnly", "singleTarget", "sharedAura"):
+            if isinstance(value, bool):
+                fields[key] = _lua_bool(value)
+
+        elif key == "tags" and is_table:
+            # Tag references (C.TAG_NAME); tags_raw marks that a tags table exists
+            refs = [item.name for item in value.array if isinstance(item, spell_data.Ref)]
+            fields["tags"] = [name[2:] for name in refs if name.startswith("C.")]
+            fields["tags_raw"] = ", ".join(refs)
+        elif key == "ranks" and is_table:
+            fields["ranks"] = table.ints("ranks")
+        elif key == "rankDurations" and is_table:
+            # Keys are in [spellID] = value format
+            fields["rankDurations_keys"] = [k for k in value.fields if isinstance(k, int)]
+
+        elif key == "procInfo" and is_table:
+            fields["has_procInfo"] = True
+            for sub_key in ("onTarget", "onAlly"):
+                if isinstance(value.get(sub_key), bool):
+                    fields[f"procInfo.{sub_key}"] = _lua_bool(value.get(sub_key))
+            # Check for required procInfo sub-fields
+            stacks = value.get("stacks")
+            fields["procInfo.has_description"] = isinstance(value.get("description"), str)
+            fields["procInfo.has_stacks"] = stacks is False or (isinstance(stacks, int) and stacks is not True)
+
+        elif key == "triggersAuras" and is_table:
+            # Every triggered aura entry must carry its own spellID, type and onTarget
+            auras = [aura for aura in value.array if isinstance(aura, spell_data.LuaTable)]
+            on_target = [aura.get("onTarget") for aura in auras if isinstance(aura.get("onTarget"), bool)]
+            fields["has_triggersAuras"] = True
+            fields["triggersAuras.onTarget"] = _lua_bool(on_target[0]) if on_target else None
+            fields["triggersAuras.has_spellID"] = bool(auras) and all(
+                isinstance(aura.get("spellID"), int) for aura in auras)
+            fields["triggersAuras.has_type"] = bool(auras) and all(
+                aura.get("type") in ("BUFF", "DEBUFF") for aura in auras)
+            fields["triggersAuras.has_onTarget"] = len(on_target) == len(auras) > 0
+
+        elif key == "appliesBuff":
+            # Must be an array of IDs; a bare number is flagged by rule 17
+            if is_table:
+                fields["has_appliesBuff"] = True
+                fields["appliesBuff_is_array"] = True
+                fields["appliesBuff_count"] = len(table.ints("appliesBuff"))
+            elif isinstance(value, int) and not isinstance(value, bool):
+                fields["has_appliesBuff"] = True
+                fields["appliesBuff_is_array"] = False
+                fields["appliesBuff_count"] = 1
 
     return fields
 
 
-def extract_default_classes(lua_content):
-    """Extract all default class arguments from lib:RegisterSpells(..., "CLASS") calls.
+def bench_field_extraction(rounds):
+    """Time parse_spell_fields over every spell entry in Data/*.lua."""
+    entries = [
+        entry
+        for path in sorted(DATA_DIR.glob("*.lua")) if path.name not in SKIP_FILES
+        for entry in spell_data.parse_data_file(path).spells()
+    ]
+    best = None
+    for _ in range(rounds):
+        started = time.perf_counter()
+        for entry in entries:
+            parse_spell_fields(entry.table)
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    print(f"parse_spell_fields: {len(entries)} blocks, best of {rounds}: "
+          f"{best * 1000:.2f} ms ({len(entries) / best:,.0f} blocks/sec)")
+
+
+# ─── Rule registry ───────────────────────────────────────────────────────────
+#
+# Each numbered check is a Rule registered with @rule, in the order its errors
+# are reported. A rule declares the spell fields it depends on: ``requires``
+# must all be present and at least one of ``requires_any`` (when given), else
+# the rule is skipped for that spell without being evaluated. Scopes:
+#   "spell" - check(spell_check) once per spell (a SpellCheck)
+#   "file"  - check(filepath, data_file, spells) once per data file
+#   "data"  - check(all_spell_ids) once, after every file has been validated
+# Each check yields error strings.
+
+RULES = []
+
+
+class Rule:
+    def __init__(self, number, name, scope, requires, requires_any, check):
+        self.number = number
+        self.name = name
+        self.scope = scope
+        self.requires = requires
+        self.requires_any = requires_any
+        self.check = check
+
+    def applies(self, spell):
+        return (all(field in spell for field in self.requires)
+                and (not self.requires_any or any(field in spell for field in self.requires_any)))
+
+
+def rule(number, name, scope="spell", requires=(), requires_any=()):
+    def register(check):
+        RULES.append(Rule(number, name, scope, tuple(requires), tuple(requires_any), check))
+        return check
+    return register
+
+
+class SpellCheck:
+    """A spell's extracted fields plus the values most rules share."""
+
+    def __init__(self, spell, line_num, filepath, valid_tags, buff_groups, shared_cd_groups, resolved_class):
+        self.spell = spell
+        self.valid_tags = valid_tags
+        self.buff_groups = buff_groups
+        self.shared_cd_groups = shared_cd_groups
+        self.resolved_class = resolved_class
+        self.spell_id = spell.get("spellID", "???")
+        self.duration = spell.get("duration", 0)
+        self.aura_target = spell.get("auraTarget")
+        self.tags = spell.get("tags", [])
+        self.tag_set = set(self.tags)
+        self.ranks = spell.get("ranks", [])
+        self.label = f"[{self.spell_id}] {spell.get('name', 'unknown')} ({filepath.name}:{line_num})"
+
+
+def select_rules(only=None, skip=None):
+    """Registered rules filtered by --rules / --skip-rules (sets of numbers or names)."""
+    def chosen(item, wanted):
+        return str(item.number) in wanted or item.name in wanted
+    return [item for item in RULES
+            if (not only or chosen(item, only)) and not (skip and chosen(item, skip))]
+
+
+def run_rules(rules, scope, args, stats=None, spell=None):
+    """Run the ``scope`` rules on one subject. With a ``stats`` dict, record
+    {rule number: [seconds, visited, skipped]} per rule."""
+    errors = []
+    for item in rules:
+        if item.scope != scope:
+            continue
+        if spell is not None and not item.applies(spell):
+            if stats is not None:
+                stats.setdefault(item.number, [0.0, 0, 0])[2] += 1
+            continue
+        if stats is None:
+            errors.extend(item.check(*args))
+            continue
+        started = time.perf_counter()
+        errors.extend(item.check(*args))
+        entry = stats.setdefault(item.number, [0.0, 0, 0])
+        entry[0] += time.perf_counter() - started
+        entry[1] += 1
+    return errors
 
-    Returns a list of (start_line, class_string) tuples, sorted by line number.
-    Each entry marks the start of a RegisterSpells block with its default class.
-    """
-    results = []
-    lines = lua_content.split("\n")
-    # Track brace depth to find the closing ) of each RegisterSpells call
-    in_register = False
-    register_start = 0
-    brace_depth = 0
 
-    for i, line in enumerate(lines, 1):
-        stripped = line.strip()
-        if "lib:RegisterSpells(" in stripped:
-            in_register = True
-            register_start = i
-            brace_depth = stripped.count("{") - stripped.count("}")
-            # Check if it closes on the same line (unlikely but handle it)
-            m = re.search(r'\}\s*,\s*"(\w+)"\s*\)', stripped)
-            if m:
-                results.append((register_start, m.group(1)))
-                in_register = False
-            continue
-        if in_register:
-            brace_depth += stripped.count("{") - stripped.count("}")
-            if brace_depth <= 0:
-                # End of RegisterSpells — check for class argument
-                m = re.search(r'\}\s*,\s*"(\w+)"\s*\)', stripped)
-                if m:
-                    results.append((register_start, m.group(1)))
-                else:
-                    results.append((register_start, None))
-                in_register = False
-
-    return results
-
-
-def get_default_class_for_line(register_blocks, line_num):
-    """Given a spell's line number, find which RegisterSpells block it belongs to."""
-    result = None
-    for start_line, default_class in register_blocks:
-        if start_line <= line_num:
-            result = default_class
-        else:
-            break
-    return result
+# === Aura targeting rules ===
 
+@rule(1, "duration-needs-aura-target", requires=("duration",))
+def check_duration_aura_target(s):
+    # duration > 0 requires auraTarget
+    if s.duration > 0 and not s.aura_target:
+        yield f"MISSING auraTarget: {s.label} has duration={s.duration} but no auraTarget field"
+
+
+@rule(2, "valid-aura-target", requires=("auraTarget",))
+def check_aura_target_value(s):
+    if s.aura_target not in VALID_AURA_TARGETS:
+        yield f"INVALID auraTarget: {s.label} has auraTarget={s.aura_target} (valid: {', '.join(sorted(VALID_AURA_TARGETS))})"
+
+
+@rule(3, "proc-on-target-enemy", requires=("procInfo.onTarget", "auraTarget"))
+def check_proc_on_target(s):
+    # procInfo.onTarget=true should have auraTarget=AT.ENEMY
+    if s.spell["procInfo.onTarget"] == "true" and s.aura_target != "AT.ENEMY":
+        yield f"MISMATCH: {s.label} has procInfo.onTarget=true but auraTarget={s.aura_target} (expected AT.ENEMY)"
 
-def validate_spell(spell, line_num, filepath, valid_tags, buff_groups, shared_cd_groups, resolved_class=None):
-    """Validate a single spell. Returns list of error strings."""
-    errors = []
-    spell_id = spell.get("spellID", "???")
-    spell_name = spell.get("name", "unknown")
-    duration = spell.get("duration", 0)
-    aura_target = spell.get("auraTarget")
-    self_only = spell.get("selfOnly")
-    tags = spell.get("tags", [])
-    label = f"[{spell_id}] {spell_name} ({filepath.name}:{line_num})"
 
-    # === Aura targeting rules ===
+@rule(4, "proc-on-ally-ally", requires=("procInfo.onAlly", "auraTarget"))
+def check_proc_on_ally(s):
+    # procInfo.onAlly=true should have auraTarget=AT.ALLY
+    if s.spell["procInfo.onAlly"] == "true" and s.aura_target != "AT.ALLY":
+        yield f"MISMATCH: {s.label} has procInfo.onAlly=true but auraTarget={s.aura_target} (expected AT.ALLY)"
 
-    # Rule 1: duration > 0 requires auraTarget
-    if duration > 0 and not aura_target:
-        errors.append(f"MISSING auraTarget: {label} has duration={duration} but no auraTarget field")
 
-    # Rule 2: auraTarget value must be valid
-    if aura_target and aura_target not in VALID_AURA_TARGETS:
-        errors.append(f"INVALID auraTarget: {label} has auraTarget={aura_target} (valid: {', '.join(sorted(VALID_AURA_TARGETS))})")
+@rule(5, "aura-target-import", scope="file")
+def check_aura_target_import(filepath, data_file, spells):
+    # Files using auraTarget must import AT = lib.AuraTarget
+    has_at_import = data_file.locals.get("AT") == spell_data.Ref("lib.AuraTarget")
+    if any(spell.get("auraTarget") for spell, _ in spells) and not has_at_import:
+        yield f"MISSING IMPORT: {filepath.name} uses auraTarget but missing 'local AT = lib.AuraTarget'"
 
-    # Rule 3: procInfo.onTarget=true should have auraTarget=AT.ENEMY
-    if spell.get("procInfo.onTarget") == "true" and aura_target and aura_target != "AT.ENEMY":
-        errors.append(f"MISMATCH: {label} has procInfo.onTarget=true but auraTarget={aura_target} (expected AT.ENEMY)")
 
-    # Rule 4: procInfo.onAlly=true should have auraTarget=AT.ALLY
-    if spell.get("procInfo.onAlly") == "true" and aura_target and aura_target != "AT.ALLY":
-        errors.append(f"MISMATCH: {label} has procInfo.onAlly=true but auraTarget={aura_target} (expected AT.ALLY)")
+# === Tag validation ===
 
-    # === Tag validation ===
+@rule(6, "known-tags", requires=("tags",))
+def check_known_tags(s):
+    for tag in s.tags:
+        if tag not in s.valid_tags:
+            yield f"INVALID TAG: {s.label} has unknown tag '{tag}' (not defined in Categories.lua)"
 
-    # Rule 6: All tags must be valid
-    for tag in tags:
-        if tag not in valid_tags:
-            errors.append(f"INVALID TAG: {label} has unknown tag '{tag}' (not defined in Categories.lua)")
 
-    # Rule 7: Mutually exclusive tags
-    tag_set = set(tags)
+@rule(7, "exclusive-tags", requires=("tags",))
+def check_exclusive_tags(s):
     for tag_a, tag_b in EXCLUSIVE_TAG_PAIRS:
-        if tag_a in tag_set and tag_b in tag_set:
-            errors.append(f"EXCLUSIVE TAGS: {label} has both {tag_a} and {tag_b} (mutually exclusive)")
+        if tag_a in s.tag_set and tag_b in s.tag_set:
+            yield f"EXCLUSIVE TAGS: {s.label} has both {tag_a} and {tag_b} (mutually exclusive)"
 
-    # Rule 8: TIMED_EFFECT requires duration > 0
-    if "TIMED_EFFECT" in tag_set and duration <= 0:
-        errors.append(f"TIMED_EFFECT: {label} has TIMED_EFFECT tag but duration={duration} (must be > 0)")
 
-    # Rule 19: TIMED_EFFECT must have auraTarget=AT.NONE
-    if "TIMED_EFFECT" in tag_set and aura_target and aura_target != "AT.NONE":
-        errors.append(f"TIMED_EFFECT: {label} has TIMED_EFFECT tag but auraTarget={aura_target} (expected AT.NONE)")
+@rule(8, "timed-effect-duration", requires=("tags",))
+def check_timed_effect_duration(s):
+    if "TIMED_EFFECT" in s.tag_set and s.duration <= 0:
+        yield f"TIMED_EFFECT: {s.label} has TIMED_EFFECT tag but duration={s.duration} (must be > 0)"
 
-    # Rule 20: Duplicate tags within a spell
-    if len(tags) != len(set(tags)):
+
+@rule(19, "timed-effect-aura-none", requires=("tags", "auraTarget"))
+def check_timed_effect_aura_target(s):
+    if "TIMED_EFFECT" in s.tag_set and s.aura_target != "AT.NONE":
+        yield f"TIMED_EFFECT: {s.label} has TIMED_EFFECT tag but auraTarget={s.aura_target} (expected AT.NONE)"
+
+
+@rule(20, "duplicate-tags", requires=("tags",))
+def check_duplicate_tags(s):
+    if len(s.tags) != len(s.tag_set):
         seen = set()
         dupes = set()
-        for tag in tags:
+        for tag in s.tags:
             if tag in seen:
                 dupes.add(tag)
             seen.add(tag)
-        errors.append(f"DUPLICATE TAGS: {label} has duplicate tag(s): {', '.join(sorted(dupes))}")
+        yield f"DUPLICATE TAGS: {s.label} has duplicate tag(s): {', '.join(sorted(dupes))}"
+
+
+@rule(21, "empty-tags", requires=("tags_raw",))
+def check_empty_tags(s):
+    if not s.tags:
+        yield f"EMPTY TAGS: {s.label} has empty tags array"
+
+
+# === Totem rules ===
+
+@rule(9, "totem-one-element", requires=("tags",))
+def check_totem_element(s):
+    element_tags = s.tag_set & TOTEM_ELEMENT_TAGS
+    if "TOTEM" in s.tag_set and len(element_tags) == 0:
+        yield f"TOTEM: {s.label} has TOTEM tag but no element tag (need one of {', '.join(sorted(TOTEM_ELEMENT_TAGS))})"
+    if "TOTEM" in s.tag_set and len(element_tags) > 1:
+        yield f"TOTEM: {s.label} has TOTEM tag with multiple element tags: {', '.join(sorted(element_tags))} (need exactly one)"
+
+
+@rule(10, "element-needs-totem", requires=("tags",))
+def check_element_has_totem(s):
+    element_tags = s.tag_set & TOTEM_ELEMENT_TAGS
+    if element_tags and "TOTEM" not in s.tag_set:
+        yield f"TOTEM: {s.label} has element tag(s) {', '.join(sorted(element_tags))} but missing base TOTEM tag"
 
-    # Rule 21: Empty tags array
-    if "tags_raw" in spell and not tags:
-        errors.append(f"EMPTY TAGS: {label} has empty tags array")
 
-    # === Totem rules ===
+@rule(11, "totem-aura-none", requires=("tags", "duration", "auraTarget"))
+def check_totem_aura_target(s):
+    if "TOTEM" in s.tag_set and s.duration > 0 and s.aura_target != "AT.NONE":
+        yield f"TOTEM: {s.label} is a totem but auraTarget={s.aura_target} (expected AT.NONE)"
 
-    has_totem = "TOTEM" in tag_set
-    element_tags = tag_set & TOTEM_ELEMENT_TAGS
 
-    # Rule 9: TOTEM must have exactly one element tag
-    if has_totem and len(element_tags) == 0:
-        errors.append(f"TOTEM: {label} has TOTEM tag but no element tag (need one of {', '.join(sorted(TOTEM_ELEMENT_TAGS))})")
-    if has_totem and len(element_tags) > 1:
-        errors.append(f"TOTEM: {label} has TOTEM tag with multiple element tags: {', '.join(sorted(element_tags))} (need exactly one)")
+# === Rank ordering ===
 
-    # Rule 10: Element tags require base TOTEM tag
-    if element_tags and not has_totem:
-        errors.append(f"TOTEM: {label} has element tag(s) {', '.join(sorted(element_tags))} but missing base TOTEM tag")
+@rule(12, "ranks-ascending", requires=("ranks",))
+def check_rank_order(s):
+    ranks = s.ranks
+    if any(ranks[i] >= ranks[i + 1] for i in range(len(ranks) - 1)):
+        yield f"RANK ORDER: {s.label} ranks not sorted ascending: {ranks}"
 
-    # Rule 11: TOTEM spells with duration must have auraTarget=AT.NONE
-    if has_totem and duration > 0 and aura_target and aura_target != "AT.NONE":
-        errors.append(f"TOTEM: {label} is a totem but auraTarget={aura_target} (expected AT.NONE)")
 
-    # === Rank ordering ===
+# === triggersAuras integrity ===
 
-    # Rule 12: ranks must be sorted ascending
-    ranks = spell.get("ranks", [])
-    if len(ranks) >= 2:
-        for i in range(len(ranks) - 1):
-            if ranks[i] >= ranks[i + 1]:
-                errors.append(f"RANK ORDER: {label} ranks not sorted ascending: {ranks}")
-                break
+@rule(13, "triggered-aura-fields", requires=("has_triggersAuras",))
+def check_triggered_aura_fields(s):
+    if not s.spell.get("triggersAuras.has_spellID"):
+        yield f"TRIGGERS_AURAS: {s.label} triggersAuras entry missing spellID"
+    if not s.spell.get("triggersAuras.has_type"):
+        yield f"TRIGGERS_AURAS: {s.label} triggersAuras entry missing type (\"BUFF\" or \"DEBUFF\")"
+    if not s.spell.get("triggersAuras.has_onTarget"):
+        yield f"TRIGGERS_AURAS: {s.label} triggersAuras entry missing onTarget (true/false)"
 
-    # === triggersAuras integrity ===
 
-    # Rule 13: triggersAuras entries must have required fields
-    if spell.get("has_triggersAuras"):
-        if not spell.get("triggersAuras.has_spellID"):
-            errors.append(f"TRIGGERS_AURAS: {label} triggersAuras entry missing spellID")
-        if not spell.get("triggersAuras.has_type"):
-            errors.append(f"TRIGGERS_AURAS: {label} triggersAuras entry missing type (\"BUFF\" or \"DEBUFF\")")
-        if not spell.get("triggersAuras.has_onTarget"):
-            errors.append(f"TRIGGERS_AURAS: {label} triggersAuras entry missing onTarget (true/false)")
+# === Reference integrity ===
 
-    # === Reference integrity ===
+@rule(14, "known-buff-group", requires=("buffGroup",))
+def check_buff_group(s):
+    buff_group = s.spell["buffGroup"]
+    if buff_group and buff_group not in s.buff_groups:
+        yield f"BUFFGROUP: {s.label} references undefined buffGroup '{buff_group}'"
 
-    # Rule 14: buffGroup must reference a defined group
-    buff_group = spell.get("buffGroup")
-    if buff_group and buff_group not in buff_groups:
-        errors.append(f"BUFFGROUP: {label} references undefined buffGroup '{buff_group}'")
 
-    # Rule 15: sharedCooldownGroup must reference a defined group
-    shared_cd = spell.get("sharedCooldownGroup")
-    if shared_cd and shared_cd not in shared_cd_groups:
-        errors.append(f"SHARED_CD: {label} references undefined sharedCooldownGroup '{shared_cd}'")
+@rule(15, "known-shared-cd-group", requires=("sharedCooldownGroup",))
+def check_shared_cd_group(s):
+    shared_cd = s.spell["sharedCooldownGroup"]
+    if shared_cd and shared_cd not in s.shared_cd_groups:
+        yield f"SHARED_CD: {s.label} references undefined sharedCooldownGroup '{shared_cd}'"
 
-    # === Proc metadata ===
 
-    # Rule 16: procInfo must have description and stacks
-    if spell.get("has_procInfo"):
-        if not spell.get("procInfo.has_description"):
-            errors.append(f"PROCINFO: {label} procInfo missing 'description' field")
-        if not spell.get("procInfo.has_stacks"):
-            errors.append(f"PROCINFO: {label} procInfo missing 'stacks' field (use false if no stacking)")
+# === Proc metadata ===
 
-    # === Structural ===
+@rule(16, "proc-info-fields", requires=("has_procInfo",))
+def check_proc_info_fields(s):
+    if not s.spell.get("procInfo.has_description"):
+        yield f"PROCINFO: {s.label} procInfo missing 'description' field"
+    if not s.spell.get("procInfo.has_stacks"):
+        yield f"PROCINFO: {s.label} procInfo missing 'stacks' field (use false if no stacking)"
 
-    # Rule 17: appliesBuff must be an array
-    if spell.get("has_appliesBuff") and not spell.get("appliesBuff_is_array"):
-        errors.append(f"APPLIES_BUFF: {label} appliesBuff should be an array {{id1, id2}}, not a bare number")
 
-    # === Consistency rules ===
+# === Structural ===
 
-    # Rule 22: spellID must appear in its own ranks array
+@rule(17, "applies-buff-array", requires=("has_appliesBuff",))
+def check_applies_buff_array(s):
+    if not s.spell.get("appliesBuff_is_array"):
+        yield f"APPLIES_BUFF: {s.label} appliesBuff should be an array {{id1, id2}}, not a bare number"
+
+
+# === Consistency rules ===
+
+@rule(22, "spell-in-ranks", requires=("ranks", "spellID"))
+def check_spell_in_ranks(s):
     # Exception: procs where the tracked aura ID differs from talent rank IDs
-    if ranks and spell_id != "???" and spell_id not in ranks and not spell.get("has_procInfo"):
-        errors.append(f"SPELL_IN_RANKS: {label} spellID {spell_id} not found in its own ranks array: {ranks}")
-
-    # Rule 23: appliesBuff length must match ranks length
-    if ranks and spell.get("has_appliesBuff") and spell.get("appliesBuff_is_array"):
-        ab_count = spell.get("appliesBuff_count", 0)
-        if ab_count != len(ranks):
-            errors.append(f"BUFF_RANK_MISMATCH: {label} appliesBuff has {ab_count} entries but ranks has {len(ranks)} (must match)")
-
-    # Rule 24: rankDurations keys must all appear in ranks array
-    rd_keys = spell.get("rankDurations_keys", [])
-    if rd_keys and ranks:
-        rank_set = set(ranks)
-        orphaned = [k for k in rd_keys if k not in rank_set]
-        if orphaned:
-            errors.append(f"RANK_DURATIONS: {label} rankDurations has keys not in ranks: {orphaned}")
-
-    # Rule 25: reactiveWindow/dodgeReactive requires REACTIVE tag
-    has_reactive_field = spell.get("reactiveWindow") or spell.get("dodgeReactive")
-    if has_reactive_field and "REACTIVE" not in tag_set:
-        errors.append(f"REACTIVE: {label} has reactiveWindow/dodgeReactive but missing REACTIVE tag")
-
-    # Rule 26: singleTarget requires auraTarget ENEMY or ALLY
-    if spell.get("singleTarget") == "true" and aura_target:
-        if aura_target not in ("AT.ENEMY", "AT.ALLY"):
-            errors.append(f"SINGLE_TARGET: {label} has singleTarget=true but auraTarget={aura_target} (expected AT.ENEMY or AT.ALLY)")
-
-    # Rule 27: sharedAura requires auraTarget ENEMY
-    if spell.get("sharedAura") == "true" and aura_target:
-        if aura_target != "AT.ENEMY":
-            errors.append(f"SHARED_AURA: {label} has sharedAura=true but auraTarget={aura_target} (expected AT.ENEMY)")
-
-    # Rule 28: class must be a valid WoW class token
-    spell_class = spell.get("class")
-    if spell_class and spell_class not in VALID_CLASSES:
-        errors.append(f"INVALID CLASS: {label} has class='{spell_class}' (not a valid class token)")
+    if s.ranks and s.spell_id not in s.ranks and not s.spell.get("has_procInfo"):
+        yield f"SPELL_IN_RANKS: {s.label} spellID {s.spell_id} not found in its own ranks array: {s.ranks}"
 
-    # Rule 31: Every spell must resolve to a class (per-spell or RegisterSpells default)
-    if resolved_class is None:
-        errors.append(f"MISSING CLASS: {label} has no class (set per-spell or use RegisterSpells with defaultClass)")
 
-    # Rule 32: auraTarget consistency with tags
-    # ENEMY auraTarget should not have BUFF/HAS_BUFF tags (it's a debuff, not a buff)
-    # SELF/ALLY/PET auraTarget should not have DEBUFF/HAS_DEBUFF/HAS_DOT tags
-    # Exception: spells with triggersAuras can have mixed buff/debuff via triggered auras
-    if aura_target and not spell.get("has_triggersAuras"):
-        tag_set = set(tags)
-        if aura_target == "AT.ENEMY" and (tag_set & {"BUFF", "HAS_BUFF"}):
-            bad_tags = ", ".join(sorted(tag_set & {"BUFF", "HAS_BUFF"}))
-            errors.append(f"AURA_TAG_MISMATCH: {label} has auraTarget={aura_target} but also has buff tag(s): {bad_tags} (enemy auras are debuffs)")
-        if aura_target in ("AT.SELF", "AT.ALLY", "AT.PET") and (tag_set & {"DEBUFF", "HAS_DEBUFF", "HAS_DOT"}):
-            bad_tags = ", ".join(sorted(tag_set & {"DEBUFF", "HAS_DEBUFF", "HAS_DOT"}))
-            errors.append(f"AURA_TAG_MISMATCH: {label} has auraTarget={aura_target} but also has debuff tag(s): {bad_tags} (self/ally auras are buffs)")
+@rule(23, "applies-buff-per-rank", requires=("ranks", "has_appliesBuff"))
+def check_applies_buff_count(s):
+    if s.ranks and s.spell.get("appliesBuff_is_array"):
+        ab_count = s.spell.get("appliesBuff_count", 0)
+        if ab_count != len(s.ranks):
+            yield f"BUFF_RANK_MISMATCH: {s.label} appliesBuff has {ab_count} entries but ranks has {len(s.ranks)} (must match)"
 
-    return errors
 
+@rule(24, "rank-duration-keys", requires=("rankDurations_keys", "ranks"))
+def check_rank_duration_keys(s):
+    rank_set = set(s.ranks)
+    orphaned = [k for k in s.spell["rankDurations_keys"] if k not in rank_set]
+    if s.ranks and orphaned:
+        yield f"RANK_DURATIONS: {s.label} rankDurations has keys not in ranks: {orphaned}"
 
-def validate_file(filepath, valid_tags, buff_groups, shared_cd_groups):
-    """Validate all spells in a single Lua file. Returns (errors, spell_id_list)."""
-    errors = []
-    spell_ids = []
-    content = filepath.read_text(encoding="utf-8")
 
-    # Rule 5: Check AT import exists if any spell uses auraTarget
-    has_at_import = bool(re.search(r"local\s+AT\s*=\s*lib\.AuraTarget", content))
-    spells_with_at = any(
-        spell.get("auraTarget") for spell, _ in parse_spell_blocks(content, filepath)
-    )
-    if spells_with_at and not has_at_import:
-        errors.append(f"MISSING IMPORT: {filepath.name} uses auraTarget but missing 'local AT = lib.AuraTarget'")
+@rule(25, "reactive-tag", requires_any=("reactiveWindow", "dodgeReactive"))
+def check_reactive_tag(s):
+    has_reactive_field = s.spell.get("reactiveWindow") or s.spell.get("dodgeReactive")
+    if has_reactive_field and "REACTIVE" not in s.tag_set:
+        yield f"REACTIVE: {s.label} has reactiveWindow/dodgeReactive but missing REACTIVE tag"
+
 
-    # Extract all RegisterSpells default class arguments
-    register_blocks = extract_default_classes(content)
+@rule(26, "single-target-aura", requires=("singleTarget", "auraTarget"))
+def check_single_target(s):
+    if s.spell["singleTarget"] == "true" and s.aura_target not in ("AT.ENEMY", "AT.ALLY"):
+        yield f"SINGLE_TARGET: {s.label} has singleTarget=true but auraTarget={s.aura_target} (expected AT.ENEMY or AT.ALLY)"
 
-    # Rule 29: default class in RegisterSpells should match filename (single-class files only)
+
+@rule(27, "shared-aura-enemy", requires=("sharedAura", "auraTarget"))
+def check_shared_aura(s):
+    if s.spell["sharedAura"] == "true" and s.aura_target != "AT.ENEMY":
+        yield f"SHARED_AURA: {s.label} has sharedAura=true but auraTarget={s.aura_target} (expected AT.ENEMY)"
+
+
+@rule(28, "valid-class", requires=("class",))
+def check_class_token(s):
+    spell_class = s.spell["class"]
+    if spell_class and spell_class not in VALID_CLASSES:
+        yield f"INVALID CLASS: {s.label} has class='{spell_class}' (not a valid class token)"
+
+
+@rule(29, "default-class-matches-file", scope="file")
+def check_default_class(filepath, data_file, spells):
+    # default class in RegisterSpells should match filename (single-class files only)
     expected_class = FILENAME_TO_CLASS.get(filepath.name)
     if expected_class:
-        unique_classes = set(c for _, c in register_blocks if c)
+        unique_classes = set(
+            registration.default_class for registration in data_file.registrations
+            if registration.method == "RegisterSpells" and registration.default_class
+        )
         # Only check single-class files (Procs.lua has multiple classes, skip it)
         if len(unique_classes) == 1:
             actual_class = unique_classes.pop()
             if actual_class != expected_class:
-                errors.append(f"CLASS MISMATCH: {filepath.name} RegisterSpells default class is '{actual_class}' but expected '{expected_class}'")
+                yield f"CLASS MISMATCH: {filepath.name} RegisterSpells default class is '{actual_class}' but expected '{expected_class}'"
+
+
+@rule(31, "resolved-class")
+def check_resolved_class(s):
+    # Every spell must resolve to a class (per-spell or RegisterSpells default)
+    if s.resolved_class is None:
+        yield f"MISSING CLASS: {s.label} has no class (set per-spell or use RegisterSpells with defaultClass)"
+
+
+@rule(32, "aura-target-tags", requires=("auraTarget", "tags"))
+def check_aura_target_tags(s):
+    # ENEMY auraTarget should not have BUFF/HAS_BUFF tags (it's a debuff, not a buff)
+    # SELF/ALLY/PET auraTarget should not have DEBUFF/HAS_DEBUFF/HAS_DOT tags
+    # Exception: spells with triggersAuras can have mixed buff/debuff via triggered auras
+    if s.spell.get("has_triggersAuras"):
+        return
+    if s.aura_target == "AT.ENEMY" and (s.tag_set & {"BUFF", "HAS_BUFF"}):
+        bad_tags = ", ".join(sorted(s.tag_set & {"BUFF", "HAS_BUFF"}))
+        yield f"AURA_TAG_MISMATCH: {s.label} has auraTarget={s.aura_target} but also has buff tag(s): {bad_tags} (enemy auras are debuffs)"
+    if s.aura_target in ("AT.SELF", "AT.ALLY", "AT.PET") and (s.tag_set & {"DEBUFF", "HAS_DEBUFF", "HAS_DOT"}):
+        bad_tags = ", ".join(sorted(s.tag_set & {"DEBUFF", "HAS_DEBUFF", "HAS_DOT"}))
+        yield f"AURA_TAG_MISMATCH: {s.label} has auraTarget={s.aura_target} but also has debuff tag(s): {bad_tags} (self/ally auras are buffs)"
+
+
+def validate_spell(spell, line_num, filepath, valid_tags, buff_groups, shared_cd_groups, resolved_class=None,
+                   rules=None, stats=None):
+    """Validate a single spell. Returns list of error strings."""
+    check = SpellCheck(spell, line_num, filepath, valid_tags, buff_groups, shared_cd_groups, resolved_class)
+    return run_rules(RULES if rules is None else rules, "spell", (check,), stats, spell)
+
 
-    for spell, line_num in parse_spell_blocks(content, filepath):
+def validate_file(filepath, valid_tags, buff_groups, shared_cd_groups, rules=None, stats=None):
+    """Validate all spells in a single Lua file. Returns (errors, spell_id_list, stats);
+    ``stats`` is the per-rule timing dict passed in (or None)."""
+    rules = RULES if rules is None else rules
+    errors = []
+    spell_ids = []
+    try:
+        data_file = spell_data.parse_data_file(filepath)
+    except spell_data.LuaSyntaxError as error:
+        return [f"PARSE ERROR: {error}"], spell_ids, stats
+    spells = [(parse_spell_fields(entry.table), entry) for entry in data_file.spells()]
+
+    errors.extend(run_rules(rules, "file", (filepath, data_file, spells), stats))
+
+    for spell, entry in spells:
         # Resolve class: per-spell override > default from enclosing RegisterSpells
         # Note: resolved_class may be None if neither is set (Rule 31 will catch this)
-        default_class = get_default_class_for_line(register_blocks, line_num)
-        resolved_class = spell.get("class") or default_class
+        line_num = entry.line
+        resolved_class = spell.get("class") or entry.default_class
         spell_ids.append((spell.get("spellID"), spell.get("name", "unknown"), resolved_class or "SHARED", filepath.name, line_num))
-        errors.extend(validate_spell(spell, line_num, filepath, valid_tags, buff_groups, shared_cd_groups, resolved_class=resolved_class))
+        errors.extend(validate_spell(spell, line_num, filepath, valid_tags, buff_groups, shared_cd_groups,
+                                     resolved_class=resolved_class, rules=rules, stats=stats))
 
-    return errors, spell_ids
+    return errors, spell_ids, stats
 
 
+@rule(18, "unique-spell-ids", scope="data")
 def check_duplicate_spell_ids(all_spell_ids):
     """Rule 18: Check for duplicate spellIDs across all files.
 
@@ -683,6 +686,7 @@ def check_duplicate_spell_ids(all_spell_ids):
     return errors
 
 
+@rule(33, "spell-colors", scope="data")
 def check_color_coverage(all_spell_ids):
     """Every registered spell should have a Data/SpellColors.lua entry. That
     table is generated from spell icons (Tools/generate_icon_colors.py); a spell
@@ -692,7 +696,7 @@ def check_color_coverage(all_spell_ids):
     if not colors_path.is_file():
         return ["MISSING COLORS FILE: Data/SpellColors.lua not found — "
                 "run: python Tools/generate_icon_colors.py --write"]
-    colored = {int(m) for m in re.findall(r"\[(\d+)\]\s*=\s*\{",
+    colored = {int(m) for m in re.findall(r"\[(\d+)\]\s*=\s*0x[0-9A-Fa-f]+",
                                           colors_path.read_text(encoding="utf-8"))}
     errors = []
     seen = set()
@@ -708,7 +712,157 @@ def check_color_coverage(all_spell_ids):
     return errors
 
 
-def main():
+# ─── Watch mode ──────────────────────────────────────────────────────────────
+
+class Watcher:
+    """State for --watch: Categories.lua-derived sets and the per-file results of
+    untouched files stay in memory; each poll re-validates only the data files
+    whose mtime/size changed, then re-runs the cross-file ("data") rules over the
+    merged spell IDs. Categories.lua changes re-validate everything;
+    SpellColors.lua changes only re-run the cross-file rules."""
+
+    def __init__(self, rules):
+        self.rules = rules
+        self.categories_path = CORE_DIR / "Categories.lua"
+        self.colors_path = DATA_DIR / "SpellColors.lua"
+        self.stamps = {}
+        self.results = {}
+        self.errors = []
+        self.categories = None
+
+    def _stamp(self, path):
+        try:
+            stat = path.stat()
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def poll(self):
+        """Re-validate whatever changed since the last poll. Returns
+        (changed file names, added errors, resolved errors), or None if nothing changed."""
+        paths = [self.categories_path, self.colors_path] + [
+            path for path in sorted(DATA_DIR.glob("*.lua")) if path.name not in SKIP_FILES
+        ]
+        stamps = {path: self._stamp(path) for path in paths}
+        changed = [path for path in paths if stamps[path] != self.stamps.get(path)]
+        removed = [path for path in self.stamps if path not in stamps]
+        if not changed and not removed:
+            return None
+        self.stamps = stamps
+
+        if self.categories is None or self.categories_path in changed:
+            self.categories = (
+                extract_valid_tags(self.categories_path),
+                extract_buff_groups(self.categories_path),
+                extract_shared_cd_groups(self.categories_path),
+            )
+            self.results = {}
+            changed = paths
+        for path in removed:
+            self.results.pop(path, None)
+        for path in changed:
+            if path in (self.categories_path, self.colors_path):
+                continue
+            if stamps[path] is None:
+                self.results.pop(path, None)
+                continue
+            errors, spell_ids, _ = validate_file(path, *self.categories, rules=self.rules)
+            self.results[path] = (errors, spell_ids)
+
+        errors = []
+        all_spell_ids = []
+        for path in sorted(self.results):
+            file_errors, spell_ids = self.results[path]
+            errors.extend(file_errors)
+            all_spell_ids.extend(spell_ids)
+        errors.extend(run_rules(self.rules, "data", (all_spell_ids,)))
+
+        previous = set(self.errors)
+        current = set(errors)
+        added = [error for error in errors if error not in previous]
+        resolved = [error for error in self.errors if error not in current]
+        self.errors = errors
+        return [path.name for path in changed + removed], added, resolved
+
+
+def watch(rules, interval):
+    """Poll until interrupted, printing each change's error delta and timing."""
+    watcher = Watcher(rules)
+    print(f"Watching {DATA_DIR} and {watcher.categories_path.name} (every {interval:g}s, Ctrl+C to stop)")
+    try:
+        while True:
+            started = time.perf_counter()
+            delta = watcher.poll()
+            if delta is not None:
+                names, added, resolved = delta
+                elapsed = (time.perf_counter() - started) * 1000
+                label = ", ".join(names) if len(names) <= 3 else f"{len(names)} files"
+                print(f"[{time.strftime('%H:%M:%S')}] {label}: revalidated in {elapsed:.1f} ms — "
+                      f"{len(watcher.errors)} error(s) (+{len(added)} / -{len(resolved)})")
+                for error in added:
+                    print(f"  + ERROR: {error}")
+                for error in resolved:
+                    print(f"  - fixed: {error}")
+            time.sleep(interval)
+    except KeyboardInterrupt:
+        return 0
+
+
+def _rule_selector(text):
+    return {part.strip() for part in text.split(",") if part.strip()}
+
+
+def print_rule_timings(rules, stats):
+    """--timings report: time spent, spells (or files) visited and skipped per rule."""
+    total = sum(entry[0] for entry in stats.values()) or 1e-9
+    print("\nRule timings (slowest first):")
+    print(f"  {'rule':>4}  {'name':<28} {'ms':>8} {'share':>6} {'visited':>8} {'skipped':>8}")
+    for item in sorted(rules, key=lambda item: -stats.get(item.number, [0.0])[0]):
+        seconds, visited, skipped = stats.get(item.number, [0.0, 0, 0])
+        print(f"  {item.number:>4}  {item.name:<28} {seconds * 1000:8.2f} {seconds / total:6.1%} "
+              f"{visited:8d} {skipped:8d}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Validate LibSpellDB Data/*.lua spell definitions.")
+    parser.add_argument("--jobs", "-j", type=int, default=1, metavar="N",
+                        help="validate files in N worker processes (0 = one per CPU; default: 1)")
+    parser.add_argument("--rules", type=_rule_selector, metavar="LIST",
+                        help="only run these rules (comma-separated numbers or names, e.g. 1,2,known-tags)")
+    parser.add_argument("--skip-rules", type=_rule_selector, metavar="LIST",
+                        help="skip these rules (comma-separated numbers or names)")
+    parser.add_argument("--list-rules", action="store_true", help="list the registered rules and exit")
+    parser.add_argument("--timings", action="store_true",
+                        help="report time spent and spells visited per rule")
+    parser.add_argument("--watch", action="store_true",
+                        help="keep running and re-validate only the files that change")
+    parser.add_argument("--interval", type=float, default=0.25, metavar="SECONDS",
+                        help="--watch polling interval (default: 0.25)")
+    parser.add_argument("--bench", type=int, metavar="N",
+                        help="time field extraction over all spells N times and exit")
+    args = parser.parse_args(argv)
+
+    known = {str(item.number) for item in RULES} | {item.name for item in RULES}
+    unknown = sorted((args.rules or set()) - known) + sorted((args.skip_rules or set()) - known)
+    if unknown:
+        parser.error(f"unknown rule(s): {', '.join(unknown)} (see --list-rules)")
+    rules = select_rules(args.rules, args.skip_rules)
+
+    if args.list_rules:
+        for item in sorted(RULES, key=lambda item: item.number):
+            needs = list(item.requires)
+            if item.requires_any:
+                needs.append(f"any of {'/'.join(item.requires_any)}")
+            print(f"  {item.number:>2}  {item.name:<28} {item.scope:<5}  {', '.join(needs)}")
+        return 0
+
+    if args.bench:
+        bench_field_extraction(args.bench)
+        return 0
+
+    if args.watch:
+        return watch(rules, args.interval)
+
     if not DATA_DIR.is_dir():
         print(f"ERROR: Data directory not found: {DATA_DIR}")
         return 1
@@ -738,26 +892,42 @@ def main():
     all_spell_ids = []
     files_checked = 0
     spells_checked = 0
+    stats = {} if args.timings else None
+
+    # Files are independent until the cross-file rules below. Results are merged
+    # in sorted filename order whatever the job count, so output stays diffable.
+    check = partial(validate_file, valid_tags=valid_tags, buff_groups=buff_groups,
+                    shared_cd_groups=shared_cd_groups, rules=rules, stats=stats)
+    jobs = min(args.jobs or os.cpu_count() or 1, len(lua_files))
+    if jobs > 1:
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            results = list(executor.map(check, lua_files))
+    else:
+        results = [check(filepath) for filepath in lua_files]
 
-    for filepath in lua_files:
-        content = filepath.read_text(encoding="utf-8")
-        file_spell_count = sum(1 for _ in parse_spell_blocks(content, filepath))
-        spells_checked += file_spell_count
+    for errors, spell_ids, file_stats in results:
         files_checked += 1
-
-        errors, spell_ids = validate_file(filepath, valid_tags, buff_groups, shared_cd_groups)
+        spells_checked += len(spell_ids)
         all_errors.extend(errors)
         all_spell_ids.extend(spell_ids)
+        # Worker processes fill their own copy of the stats dict
+        if jobs > 1 and file_stats:
+            for number, (seconds, visited, skipped) in file_stats.items():
+                entry = stats.setdefault(number, [0.0, 0, 0])
+                entry[0] += seconds
+                entry[1] += visited
+                entry[2] += skipped
 
-    # Rule 18: Cross-file duplicate spellID check
-    all_errors.extend(check_duplicate_spell_ids(all_spell_ids))
-
-    # Rule 19: Every spell must have a generated bar color (Data/SpellColors.lua)
-    all_errors.extend(check_color_coverage(all_spell_ids))
+    # Cross-file rules: 18 (duplicate spellIDs) and 33 (SpellColors.lua coverage)
+    all_errors.extend(run_rules(rules, "data", (all_spell_ids,), stats))
 
     # Report
     print(f"LibSpellDB Validation: checked {spells_checked} spells across {files_checked} files")
     print(f"  Valid tags: {len(valid_tags)}, BuffGroups: {len(buff_groups)}, SharedCDGroups: {len(shared_cd_groups)}")
+    if len(rules) != len(RULES):
+        print(f"  Rules: {len(rules)} of {len(RULES)} selected")
+    if stats is not None:
+        print_rule_timings(rules, stats)
 
     if all_errors:
         # Group errors by category for readability
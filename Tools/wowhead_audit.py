@@ -10,6 +10,8 @@ Examples:
     python Tools/wowhead_audit.py --audit --ids 33938,403789
     python Tools/wowhead_audit.py --audit --strict
     python Tools/wowhead_audit.py --audit --strict --no-cache --json-report report.json
+    python Tools/wowhead_audit.py --audit --strict --changed-since origin/main
+    python Tools/wowhead_audit.py --bench-tooltips 10
 
 The optional cache is disposable acceleration. It records source URL, branch,
 and fetch time, lives under Tools/.cache, and is never a source of truth.
@@ -18,26 +20,34 @@ and fetch time, lives under Tools/.cache, and is never a source of truth.
 from __future__ import annotations
 
 import argparse
-import csv
-import io
+import hashlib
 import json
+import os
 import re
+import subprocess
 import sys
+import tempfile
+import threading
 import time
-import urllib.error
-import urllib.request
-from dataclasses import asdict, dataclass
+from bisect import bisect_left
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, fields as dataclass_fields
 from datetime import datetime, timezone
+from functools import cached_property
 from html import unescape
 from pathlib import Path
-from typing import Iterable
+from typing import Callable, Iterable, Iterator, Mapping
 
+import db2_store
+import http_session
+import spell_data
+import wowhead_store
 
 SCRIPT_DIR = Path(__file__).resolve().parent
 DATA_DIR = SCRIPT_DIR.parent / "Data"
-DEFAULT_CACHE = SCRIPT_DIR / ".cache" / "wowhead-live.json"
-WAGO_BUILDS_URL = "https://wago.tools/api/builds"
-WAGO_CSV_URL = "https://wago.tools/db2/{table}/csv?build={build}"
+DEFAULT_CACHE = wowhead_store.DEFAULT_STORE
+CHECKPOINT_DIR = SCRIPT_DIR / ".cache" / "audit"
 WOWHEAD_URL = "https://nether.wowhead.com/{branch}/tooltip/spell/{spell_id}"
 
 TBC_PRODUCT = "wow_anniversary"
@@ -75,114 +85,67 @@ class Finding:
     wago: str | float | None = None
 
 
-def _request_text(url: str, timeout: int = 30) -> str:
-    request = urllib.request.Request(url, headers={"User-Agent": "LibSpellDB-Live-Audit/2.0"})
-    with urllib.request.urlopen(request, timeout=timeout) as response:
-        return response.read().decode("utf-8")
+def iter_entry_blocks(path: Path, methods: tuple[str, ...] = ("RegisterSpells",)) -> Iterable[tuple[str, int]]:
+    """Source text and start line of every entry of ``methods`` (all when empty) in ``path``."""
+    for entry in spell_data.parse_data_file(path).entries(*methods):
+        yield entry.text, entry.line
 
 
-def _balanced_table(text: str, start: int) -> tuple[str, int] | None:
-    brace = text.find("{", start)
-    if brace == -1:
-        return None
-    depth = 0
-    in_string = False
-    escaped = False
-    for index in range(brace, len(text)):
-        char = text[index]
-        if in_string:
-            if escaped:
-                escaped = False
-            elif char == "\\":
-                escaped = True
-            elif char == '"':
-                in_string = False
-            continue
-        if char == '"':
-            in_string = True
-        elif char == "{":
-            depth += 1
-        elif char == "}":
-            depth -= 1
-            if depth == 0:
-                return text[brace : index + 1], index + 1
-    return None
-
-
-def _remove_named_table(text: str, field: str) -> tuple[str, str | None]:
-    match = re.search(rf"\b{re.escape(field)}\s*=", text)
-    if not match:
-        return text, None
-    table = _balanced_table(text, match.end())
-    if not table:
-        return text, None
-    payload, end = table
-    return text[: match.start()] + text[end:], payload
-
-
-def _named_subtable(text: str, field: str) -> str | None:
-    match = re.search(rf"\b{re.escape(field)}\s*=\s*", text)
-    if not match:
-        return None
-    if text[match.end() :].lstrip().startswith("false"):
-        return None
-    table = _balanced_table(text, match.end())
-    return table[0] if table else None
-
-
-def _number_array(text: str, field: str) -> list[int]:
-    match = re.search(rf"^\s*{re.escape(field)}\s*=\s*\{{([^}}]*)\}}", text, re.MULTILINE)
-    return [int(value) for value in re.findall(r"\d+", match.group(1))] if match else []
+_HUNK = re.compile(r"^@@ -\d+(?:,\d+)? \+(\d+)(?:,(\d+))? @@", re.MULTILINE)
 
 
-def _string_array(text: str, field: str) -> tuple[str, ...]:
-    match = re.search(rf"^\s*{re.escape(field)}\s*=\s*\{{([^}}]*)\}}", text, re.MULTILINE)
-    return tuple(re.findall(r'"([^"]+)"', match.group(1))) if match else ()
+def changed_lines(ref: str, data_dir: Path = DATA_DIR) -> dict[str, list[int] | None]:
+    """Data file name -> sorted line numbers that differ from git revision
+    ``ref`` in the working tree (None for files that are new or untracked).
+    A deletion marks the lines on both sides of the removed text."""
+    def git(*args: str) -> str:
+        return subprocess.run(("git", *args), cwd=data_dir, check=True, capture_output=True,
+                              text=True, encoding="utf-8").stdout
 
-
-def _scalar_number(text: str, field: str) -> float | None:
-    match = re.search(rf"^\s*{re.escape(field)}\s*=\s*([\d.]+)", text, re.MULTILINE)
-    return float(match.group(1)) if match else None
-
-
-def _scalar_string(text: str, field: str) -> str | None:
-    match = re.search(rf'^\s*{re.escape(field)}\s*=\s*"([^"]+)"', text, re.MULTILINE)
-    return match.group(1) if match else None
-
-
-def iter_entry_blocks(path: Path) -> Iterable[tuple[str, int]]:
-    lines = path.read_text(encoding="utf-8-sig").splitlines()
-    in_register = False
-    depth = 0
-    current: list[str] = []
-    start_line = 0
-
-    for line_number, line in enumerate(lines, 1):
-        stripped = line.strip()
-        if "lib:RegisterSpells(" in stripped:
-            in_register = True
-            depth += stripped.count("{") - stripped.count("}")
-            continue
-        if not in_register:
+    result: dict[str, list[int] | None] = {}
+    diff = git("diff", "--unified=0", "--no-color", "--no-ext-diff", "--no-renames", ref, "--", ".")
+    for section in re.split(r"^diff --git ", diff, flags=re.MULTILINE)[1:]:
+        target = re.search(r"^\+\+\+ (?:b/)?(.+)$", section, re.MULTILINE)
+        if target is None or target.group(1) == "/dev/null":
+            continue  # deleted (or binary) file: nothing left to audit
+        name = Path(target.group(1)).name
+        if re.search(r"^--- /dev/null$", section, re.MULTILINE):
+            result[name] = None
             continue
+        lines: set[int] = set()
+        for start, count in _HUNK.findall(section):
+            start, count = int(start), 1 if count == "" else int(count)
+            lines.update(range(start, start + count) if count else (start, start + 1))
+        result[name] = sorted(lines)
+    for name in git("ls-files", "--others", "--exclude-standard", "--", ".").splitlines():
+        result[Path(name).name] = None
+    return result
 
-        opens = stripped.count("{")
-        closes = stripped.count("}")
-        if depth == 1 and stripped.startswith("{") and opens:
-            current = [line]
-            start_line = line_number
-            depth += opens - closes
-            continue
 
-        depth += opens - closes
-        if current:
-            current.append(line)
-            if depth <= 1:
-                yield "\n".join(current), start_line
-                current = []
-        if depth <= 0:
-            in_register = False
-            depth = 0
+def changed_entries(ref: str, data_dir: Path = DATA_DIR) -> dict[str, set[int]]:
+    """Data file name -> start lines of the entry blocks changed or added since
+    ``ref``. References carry their entry's start line, so this selects every
+    reference derived from a changed block, including its version overrides.
+    Files changed only outside entry blocks (comments, headers) are left out,
+    so an empty result means no authored entry changed."""
+    result: dict[str, set[int]] = {}
+    for name, lines in changed_lines(ref, data_dir).items():
+        path = data_dir / name
+        if path.suffix != ".lua" or name in NON_SPELL_FILES or not path.is_file():
+            continue
+        methods = () if name in ITEM_SPELL_FIELDS else ("RegisterSpells",)
+        starts = set()
+        for text, start in iter_entry_blocks(path, methods):
+            end = start + text.count("\n")
+            if lines is None:
+                starts.add(start)
+            else:
+                index = bisect_left(lines, start)
+                if index < len(lines) and lines[index] <= end:
+                    starts.add(start)
+        if starts:
+            result[name] = starts
+    return result
 
 
 def _infer_branch(primary_id: int, explicit: str | None) -> str:
@@ -191,8 +154,12 @@ def _infer_branch(primary_id: int, explicit: str | None) -> str:
     return "classic" if primary_id >= 398000 else "tbc"
 
 
+def _int(value: object) -> int | None:
+    return value if isinstance(value, int) and not isinstance(value, bool) else None
+
+
 def _references_for_payload(
-    payload: str,
+    payload: spell_data.LuaTable | str,
     *,
     branch: str,
     filename: str,
@@ -200,96 +167,107 @@ def _references_for_payload(
     expected_name: str | None,
     aliases: tuple[str, ...],
     include_stats: bool,
+    inherited_id: int | None = None,
 ) -> list[SpellReference]:
-    primary_match = re.search(r"^\s*spellID\s*=\s*(\d+)", payload, re.MULTILINE)
-    if not primary_match:
+    if isinstance(payload, str):
+        payload = spell_data.parse_table(payload, filename)
+    # An override can replace only ranks while retaining the base primary ID.
+    primary_id = _int(payload.get("spellID")) or inherited_id
+    if primary_id is None:
         return []
-    primary_id = int(primary_match.group(1))
-    cooldown = _scalar_number(payload, "cooldown") if include_stats else None
+    cooldown = payload.get("cooldown") if include_stats else None
+    cooldown = float(cooldown) if isinstance(cooldown, (int, float)) and not isinstance(cooldown, bool) else None
     references = [
         SpellReference(primary_id, branch, "primary", filename, line, expected_name, aliases, cooldown)
     ]
 
-    for spell_id in _number_array(payload, "ranks"):
+    for spell_id in payload.ints("ranks"):
         references.append(SpellReference(spell_id, branch, "rank", filename, line, expected_name, aliases))
     for field, kind in (("variants", "variant"), ("appliesBuff", "applied_aura")):
-        for spell_id in _number_array(payload, field):
+        for spell_id in payload.ints(field):
             references.append(SpellReference(spell_id, branch, kind, filename, line))
 
-    # Nested spellID fields are triggered/helper auras. The first occurrence is
-    # the primary ID already recorded above.
-    nested_ids = [int(value) for value in re.findall(r"\bspellID\s*=\s*(\d+)", payload)][1:]
-    for spell_id in nested_ids:
-        references.append(SpellReference(spell_id, branch, "triggered_aura", filename, line))
-
-    reset_match = re.search(r"\bcooldownResetBy\s*=\s*(\{.*?\}|\d+)", payload, re.DOTALL)
-    if reset_match:
-        for value in re.findall(r"\d+", reset_match.group(1)):
-            references.append(SpellReference(int(value), branch, "reset_source", filename, line))
-
-    duration_match = re.search(r"\brankDurations\s*=\s*(\{.*?\})", payload, re.DOTALL)
-    if duration_match:
-        for value in re.findall(r"\[(\d+)\]\s*=", duration_match.group(1)):
-            references.append(SpellReference(int(value), branch, "rank_duration", filename, line))
+    # Nested spellID fields are triggered/helper auras.
+    for table in payload.walk():
+        spell_id = _int(table.get("spellID"))
+        if spell_id is not None:
+            references.append(SpellReference(spell_id, branch, "triggered_aura", filename, line))
+
+    for spell_id in payload.ints("cooldownResetBy"):
+        references.append(SpellReference(spell_id, branch, "reset_source", filename, line))
+
+    durations = payload.table("rankDurations")
+    if durations:
+        for spell_id in durations.fields:
+            if _int(spell_id) is not None:
+                references.append(SpellReference(spell_id, branch, "rank_duration", filename, line))
     return references
 
 
 def parse_lua_file(path: Path) -> list[SpellReference]:
+    data_file = spell_data.parse_data_file(path)
     if path.name in ITEM_SPELL_FIELDS:
-        references: list[SpellReference] = []
-        fields = "|".join(map(re.escape, ITEM_SPELL_FIELDS[path.name]))
-        pattern = re.compile(rf"\b({fields})\s*=\s*(\d+)")
-        for line, text in enumerate(path.read_text(encoding="utf-8-sig").splitlines(), 1):
-            for match in pattern.finditer(text):
-                references.append(
-                    SpellReference(int(match.group(2)), "tbc", match.group(1), path.name, line)
-                )
-        return references
+        fields = ITEM_SPELL_FIELDS[path.name]
+        return [
+            SpellReference(value, "tbc", key, path.name, entry.line)
+            for entry in data_file.entries()
+            for key, value in entry.table.items
+            if key in fields and _int(value) is not None
+        ]
 
     references: list[SpellReference] = []
-    for block, line in iter_entry_blocks(path):
-        base, overrides = _remove_named_table(block, "versionOverrides")
-        primary_match = re.search(r"^\s*spellID\s*=\s*(\d+)", base, re.MULTILINE)
-        if not primary_match:
+    for entry in data_file.entries("RegisterSpells"):
+        base = entry.table
+        primary_id = entry.spell_id
+        if primary_id is None:
             continue
-        primary_id = int(primary_match.group(1))
-        name = _scalar_string(base, "name")
-        aliases = _string_array(base, "auditAliases")
-        branch = _infer_branch(primary_id, _scalar_string(base, "auditBranch"))
+        name = entry.name
+        aliases = base.strings("auditAliases")
+        explicit_branch = base.get("auditBranch")
+        branch = _infer_branch(primary_id, explicit_branch if isinstance(explicit_branch, str) else None)
         references.extend(
             _references_for_payload(
-                base,
+                _without(base, "versionOverrides"),
                 branch=branch,
                 filename=path.name,
-                line=line,
+                line=entry.line,
                 expected_name=name,
                 aliases=aliases,
                 include_stats=True,
             )
         )
 
+        overrides = base.table("versionOverrides")
         if overrides:
             for version, override_branch in (("vanilla", "classic"), ("tbc", "tbc")):
-                payload = _named_subtable(overrides, version)
-                if payload and re.search(r"\b(?:spellID|ranks)\s*=", payload):
-                    # An override can replace only ranks while retaining the base
-                    # primary ID, so synthesize the inherited ID when necessary.
-                    if not re.search(r"\bspellID\s*=", payload):
-                        payload = "{\nspellID = %d,\n%s\n}" % (primary_id, payload[1:-1])
+                payload = overrides.table(version)
+                if payload and ("spellID" in payload or "ranks" in payload):
                     references.extend(
                         _references_for_payload(
                             payload,
                             branch=override_branch,
                             filename=path.name,
-                            line=line,
+                            line=entry.line,
                             expected_name=name,
                             aliases=aliases,
                             include_stats=False,
+                            inherited_id=primary_id,
                         )
                     )
     return references
 
 
+def _without(table: spell_data.LuaTable, key: str) -> spell_data.LuaTable:
+    """Shallow copy of ``table`` minus one field (e.g. its versionOverrides)."""
+    if key not in table:
+        return table
+    copy = spell_data.LuaTable(table.line, table.end_line, table.start, table.end)
+    copy.items = [item for item in table.items if item[0] != key]
+    copy.array = table.array
+    copy.fields = {name: value for name, value in table.fields.items() if name != key}
+    return copy
+
+
 def parse_all_files() -> dict[str, list[SpellReference]]:
     result: dict[str, list[SpellReference]] = {}
     for path in sorted(DATA_DIR.glob("*.lua")):
@@ -328,87 +306,347 @@ def extract_description(tooltip_html: str) -> str | None:
     return re.sub(r"\s+", " ", unescape(text).replace("\xa0", " ")).strip() or None
 
 
+# One left-to-right scan over the tooltip HTML finds every field parse_tooltip
+# records. Alternatives are dispatched on ``lastgroup``, so each one must end
+# with its named group.
+_TOOLTIP_SCAN = re.compile(
+    r"<!--baseCooldown:(?P<cooldown>.+?)-->"
+    r'|<div class="q">(?P<description>.*?)</div>'
+    r"|<th>(?P<range>[^<]*?)\s+[Rr]ange</th>"
+    r"|(?:<td>|</table>)(?P<cast>Instant(?: cast)?|Channeled(?: \((?P<channel>[\d.]+) sec cast\))?"
+    r"|(?P<cast_seconds>[\d.]+) sec cast|Next Melee)(?=<)"
+    r'|<b class="q0">(?P<rank>Rank \d+)</b>',
+    re.DOTALL,
+)
+_REMAINING = re.compile(r'<span class="q">([\d.]+)\s*(seconds?|minutes?|hours?)\s*remaining</span>')
+_TIME_UNITS = tuple((re.compile(rf"([\d.]+)\s*{unit}"), multiplier)
+                    for unit, multiplier in (("hr", 3600), ("min", 60), ("sec", 1)))
+_MARKUP = re.compile(r"<!--.*?-->|<[^>]+>", re.DOTALL)
+_SPACES = re.compile(r"\s+")
+
+
+@dataclass(frozen=True)
+class Tooltip:
+    """The fields of one Wowhead tooltip payload, parsed once.
+
+    ``cast_time`` is in seconds (0 for instant, None for "Next Melee" or no
+    cast line); ``range`` and ``rank`` keep Wowhead's text ("5 - 30 yd",
+    "Rank 3"). The description is stored as HTML and cleaned on first use,
+    since only some callers read it.
+    """
+
+    name: str | None = None
+    icon: str | None = None
+    error: str | None = None
+    cooldown: float | None = None
+    duration: float | None = None
+    cast_time: float | None = None
+    channeled: bool = False
+    range: str | None = None
+    rank: str | None = None
+    description_html: str | None = None
+
+    @cached_property
+    def description(self) -> str | None:
+        if self.description_html is None:
+            return None
+        text = unescape(_MARKUP.sub("", self.description_html)).replace("\xa0", " ")
+        return _SPACES.sub(" ", text).strip() or None
+
+
+# Bump when parse_tooltip changes, so stored records are parsed again.
+TOOLTIP_PARSER = 1
+_TOOLTIP_FIELDS = tuple(field.name for field in dataclass_fields(Tooltip))
+
+
+def _seconds(text: str) -> float | None:
+    for pattern, multiplier in _TIME_UNITS:
+        value = pattern.search(text)
+        if value:
+            return float(value.group(1)) * multiplier
+    return None
+
+
+def parse_tooltip(payload: dict) -> Tooltip:
+    """Parse a Wowhead tooltip payload in one pass over its HTML.
+
+    Agrees with extract_cooldown, extract_duration and extract_description on
+    every payload in wowhead_cache.json (checked by ``--bench-tooltips``).
+    """
+    if payload.get("error"):
+        return Tooltip(error=payload["error"])
+    found: dict = {}
+    for match in _TOOLTIP_SCAN.finditer(payload.get("tooltip") or ""):
+        kind = match.lastgroup
+        if kind == "description":
+            found["description_html"] = match.group(kind)  # the last block is the spell text
+        elif kind == "cast":
+            if "cast_time" not in found:
+                cast = match.group(kind)
+                seconds = match.group("channel") or match.group("cast_seconds")
+                found["channeled"] = cast.startswith("Channeled")
+                found["cast_time"] = float(seconds) if seconds else 0.0 if cast.startswith("Instant") else None
+        elif kind not in found:
+            found[kind] = match.group(kind)
+    if "cooldown" in found:
+        found["cooldown"] = _seconds(found["cooldown"])
+    remaining = _REMAINING.search(payload.get("buff") or "")
+    if remaining:
+        unit = remaining.group(2)
+        found["duration"] = float(remaining.group(1)) * (3600 if "hour" in unit else 60 if "minute" in unit else 1)
+    return Tooltip(name=payload.get("name"), icon=payload.get("icon"), **found)
+
+
+class Phases:
+    """Named wall-clock spans of one run, relative to its start. Spans may
+    overlap, since Wago loads, parsing and Wowhead fetches are pipelined."""
+
+    def __init__(self):
+        self.origin = time.perf_counter()
+        self.spans: dict[str, tuple[float, float]] = {}
+        self.lock = threading.Lock()
+
+    def add(self, name: str, start: float, end: float) -> None:
+        with self.lock:
+            self.spans[name] = (start, end)
+
+    @contextmanager
+    def timed(self, name: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(name, start, time.perf_counter())
+
+    def as_dict(self) -> dict[str, dict[str, float]]:
+        with self.lock:
+            spans = sorted(self.spans.items(), key=lambda item: item[1])
+        return {name: {"start": round(start - self.origin, 3), "seconds": round(end - start, 3)}
+                for name, (start, end) in spans}
+
+
+def _encode_tooltip(record: Tooltip) -> list:
+    return [getattr(record, name) for name in _TOOLTIP_FIELDS]
+
+
 class WowheadClient:
-    def __init__(self, cache_path: Path | None, max_age_hours: float, delay: float):
-        self.cache_path = cache_path
+    def __init__(self, cache_path: Path | None, max_age_hours: float, delay: float,
+                 workers: int = 1, retries: int = 4):
+        self.store = wowhead_store.WowheadStore(cache_path) if cache_path else None
         self.max_age = max_age_hours * 3600
-        self.delay = delay
-        self.cache: dict[str, dict] = {}
-        if cache_path and cache_path.exists():
-            try:
-                document = json.loads(cache_path.read_text(encoding="utf-8"))
-                if document.get("schema") == 1:
-                    self.cache = document.get("entries", {})
-            except (OSError, ValueError):
-                self.cache = {}
+        self.workers = max(1, workers)
+        self.retries = retries
+        # --delay is the spacing between request starts across all workers.
+        self.limiter = http_session.TokenBucket(1 / delay) if delay > 0 else None
+        self.http = http_session.shared_session()
+        self.lock = threading.Lock()
+        # Payloads fetched or read from the store during this run, and their
+        # parsed tooltips.
+        self.payloads: dict[tuple[str, int], dict] = {}
+        self.tooltips: dict[tuple[str, int], Tooltip] = {}
+        # Background fetches started by prefetch().
+        self.pool: ThreadPoolExecutor | None = None
+        self.pending: dict[tuple[str, int], Future] = {}
+        self.fetched = 0
+        # Store hits versus downloads, and when the first and last download ran.
+        self.hits = 0
+        self.downloads = 0
+        self.download_span: tuple[float, float] | None = None
+
+    def _cached(self, branch: str, spell_id: int) -> dict | None:
+        payload = self.payloads.get((branch, spell_id))
+        if payload is None and self.store:
+            payload = self.store.get(branch, spell_id, self.max_age)
+            if payload is not None:
+                with self.lock:
+                    self.payloads[(branch, spell_id)] = payload
+                    self.hits += 1
+        return payload
 
-    def fetch(self, branch: str, spell_id: int) -> dict:
-        key = f"{branch}:{spell_id}"
-        now = time.time()
-        cached = self.cache.get(key)
-        if cached and now - cached.get("fetched_at_epoch", 0) <= self.max_age:
-            return cached["payload"]
-        url = WOWHEAD_URL.format(branch=branch, spell_id=spell_id)
+    def _download(self, url: str) -> dict:
+        # Throttled or overloaded responses are retried by the session, which
+        # also halves the shared request rate until the server recovers.
         try:
-            payload = json.loads(_request_text(url))
-        except urllib.error.HTTPError as error:
-            payload = {"error": f"http_{error.code}"}
+            return self.http.get(url, limiter=self.limiter, retries=self.retries).json()
+        except http_session.HTTPStatusError as error:
+            return {"error": f"http_{error.code}"}
         except Exception as error:  # network failures must remain distinguishable from 404s
-            payload = {"error": "network", "detail": str(error)}
-        self.cache[key] = {
-            "branch": branch,
-            "spell_id": spell_id,
-            "source_url": url,
-            "fetched_at": datetime.now(timezone.utc).isoformat(),
-            "fetched_at_epoch": now,
-            "payload": payload,
-        }
-        time.sleep(self.delay)
+            return {"error": "network", "detail": str(error)}
+
+    def fetch(self, branch: str, spell_id: int) -> dict:
+        pending = self.pending.get((branch, spell_id))
+        if pending is not None:
+            return pending.result()
+        return self._fetch(branch, spell_id)
+
+    def _fetch(self, branch: str, spell_id: int) -> dict:
+        cached = self._cached(branch, spell_id)
+        if cached is not None:
+            return cached
+        url = WOWHEAD_URL.format(branch=branch, spell_id=spell_id)
+        fetched_at = time.time()
+        started = time.perf_counter()
+        payload = self._download(url)
+        finished = time.perf_counter()
+        # Parsed as it arrives (in the worker that fetched it) and stored with
+        # the payload, so later runs read the record without touching the HTML.
+        record = parse_tooltip(payload)
+        with self.lock:
+            self.payloads[(branch, spell_id)] = payload
+            self.tooltips[(branch, spell_id)] = record
+            self.downloads += 1
+            span = self.download_span
+            self.download_span = (min(span[0], started), max(span[1], finished)) if span else (started, finished)
+        if self.store:
+            # Written as it arrives, so an interrupted run keeps its progress.
+            self.store.put(branch, spell_id, url, payload, fetched_at,
+                           record=_encode_tooltip(record), parser=TOOLTIP_PARSER)
         return payload
 
-    def save(self) -> None:
-        if not self.cache_path:
+    def tooltip(self, branch: str, spell_id: int) -> Tooltip:
+        """The parsed tooltip for a spell, fetching it if needed. Each payload
+        is parsed at most once: records are memoized per (branch, spell ID)
+        and persisted next to the payload in the store."""
+        key = (branch, spell_id)
+        record = self.tooltips.get(key)
+        if record is not None:
+            return record
+        if key in self.pending:
+            self.pending[key].result()
+            record = self.tooltips.get(key)
+            if record is not None:
+                return record
+        stored = self.store.record(branch, spell_id, TOOLTIP_PARSER, self.max_age) if self.store else None
+        if stored is not None:
+            record = Tooltip(*stored)
+            with self.lock:
+                self.hits += 1
+        else:
+            payload = self.fetch(branch, spell_id)
+            record = self.tooltips.get(key)
+            if record is None:  # cached payload without a current record
+                record = parse_tooltip(payload)
+                if self.store:
+                    self.store.put_record(branch, spell_id, TOOLTIP_PARSER, _encode_tooltip(record))
+        with self.lock:
+            self.tooltips[key] = record
+        return record
+
+    def prefetch(self, keys: Iterable[tuple[str, int]]) -> None:
+        """Start fetching every (branch, spell ID) not already cached,
+        ``workers`` at a time under the shared rate limit, and return at once.
+        ``fetch`` and ``tooltip`` wait for a pending key, so callers keep their
+        own (deterministic) order and can start on the first keys early."""
+        fresh = self.store.fresh(self.max_age) if self.store else set()
+        missing = [key for key in dict.fromkeys(keys)
+                   if key not in self.tooltips and key not in self.pending and key not in fresh]
+        if self.workers == 1 or len(missing) < 2:
             return
-        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
-        document = {"schema": 1, "entries": self.cache}
-        self.cache_path.write_text(json.dumps(document, indent=2, sort_keys=True), encoding="utf-8")
+        if self.pool is None:
+            self.pool = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="wowhead")
+        total = len(self.pending) + len(missing)
+        for key in missing:
+            self.pending[key] = future = self.pool.submit(self._fetch, *key)
+            future.add_done_callback(lambda _: self._progress(total))
+
+    def _progress(self, total: int) -> None:
+        with self.lock:
+            self.fetched += 1
+            if self.fetched % 100 == 0:
+                print(f"Fetched {self.fetched}/{total} Wowhead tooltips...", file=sys.stderr)
+
+    def metrics(self) -> dict[str, float | int | None]:
+        looked_up = self.hits + self.downloads
+        seconds = self.download_span[1] - self.download_span[0] if self.download_span else 0.0
+        return {
+            "store_hits": self.hits,
+            "downloads": self.downloads,
+            "hit_ratio": round(self.hits / looked_up, 3) if looked_up else None,
+            "download_seconds": round(seconds, 3),
+            "downloads_per_second": round(self.downloads / seconds, 2) if seconds else None,
+        }
 
+    def save(self) -> None:
+        # Every response is already committed by fetch(); just release the store.
+        if self.pool:
+            self.pool.shutdown(cancel_futures=True)
+            self.pool = None
+        if self.store:
+            self.store.close()
+            self.store = None
 
-class WagoClient:
-    def __init__(self, tbc_build: str | None = None, classic_build: str | None = None):
-        builds = json.loads(_request_text(WAGO_BUILDS_URL))
-        self.builds = {
-            "tbc": tbc_build or self._latest(builds, TBC_PRODUCT),
-            "classic": classic_build or self._latest(builds, CLASSIC_PRODUCT),
-        }
-        self.names: dict[str, dict[int, str]] = {}
-        self.cooldowns: dict[str, dict[int, float]] = {}
-        for branch, build in self.builds.items():
-            self.names[branch] = self._load_names(build)
-            self.cooldowns[branch] = self._load_cooldowns(build)
 
-    @staticmethod
-    def _latest(builds: dict, product: str) -> str:
-        candidates = builds.get(product) or []
-        if not candidates:
-            raise RuntimeError(f"Wago returned no builds for {product}")
-        return candidates[0]["version"]
+class _Loading(Mapping):
+    """Branch -> table, loaded in the background; a lookup waits for its table."""
 
-    @staticmethod
-    def _load_names(build: str) -> dict[int, str]:
-        text = _request_text(WAGO_CSV_URL.format(table="SpellName", build=build))
-        return {int(row["ID"]): row["Name_lang"] for row in csv.DictReader(io.StringIO(text))}
+    def __init__(self, futures: dict[str, Future]):
+        self.futures = futures
+
+    def __getitem__(self, branch: str):
+        return self.futures[branch].result()
+
+    def __iter__(self):
+        return iter(self.futures)
+
+    def __len__(self) -> int:
+        return len(self.futures)
 
-    @staticmethod
-    def _load_cooldowns(build: str) -> dict[int, float]:
-        text = _request_text(WAGO_CSV_URL.format(table="SpellCooldowns", build=build))
-        result: dict[int, float] = {}
-        for row in csv.DictReader(io.StringIO(text)):
-            spell_id = int(row["SpellID"])
-            milliseconds = max(int(row["RecoveryTime"]), int(row["CategoryRecoveryTime"]))
-            if milliseconds:
-                result[spell_id] = milliseconds / 1000
-        return result
+
+class WagoClient:
+    """Wago DB2 names and cooldowns, read through the build-pinned local store.
+
+    All four tables (names and cooldowns of both branches) load concurrently.
+    With ``background=True`` the constructor returns at once and ``builds``,
+    ``names[branch]`` and ``cooldowns[branch]`` wait for just what they need,
+    so callers can start Wowhead fetches while Wago data is still arriving.
+    """
+
+    def __init__(self, tbc_build: str | None = None, classic_build: str | None = None, *,
+                 offline: bool = False, background: bool = False, phases: Phases | None = None):
+        self.offline = offline
+        self.phases = phases or Phases()
+        pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="wago")
+        # Submitted first, so it always has a thread before the loads wait on it.
+        self._builds = pool.submit(self._resolve_builds, tbc_build, classic_build)
+        loads = {(branch, table): pool.submit(self._load, branch, table)
+                 for branch in ("tbc", "classic") for table in ("SpellName", "SpellCooldowns")}
+        pool.shutdown(wait=False)
+        self._pool = pool
+        self.names: Mapping[str, dict[int, str]] = _Loading({branch: loads[branch, "SpellName"]
+                                                             for branch in ("tbc", "classic")})
+        self.cooldowns: Mapping[str, dict[int, float]] = _Loading({branch: loads[branch, "SpellCooldowns"]
+                                                                   for branch in ("tbc", "classic")})
+        if not background:
+            for future in loads.values():
+                future.result()
+
+    @property
+    def builds(self) -> dict[str, str]:
+        return self._builds.result()
+
+    def close(self) -> None:
+        """Drop table loads that have not started yet."""
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+    def _resolve_builds(self, tbc_build: str | None, classic_build: str | None) -> dict[str, str]:
+        latest = {}
+        if not (tbc_build and classic_build):
+            with self.phases.timed("wago builds"):
+                latest = db2_store.latest_builds((TBC_PRODUCT, CLASSIC_PRODUCT), offline=self.offline)
+        return {
+            "tbc": tbc_build or latest[TBC_PRODUCT],
+            "classic": classic_build or latest[CLASSIC_PRODUCT],
+        }
+
+    def _load(self, branch: str, table: str) -> dict:
+        store = db2_store.Db2Store(self.builds[branch], offline=self.offline)
+        try:
+            with self.phases.timed(f"wago {branch} {table}"):
+                return store.spell_names() if table == "SpellName" else store.spell_cooldowns()
+        finally:
+            store.close()
+            for name, (start, end) in store.timings.items():
+                self.phases.add(f"wago {branch} {name}", start, end)
 
 
 def normalize_name(name: str, *, rank: bool) -> str:
@@ -429,65 +667,157 @@ def _context(reference: SpellReference) -> str:
     return f"{reference.filename}:{reference.line} ({reference.kind})"
 
 
+class AuditCheckpoint:
+    """Completed (branch, spell ID) checks of one audit run, appended to a
+    JSON-lines file as each check finishes.
+
+    The first line identifies the run (selected references and Wago builds),
+    so a resume never mixes results from different inputs. Appends are
+    flushed per check; a line torn by a kill is dropped on load.
+    """
+
+    def __init__(self, directory: Path, references: list[SpellReference], builds: dict[str, str], *,
+                 resume: bool = False):
+        digest = hashlib.sha256(json.dumps(
+            {"builds": builds, "references": [asdict(reference) for reference in references]},
+            sort_keys=True).encode("utf-8"))
+        self.run = digest.hexdigest()
+        # One file per run, so differently scoped runs never overwrite each other.
+        path = self.path = directory / f"{self.run[:16]}.jsonl"
+        self.done: dict[tuple[str, int], list[Finding]] = self._load() if resume else {}
+        # Rewrite the valid part, so appends never follow a torn line.
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp = path.with_name(path.name + ".tmp")
+        with temp.open("w", encoding="utf-8") as handle:
+            handle.write(json.dumps({"run": self.run}) + "\n")
+            for (branch, spell_id), findings in self.done.items():
+                handle.write(self._line(branch, spell_id, findings))
+        os.replace(temp, path)
+        self.handle = path.open("a", encoding="utf-8")
+
+    def _load(self) -> dict[tuple[str, int], list[Finding]]:
+        try:
+            lines = self.path.read_text(encoding="utf-8").splitlines()
+        except FileNotFoundError:
+            return {}
+        try:
+            if not lines or json.loads(lines[0]).get("run") != self.run:
+                print(f"{self.path} is from a different audit run; starting over.", file=sys.stderr)
+                return {}
+        except ValueError:
+            return {}
+        done = {}
+        for line in lines[1:]:
+            try:
+                item = json.loads(line)
+            except ValueError:
+                break
+            done[item["branch"], item["spell_id"]] = [Finding(**finding) for finding in item["findings"]]
+        return done
+
+    @staticmethod
+    def _line(branch: str, spell_id: int, findings: list[Finding]) -> str:
+        return json.dumps({"branch": branch, "spell_id": spell_id,
+                           "findings": [asdict(finding) for finding in findings]}) + "\n"
+
+    def record(self, branch: str, spell_id: int, findings: list[Finding]) -> None:
+        self.handle.write(self._line(branch, spell_id, findings))
+        self.handle.flush()
+
+    def close(self, *, completed: bool = False) -> None:
+        """Close the file; a completed run has nothing to resume, so it is removed."""
+        self.handle.close()
+        if completed:
+            self.path.unlink(missing_ok=True)
+
+
+def check_spell(branch: str, spell_id: int, contexts: list[SpellReference], wh: Tooltip,
+                wago: WagoClient) -> list[Finding]:
+    """Findings for one (branch, spell ID) and every data-file context citing it."""
+    findings: list[Finding] = []
+    wh_name = None if wh.error else wh.name
+    wago_name = wago.names[branch].get(spell_id)
+    context_labels = sorted({_context(reference) for reference in contexts})
+
+    if wh_name is None and wago_name is None:
+        findings.append(Finding("error", "confirmed_missing", spell_id, branch,
+                                "Both live sources have no spell record", context_labels))
+        return findings
+    if wh_name is None or wago_name is None:
+        findings.append(Finding("warning", "source_incomplete", spell_id, branch,
+                                "Only one live source returned this spell", context_labels,
+                                wh_name, wago_name))
+        return findings
+    if normalize_name(wh_name, rank=False) != normalize_name(wago_name, rank=False):
+        findings.append(Finding("warning", "source_conflict", spell_id, branch,
+                                "Wowhead and Wago disagree on spell identity", context_labels,
+                                wh_name, wago_name))
+        return findings
+
+    strict_contexts = [reference for reference in contexts if reference.expected_name]
+    mismatched = [reference for reference in strict_contexts if not name_matches(wh_name, reference)]
+    if mismatched:
+        expected = sorted({reference.expected_name for reference in mismatched if reference.expected_name})
+        findings.append(Finding("error", "confirmed_name_mismatch", spell_id, branch,
+                                f"Authored identity {expected} disagrees with both live sources",
+                                sorted({_context(reference) for reference in mismatched}),
+                                wh_name, wago_name))
+
+    for reference in contexts:
+        if reference.kind != "primary" or reference.cooldown is None or reference.filename == "Procs.lua":
+            continue
+        wh_cooldown = wh.cooldown
+        wago_cooldown = wago.cooldowns[branch].get(spell_id)
+        if wh_cooldown is None or wago_cooldown is None:
+            continue
+        if wh_cooldown != wago_cooldown:
+            findings.append(Finding("warning", "source_cooldown_conflict", spell_id, branch,
+                                    "Wowhead and Wago disagree on cooldown", [_context(reference)],
+                                    wh_cooldown, wago_cooldown))
+        elif reference.cooldown != wh_cooldown:
+            findings.append(Finding("error", "confirmed_cooldown_mismatch", spell_id, branch,
+                                    f"Authored cooldown {reference.cooldown:g}s disagrees with both live sources",
+                                    [_context(reference)], wh_cooldown, wago_cooldown))
+    return findings
+
+
 def audit(
     references: list[SpellReference],
     wowhead: WowheadClient,
     wago: WagoClient,
+    report: Callable[[Finding], None] | None = None,
+    checkpoint: AuditCheckpoint | None = None,
 ) -> list[Finding]:
+    """Check every referenced (branch, spell ID) in sorted order. ``report``
+    is called with each finding as soon as its spell has been checked; spells
+    already in ``checkpoint`` reuse their recorded findings."""
     findings: list[Finding] = []
     grouped: dict[tuple[str, int], list[SpellReference]] = {}
     for reference in references:
         grouped.setdefault((reference.branch, reference.spell_id), []).append(reference)
-
-    for index, ((branch, spell_id), contexts) in enumerate(sorted(grouped.items()), 1):
-        wh = wowhead.fetch(branch, spell_id)
-        wh_name = None if wh.get("error") else wh.get("name")
-        wago_name = wago.names[branch].get(spell_id)
-        context_labels = sorted({_context(reference) for reference in contexts})
-
-        if wh_name is None and wago_name is None:
-            findings.append(Finding("error", "confirmed_missing", spell_id, branch,
-                                    "Both live sources have no spell record", context_labels))
-            continue
-        if wh_name is None or wago_name is None:
-            findings.append(Finding("warning", "source_incomplete", spell_id, branch,
-                                    "Only one live source returned this spell", context_labels,
-                                    wh_name, wago_name))
-            continue
-        if normalize_name(wh_name, rank=False) != normalize_name(wago_name, rank=False):
-            findings.append(Finding("warning", "source_conflict", spell_id, branch,
-                                    "Wowhead and Wago disagree on spell identity", context_labels,
-                                    wh_name, wago_name))
-            continue
-
-        strict_contexts = [reference for reference in contexts if reference.expected_name]
-        mismatched = [reference for reference in strict_contexts if not name_matches(wh_name, reference)]
-        if mismatched:
-            expected = sorted({reference.expected_name for reference in mismatched if reference.expected_name})
-            findings.append(Finding("error", "confirmed_name_mismatch", spell_id, branch,
-                                    f"Authored identity {expected} disagrees with both live sources",
-                                    sorted({_context(reference) for reference in mismatched}),
-                                    wh_name, wago_name))
-
-        for reference in contexts:
-            if reference.kind != "primary" or reference.cooldown is None or reference.filename == "Procs.lua":
-                continue
-            wh_cooldown = extract_cooldown(wh.get("tooltip", ""))
-            wago_cooldown = wago.cooldowns[branch].get(spell_id)
-            if wh_cooldown is None or wago_cooldown is None:
-                continue
-            if wh_cooldown != wago_cooldown:
-                findings.append(Finding("warning", "source_cooldown_conflict", spell_id, branch,
-                                        "Wowhead and Wago disagree on cooldown", [_context(reference)],
-                                        wh_cooldown, wago_cooldown))
-            elif reference.cooldown != wh_cooldown:
-                findings.append(Finding("error", "confirmed_cooldown_mismatch", spell_id, branch,
-                                        f"Authored cooldown {reference.cooldown:g}s disagrees with both live sources",
-                                        [_context(reference)], wh_cooldown, wago_cooldown))
-
-        if index % 100 == 0:
-            print(f"Checked {index}/{len(grouped)} unique branch/ID pairs...", file=sys.stderr)
-    wowhead.save()
+    done = checkpoint.done if checkpoint else {}
+
+    try:
+        wowhead.prefetch(key for key in sorted(grouped) if key not in done)
+        for index, ((branch, spell_id), contexts) in enumerate(sorted(grouped.items()), 1):
+            if (branch, spell_id) in done:
+                checked = done[branch, spell_id]
+            else:
+                wh = wowhead.tooltip(branch, spell_id)
+                checked = check_spell(branch, spell_id, contexts, wh, wago)
+                # Only definitive answers are kept; a resumed run retries outages.
+                if checkpoint and wh.error in (None, "http_404"):
+                    checkpoint.record(branch, spell_id, checked)
+            findings.extend(checked)
+            if report:
+                for finding in checked:
+                    report(finding)
+            if index % 100 == 0:
+                print(f"Checked {index}/{len(grouped)} unique branch/ID pairs...", file=sys.stderr)
+    finally:
+        # Also on Ctrl-C or an error: queued prefetches are dropped instead of
+        # draining before the interpreter exits.
+        wowhead.save()
     return findings
 
 
@@ -502,54 +832,198 @@ def _parse_ids(values: list[str]) -> set[int]:
     return result
 
 
+def bench_tooltips(rounds: int, path: Path = wowhead_store.LEGACY_CACHE) -> None:
+    """Time tooltip extraction over a cached corpus: the per-field extractors
+    against parse_tooltip, and reading payloads back from a store and
+    extracting against reading the stored records."""
+    corpus = {int(key): payload for key, payload in json.loads(path.read_text(encoding="utf-8")).items()
+              if isinstance(payload, dict) and not payload.get("error")}
+    for spell_id, payload in corpus.items():
+        record = parse_tooltip(payload)
+        expected = (extract_cooldown(payload.get("tooltip", "")), extract_duration(payload.get("buff", "")),
+                    extract_description(payload.get("tooltip", "")))
+        if (record.cooldown, record.duration, record.description) != expected:
+            raise SystemExit(f"parse_tooltip disagrees with the extractors on spell {spell_id}")
+
+    def timed(body) -> float:
+        started = time.perf_counter()
+        for _ in range(rounds):
+            body()
+        return (time.perf_counter() - started) / rounds * 1000
+
+    def extract_all():
+        for payload in corpus.values():
+            extract_cooldown(payload.get("tooltip", ""))
+            extract_duration(payload.get("buff", ""))
+            extract_description(payload.get("tooltip", ""))
+
+    def parse_all():
+        for payload in corpus.values():
+            parse_tooltip(payload).description
+
+    with tempfile.TemporaryDirectory() as temp:
+        store = wowhead_store.WowheadStore(Path(temp) / "bench.sqlite")
+        for spell_id, payload in corpus.items():
+            store.put("tbc", spell_id, "", payload, record=_encode_tooltip(parse_tooltip(payload)),
+                      parser=TOOLTIP_PARSER)
+
+        def read_payloads():
+            for spell_id in corpus:
+                payload = store.get("tbc", spell_id)
+                payload.get("name"), extract_cooldown(payload.get("tooltip", ""))
+
+        def read_records():
+            for spell_id in corpus:
+                record = Tooltip(*store.record("tbc", spell_id, TOOLTIP_PARSER))
+                record.name, record.cooldown
+
+        print(f"{len(corpus)} tooltips from {path.name}, x{rounds} (ms per pass):")
+        print(f"  all fields from payloads:   extractors {timed(extract_all):7.2f}   parse_tooltip {timed(parse_all):7.2f}")
+        print(f"  audit fields from the store: payloads  {timed(read_payloads):7.2f}   records       {timed(read_records):7.2f}")
+        store.close()
+
+
+def _print_finding(finding: Finding) -> None:
+    print(f"[{finding.severity.upper()}] {finding.code} {finding.branch}:{finding.spell_id} - {finding.message}")
+    if finding.wowhead is not None or finding.wago is not None:
+        print(f"        Wowhead={finding.wowhead!r} Wago={finding.wago!r}")
+    for context in finding.contexts:
+        print(f"        {context}")
+    sys.stdout.flush()
+
+
+def _print_metrics(metrics: dict) -> None:
+    print("Phases (start, duration):", file=sys.stderr)
+    for name, span in metrics["phases"].items():
+        print(f"  {name:36s} {span['start']:8.2f}s {span['seconds']:8.2f}s", file=sys.stderr)
+    wowhead = metrics["wowhead"]
+    ratio = "n/a" if wowhead["hit_ratio"] is None else f"{wowhead['hit_ratio']:.0%}"
+    rate = "" if wowhead["downloads_per_second"] is None else f", {wowhead['downloads_per_second']:.1f}/s"
+    print(f"Wowhead: {wowhead['store_hits']} store hit(s), {wowhead['downloads']} download(s){rate},"
+          f" hit ratio {ratio}", file=sys.stderr)
+    if http_session.shared_session().stats:
+        print(http_session.shared_session().summary(), file=sys.stderr)
+
+
 def main(argv: list[str] | None = None) -> int:
     parser = argparse.ArgumentParser(description=__doc__)
     parser.add_argument("--audit", action="store_true", help="run the two-source live audit")
     parser.add_argument("--ids", action="append", default=[], help="comma-separated IDs to audit")
+    parser.add_argument("--changed-since", metavar="REF",
+                        help="audit only references from Data entries changed since git revision REF")
     parser.add_argument("--strict", action="store_true", help="exit nonzero for any error or source warning")
-    parser.add_argument("--delay", type=float, default=0.15, help="delay after Wowhead requests")
+    parser.add_argument("--resume", action="store_true",
+                        help="continue an interrupted run over the same references and Wago builds")
+    parser.add_argument("--delay", type=float, default=0.15,
+                        help="minimum spacing between Wowhead requests, across all workers")
+    parser.add_argument("--workers", type=int, default=6, help="concurrent Wowhead requests")
     parser.add_argument("--no-cache", action="store_true", help="do not read or write the disposable cache")
-    parser.add_argument("--cache", type=Path, default=DEFAULT_CACHE, help="disposable Wowhead cache path")
+    parser.add_argument("--cache", type=Path, default=DEFAULT_CACHE, help="disposable Wowhead response store")
     parser.add_argument("--max-cache-age-hours", type=float, default=24)
     parser.add_argument("--tbc-build", help="override auto-discovered Wago Anniversary build")
     parser.add_argument("--classic-build", help="override auto-discovered Wago Classic Era build")
+    parser.add_argument("--offline-wago", action="store_true",
+                        help="use only Wago builds already in the local DB2 store (no Wago downloads)")
     parser.add_argument("--json-report", type=Path, help="write a machine-readable report")
+    parser.add_argument("--sequential", action="store_true",
+                        help="parse, load Wago and fetch Wowhead one phase at a time instead of overlapping them")
+    parser.add_argument("--bench-tooltips", type=int, metavar="N",
+                        help="time tooltip parsing over wowhead_cache.json N times and exit")
     args = parser.parse_args(argv)
 
+    if args.bench_tooltips:
+        bench_tooltips(args.bench_tooltips)
+        return 0
     if not args.audit:
         parser.print_help()
         return 2
+    if args.resume and args.no_cache:
+        parser.error("--resume reads the checkpoint that --no-cache does not write")
 
-    parsed = parse_all_files()
+    phases = Phases()
+    changed = None
+    if args.changed_since:
+        try:
+            with phases.timed("git diff"):
+                changed = changed_entries(args.changed_since)
+        except (OSError, subprocess.CalledProcessError) as error:
+            detail = getattr(error, "stderr", None) or error
+            print(f"Cannot diff against {args.changed_since}: {str(detail).strip()}", file=sys.stderr)
+            return 2
+
+    wago = None
+    if not args.sequential and changed != {}:
+        # Wago tables load in the background while the data files are parsed
+        # and the first Wowhead tooltips are fetched.
+        wago = WagoClient(args.tbc_build, args.classic_build, offline=args.offline_wago, background=True,
+                          phases=phases)
+    with phases.timed("parse"):
+        parsed = parse_all_files()
     references = _flatten(parsed)
     selected_ids = _parse_ids(args.ids)
     if selected_ids:
         references = [reference for reference in references if reference.spell_id in selected_ids]
+    if changed is not None:
+        references = [reference for reference in references
+                      if reference.line in changed.get(reference.filename, ())]
     if not references:
+        if wago:
+            wago.close()
+        if changed is not None:
+            # Nothing authored changed, so there is nothing to verify.
+            print(f"No audited spell entries changed since {args.changed_since}.")
+            return 0
         print("No matching spell references found.", file=sys.stderr)
         return 2
 
     print(f"Parsed {len(references)} references from {len(parsed)} data files.")
-    wago = WagoClient(args.tbc_build, args.classic_build)
-    print(f"Wago builds: TBC={wago.builds['tbc']} Classic={wago.builds['classic']}")
-    wowhead = WowheadClient(None if args.no_cache else args.cache, args.max_cache_age_hours, args.delay)
-    findings = audit(references, wowhead, wago)
-
-    for finding in findings:
-        print(f"[{finding.severity.upper()}] {finding.code} {finding.branch}:{finding.spell_id} - {finding.message}")
-        if finding.wowhead is not None or finding.wago is not None:
-            print(f"        Wowhead={finding.wowhead!r} Wago={finding.wago!r}")
-        for context in finding.contexts:
-            print(f"        {context}")
+    wowhead = WowheadClient(None if args.no_cache else args.cache, args.max_cache_age_hours, args.delay,
+                            workers=args.workers)
+    try:
+        if wago is None:
+            wago = WagoClient(args.tbc_build, args.classic_build, offline=args.offline_wago, phases=phases)
+        if not args.resume:  # a resumed run first has to learn which spells are done
+            wowhead.prefetch(sorted({(reference.branch, reference.spell_id) for reference in references}))
+        print(f"Wago builds: TBC={wago.builds['tbc']} Classic={wago.builds['classic']}")
+        # Progress is checkpointed per spell, so --resume can pick up after a crash
+        # or timeout; the checkpoint is part of the disposable cache.
+        checkpoint = None
+        if not args.no_cache:
+            checkpoint = AuditCheckpoint(CHECKPOINT_DIR, references, wago.builds, resume=args.resume)
+            if checkpoint.done:
+                print(f"Resuming: {len(checkpoint.done)} spell(s) already checked.")
+        completed = False
+        try:
+            with phases.timed("audit"):
+                findings = audit(references, wowhead, wago, report=_print_finding, checkpoint=checkpoint)
+            completed = True
+        finally:
+            if checkpoint:
+                checkpoint.close(completed=completed)
+    finally:
+        # Queued Wowhead fetches and Wago loads are cancelled however the run ends.
+        wowhead.save()
+        if wago is not None:
+            wago.close()
 
     counts = {severity: sum(item.severity == severity for item in findings) for severity in ("error", "warning")}
     print(f"Summary: {counts['error']} confirmed error(s), {counts['warning']} warning(s)")
+    if wowhead.download_span:
+        phases.add("wowhead fetch", *wowhead.download_span)
+    phases.add("total", phases.origin, time.perf_counter())
+    metrics = {
+        "phases": phases.as_dict(),
+        "wowhead": wowhead.metrics(),
+        "http": {host: stats.as_dict() for host, stats in sorted(http_session.shared_session().stats.items())},
+    }
+    _print_metrics(metrics)
     if args.json_report:
         args.json_report.parent.mkdir(parents=True, exist_ok=True)
         report = {
             "generated_at": datetime.now(timezone.utc).isoformat(),
             "wago_builds": wago.builds,
             "findings": [asdict(finding) for finding in findings],
+            "metrics": metrics,
         }
         args.json_report.write_text(json.dumps(report, indent=2), encoding="utf-8")
     # Strict mode means the data was fully verified, not merely that no agreed
@@ -0,0 +1,274 @@
+#!/usr/bin/env python3
+"""Indexed, incrementally written store of Wowhead tooltip responses.
+
+One row per (branch, spell ID) in ``Tools/.cache/wowhead.sqlite`` records the
+source URL, fetch time and the zlib-compressed JSON payload, with the spell
+name and icon kept in their own columns. Every ``put`` is a small SQLite
+transaction in WAL mode, so an interrupted fetch keeps everything fetched so
+far and never leaves a half-written file. Reads are by key, and only the
+payloads actually asked for are decompressed: resolving the icons of every
+authored spell reads two short columns instead of megabytes of tooltip HTML.
+
+Callers may also store a parsed record of each payload (a JSON value tagged
+with a parser version). A record is only returned while it belongs to the
+stored payload, so refetching a spell or bumping the parser version discards
+it without any explicit invalidation.
+
+The committed legacy ``wowhead_cache.json`` (icon generation only) is imported
+into its own ``legacy`` branch whenever that file changes, replacing the branch
+wholesale with fetch time 0. Live fetches never write that branch, so icon
+generation reads exactly the committed file and the audit never sees it.
+
+Examples:
+    python Tools/wowhead_store.py                # entry counts per branch
+    python Tools/wowhead_store.py --show tbc:133 # one stored payload (legacy:133 for the committed file)
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import os
+import sqlite3
+import sys
+import threading
+import time
+import zlib
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Iterable
+
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+DEFAULT_STORE = SCRIPT_DIR / ".cache" / "wowhead.sqlite"
+LEGACY_CACHE = SCRIPT_DIR / "wowhead_cache.json"
+LEGACY_URL = "https://nether.wowhead.com/tbc/tooltip/spell/{spell_id}"
+LEGACY_BRANCH = "legacy"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    branch TEXT NOT NULL,
+    spell_id INTEGER NOT NULL,
+    source_url TEXT NOT NULL,
+    fetched_at TEXT NOT NULL,
+    fetched_at_epoch REAL NOT NULL,
+    name TEXT,
+    icon TEXT,
+    error TEXT,
+    payload BLOB NOT NULL,
+    PRIMARY KEY (branch, spell_id)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS records (
+    branch TEXT NOT NULL,
+    spell_id INTEGER NOT NULL,
+    parser INTEGER NOT NULL,
+    fetched_at_epoch REAL NOT NULL,
+    record TEXT NOT NULL,
+    PRIMARY KEY (branch, spell_id)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+"""
+
+
+def _compress(payload: dict) -> bytes:
+    return zlib.compress(json.dumps(payload, separators=(",", ":"), ensure_ascii=False).encode("utf-8"), 6)
+
+
+def _decompress(blob: bytes) -> dict:
+    return json.loads(zlib.decompress(blob))
+
+
+def _chunks(values: list[int], size: int = 500) -> Iterable[list[int]]:
+    for start in range(0, len(values), size):
+        yield values[start:start + size]
+
+
+class WowheadStore:
+    def __init__(self, path: Path = DEFAULT_STORE):
+        self.path = path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Fetch workers share the connection; the lock serializes access.
+        self.connection = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.executescript(SCHEMA)
+        self.lock = threading.Lock()
+
+    def close(self) -> None:
+        with self.lock:
+            self.connection.close()
+
+    def put(self, branch: str, spell_id: int, source_url: str, payload: dict,
+            fetched_at_epoch: float | None = None, record=None, parser: int = 0) -> None:
+        """Store a payload, and optionally its parsed ``record``, in one transaction."""
+        epoch = time.time() if fetched_at_epoch is None else fetched_at_epoch
+        row = (
+            branch, spell_id, source_url,
+            datetime.fromtimestamp(epoch, timezone.utc).isoformat(), epoch,
+            payload.get("name"), payload.get("icon"), payload.get("error"), _compress(payload),
+        )
+        with self.lock:
+            if record is None:
+                self.connection.execute("INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", row)
+                return
+            self.connection.execute("BEGIN")
+            try:
+                self.connection.execute("INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", row)
+                self.connection.execute(
+                    "INSERT OR REPLACE INTO records VALUES (?, ?, ?, ?, ?)",
+                    (branch, spell_id, parser, epoch, json.dumps(record, separators=(",", ":"))),
+                )
+                self.connection.execute("COMMIT")
+            except BaseException:
+                self.connection.execute("ROLLBACK")
+                raise
+
+    def put_record(self, branch: str, spell_id: int, parser: int, record) -> None:
+        """Attach a parsed record to the payload already stored for this key."""
+        with self.lock:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO records"
+                " SELECT branch, spell_id, ?, fetched_at_epoch, ? FROM responses WHERE branch = ? AND spell_id = ?",
+                (parser, json.dumps(record, separators=(",", ":")), branch, spell_id),
+            )
+
+    def record(self, branch: str, spell_id: int, parser: int, max_age: float | None = None):
+        """The parsed record of the stored payload, or None if there is none for
+        this parser version (or the payload is older than ``max_age`` seconds)."""
+        with self.lock:
+            row = self.connection.execute(
+                "SELECT records.record FROM records JOIN responses USING (branch, spell_id)"
+                " WHERE branch = ? AND spell_id = ? AND parser = ?"
+                " AND records.fetched_at_epoch = responses.fetched_at_epoch AND responses.fetched_at_epoch >= ?",
+                (branch, spell_id, parser, -1 if max_age is None else time.time() - max_age),
+            ).fetchone()
+        return None if row is None else json.loads(row[0])
+
+    def get(self, branch: str, spell_id: int, max_age: float | None = None) -> dict | None:
+        """The stored payload, or None if absent (or older than ``max_age`` seconds)."""
+        with self.lock:
+            row = self.connection.execute(
+                "SELECT fetched_at_epoch, payload FROM responses WHERE branch = ? AND spell_id = ?",
+                (branch, spell_id),
+            ).fetchone()
+        if row is None or (max_age is not None and time.time() - row[0] > max_age):
+            return None
+        return _decompress(row[1])
+
+    def fresh(self, max_age: float) -> set[tuple[str, int]]:
+        """Every (branch, spell ID) fetched within the last ``max_age`` seconds."""
+        with self.lock:
+            return set(self.connection.execute(
+                "SELECT branch, spell_id FROM responses WHERE fetched_at_epoch >= ?", (time.time() - max_age,)))
+
+    def icons(self, branch: str, spell_ids: Iterable[int]) -> dict[int, str]:
+        """Spell ID -> icon name for the given IDs that have one; payloads stay compressed."""
+        result: dict[int, str] = {}
+        with self.lock:
+            for chunk in _chunks(sorted(set(spell_ids))):
+                result.update(self.connection.execute(
+                    f"SELECT spell_id, icon FROM responses WHERE branch = ? AND icon IS NOT NULL AND icon != ''"
+                    f" AND spell_id IN ({', '.join('?' * len(chunk))})",
+                    (branch, *chunk),
+                ))
+        return result
+
+    def counts(self) -> dict[str, int]:
+        with self.lock:
+            return dict(self.connection.execute("SELECT branch, COUNT(*) FROM responses GROUP BY branch"))
+
+    # -- legacy wowhead_cache.json ----------------------------------------
+
+    def _meta(self, key: str) -> str | None:
+        with self.lock:
+            row = self.connection.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def _set_meta(self, key: str, value: str) -> None:
+        with self.lock:
+            self.connection.execute("INSERT OR REPLACE INTO meta VALUES (?, ?)", (key, value))
+
+    def sync_legacy(self, path: Path = LEGACY_CACHE) -> int:
+        """Mirror the legacy JSON cache into the ``legacy`` branch if the file
+        changed since the last import. Returns the number of imported rows (0
+        when the file is unchanged)."""
+        if not path.is_file():
+            return 0
+        meta_key = f"{LEGACY_BRANCH}:{path.name}"
+        # Cheap stat check first; the content hash settles touched-but-equal files.
+        stat = path.stat()
+        stamp = f"{stat.st_size}:{stat.st_mtime_ns}"
+        recorded = (self._meta(meta_key) or "::").split(":")
+        if recorded[:2] == stamp.split(":"):
+            return 0
+        raw = path.read_bytes()
+        digest = hashlib.sha256(raw).hexdigest()
+        if recorded[2] == digest:
+            self._set_meta(meta_key, f"{stamp}:{digest}")
+            return 0
+        rows = [
+            (int(key), LEGACY_URL.format(spell_id=int(key)), payload)
+            for key, payload in json.loads(raw.decode("utf-8")).items() if isinstance(payload, dict)
+        ]
+        with self.lock:
+            self.connection.execute("BEGIN")
+            try:
+                # Older stores imported the file into ``tbc`` at fetch time 0.
+                self.connection.execute("DELETE FROM responses WHERE branch = 'tbc' AND fetched_at_epoch = 0")
+                self.connection.execute("DELETE FROM responses WHERE branch = ?", (LEGACY_BRANCH,))
+                self.connection.executemany(
+                    "INSERT INTO responses VALUES (?, ?, ?, ?, 0, ?, ?, ?, ?)",
+                    [
+                        (LEGACY_BRANCH, spell_id, url, datetime.fromtimestamp(0, timezone.utc).isoformat(),
+                         payload.get("name"), payload.get("icon"), payload.get("error"), _compress(payload))
+                        for spell_id, url, payload in rows
+                    ],
+                )
+                self.connection.execute("INSERT OR REPLACE INTO meta VALUES (?, ?)", (meta_key, f"{stamp}:{digest}"))
+                self.connection.execute("COMMIT")
+            except BaseException:
+                self.connection.execute("ROLLBACK")
+                raise
+        return len(rows)
+
+    def export_legacy(self, spell_ids: Iterable[int], path: Path = LEGACY_CACHE) -> None:
+        """Add the given live ``tbc`` entries to the legacy JSON cache, keeping
+        its existing key order, and re-import it into the ``legacy`` branch."""
+        document = json.loads(path.read_text(encoding="utf-8")) if path.is_file() else {}
+        for spell_id in spell_ids:
+            payload = self.get("tbc", spell_id)
+            if payload is not None:
+                document[str(spell_id)] = payload
+        temp = path.with_name(path.name + ".tmp")
+        temp.write_text(json.dumps(document, indent=2, ensure_ascii=False), encoding="utf-8")
+        os.replace(temp, path)
+        self.sync_legacy(path)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--store", type=Path, default=DEFAULT_STORE)
+    parser.add_argument("--show", metavar="BRANCH:ID", help="print one stored payload")
+    args = parser.parse_args(argv)
+
+    store = WowheadStore(args.store)
+    try:
+        store.sync_legacy()
+        if args.show:
+            branch, _, spell_id = args.show.partition(":")
+            payload = store.get(branch, int(spell_id))
+            if payload is None:
+                print(f"{args.show} is not stored", file=sys.stderr)
+                return 1
+            print(json.dumps(payload, indent=2, ensure_ascii=False))
+            return 0
+        for branch, count in sorted(store.counts().items()):
+            print(f"{branch:10s} {count:6d} response(s)")
+    finally:
+        store.close()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())